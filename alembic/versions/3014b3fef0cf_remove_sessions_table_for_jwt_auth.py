@@ -39,11 +39,11 @@ def downgrade() -> None:
         sa.Column("user_agent", sa.VARCHAR(length=255), nullable=True),
         sa.Column(
             "created_at",
-            sa.DATETIME(),
+            sa.DateTime(),
             server_default=sa.text("(CURRENT_TIMESTAMP)"),
             nullable=False,
         ),
-        sa.Column("expires_at", sa.DATETIME(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
         sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("session_id"),
@@ -17,90 +17,97 @@ branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
 
+def _shift(column: str, sign: str) -> str:
+    """列の日時を9時間ずらす式（SQLiteはdatetime関数、PostgreSQLはinterval）"""
+    if op.get_context().dialect.name == "postgresql":
+        return f"{column} {sign} interval '9 hours'"
+    return f"datetime({column}, '{sign}9 hours')"
+
+
 def upgrade() -> None:
     """既存データのタイムスタンプをUTC→JSTに変換（+9時間）"""
 
     # 1. care_logs テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE care_logs
-        SET created_at = datetime(created_at, '+9 hours'),
-            last_updated_at = datetime(last_updated_at, '+9 hours')
+        SET created_at = {_shift("created_at", "+")},
+            last_updated_at = {_shift("last_updated_at", "+")}
     """)
 
     # 2. animals テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE animals
-        SET created_at = datetime(created_at, '+9 hours'),
-            updated_at = datetime(updated_at, '+9 hours')
+        SET created_at = {_shift("created_at", "+")},
+            updated_at = {_shift("updated_at", "+")}
     """)
 
     # 3. medical_records テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE medical_records
-        SET created_at = datetime(created_at, '+9 hours'),
-            updated_at = datetime(updated_at, '+9 hours'),
-            last_updated_at = datetime(last_updated_at, '+9 hours')
+        SET created_at = {_shift("created_at", "+")},
+            updated_at = {_shift("updated_at", "+")},
+            last_updated_at = {_shift("last_updated_at", "+")}
     """)
 
     # 4. medical_actions テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE medical_actions
-        SET created_at = datetime(created_at, '+9 hours'),
-            updated_at = datetime(updated_at, '+9 hours'),
-            last_updated_at = datetime(last_updated_at, '+9 hours')
+        SET created_at = {_shift("created_at", "+")},
+            updated_at = {_shift("updated_at", "+")},
+            last_updated_at = {_shift("last_updated_at", "+")}
     """)
 
     # 5. users テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE users
-        SET created_at = datetime(created_at, '+9 hours'),
-            updated_at = datetime(updated_at, '+9 hours')
+        SET created_at = {_shift("created_at", "+")},
+            updated_at = {_shift("updated_at", "+")}
     """)
 
     # 6. volunteers テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE volunteers
-        SET created_at = datetime(created_at, '+9 hours'),
-            updated_at = datetime(updated_at, '+9 hours')
+        SET created_at = {_shift("created_at", "+")},
+            updated_at = {_shift("updated_at", "+")}
     """)
 
     # 7. status_history テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE status_history
-        SET changed_at = datetime(changed_at, '+9 hours')
+        SET changed_at = {_shift("changed_at", "+")}
     """)
 
     # 8. adoption_records テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE adoption_records
-        SET created_at = datetime(created_at, '+9 hours'),
-            updated_at = datetime(updated_at, '+9 hours')
+        SET created_at = {_shift("created_at", "+")},
+            updated_at = {_shift("updated_at", "+")}
     """)
 
     # 9. applicants テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE applicants
-        SET created_at = datetime(created_at, '+9 hours'),
-            updated_at = datetime(updated_at, '+9 hours')
+        SET created_at = {_shift("created_at", "+")},
+            updated_at = {_shift("updated_at", "+")}
     """)
 
     # 10. animal_images テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE animal_images
-        SET created_at = datetime(created_at, '+9 hours')
+        SET created_at = {_shift("created_at", "+")}
     """)
 
     # 11. audit_logs テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE audit_logs
-        SET created_at = datetime(created_at, '+9 hours')
+        SET created_at = {_shift("created_at", "+")}
     """)
 
     # 12. settings テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE settings
-        SET created_at = datetime(created_at, '+9 hours'),
-            updated_at = datetime(updated_at, '+9 hours')
+        SET created_at = {_shift("created_at", "+")},
+            updated_at = {_shift("updated_at", "+")}
     """)
 
 
@@ -108,84 +115,84 @@ def downgrade() -> None:
     """ロールバック: JST→UTCに戻す（-9時間）"""
 
     # 1. care_logs テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE care_logs
-        SET created_at = datetime(created_at, '-9 hours'),
-            last_updated_at = datetime(last_updated_at, '-9 hours')
+        SET created_at = {_shift("created_at", "-")},
+            last_updated_at = {_shift("last_updated_at", "-")}
     """)
 
     # 2. animals テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE animals
-        SET created_at = datetime(created_at, '-9 hours'),
-            updated_at = datetime(updated_at, '-9 hours')
+        SET created_at = {_shift("created_at", "-")},
+            updated_at = {_shift("updated_at", "-")}
     """)
 
     # 3. medical_records テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE medical_records
-        SET created_at = datetime(created_at, '-9 hours'),
-            updated_at = datetime(updated_at, '-9 hours'),
-            last_updated_at = datetime(last_updated_at, '-9 hours')
+        SET created_at = {_shift("created_at", "-")},
+            updated_at = {_shift("updated_at", "-")},
+            last_updated_at = {_shift("last_updated_at", "-")}
     """)
 
     # 4. medical_actions テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE medical_actions
-        SET created_at = datetime(created_at, '-9 hours'),
-            updated_at = datetime(updated_at, '-9 hours'),
-            last_updated_at = datetime(last_updated_at, '-9 hours')
+        SET created_at = {_shift("created_at", "-")},
+            updated_at = {_shift("updated_at", "-")},
+            last_updated_at = {_shift("last_updated_at", "-")}
     """)
 
     # 5. users テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE users
-        SET created_at = datetime(created_at, '-9 hours'),
-            updated_at = datetime(updated_at, '-9 hours')
+        SET created_at = {_shift("created_at", "-")},
+            updated_at = {_shift("updated_at", "-")}
     """)
 
     # 6. volunteers テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE volunteers
-        SET created_at = datetime(created_at, '-9 hours'),
-            updated_at = datetime(updated_at, '-9 hours')
+        SET created_at = {_shift("created_at", "-")},
+            updated_at = {_shift("updated_at", "-")}
     """)
 
     # 7. status_history テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE status_history
-        SET changed_at = datetime(changed_at, '-9 hours')
+        SET changed_at = {_shift("changed_at", "-")}
     """)
 
     # 8. adoption_records テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE adoption_records
-        SET created_at = datetime(created_at, '-9 hours'),
-            updated_at = datetime(updated_at, '-9 hours')
+        SET created_at = {_shift("created_at", "-")},
+            updated_at = {_shift("updated_at", "-")}
     """)
 
     # 9. applicants テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE applicants
-        SET created_at = datetime(created_at, '-9 hours'),
-            updated_at = datetime(updated_at, '-9 hours')
+        SET created_at = {_shift("created_at", "-")},
+            updated_at = {_shift("updated_at", "-")}
     """)
 
     # 10. animal_images テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE animal_images
-        SET created_at = datetime(created_at, '-9 hours')
+        SET created_at = {_shift("created_at", "-")}
     """)
 
     # 11. audit_logs テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE audit_logs
-        SET created_at = datetime(created_at, '-9 hours')
+        SET created_at = {_shift("created_at", "-")}
     """)
 
     # 12. settings テーブル
-    op.execute("""
+    op.execute(f"""
         UPDATE settings
-        SET created_at = datetime(created_at, '-9 hours'),
-            updated_at = datetime(updated_at, '-9 hours')
+        SET created_at = {_shift("created_at", "-")},
+            updated_at = {_shift("updated_at", "-")}
     """)
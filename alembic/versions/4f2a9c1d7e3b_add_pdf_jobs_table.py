@@ -0,0 +1,84 @@
+"""add_pdf_jobs_table
+
+Revision ID: 4f2a9c1d7e3b
+Revises: 8b1e0d7b7b6f
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f2a9c1d7e3b"
+down_revision: str | None = "8b1e0d7b7b6f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create pdf_jobs table for the asynchronous PDF job queue."""
+    op.create_table(
+        "pdf_jobs",
+        sa.Column("id", sa.String(length=32), nullable=False, comment="ジョブID"),
+        sa.Column(
+            "kind",
+            sa.String(length=30),
+            nullable=False,
+            comment="PDF種別（qr_card, qr_card_grid等）",
+        ),
+        sa.Column(
+            "params", sa.Text(), nullable=False, comment="生成パラメータ（JSON形式）"
+        ),
+        sa.Column(
+            "status",
+            sa.String(length=20),
+            nullable=False,
+            comment="状態（queued, running, completed, failed）",
+        ),
+        sa.Column("error", sa.Text(), nullable=True, comment="失敗理由"),
+        sa.Column(
+            "result_path",
+            sa.String(length=255),
+            nullable=True,
+            comment="生成したPDFの保存パス",
+        ),
+        sa.Column(
+            "requested_by", sa.Integer(), nullable=True, comment="依頼者のユーザーID"
+        ),
+        sa.Column(
+            "created_at", sa.DateTime(), nullable=False, comment="投入日時（JST）"
+        ),
+        sa.Column(
+            "started_at", sa.DateTime(), nullable=True, comment="処理開始日時（JST）"
+        ),
+        sa.Column(
+            "finished_at", sa.DateTime(), nullable=True, comment="処理完了日時（JST）"
+        ),
+        sa.ForeignKeyConstraint(
+            ["requested_by"],
+            ["users.id"],
+            name=op.f("fk_pdf_jobs_requested_by_users"),
+            ondelete="SET NULL",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_pdf_jobs")),
+    )
+    op.create_index(
+        "ix_pdf_jobs_status_created_at",
+        "pdf_jobs",
+        ["status", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_pdf_jobs_finished_at", "pdf_jobs", ["finished_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop pdf_jobs table."""
+    op.drop_index("ix_pdf_jobs_finished_at", table_name="pdf_jobs")
+    op.drop_index("ix_pdf_jobs_status_created_at", table_name="pdf_jobs")
+    op.drop_table("pdf_jobs")
@@ -0,0 +1,67 @@
+"""add_daily_care_statuses_table
+
+Revision ID: 7c3d5e8a1b26
+Revises: 4f2a9c1d7e3b
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3d5e8a1b26"
+down_revision: str | None = "4f2a9c1d7e3b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create daily_care_statuses table and backfill it from care_logs."""
+    op.create_table(
+        "daily_care_statuses",
+        sa.Column("log_date", sa.Date(), nullable=False, comment="記録日（年月日）"),
+        sa.Column("animal_id", sa.Integer(), nullable=False, comment="猫ID"),
+        sa.Column(
+            "slots",
+            sa.SmallInteger(),
+            nullable=False,
+            comment="記録済みの時点のビットマスク（朝=1, 昼=2, 夕=4）",
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), nullable=False, comment="更新日時（JST）"
+        ),
+        sa.ForeignKeyConstraint(
+            ["animal_id"],
+            ["animals.id"],
+            name=op.f("fk_daily_care_statuses_animal_id_animals"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "log_date", "animal_id", name=op.f("pk_daily_care_statuses")
+        ),
+    )
+
+    # 既存の世話記録から記録状況を復元
+    op.execute(
+        """
+        INSERT INTO daily_care_statuses (log_date, animal_id, slots, updated_at)
+        SELECT
+            log_date,
+            animal_id,
+            MAX(CASE WHEN time_slot = 'morning' THEN 1 ELSE 0 END)
+            + MAX(CASE WHEN time_slot = 'noon' THEN 2 ELSE 0 END)
+            + MAX(CASE WHEN time_slot = 'evening' THEN 4 ELSE 0 END),
+            CURRENT_TIMESTAMP
+        FROM care_logs
+        GROUP BY log_date, animal_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop daily_care_statuses table."""
+    op.drop_table("daily_care_statuses")
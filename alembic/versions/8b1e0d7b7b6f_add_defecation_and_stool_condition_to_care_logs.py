@@ -23,13 +23,14 @@ def upgrade() -> None:
     """Add defecation + stool_condition with CHECK constraint."""
 
     # SQLiteではCHECK制約の追加等でALTERが制限されるため、バッチ操作を使用
+    # 真偽値は整数と比較しない（PostgreSQLでは boolean = integer が型エラーになる）
     with op.batch_alter_table("care_logs", schema=None) as batch_op:
         batch_op.add_column(
             sa.Column(
                 "defecation",
                 sa.Boolean(),
                 nullable=False,
-                server_default=sa.text("0"),
+                server_default=sa.false(),
                 comment="排便有無（True=有り、False=無し）",
             )
         )
@@ -43,8 +44,8 @@ def upgrade() -> None:
         )
         batch_op.create_check_constraint(
             op.f("ck_care_logs_defecation_stool_condition"),
-            "(defecation = 0 AND stool_condition IS NULL) "
-            "OR (defecation = 1 AND stool_condition IS NOT NULL AND stool_condition BETWEEN 1 AND 5)",
+            "(NOT defecation AND stool_condition IS NULL) "
+            "OR (defecation AND stool_condition IS NOT NULL AND stool_condition BETWEEN 1 AND 5)",
         )
 
 
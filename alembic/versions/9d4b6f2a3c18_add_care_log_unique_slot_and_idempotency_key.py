@@ -0,0 +1,105 @@
+"""add_care_log_unique_slot_and_idempotency_key
+
+Revision ID: 9d4b6f2a3c18
+Revises: 7c3d5e8a1b26
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+import logging
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4b6f2a3c18"
+down_revision: str | None = "7c3d5e8a1b26"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# 重複排除で削除した記録の退避先（ダウングレードでは復元しない）
+BACKUP_TABLE = "care_logs_dedup_backup"
+
+_DUPLICATE_ROWS = """
+    FROM care_logs
+    WHERE id NOT IN (
+        SELECT MAX(id)
+        FROM care_logs
+        GROUP BY animal_id, log_date, time_slot
+    )
+"""
+
+
+def _back_up_and_delete_duplicates() -> None:
+    """Copy duplicate slot rows into BACKUP_TABLE, then delete them."""
+    if context.is_offline_mode():
+        # SQLスクリプト出力時は件数を確認できないため、退避テーブルを常に作成
+        op.execute(f"CREATE TABLE {BACKUP_TABLE} AS SELECT * {_DUPLICATE_ROWS}")
+        op.execute(f"DELETE {_DUPLICATE_ROWS}")
+        return
+
+    bind = op.get_bind()
+    duplicates = bind.execute(
+        sa.text(f"SELECT COUNT(*) {_DUPLICATE_ROWS}")
+    ).scalar_one()
+    if not duplicates:
+        return
+    # ダウングレード後の再適用では既存の退避テーブルに追記する
+    if sa.inspect(bind).has_table(BACKUP_TABLE):
+        op.execute(f"INSERT INTO {BACKUP_TABLE} SELECT * {_DUPLICATE_ROWS}")
+    else:
+        op.execute(f"CREATE TABLE {BACKUP_TABLE} AS SELECT * {_DUPLICATE_ROWS}")
+    op.execute(f"DELETE {_DUPLICATE_ROWS}")
+    logger.warning(
+        "care_logs: removed %d duplicate (animal_id, log_date, time_slot) rows; "
+        "copies are kept in %s",
+        duplicates,
+        BACKUP_TABLE,
+    )
+
+
+def upgrade() -> None:
+    """Make (animal_id, log_date, time_slot) unique and add idempotency_key."""
+
+    # 再取り込み・オフライン同期の再送で重複した記録は、最後に登録されたものを残す
+    # （記録状況の時点ビットは同じ組の重複を除いても変わらない）。
+    # 削除する行はメモや内容が異なる場合もあるため、退避テーブルに複製してから削除する
+    _back_up_and_delete_duplicates()
+
+    # SQLiteでは制約の追加にALTERが使えないため、バッチ操作を使用
+    with op.batch_alter_table("care_logs", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "idempotency_key",
+                sa.String(length=64),
+                nullable=True,
+                comment="冪等キー（クライアントが登録リクエストごとに発行）",
+            )
+        )
+        batch_op.create_unique_constraint(
+            op.f("uq_care_logs_idempotency_key"), ["idempotency_key"]
+        )
+        batch_op.create_unique_constraint(
+            "uq_care_logs_animal_id_log_date_time_slot",
+            ["animal_id", "log_date", "time_slot"],
+        )
+
+
+def downgrade() -> None:
+    """Drop the unique slot constraint and idempotency_key.
+
+    Duplicate rows removed by the upgrade are NOT restored. They stay in
+    ``care_logs_dedup_backup`` for manual inspection, and that table is left
+    in place so a downgrade never discards them.
+    """
+
+    with op.batch_alter_table("care_logs", schema=None) as batch_op:
+        batch_op.drop_constraint(
+            "uq_care_logs_animal_id_log_date_time_slot", type_="unique"
+        )
+        batch_op.drop_constraint(op.f("uq_care_logs_idempotency_key"), type_="unique")
+        batch_op.drop_column("idempotency_key")
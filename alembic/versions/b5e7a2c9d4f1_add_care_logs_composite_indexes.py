@@ -0,0 +1,60 @@
+"""add_care_logs_composite_indexes
+
+Revision ID: b5e7a2c9d4f1
+Revises: 9d4b6f2a3c18
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5e7a2c9d4f1"
+down_revision: str | None = "9d4b6f2a3c18"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace single-column care_logs indexes with composite ones."""
+    op.create_index(
+        "ix_care_logs_animal_id_created_at",
+        "care_logs",
+        ["animal_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_care_logs_log_date_created_at",
+        "care_logs",
+        ["log_date", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_care_logs_recorder_id_created_at",
+        "care_logs",
+        ["recorder_id", "created_at"],
+        unique=False,
+    )
+
+    # 複合インデックス・一意制約の先頭列で代替できるため削除
+    op.drop_index("ix_care_logs_animal_id", table_name="care_logs")
+    op.drop_index("ix_care_logs_log_date", table_name="care_logs")
+    op.drop_index("ix_care_logs_recorder_id", table_name="care_logs")
+
+    # プランナーが新しいインデックスを選べるよう統計情報を更新
+    if op.get_bind().dialect.name == "sqlite":
+        op.execute("ANALYZE care_logs")
+
+
+def downgrade() -> None:
+    """Restore single-column care_logs indexes."""
+    op.create_index(
+        "ix_care_logs_recorder_id", "care_logs", ["recorder_id"], unique=False
+    )
+    op.create_index("ix_care_logs_log_date", "care_logs", ["log_date"], unique=False)
+    op.create_index("ix_care_logs_animal_id", "care_logs", ["animal_id"], unique=False)
+    op.drop_index("ix_care_logs_recorder_id_created_at", table_name="care_logs")
+    op.drop_index("ix_care_logs_log_date_created_at", table_name="care_logs")
+    op.drop_index("ix_care_logs_animal_id_created_at", table_name="care_logs")
@@ -0,0 +1,43 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: c8f1d3a6e2b7
+Revises: b5e7a2c9d4f1
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c8f1d3a6e2b7"
+down_revision: str | None = "b5e7a2c9d4f1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add indexes matching the keyset pagination order of list endpoints."""
+    op.create_index("ix_animals_created_at", "animals", ["created_at"], unique=False)
+    op.create_index(
+        "ix_medical_records_animal_id_date",
+        "medical_records",
+        ["animal_id", "date"],
+        unique=False,
+    )
+
+    # 複合インデックスの先頭列で代替できるため削除
+    op.drop_index("ix_medical_records_animal_id", table_name="medical_records")
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes."""
+    op.create_index(
+        "ix_medical_records_animal_id",
+        "medical_records",
+        ["animal_id"],
+        unique=False,
+    )
+    op.drop_index("ix_medical_records_animal_id_date", table_name="medical_records")
+    op.drop_index("ix_animals_created_at", table_name="animals")
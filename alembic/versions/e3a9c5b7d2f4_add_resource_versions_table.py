@@ -0,0 +1,44 @@
+"""add_resource_versions_table
+
+Revision ID: e3a9c5b7d2f4
+Revises: c8f1d3a6e2b7
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a9c5b7d2f4"
+down_revision: str | None = "c8f1d3a6e2b7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create resource_versions table shared by all worker processes for ETags."""
+    op.create_table(
+        "resource_versions",
+        sa.Column(
+            "resource", sa.String(length=30), nullable=False, comment="リソース種別"
+        ),
+        sa.Column(
+            "resource_key",
+            sa.Integer(),
+            nullable=False,
+            comment="猫IDなどのキー（テーブル全体は0）",
+        ),
+        sa.Column("version", sa.Integer(), nullable=False, comment="バージョン番号"),
+        sa.PrimaryKeyConstraint(
+            "resource", "resource_key", name=op.f("pk_resource_versions")
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop resource_versions table."""
+    op.drop_table("resource_versions")
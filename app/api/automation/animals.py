@@ -19,6 +19,8 @@ from app.models.animal import Animal
 from app.schemas.animal import AnimalCreate, AnimalResponse
 from app.schemas.animal_image import AnimalImageResponse
 from app.services import image_service
+from app.services.dashboard_service import invalidate_dashboard_stats
+from app.utils.http_cache import RESOURCE_ANIMALS, bump_resource_version
 
 logger = logging.getLogger(__name__)
 
@@ -107,8 +109,11 @@ def create_animal_automation(
         # 猫を作成（ステータス履歴は記録しない）
         animal = Animal(**animal_data.model_dump())
         db.add(animal)
+        db.flush()
+        bump_resource_version(db, RESOURCE_ANIMALS, animal.id)
         db.commit()
         db.refresh(animal)
+        invalidate_dashboard_stats()
 
         logger.info(
             f"Automation API: 猫を登録しました - "
@@ -10,14 +10,21 @@ Requirements: 5.1, 5.2, 5.3, 5.4, 5.5, 5.6
 from __future__ import annotations
 
 import logging
+from collections import Counter
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.animal import Animal
-from app.schemas.care_log import CareLogCreate, CareLogResponse
-from app.services.care_log_service import create_care_log
+from app.schemas.care_log import (
+    CARE_LOG_BATCH_MAX_ITEMS,
+    CareLogBatchCreate,
+    CareLogBatchResponse,
+    CareLogCreate,
+    CareLogResponse,
+)
+from app.services.care_log_service import create_care_log, create_care_logs_batch
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +49,9 @@ router = APIRouter()
     - recorder_name はリクエストから受け取る（例: "OCR自動取込"）
     - from_paper フラグをサポート
     - device_tag をサポート（例: "OCR-Import"）
+    - 同じ猫・日付・時点の記録が既にある場合は、その記録を更新します
+    - Idempotency-Key ヘッダー（または idempotency_key）が登録済みの場合は、
+      何もせずに既存の記録を返します
 
     **Requirements**: 5.1, 5.2, 5.3, 5.4, 5.5, 5.6
     """,
@@ -105,6 +115,9 @@ router = APIRouter()
 def create_care_log_automation(
     care_log_data: CareLogCreate,
     db: Session = Depends(get_db),
+    idempotency_key: str | None = Header(
+        None, alias="Idempotency-Key", min_length=1, max_length=64
+    ),
 ) -> CareLogResponse:
     """
     世話記録を登録（Automation API）
@@ -112,6 +125,7 @@ def create_care_log_automation(
     Args:
         care_log_data: 世話記録データ
         db: データベースセッション
+        idempotency_key: 冪等キー（Idempotency-Key ヘッダー、任意）
 
     Returns:
         CareLogResponse: 登録された世話記録
@@ -130,6 +144,9 @@ def create_care_log_automation(
             detail=f"ID {care_log_data.animal_id} の猫が見つかりません",
         )
 
+    if care_log_data.idempotency_key is None:
+        care_log_data.idempotency_key = idempotency_key
+
     # 世話記録を登録
     try:
         care_log = create_care_log(db, care_log_data)
@@ -174,3 +191,98 @@ def create_care_log_automation(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="世話記録の登録に失敗しました",
         ) from e
+
+
+@router.post(
+    "/care-logs/batch",
+    response_model=CareLogBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="世話記録を一括登録（Automation API）",
+    description=f"""
+    世話記録を一括登録します（Automation API専用）。
+
+    紙記録の取り込みなど、多数の記録をまとめて登録する場合に使用します。
+    1リクエストあたり最大{CARE_LOG_BATCH_MAX_ITEMS}件です。
+
+    **認証**: X-Automation-Key ヘッダーでAPI Keyを送信
+
+    **特徴**:
+    - 猫の存在確認は全行まとめて1回で行います
+    - 検証を通過した行は1つのトランザクションで登録します
+    - 同じ猫・日付・時点の記録が既にある行は更新し（updated）、
+      内容が同じ行や冪等キーが登録済みの行は何もしません（unchanged）
+    - 排便・便の状態の不整合や存在しない猫の行は登録せず、行ごとの結果で返します
+    - スキーマに合わない行（時点の誤り等）を含む場合はリクエスト全体が422になります
+    """,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "行ごとの登録結果",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "created": 1,
+                        "updated": 0,
+                        "unchanged": 0,
+                        "failed": 1,
+                        "results": [
+                            {
+                                "index": 0,
+                                "status": "created",
+                                "id": 178,
+                                "animal_id": 12,
+                                "detail": None,
+                            },
+                            {
+                                "index": 1,
+                                "status": "error",
+                                "id": None,
+                                "animal_id": 999,
+                                "detail": "ID 999 の猫が見つかりません",
+                            },
+                        ],
+                    }
+                }
+            },
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "サーバーエラーが発生しました",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "世話記録の一括登録に失敗しました"}
+                }
+            },
+        },
+    },
+)
+def create_care_logs_batch_automation(
+    batch: CareLogBatchCreate,
+    db: Session = Depends(get_db),
+) -> CareLogBatchResponse:
+    """
+    世話記録を一括登録（Automation API）
+
+    Args:
+        batch: 登録する世話記録の一覧
+        db: データベースセッション
+
+    Returns:
+        CareLogBatchResponse: 登録件数・エラー件数と行ごとの結果
+
+    Raises:
+        HTTPException: データベースエラーが発生した場合（500）
+    """
+    results = create_care_logs_batch(db, batch.items)
+    counts = Counter(result.status for result in results)
+
+    logger.info(
+        f"Automation API: 世話記録を一括登録しました - "
+        f"created={counts['created']}, updated={counts['updated']}, "
+        f"unchanged={counts['unchanged']}, failed={counts['error']}"
+    )
+    return CareLogBatchResponse(
+        created=counts["created"],
+        updated=counts["updated"],
+        unchanged=counts["unchanged"],
+        failed=counts["error"],
+        results=results,
+    )
@@ -12,11 +12,14 @@ from __future__ import annotations
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.services import pdf_service
+from app.schemas.pdf_job import PDFJobCreate, PDFJobResponse
+from app.services import pdf_job_service, pdf_service
 
 logger = logging.getLogger(__name__)
 
@@ -75,9 +78,19 @@ class QRCardGridRequest(BaseModel):
                 "application/json": {"example": {"detail": "PDF生成に失敗しました"}}
             },
         },
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "description": "PDF生成が混雑しています（Retry-After秒後に再試行）",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "PDF生成が混み合っています。しばらくしてから再度お試しください"
+                    }
+                }
+            },
+        },
     },
 )
-def generate_qr_card_automation(
+async def generate_qr_card_automation(
     request: QRCardRequest,
     db: Session = Depends(get_db),
 ) -> Response:
@@ -92,15 +105,17 @@ def generate_qr_card_automation(
         Response: 生成されたPDF（application/pdf）
 
     Raises:
-        HTTPException: 猫が見つからない場合（404）
+        HTTPException: 猫が見つからない場合（404）、PDF生成が混雑している場合（503）
     """
     try:
-        pdf_bytes = pdf_service.generate_qr_card_pdf(
+        job = await run_in_threadpool(
+            pdf_service.prepare_qr_card_pdf,
             db=db,
             animal_id=request.animal_id,
             base_url=request.base_url,
             locale=request.locale,
         )
+        pdf_bytes = await pdf_service.render_pdf_async(job)
 
         logger.info(
             f"Automation API: 単一QRカードPDFを生成しました - "
@@ -120,6 +135,8 @@ def generate_qr_card_automation(
             f"animal_id={request.animal_id}, error={e}"
         )
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             f"Automation API: QRカード生成失敗 - "
@@ -172,9 +189,19 @@ def generate_qr_card_automation(
                 "application/json": {"example": {"detail": "PDF生成に失敗しました"}}
             },
         },
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "description": "PDF生成が混雑しています（Retry-After秒後に再試行）",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "PDF生成が混み合っています。しばらくしてから再度お試しください"
+                    }
+                }
+            },
+        },
     },
 )
-def generate_qr_card_grid_automation(
+async def generate_qr_card_grid_automation(
     request: QRCardGridRequest,
     db: Session = Depends(get_db),
 ) -> Response:
@@ -189,14 +216,17 @@ def generate_qr_card_grid_automation(
         Response: 生成されたPDF（application/pdf）
 
     Raises:
-        HTTPException: 猫が見つからない場合（404）、またはIDが10個を超える場合（400）
+        HTTPException: 猫が見つからない場合（404）、IDが10個を超える場合（400）、
+            またはPDF生成が混雑している場合（503）
     """
     try:
-        pdf_bytes = pdf_service.generate_qr_card_grid_pdf(
+        job = await run_in_threadpool(
+            pdf_service.prepare_qr_card_grid_pdf,
             db=db,
             animal_ids=request.animal_ids,
             base_url=request.base_url,
         )
+        pdf_bytes = await pdf_service.render_pdf_async(job)
 
         logger.info(
             f"Automation API: QRカードPDFを生成しました - "
@@ -222,6 +252,8 @@ def generate_qr_card_grid_automation(
             f"animal_ids={request.animal_ids}, error={e}"
         )
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             f"Automation API: QRカード生成失敗 - "
@@ -231,3 +263,121 @@ def generate_qr_card_grid_automation(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="PDF生成に失敗しました",
         ) from e
+
+
+@router.post(
+    "/pdf/jobs",
+    response_model=PDFJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="PDF生成ジョブを投入（Automation API）",
+    description="""
+    PDF生成ジョブを投入します（Automation API専用）。
+
+    時間のかかるPDF生成をバックグラウンドで処理するため、
+    MCPなどのクライアントがHTTPタイムアウトを気にせずにPDFを取得できます。
+    面付けQRカード（qr_card_grid）は件数制限がなく、10枚ごとにA4を1ページ追加します。
+
+    1. このエンドポイントでジョブを投入し、ジョブIDを受け取る
+    2. `GET /pdf/jobs/{job_id}` で状態が `completed` になるまで待つ
+    3. `GET /pdf/jobs/{job_id}/download` でPDFをダウンロード
+
+    **認証**: X-Automation-Key ヘッダーでAPI Keyを送信
+    """,
+    responses={
+        status.HTTP_202_ACCEPTED: {"description": "ジョブを受け付けました"},
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "リクエストデータが不正です",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "不正な帳票種別です: yearly"}
+                }
+            },
+        },
+    },
+)
+def submit_pdf_job_automation(
+    job_data: PDFJobCreate,
+    db: Session = Depends(get_db),
+) -> PDFJobResponse:
+    """
+    PDF生成ジョブを投入（Automation API）
+
+    Args:
+        job_data: ジョブ投入データ
+        db: データベースセッション
+
+    Returns:
+        PDFJobResponse: 投入されたジョブ
+
+    Raises:
+        HTTPException: 帳票種別が不正な場合（400）
+    """
+    job = pdf_job_service.submit_pdf_job(db, job_data)
+    logger.info(f"Automation API: PDF生成ジョブを投入しました - id={job.id}")
+    return PDFJobResponse.model_validate(job)
+
+
+@router.get(
+    "/pdf/jobs/{job_id}",
+    response_model=PDFJobResponse,
+    summary="PDF生成ジョブの状態を取得（Automation API）",
+    responses={
+        status.HTTP_404_NOT_FOUND: {"description": "ジョブが存在しません"},
+    },
+)
+def get_pdf_job_automation(
+    job_id: str,
+    db: Session = Depends(get_db),
+) -> PDFJobResponse:
+    """
+    PDF生成ジョブの状態を取得（Automation API）
+
+    Args:
+        job_id: ジョブID
+        db: データベースセッション
+
+    Returns:
+        PDFJobResponse: ジョブの状態
+
+    Raises:
+        HTTPException: ジョブが存在しない場合（404）
+    """
+    job = pdf_job_service.get_pdf_job(db, job_id)
+    return PDFJobResponse.model_validate(job)
+
+
+@router.get(
+    "/pdf/jobs/{job_id}/download",
+    summary="PDF生成ジョブのPDFをダウンロード（Automation API）",
+    responses={
+        status.HTTP_200_OK: {
+            "description": "生成されたPDF",
+            "content": {"application/pdf": {"example": "PDF binary data"}},
+        },
+        status.HTTP_404_NOT_FOUND: {"description": "ジョブが存在しません"},
+        status.HTTP_409_CONFLICT: {"description": "ジョブが完了していません"},
+    },
+)
+def download_pdf_job_automation(
+    job_id: str,
+    db: Session = Depends(get_db),
+) -> FileResponse:
+    """
+    完了したPDF生成ジョブのPDFをダウンロード（Automation API）
+
+    Args:
+        job_id: ジョブID
+        db: データベースセッション
+
+    Returns:
+        FileResponse: 生成されたPDF（application/pdf）
+
+    Raises:
+        HTTPException: ジョブが存在しない場合（404）、未完了の場合（409）
+    """
+    job, result_path = pdf_job_service.get_pdf_job_result(db, job_id)
+    return FileResponse(
+        result_path,
+        media_type="application/pdf",
+        filename=f"{job.kind}_{job.id}.pdf",
+    )
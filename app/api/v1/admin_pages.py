@@ -20,9 +20,9 @@ from starlette.responses import Response
 from app.auth.dependencies import (
     get_current_user_optional,
 )
+from app.auth.user_cache import UserPrincipal
 from app.config import get_settings
 from app.database import get_db
-from app.models.user import User
 
 router = APIRouter(prefix="/admin", tags=["admin-pages"])
 
@@ -37,7 +37,7 @@ settings = get_settings()
 @router.get("/login", response_class=HTMLResponse)
 def login_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     ログインページを表示
@@ -68,7 +68,7 @@ def login_page(
 @router.get("", response_class=HTMLResponse)
 def dashboard_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     ダッシュボードページを表示（認証必須）
@@ -100,7 +100,7 @@ def dashboard_page(
 @router.get("/animals", response_class=HTMLResponse)
 def animals_list_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     猫一覧ページを表示（認証必須）
@@ -130,7 +130,7 @@ def animals_list_page(
 @router.get("/animals/new", response_class=HTMLResponse)
 def animal_new_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     猫新規登録ページを表示（認証必須）
@@ -160,7 +160,7 @@ def animal_new_page(
 def animal_detail_page(
     request: Request,
     animal_id: int,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
     db: Session = Depends(get_db),
 ) -> Response:
     """
@@ -209,7 +209,7 @@ def animal_detail_page(
 def animal_edit_page(
     request: Request,
     animal_id: int,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     猫編集ページを表示
@@ -243,7 +243,7 @@ def animal_edit_page(
 @router.get("/care-logs", response_class=HTMLResponse)
 def care_logs_list_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     世話記録一覧ページを表示
@@ -272,7 +272,7 @@ def care_logs_list_page(
 @router.get("/care-logs/new", response_class=HTMLResponse)
 def care_log_new_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     世話記録新規登録ページを表示
@@ -301,7 +301,7 @@ def care_log_new_page(
 def care_log_detail_page(
     request: Request,
     care_log_id: int,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     世話記録詳細ページを表示
@@ -336,7 +336,7 @@ def care_log_detail_page(
 def care_log_edit_page(
     request: Request,
     care_log_id: int,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     世話記録編集ページを表示
@@ -370,7 +370,7 @@ def care_log_edit_page(
 @router.get("/volunteers", response_class=HTMLResponse)
 def volunteers_list_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     ボランティア一覧ページを表示
@@ -399,7 +399,7 @@ def volunteers_list_page(
 @router.get("/volunteers/new", response_class=HTMLResponse)
 def volunteer_new_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """ボランティア新規作成ページ"""
     if not current_user:
@@ -415,7 +415,7 @@ def volunteer_new_page(
 def volunteer_edit_page(
     request: Request,
     volunteer_id: int,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """ボランティア編集ページ"""
     if not current_user:
@@ -436,7 +436,7 @@ def volunteer_edit_page(
 def volunteer_detail_page(
     request: Request,
     volunteer_id: int,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """ボランティア詳細ページ"""
     if not current_user:
@@ -456,7 +456,7 @@ def volunteer_detail_page(
 @router.get("/medical-records", response_class=HTMLResponse)
 def medical_records_list_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     診療記録一覧ページを表示
@@ -485,7 +485,7 @@ def medical_records_list_page(
 @router.get("/medical-records/new", response_class=HTMLResponse)
 def medical_record_new_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     診療記録新規登録ページを表示
@@ -514,7 +514,7 @@ def medical_record_new_page(
 def medical_record_detail_page(
     request: Request,
     record_id: int,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     診療記録詳細ページを表示
@@ -549,7 +549,7 @@ def medical_record_detail_page(
 def medical_record_edit_page(
     request: Request,
     record_id: int,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     診療記録修正ページを表示
@@ -583,7 +583,7 @@ def medical_record_edit_page(
 @router.get("/medical-actions", response_class=HTMLResponse)
 def medical_actions_list_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     診療行為マスター一覧ページを表示
@@ -612,7 +612,7 @@ def medical_actions_list_page(
 @router.get("/adoptions/applicants", response_class=HTMLResponse)
 def adoptions_applicants_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     里親希望者一覧ページを表示
@@ -641,7 +641,7 @@ def adoptions_applicants_page(
 @router.get("/adoptions/records", response_class=HTMLResponse)
 def adoptions_records_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     譲渡記録一覧ページを表示
@@ -670,7 +670,7 @@ def adoptions_records_page(
 @router.get("/reports", response_class=HTMLResponse)
 def reports_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     帳票出力ページを表示
@@ -699,7 +699,7 @@ def reports_page(
 @router.get("/reports/care", response_class=HTMLResponse)
 def care_reports_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """世話記録帳票ページを表示（認証必須）"""
     if not current_user:
@@ -714,7 +714,7 @@ def care_reports_page(
 @router.get("/reports/medical", response_class=HTMLResponse)
 def medical_reports_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """診療記録帳票ページを表示（認証必須）"""
     if not current_user:
@@ -729,7 +729,7 @@ def medical_reports_page(
 @router.get("/settings", response_class=HTMLResponse)
 def settings_page(
     request: Request,
-    current_user: User | None = Depends(get_current_user_optional),
+    current_user: UserPrincipal | None = Depends(get_current_user_optional),
 ) -> Response:
     """
     設定ページを表示
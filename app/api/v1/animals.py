@@ -6,20 +6,18 @@
 
 from __future__ import annotations
 
-from io import BytesIO
 from typing import Annotated
 
-import qrcode  # type: ignore[import-untyped]
-from fastapi import APIRouter, Depends, Query, UploadFile, status
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
 from fastapi.responses import Response
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_current_active_user
 from app.auth.permissions import require_permission
+from app.auth.user_cache import UserPrincipal
 from app.config import get_settings
 from app.database import get_db
 from app.models.animal import Animal
-from app.models.user import User
 from app.schemas.animal import (
     AnimalCreate,
     AnimalListResponse,
@@ -27,6 +25,9 @@ from app.schemas.animal import (
     AnimalUpdate,
 )
 from app.services import animal_service
+from app.utils.http_cache import RESOURCE_ANIMALS, bump_resource_version
+from app.utils.pdf_cache import invalidate_animal_pdfs
+from app.utils.qr_code import generate_animal_qr_code_bytes
 
 router = APIRouter(prefix="/animals", tags=["猫管理"])
 
@@ -34,16 +35,20 @@ router = APIRouter(prefix="/animals", tags=["猫管理"])
 @router.get("", response_model=AnimalListResponse)
 def list_animals(
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
     page: int = Query(1, ge=1, description="ページ番号"),
     page_size: int = Query(20, ge=1, le=100, description="1ページあたりの件数"),
     status: str | None = Query(None, description="ステータスフィルター"),
+    cursor: str | None = Query(
+        None, description="直前のページの next_cursor（指定時はカーソル方式）"
+    ),
 ) -> AnimalListResponse:
     """
     猫一覧を取得
 
     ページネーション付きで猫の一覧を取得します。
     ステータスでフィルタリングすることも可能です。
+    cursor を指定すると、ページの深さによらず一定の速度で次のページを取得します。
 
     Args:
         db: データベースセッション
@@ -51,12 +56,13 @@ def list_animals(
         page: ページ番号（1から開始）
         page_size: 1ページあたりの件数（最大100）
         status: ステータスフィルター（保護中、譲渡可能、譲渡済み等）
+        cursor: 直前のページの next_cursor（指定時は page を無視）
 
     Returns:
         AnimalListResponse: 猫一覧とページネーション情報
     """
     return animal_service.list_animals(
-        db=db, page=page, page_size=page_size, status_filter=status
+        db=db, page=page, page_size=page_size, status_filter=status, cursor=cursor
     )
 
 
@@ -64,7 +70,7 @@ def list_animals(
 def create_animal(
     animal_data: AnimalCreate,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("animal:write"))],
+    current_user: Annotated[UserPrincipal, Depends(require_permission("animal:write"))],
 ) -> Animal:
     """
     猫を登録
@@ -88,10 +94,13 @@ def create_animal(
 @router.get("/search", response_model=AnimalListResponse)
 def search_animals(
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
     q: str = Query(..., min_length=1, description="検索クエリ"),
     page: int = Query(1, ge=1, description="ページ番号"),
     page_size: int = Query(20, ge=1, le=100, description="1ページあたりの件数"),
+    cursor: str | None = Query(
+        None, description="直前のページの next_cursor（指定時はカーソル方式）"
+    ),
 ) -> AnimalListResponse:
     """
     猫を検索
@@ -104,18 +113,21 @@ def search_animals(
         q: 検索クエリ（最低1文字）
         page: ページ番号（1から開始）
         page_size: 1ページあたりの件数（最大100）
+        cursor: 直前のページの next_cursor（指定時は page を無視）
 
     Returns:
         AnimalListResponse: 検索結果とページネーション情報
     """
-    return animal_service.search_animals(db=db, query=q, page=page, page_size=page_size)
+    return animal_service.search_animals(
+        db=db, query=q, page=page, page_size=page_size, cursor=cursor
+    )
 
 
 @router.get("/{animal_id}", response_model=AnimalResponse)
 def get_animal(
     animal_id: int,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
 ) -> Animal:
     """
     猫の詳細を取得
@@ -141,7 +153,7 @@ def update_animal(
     animal_id: int,
     animal_data: AnimalUpdate,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("animal:write"))],
+    current_user: Annotated[UserPrincipal, Depends(require_permission("animal:write"))],
 ) -> Animal:
     """
     猫情報を更新
@@ -170,7 +182,9 @@ def update_animal(
 def delete_animal(  # type: ignore[no-untyped-def]
     animal_id: int,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("animal:delete"))],
+    current_user: Annotated[
+        UserPrincipal, Depends(require_permission("animal:delete"))
+    ],
 ):
     """
     猫を削除
@@ -223,35 +237,17 @@ def get_animal_qr_code(
         settings.base_url if hasattr(settings, "base_url") else "http://localhost:8000"
     )
 
-    # 世話記録入力画面のURL
-    care_log_url = f"{base_url}/public/care?animal_id={animal.id}"
-
-    # QRコード生成
-    qr = qrcode.QRCode(
-        version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_L,
-        box_size=10,
-        border=4,
-    )
-    qr.add_data(care_log_url)
-    qr.make(fit=True)
-
-    # 画像生成
-    img = qr.make_image(fill_color="black", back_color="white")
+    # 世話記録入力画面へのQRコード（生成結果はキャッシュされる）
+    qr_code_bytes = generate_animal_qr_code_bytes(base_url, animal.id)
 
-    # BytesIOに保存
-    img_io = BytesIO()
-    img.save(img_io, "PNG")
-    img_io.seek(0)
-
-    return Response(content=img_io.getvalue(), media_type="image/png")
+    return Response(content=qr_code_bytes, media_type="image/png")
 
 
 @router.get("/{animal_id}/display-image")
 def get_animal_display_image(
     animal_id: int,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
 ) -> dict[str, str]:
     """
     猫の表示用画像パスを取得
@@ -278,7 +274,7 @@ def upload_profile_image(
     animal_id: int,
     file: UploadFile,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
 ) -> dict[str, str]:
     """
     プロフィール画像をアップロード
@@ -297,21 +293,22 @@ def upload_profile_image(
     """
     from app.services import image_service
 
-    # 画像をアップロード（画像ギャラリーに追加）
-    image = image_service.upload_image(
+    # 画像をアップロード（画像ギャラリーに追加し、プロフィール画像として設定）
+    image_service.upload_image(
         db=db,
         animal_id=animal_id,
         file=file,
         taken_at=None,
         description="プロフィール画像",
+        set_as_profile=True,
     )
 
-    # プロフィール画像として設定
     animal = animal_service.get_animal(db, animal_id)
-    animal.photo = f"/media/{image.image_path}"
-    db.commit()
-    db.refresh(animal)
-
+    if animal.photo is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="プロフィール画像の設定に失敗しました",
+        )
     return {"image_path": animal.photo}
 
 
@@ -320,7 +317,7 @@ def update_profile_image(
     animal_id: int,
     file: UploadFile,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
 ) -> dict[str, str]:
     """
     プロフィール画像を変更
@@ -339,21 +336,22 @@ def update_profile_image(
     """
     from app.services import image_service
 
-    # 画像をアップロード（画像ギャラリーに追加）
-    image = image_service.upload_image(
+    # 画像をアップロード（画像ギャラリーに追加し、プロフィール画像として設定）
+    image_service.upload_image(
         db=db,
         animal_id=animal_id,
         file=file,
         taken_at=None,
         description="プロフィール画像",
+        set_as_profile=True,
     )
 
-    # プロフィール画像として設定
     animal = animal_service.get_animal(db, animal_id)
-    animal.photo = f"/media/{image.image_path}"
-    db.commit()
-    db.refresh(animal)
-
+    if animal.photo is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="プロフィール画像の設定に失敗しました",
+        )
     return {"image_path": animal.photo}
 
 
@@ -362,7 +360,7 @@ def set_profile_image_from_gallery(
     animal_id: int,
     image_id: int,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
 ) -> dict[str, str]:
     """
     画像ギャラリーからプロフィール画像を選択
@@ -386,17 +384,17 @@ def set_profile_image_from_gallery(
 
     # 画像が指定された猫のものか確認
     if image.animal_id != animal_id:
-        from fastapi import HTTPException
-
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="指定された画像は別の猫のものです",
         )
 
-    # プロフィール画像として設定
+    # プロフィール画像として設定（大サイズの派生画像、生成前は元画像）
     animal = animal_service.get_animal(db, animal_id)
-    animal.photo = f"/media/{image.image_path}"
+    animal.photo = image_service.profile_photo_path(f"/media/{image.image_path}")
+    bump_resource_version(db, RESOURCE_ANIMALS, animal_id)
     db.commit()
     db.refresh(animal)
+    invalidate_animal_pdfs(animal_id)
 
     return {"image_path": animal.photo}
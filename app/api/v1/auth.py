@@ -13,13 +13,14 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
-from app.auth.dependencies import get_current_active_user
-from app.auth.jwt import create_access_token
+from app.auth.dependencies import get_current_active_user, get_request_token
+from app.auth.jwt import create_access_token, get_token_user_id
 from app.auth.password import verify_password
+from app.auth.user_cache import UserPrincipal, invalidate_user_principal
 from app.database import get_db
 from app.models.user import User
 from app.schemas.auth import Token, UserResponse
@@ -91,6 +92,8 @@ def login_for_access_token(
                 user.locked_until = datetime.now() + timedelta(minutes=15)
 
             db.commit()
+            # ロック状態をキャッシュ済みのセッションにも反映
+            invalidate_user_principal(user.id)
 
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -115,6 +118,7 @@ def login_for_access_token(
     # ログイン成功：失敗回数をリセット
     user.reset_failed_login()
     db.commit()
+    invalidate_user_principal(user.id)
 
     # JWTアクセストークンを生成
     access_token = create_access_token(data={"user_id": user.id, "role": user.role})
@@ -139,8 +143,8 @@ def login_for_access_token(
 
 @router.get("/me", response_model=UserResponse, status_code=status.HTTP_200_OK)
 def read_users_me(
-    current_user: Annotated[User, Depends(get_current_active_user)],
-) -> User:
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
+) -> UserPrincipal:
     """
     現在のユーザー情報を取得
 
@@ -189,15 +193,21 @@ def read_users_me(
 
 
 @router.post("/logout", status_code=status.HTTP_200_OK)
-def logout(response: Response) -> dict[str, str]:
+def logout(request: Request, response: Response) -> dict[str, str]:
     """
     ログアウト
 
     HTTPOnly Cookieを削除してログアウトします。
+    認証済みユーザーのキャッシュも破棄します。
 
     Returns:
         dict: ログアウト成功メッセージ
     """
+    token = get_request_token(request)
+    user_id = get_token_user_id(token) if token else None
+    if user_id is not None:
+        invalidate_user_principal(user_id)
+
     # Cookieを削除
     response.delete_cookie(key="access_token")
 
@@ -9,14 +9,15 @@ from __future__ import annotations
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_current_active_user
 from app.auth.permissions import require_permission
-from app.database import get_db
+from app.auth.user_cache import UserPrincipal
+from app.database import get_db, get_read_db
 from app.models.care_log import CareLog
-from app.models.user import User
 from app.schemas.care_log import (
     CareLogCreate,
     CareLogListResponse,
@@ -31,19 +32,23 @@ router = APIRouter(prefix="/care-logs", tags=["世話記録"])
 @router.get("", response_model=CareLogListResponse)
 def list_care_logs(
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
     page: int = Query(1, ge=1, description="ページ番号"),
     page_size: int = Query(20, ge=1, le=100, description="1ページあたりの件数"),
     animal_id: int | None = Query(None, description="猫IDフィルター"),
     start_date: date | None = Query(None, description="開始日フィルター"),
     end_date: date | None = Query(None, description="終了日フィルター"),
     time_slot: str | None = Query(None, description="時点フィルター"),
+    cursor: str | None = Query(
+        None, description="直前のページの next_cursor（指定時はカーソル方式）"
+    ),
 ) -> CareLogListResponse:
     """
     世話記録一覧を取得
 
     ページネーション付きで世話記録の一覧を取得します。
     猫ID、日付範囲、時点でフィルタリングすることも可能です。
+    cursor を指定すると、ページの深さによらず一定の速度で次のページを取得します。
 
     Args:
         db: データベースセッション
@@ -54,6 +59,7 @@ def list_care_logs(
         start_date: 開始日フィルター
         end_date: 終了日フィルター
         time_slot: 時点フィルター（morning/noon/evening）
+        cursor: 直前のページの next_cursor（指定時は page を無視）
 
     Returns:
         CareLogListResponse: 世話記録一覧とページネーション情報
@@ -66,6 +72,7 @@ def list_care_logs(
         start_date=start_date,
         end_date=end_date,
         time_slot=time_slot,
+        cursor=cursor,
     )
 
 
@@ -73,7 +80,7 @@ def list_care_logs(
 def create_care_log(
     care_log_data: CareLogCreate,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
 ) -> CareLog:
     """
     世話記録を登録
@@ -95,7 +102,7 @@ def create_care_log(
 @router.get("/daily-view", response_model=dict)
 def get_daily_view(
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
     animal_id: int | None = Query(None, description="猫IDフィルター"),
     start_date: date | None = Query(None, description="開始日（デフォルト: 7日前）"),
     end_date: date | None = Query(None, description="終了日（デフォルト: 今日）"),
@@ -139,7 +146,7 @@ def get_daily_view(
 def get_latest_care_log(
     animal_id: int,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
 ) -> CareLog | None:
     """
     最新の世話記録を取得
@@ -158,35 +165,33 @@ def get_latest_care_log(
     return care_log_service.get_latest_care_log(db=db, animal_id=animal_id)
 
 
-@router.get("/export", response_class=Response)
+@router.get("/export", response_class=StreamingResponse)
 def export_care_logs(
-    db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("csv:export"))],
+    db: Annotated[Session, Depends(get_read_db)],
+    current_user: Annotated[UserPrincipal, Depends(require_permission("csv:export"))],
     animal_id: int | None = Query(None, description="猫IDフィルター"),
     start_date: date | None = Query(None, description="開始日フィルター"),
     end_date: date | None = Query(None, description="終了日フィルター"),
-) -> Response:
+) -> StreamingResponse:
     """
     世話記録をCSVエクスポート
 
     世話記録をCSV形式でエクスポートします。
 
     Args:
-        db: データベースセッション
+        db: データベースセッション（読み取り専用）
         current_user: 現在のユーザー（csv:export権限が必要）
         animal_id: 猫IDフィルター
         start_date: 開始日フィルター
         end_date: 終了日フィルター
 
     Returns:
-        Response: CSV形式の世話記録データ
+        StreamingResponse: CSV形式の世話記録データ（チャンク単位で送信）
     """
-    csv_content = care_log_service.export_care_logs_csv(
-        db=db, animal_id=animal_id, start_date=start_date, end_date=end_date
-    )
-
-    return Response(
-        content=csv_content,
+    return StreamingResponse(
+        care_log_service.stream_care_logs_csv(
+            db=db, animal_id=animal_id, start_date=start_date, end_date=end_date
+        ),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=care_logs.csv"},
     )
@@ -196,7 +201,7 @@ def export_care_logs(
 def get_care_log(
     care_log_id: int,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
 ) -> CareLogResponse:
     """
     世話記録の詳細を取得
@@ -222,7 +227,7 @@ def update_care_log(
     care_log_id: int,
     care_log_data: CareLogUpdate,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("care:write"))],
+    current_user: Annotated[UserPrincipal, Depends(require_permission("care:write"))],
 ) -> CareLogResponse:
     """
     世話記録を更新
@@ -8,20 +8,16 @@ Requirements: Requirement 16.1-16.4
 
 from __future__ import annotations
 
-from datetime import date
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_current_active_user
+from app.auth.user_cache import UserPrincipal
 from app.database import get_db
-from app.models.animal import Animal
-from app.models.care_log import CareLog
-from app.models.user import User
-from app.models.volunteer import Volunteer
+from app.services import dashboard_service
 
 router = APIRouter(prefix="/dashboard", tags=["ダッシュボード"])
 
@@ -35,18 +31,23 @@ class DashboardStats(BaseModel):
     active_volunteers_count: int = Field(..., description="アクティブボランティア数")
     total_animals: int = Field(..., description="総猫数")
     treatment_count: int = Field(..., description="治療中の猫数")
+    status_counts: dict[str, int] = Field(
+        default_factory=dict, description="ステータス別の猫数"
+    )
 
 
 @router.get("/stats", response_model=DashboardStats)
 def get_dashboard_stats(
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
 ) -> DashboardStats:
     """
     ダッシュボード統計情報を取得
 
     保護中の猫数、譲渡可能な猫数、今日の記録数、
     アクティブボランティア数などの統計情報を返します。
+    ステータス別の猫数は status_counts にすべてのステータス分を含みます。
+    集計結果は短時間キャッシュされ、猫・世話記録の更新時に破棄されます。
 
     Args:
         db: データベースセッション
@@ -58,39 +59,14 @@ def get_dashboard_stats(
     Example:
         GET /api/v1/dashboard/stats
     """
-    # 猫の統計
-    total_animals = db.query(func.count(Animal.id)).scalar() or 0
-
-    protected_count = (
-        db.query(func.count(Animal.id)).filter(Animal.status == "保護中").scalar() or 0
-    )
-
-    adoptable_count = (
-        db.query(func.count(Animal.id)).filter(Animal.status == "譲渡可能").scalar()
-        or 0
-    )
-
-    treatment_count = (
-        db.query(func.count(Animal.id)).filter(Animal.status == "治療中").scalar() or 0
-    )
-
-    # 今日の記録数
-    today = date.today()
-    today_logs_count = (
-        db.query(func.count(CareLog.id)).filter(CareLog.log_date == today).scalar() or 0
-    )
-
-    # アクティブボランティア数
-    active_volunteers_count = (
-        db.query(func.count(Volunteer.id)).filter(Volunteer.status == "active").scalar()
-        or 0
-    )
+    stats = dashboard_service.get_dashboard_stats(db)
 
     return DashboardStats(
-        protected_count=protected_count,
-        adoptable_count=adoptable_count,
-        today_logs_count=today_logs_count,
-        active_volunteers_count=active_volunteers_count,
-        total_animals=total_animals,
-        treatment_count=treatment_count,
+        protected_count=stats.count_for("保護中"),
+        adoptable_count=stats.count_for("譲渡可能"),
+        today_logs_count=stats.today_logs_count,
+        active_volunteers_count=stats.active_volunteers_count,
+        total_animals=stats.total_animals,
+        treatment_count=stats.count_for("治療中"),
+        status_counts=dict(stats.status_counts),
     )
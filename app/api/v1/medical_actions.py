@@ -14,9 +14,9 @@ from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_current_active_user
 from app.auth.permissions import require_permission
+from app.auth.user_cache import UserPrincipal
 from app.database import get_db
 from app.models.medical_action import MedicalAction
-from app.models.user import User
 from app.schemas.medical_action import (
     BillingCalculation,
     MedicalActionCreate,
@@ -32,7 +32,7 @@ router = APIRouter(prefix="/medical-actions", tags=["診療行為マスター"])
 @router.get("", response_model=MedicalActionListResponse)
 def list_medical_actions(
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 20,
     valid_on: Annotated[date | None, Query()] = None,
@@ -67,7 +67,9 @@ def list_medical_actions(
 def create_medical_action(
     medical_action_data: MedicalActionCreate,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("medical:write"))],
+    current_user: Annotated[
+        UserPrincipal, Depends(require_permission("medical:write"))
+    ],
 ) -> MedicalAction:
     """
     診療行為マスターを登録
@@ -91,7 +93,7 @@ def create_medical_action(
 def get_medical_action(
     medical_action_id: int,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
 ) -> MedicalAction:
     """
     診療行為マスターの詳細を取得
@@ -117,7 +119,9 @@ def update_medical_action(
     medical_action_id: int,
     medical_action_data: MedicalActionUpdate,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("medical:write"))],
+    current_user: Annotated[
+        UserPrincipal, Depends(require_permission("medical:write"))
+    ],
 ) -> MedicalAction:
     """
     診療行為マスターを更新
@@ -146,7 +150,7 @@ def update_medical_action(
 def calculate_billing(
     medical_action_id: int,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
     dosage: Annotated[int, Query(ge=1)] = 1,
 ) -> BillingCalculation:
     """
@@ -174,7 +178,7 @@ def calculate_billing(
 @router.get("/active/list", response_model=list[MedicalActionResponse])
 def get_active_medical_actions(
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
     target_date: Annotated[date | None, Query()] = None,
 ) -> list[MedicalAction]:
     """
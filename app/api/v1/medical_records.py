@@ -14,9 +14,9 @@ from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_current_active_user
 from app.auth.permissions import require_permission
+from app.auth.user_cache import UserPrincipal
 from app.database import get_db
 from app.models.medical_record import MedicalRecord
-from app.models.user import User
 from app.schemas.medical_record import (
     MedicalRecordCreate,
     MedicalRecordListResponse,
@@ -31,18 +31,20 @@ router = APIRouter(prefix="/medical-records", tags=["診療記録"])
 @router.get("", response_model=MedicalRecordListResponse)
 def list_medical_records(
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 20,
     animal_id: Annotated[int | None, Query()] = None,
     vet_id: Annotated[int | None, Query()] = None,
     start_date: Annotated[date | None, Query()] = None,
     end_date: Annotated[date | None, Query()] = None,
+    cursor: Annotated[str | None, Query()] = None,
 ) -> MedicalRecordListResponse:
     """
     診療記録一覧を取得
 
     時系列で降順に表示します。
+    cursor を指定すると、ページの深さによらず一定の速度で次のページを取得します。
 
     Args:
         db: データベースセッション
@@ -53,6 +55,7 @@ def list_medical_records(
         vet_id: 獣医師IDフィルター（任意）
         start_date: 開始日フィルター（任意）
         end_date: 終了日フィルター（任意）
+        cursor: 直前のページの next_cursor（任意、指定時は page を無視）
 
     Returns:
         MedicalRecordListResponse: 診療記録一覧とページネーション情報
@@ -65,6 +68,7 @@ def list_medical_records(
         vet_id=vet_id,
         start_date=start_date,
         end_date=end_date,
+        cursor=cursor,
     )
 
 
@@ -74,7 +78,9 @@ def list_medical_records(
 def create_medical_record(
     medical_record_data: MedicalRecordCreate,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("medical:write"))],
+    current_user: Annotated[
+        UserPrincipal, Depends(require_permission("medical:write"))
+    ],
 ) -> MedicalRecord:
     """
     診療記録を登録
@@ -98,7 +104,7 @@ def create_medical_record(
 def get_medical_record(
     medical_record_id: int,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
 ) -> MedicalRecordResponse:
     """
     診療記録の詳細を取得
@@ -124,7 +130,9 @@ def update_medical_record(
     medical_record_id: int,
     medical_record_data: MedicalRecordUpdate,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("medical:write"))],
+    current_user: Annotated[
+        UserPrincipal, Depends(require_permission("medical:write"))
+    ],
 ) -> MedicalRecordResponse:
     """
     診療記録を更新
@@ -12,14 +12,17 @@ from datetime import date
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
-from app.auth.permissions import require_permission
+from app.auth.permissions import has_permission, require_permission
+from app.auth.user_cache import UserPrincipal
 from app.config import settings
-from app.database import get_db
-from app.models.user import User
-from app.services import pdf_service
+from app.database import get_db, get_read_db
+from app.schemas.pdf_job import PDFJobCreate, PDFJobResponse
+from app.services import pdf_job_service, pdf_service
 
 router = APIRouter(prefix="/pdf", tags=["PDF生成"])
 
@@ -72,10 +75,10 @@ class ReportRequest(BaseModel):
 
 
 @router.post("/qr-card")
-def generate_qr_card(
+async def generate_qr_card(
     request: QRCardRequest,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("animal:read"))],
+    current_user: Annotated[UserPrincipal, Depends(require_permission("animal:read"))],
 ) -> Response:
     """
     QRカードPDFを生成（A6サイズ）
@@ -92,15 +95,17 @@ def generate_qr_card(
         Response: 生成されたPDF（application/pdf）
 
     Raises:
-        HTTPException: 猫が見つからない場合（404）
+        HTTPException: 猫が見つからない場合（404）、PDF生成が混雑している場合（503）
     """
     try:
-        pdf_bytes = pdf_service.generate_qr_card_pdf(
+        job = await run_in_threadpool(
+            pdf_service.prepare_qr_card_pdf,
             db=db,
             animal_id=request.animal_id,
             base_url=request.base_url,
             locale=request.locale,
         )
+        pdf_bytes = await pdf_service.render_pdf_async(job)
 
         filename = (
             f"necro_tag_{request.animal_id}.pdf"
@@ -117,10 +122,10 @@ def generate_qr_card(
 
 
 @router.post("/qr-card-grid")
-def generate_qr_card_grid(
+async def generate_qr_card_grid(
     request: QRCardGridRequest,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("animal:read"))],
+    current_user: Annotated[UserPrincipal, Depends(require_permission("animal:read"))],
 ) -> Response:
     """
     面付けQRカードPDFを生成（A4サイズ、2×5枚）
@@ -137,15 +142,18 @@ def generate_qr_card_grid(
         Response: 生成されたPDF（application/pdf）
 
     Raises:
-        HTTPException: 猫が見つからない場合（404）、またはIDが10個を超える場合（400）
+        HTTPException: 猫が見つからない場合（404）、IDが10個を超える場合（400）、
+            またはPDF生成が混雑している場合（503）
     """
     try:
-        pdf_bytes = pdf_service.generate_qr_card_grid_pdf(
+        job = await run_in_threadpool(
+            pdf_service.prepare_qr_card_grid_pdf,
             db=db,
             animal_ids=request.animal_ids,
             base_url=request.base_url,
             locale=request.locale,
         )
+        pdf_bytes = await pdf_service.render_pdf_async(job)
 
         filename = (
             "necro_tags_grid.pdf" if settings.kiroween_mode else "qr_card_grid.pdf"
@@ -164,10 +172,10 @@ def generate_qr_card_grid(
 
 
 @router.post("/paper-form")
-def generate_paper_form(
+async def generate_paper_form(
     request: PaperFormRequest,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("animal:read"))],
+    current_user: Annotated[UserPrincipal, Depends(require_permission("animal:read"))],
 ) -> Response:
     """
     紙記録フォームPDFを生成（A4サイズ、1ヶ月分）
@@ -184,15 +192,17 @@ def generate_paper_form(
         Response: 生成されたPDF（application/pdf）
 
     Raises:
-        HTTPException: 猫が見つからない場合（404）
+        HTTPException: 猫が見つからない場合（404）、PDF生成が混雑している場合（503）
     """
     try:
-        pdf_bytes = pdf_service.generate_paper_form_pdf(
+        job = await run_in_threadpool(
+            pdf_service.prepare_paper_form_pdf,
             db=db,
             animal_id=request.animal_id,
             year=request.year,
             month=request.month,
         )
+        pdf_bytes = await pdf_service.render_pdf_async(job)
 
         return Response(
             content=pdf_bytes,
@@ -209,7 +219,7 @@ def generate_paper_form(
 def generate_medical_detail(
     request: MedicalDetailRequest,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("medical:read"))],
+    current_user: Annotated[UserPrincipal, Depends(require_permission("medical:read"))],
 ) -> Response:
     """
     診療明細PDFを生成（A4縦サイズ）
@@ -250,10 +260,10 @@ def generate_medical_detail(
 
 
 @router.post("/report")
-def generate_report(
+async def generate_report(
     request: ReportRequest,
-    db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("report:read"))],
+    db: Annotated[Session, Depends(get_read_db)],
+    current_user: Annotated[UserPrincipal, Depends(require_permission("report:read"))],
 ) -> Response:
     """
     帳票PDFを生成（日報・週報・月次集計）
@@ -263,17 +273,19 @@ def generate_report(
 
     Args:
         request: 帳票生成リクエスト
-        db: データベースセッション
+        db: データベースセッション（読み取り専用）
         current_user: 現在のユーザー（report:read権限が必要）
 
     Returns:
         Response: 生成されたPDF（application/pdf）
 
     Raises:
-        HTTPException: 不正な帳票種別の場合（400）、または未実装の場合（501）
+        HTTPException: 不正な帳票種別の場合（400）、未実装の場合（501）、
+            またはPDF生成が混雑している場合（503）
     """
     try:
-        pdf_bytes = pdf_service.generate_report_pdf(
+        job = await run_in_threadpool(
+            pdf_service.prepare_report_pdf,
             db=db,
             report_type=request.report_type,
             start_date=request.start_date,
@@ -281,6 +293,7 @@ def generate_report(
             animal_id=request.animal_id,
             locale=request.locale,
         )
+        pdf_bytes = await pdf_service.render_pdf_async(job)
 
         return Response(
             content=pdf_bytes,
@@ -293,3 +306,90 @@ def generate_report(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
         ) from e
+
+
+@router.post(
+    "/jobs", response_model=PDFJobResponse, status_code=status.HTTP_202_ACCEPTED
+)
+def submit_pdf_job(
+    job_data: PDFJobCreate,
+    db: Annotated[Session, Depends(get_db)],
+    current_user: Annotated[UserPrincipal, Depends(require_permission("animal:read"))],
+) -> PDFJobResponse:
+    """
+    PDF生成ジョブを投入
+
+    時間のかかるPDF生成をバックグラウンドで処理します。
+    面付けQRカード（qr_card_grid）は件数制限がなく、10枚ごとにA4を1ページ追加します。
+    返却されたジョブIDで状態を確認し、完了後にダウンロードしてください。
+
+    Args:
+        job_data: ジョブ投入データ
+        db: データベースセッション
+        current_user: 現在のユーザー（animal:read権限、帳票はreport:read権限も必要）
+
+    Returns:
+        PDFJobResponse: 投入されたジョブ
+
+    Raises:
+        HTTPException: 帳票の権限がない場合（403）、帳票種別が不正な場合（400）
+    """
+    if job_data.kind == "report" and not has_permission(current_user, "report:read"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="この操作には 'report:read' 権限が必要です",
+        )
+    job = pdf_job_service.submit_pdf_job(db, job_data, current_user.id)
+    return PDFJobResponse.model_validate(job)
+
+
+@router.get("/jobs/{job_id}", response_model=PDFJobResponse)
+def get_pdf_job(
+    job_id: str,
+    db: Annotated[Session, Depends(get_db)],
+    current_user: Annotated[UserPrincipal, Depends(require_permission("animal:read"))],
+) -> PDFJobResponse:
+    """
+    PDF生成ジョブの状態を取得
+
+    Args:
+        job_id: ジョブID
+        db: データベースセッション
+        current_user: 現在のユーザー（animal:read権限が必要）
+
+    Returns:
+        PDFJobResponse: ジョブの状態
+
+    Raises:
+        HTTPException: ジョブが存在しない場合（404）
+    """
+    job = pdf_job_service.get_pdf_job(db, job_id)
+    return PDFJobResponse.model_validate(job)
+
+
+@router.get("/jobs/{job_id}/download")
+def download_pdf_job(
+    job_id: str,
+    db: Annotated[Session, Depends(get_db)],
+    current_user: Annotated[UserPrincipal, Depends(require_permission("animal:read"))],
+) -> FileResponse:
+    """
+    完了したPDF生成ジョブのPDFをダウンロード
+
+    Args:
+        job_id: ジョブID
+        db: データベースセッション
+        current_user: 現在のユーザー（animal:read権限が必要）
+
+    Returns:
+        FileResponse: 生成されたPDF（application/pdf）
+
+    Raises:
+        HTTPException: ジョブが存在しない場合（404）、未完了の場合（409）
+    """
+    job, result_path = pdf_job_service.get_pdf_job_result(db, job_id)
+    return FileResponse(
+        result_path,
+        media_type="application/pdf",
+        filename=f"{job.kind}_{job.id}.pdf",
+    )
@@ -11,10 +11,21 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.config import get_settings
+from app.database import get_db, open_streaming_session
 from app.models.animal import Animal
 from app.models.care_log import CareLog
 from app.schemas.care_log import (
@@ -27,10 +38,31 @@ from app.schemas.care_log import (
     CareLogUpdate,
 )
 from app.schemas.volunteer import VolunteerResponse
-from app.services import care_log_service, volunteer_service
+from app.services import care_log_service, care_status_service, volunteer_service
+from app.services.care_log_events import (
+    care_log_event_broker,
+    stream_care_log_events,
+)
+from app.utils.http_cache import (
+    RESOURCE_ANIMALS,
+    RESOURCE_CARE_LOGS,
+    RESOURCE_VOLUNTEERS,
+    conditional_response,
+    get_resource_version,
+    make_weak_etag,
+)
+from app.utils.image_pipeline import resolve_image_variant
+from app.utils.timezone import get_jst_date
+
+settings = get_settings()
 
 router = APIRouter(prefix="/public", tags=["Public API（認証不要）"])
 
+# 猫の基本情報は変更頻度が低いため短時間はそのまま再利用させる
+ANIMAL_INFO_CACHE_CONTROL = "public, max-age=60"
+# 記録状況は頻繁に変わるため毎回ETagで再検証させる
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
 
 @router.put("/care-logs/animal/{animal_id}/{log_id}", response_model=CareLogResponse)
 def update_care_log_public(
@@ -89,30 +121,41 @@ def update_care_log_public(
     )
 
 
-@router.get("/animals/{animal_id}")
+@router.get("/animals/{animal_id}", response_model=dict[str, int | str | None])
 def get_animal_info(
     animal_id: int,
+    request: Request,
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
-) -> dict[str, int | str | None]:
+) -> dict[str, int | str | None] | Response:
     """
     猫の基本情報を取得（認証不要）
 
     Publicフォームで猫の名前と顔写真を表示するために使用します。
+    If-None-Match がETagと一致する場合は猫の存在とバージョン番号の確認のみで304を返します。
 
     Args:
         animal_id: 猫のID
+        request: HTTPリクエスト（If-None-Match取得用）
+        response: HTTPレスポンス（ETag設定用）
         db: データベースセッション
 
     Returns:
-        dict: 猫の基本情報（id, name, photo）
+        dict: 猫の基本情報（id, name, photo, photo_thumbnail）
 
     Raises:
         HTTPException: 猫が見つからない場合（404）
 
     Example:
         GET /api/v1/public/animals/123
-        Response: {"id": 123, "name": "たま", "photo": "tama.jpg"}
+        Response: {
+            "id": 123,
+            "name": "たま",
+            "photo": "tama.jpg",
+            "photo_thumbnail": "tama_thumb.jpg",
+        }
     """
+    # 存在しない猫IDに304を返さないよう、ETagの照合より先に存在を確認する
     animal = db.query(Animal).filter(Animal.id == animal_id).first()
 
     if not animal:
@@ -121,23 +164,38 @@ def get_animal_info(
             detail=f"猫ID {animal_id} が見つかりません",
         )
 
+    etag = make_weak_etag(
+        "animal", animal_id, get_resource_version(db, RESOURCE_ANIMALS, animal_id)
+    )
+    not_modified = conditional_response(
+        request, response, etag, ANIMAL_INFO_CACHE_CONTROL
+    )
+    if not_modified is not None:
+        return not_modified
+
     return {
         "id": animal.id,
         "name": animal.name,
         "photo": animal.photo,
+        "photo_thumbnail": resolve_image_variant(animal.photo, "thumb"),
     }
 
 
 @router.get("/volunteers", response_model=list[VolunteerResponse])
 def get_active_volunteers(
+    request: Request,
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
-) -> list[VolunteerResponse]:
+) -> list[VolunteerResponse] | Response:
     """
     アクティブなボランティア一覧を取得（認証不要）
 
     Publicフォームのボランティア選択リストで使用します。
+    If-None-Match がETagと一致する場合はバージョン番号の確認のみで304を返します。
 
     Args:
+        request: HTTPリクエスト（If-None-Match取得用）
+        response: HTTPレスポンス（ETag設定用）
         db: データベースセッション
 
     Returns:
@@ -147,6 +205,13 @@ def get_active_volunteers(
         GET /api/v1/public/volunteers
         Response: [{"id": 1, "name": "田中太郎", ...}, ...]
     """
+    etag = make_weak_etag("volunteers", get_resource_version(db, RESOURCE_VOLUNTEERS))
+    not_modified = conditional_response(
+        request, response, etag, REVALIDATE_CACHE_CONTROL
+    )
+    if not_modified is not None:
+        return not_modified
+
     volunteers = volunteer_service.get_active_volunteers(db=db)
     return [VolunteerResponse.model_validate(volunteer) for volunteer in volunteers]
 
@@ -158,17 +223,24 @@ def create_care_log_public(
     care_log_data: CareLogCreate,
     request: Request,
     db: Annotated[Session, Depends(get_db)],
+    idempotency_key: Annotated[
+        str | None,
+        Header(alias="Idempotency-Key", min_length=1, max_length=64),
+    ] = None,
 ) -> CareLog:
     """
     世話記録を登録（認証不要）
 
     Publicフォームから世話記録を登録します。
     IPアドレス、User-Agent、デバイスタグを自動記録します。
+    同じ猫・日付・時点の記録が既にある場合は更新します。
+    オフライン同期の再送は Idempotency-Key ヘッダーで検知し、既存の記録を返します。
 
     Args:
         care_log_data: 世話記録データ
         request: HTTPリクエスト（IPアドレス、User-Agent取得用）
         db: データベースセッション
+        idempotency_key: 冪等キー（Idempotency-Key ヘッダー、任意）
 
     Returns:
         CareLogResponse: 登録された世話記録
@@ -200,6 +272,8 @@ def create_care_log_public(
     # IPアドレスとUser-Agentを取得して設定
     care_log_data.ip_address = request.client.host if request.client else None
     care_log_data.user_agent = request.headers.get("user-agent")
+    if care_log_data.idempotency_key is None:
+        care_log_data.idempotency_key = idempotency_key
 
     # 世話記録を作成
     care_log = care_log_service.create_care_log(
@@ -249,16 +323,21 @@ def get_latest_care_log(
 @router.get("/care-logs/animal/{animal_id}", response_model=AnimalCareLogListResponse)
 def get_animal_care_logs(
     animal_id: int,
+    request: Request,
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
-) -> AnimalCareLogListResponse:
+) -> AnimalCareLogListResponse | Response:
     """
     個別猫の記録一覧を取得（認証不要）
 
     指定された猫の直近7日間の世話記録一覧と、当日の記録状況を返します。
     ボランティアが記録状況を確認するために使用します。
+    If-None-Match がETagと一致する場合は猫の存在とバージョン番号の確認のみで304を返します。
 
     Args:
         animal_id: 猫のID
+        request: HTTPリクエスト（If-None-Match取得用）
+        response: HTTPレスポンス（ETag設定用）
         db: データベースセッション
 
     Returns:
@@ -292,7 +371,7 @@ def get_animal_care_logs(
     """
     from datetime import date, timedelta
 
-    # 猫の存在確認
+    # 猫の存在確認（存在しない猫IDに304を返さないよう、ETagの照合より先に行う）
     animal = db.query(Animal).filter(Animal.id == animal_id).first()
     if not animal:
         raise HTTPException(
@@ -300,8 +379,22 @@ def get_animal_care_logs(
             detail=f"猫ID {animal_id} が見つかりません",
         )
 
-    # 直近7日間の記録を取得
+    # 猫情報・世話記録・日付のいずれかが変わるとETagが変わる
     today = date.today()
+    etag = make_weak_etag(
+        "animal-care-logs",
+        animal_id,
+        get_resource_version(db, RESOURCE_ANIMALS, animal_id),
+        get_resource_version(db, RESOURCE_CARE_LOGS, animal_id),
+        today,
+    )
+    not_modified = conditional_response(
+        request, response, etag, REVALIDATE_CACHE_CONTROL
+    )
+    if not_modified is not None:
+        return not_modified
+
+    # 直近7日間の記録を取得
     seven_days_ago = today - timedelta(days=7)
 
     recent_logs = (
@@ -398,15 +491,22 @@ def get_care_log_detail(
 
 @router.get("/care-logs/status/today", response_model=AllAnimalsStatusResponse)
 def get_all_animals_status_today(
+    request: Request,
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
-) -> AllAnimalsStatusResponse:
+) -> AllAnimalsStatusResponse | Response:
     """
     全猫の当日記録状況一覧を取得（認証不要）
 
     全猫の当日の朝・昼・夕の記録状況を返します。
     ボランティアが記録漏れを確認するために使用します。
+    世話記録の登録・更新時に増分更新される記録状況を1回のクエリで読み取ります。
+    当日はJSTで判定するため、JSTの0時に新しい日の状況に切り替わります。
+    If-None-Match がETagと一致する場合はバージョン番号の確認のみで304を返します。
 
     Args:
+        request: HTTPリクエスト（If-None-Match取得用）
+        response: HTTPレスポンス（ETag設定用）
         db: データベースセッション
 
     Returns:
@@ -429,38 +529,95 @@ def get_all_animals_status_today(
             ]
         }
     """
-    from datetime import date
-
-    today = date.today()
-
-    # 保護中・治療中・譲渡可能な猫のみを取得
-    animals = (
-        db.query(Animal)
-        .filter(Animal.status.in_(["保護中", "治療中", "譲渡可能"]))
-        .order_by(Animal.name)
-        .all()
+    # 猫情報・世話記録・日付のいずれかが変わるとETagが変わる
+    today = get_jst_date()
+    etag = make_weak_etag(
+        "status-today",
+        get_resource_version(db, RESOURCE_ANIMALS),
+        get_resource_version(db, RESOURCE_CARE_LOGS),
+        today,
     )
-
-    # 当日の全記録を取得
-    today_logs = db.query(CareLog).filter(CareLog.log_date == today).all()
-
-    # 猫ごとの記録状況を集計
-    animal_statuses: list[AnimalStatusSummary] = []
-    for animal in animals:
-        animal_logs = [log for log in today_logs if log.animal_id == animal.id]
-
-        animal_statuses.append(
-            AnimalStatusSummary(
-                animal_id=animal.id,
-                animal_name=animal.name or "名前なし",
-                animal_photo=animal.photo,
-                morning_recorded=any(log.time_slot == "morning" for log in animal_logs),
-                noon_recorded=any(log.time_slot == "noon" for log in animal_logs),
-                evening_recorded=any(log.time_slot == "evening" for log in animal_logs),
-            )
+    not_modified = conditional_response(
+        request, response, etag, REVALIDATE_CACHE_CONTROL
+    )
+    if not_modified is not None:
+        return not_modified
+
+    # 保護中・治療中・譲渡可能な猫と当日の記録状況を1回で取得
+    today, board = care_status_service.get_care_status_board(db, today)
+
+    animal_statuses = [
+        AnimalStatusSummary(
+            animal_id=row.animal_id,
+            animal_name=row.animal_name or "名前なし",
+            animal_photo=row.animal_photo,
+            morning_recorded=row.is_recorded("morning"),
+            noon_recorded=row.is_recorded("noon"),
+            evening_recorded=row.is_recorded("evening"),
         )
+        for row in board
+    ]
 
     return AllAnimalsStatusResponse(
         target_date=today,
         animals=animal_statuses,
     )
+
+
+@router.get("/care-logs/events", response_class=StreamingResponse)
+async def stream_care_log_events_public(
+    request: Request,
+    db: Annotated[Session, Depends(get_db)],
+    animal_id: Annotated[
+        int | None, Query(description="絞り込む猫ID（省略時は全猫）")
+    ] = None,
+) -> StreamingResponse:
+    """
+    世話記録の登録・更新イベントを配信（認証不要、Server-Sent Events）
+
+    全猫の記録状況一覧や記録一覧の画面が、ポーリングせずに更新を検知するために使用します。
+    イベントには世話記録ID・猫ID・記録日・時点のみを含むため、
+    受信後に該当の一覧APIを再取得してください（ETagにより差分がなければ304）。
+
+    - created / updated: 世話記録が登録・更新された
+    - resync: 未送信のイベントが溢れた、または他のワーカープロセスで更新があったため、
+      一覧を再取得する必要がある（他のプロセスでの更新はハートビートの間隔ごとに確認）
+    - 一定間隔でハートビート（コメント行）を送信
+
+    Args:
+        request: HTTPリクエスト（切断検知用）
+        db: データベースセッション（バージョン番号の確認先の取得に使用）
+        animal_id: 絞り込む猫ID（省略時は全猫）
+
+    Returns:
+        StreamingResponse: text/event-stream
+
+    Raises:
+        HTTPException: 同時接続数が上限に達している場合（503）
+
+    Example:
+        GET /api/v1/public/care-logs/events?animal_id=123
+        event: created
+        data: {"type": "created", "log_id": 456, "animal_id": 123, ...}
+    """
+    # 購読はストリームの開始時に行う（送出前に切断された場合に購読を残さない）
+    if care_log_event_broker.is_full:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="接続数が上限に達しています。しばらくしてから再接続してください",
+        )
+
+    def get_version() -> int:
+        with open_streaming_session(db) as session:
+            return get_resource_version(session, RESOURCE_CARE_LOGS, animal_id)
+
+    return StreamingResponse(
+        stream_care_log_events(
+            animal_id,
+            request.is_disconnected,
+            settings.care_log_events_heartbeat_seconds,
+            get_version,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
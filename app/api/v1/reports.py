@@ -11,13 +11,14 @@ from __future__ import annotations
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from app.auth.permissions import require_permission
-from app.database import get_db
-from app.models.user import User
+from app.auth.user_cache import UserPrincipal
+from app.database import get_read_db
 from app.services import csv_service, excel_service
 
 router = APIRouter(prefix="/reports", tags=["帳票出力"])
@@ -39,9 +40,9 @@ class ReportExportRequest(BaseModel):
 @router.post("/export")
 def export_report(
     request: ReportExportRequest,
-    db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("report:read"))],
-) -> Response:
+    db: Annotated[Session, Depends(get_read_db)],
+    current_user: Annotated[UserPrincipal, Depends(require_permission("report:read"))],
+) -> StreamingResponse:
     """
     帳票をエクスポート（CSV/Excel）
 
@@ -49,19 +50,19 @@ def export_report(
 
     Args:
         request: 帳票エクスポートリクエスト
-        db: データベースセッション
+        db: データベースセッション（読み取り専用）
         current_user: 現在のユーザー（report:read権限が必要）
 
     Returns:
-        Response: 生成されたCSVまたはExcel
+        StreamingResponse: 生成されたCSVまたはExcel（チャンク単位で送信）
 
     Raises:
         HTTPException: 不正な帳票種別の場合（400）、または未実装の場合（501）
     """
     try:
         if request.format == "csv":
-            # CSV出力
-            csv_data = csv_service.generate_report_csv(
+            # CSV出力（チャンク単位でストリーミング、BOMはチャンク先頭に含まれる）
+            csv_chunks = csv_service.stream_report_csv(
                 db=db,
                 report_type=request.report_type,
                 start_date=request.start_date,
@@ -70,16 +71,16 @@ def export_report(
                 locale=request.locale,
             )
 
-            return Response(
-                content=csv_data.encode("utf-8-sig"),
+            return StreamingResponse(
+                csv_chunks,
                 media_type="text/csv; charset=utf-8-sig",
                 headers={
                     "Content-Disposition": f"attachment; filename=report_{request.report_type}_{request.start_date}_{request.end_date}.csv"
                 },
             )
         elif request.format == "excel":
-            # Excel出力
-            excel_data = excel_service.generate_report_excel(
+            # Excel出力（書き込み専用モードで一時ファイルに生成し、チャンク単位で返送）
+            excel_chunks = excel_service.stream_report_excel(
                 db=db,
                 report_type=request.report_type,
                 start_date=request.start_date,
@@ -88,8 +89,8 @@ def export_report(
                 locale=request.locale,
             )
 
-            return Response(
-                content=excel_data,
+            return StreamingResponse(
+                excel_chunks,
                 media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 headers={
                     "Content-Disposition": f"attachment; filename=report_{request.report_type}_{request.start_date}_{request.end_date}.xlsx"
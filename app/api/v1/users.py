@@ -10,8 +10,8 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_current_active_user
+from app.auth.user_cache import UserPrincipal
 from app.database import get_db
-from app.models.user import User
 from app.schemas.user import UserListResponse
 from app.services import user_service
 
@@ -25,7 +25,7 @@ def list_users(
     role: str | None = Query(None, description="ロールフィルター（admin, vet, staff）"),
     is_active: bool | None = Query(None, description="アクティブ状態フィルター"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserPrincipal = Depends(get_current_active_user),
 ) -> UserListResponse:
     """
     ユーザー一覧を取得
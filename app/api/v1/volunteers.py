@@ -13,8 +13,8 @@ from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_current_active_user
 from app.auth.permissions import require_permission
+from app.auth.user_cache import UserPrincipal
 from app.database import get_db
-from app.models.user import User
 from app.models.volunteer import Volunteer
 from app.schemas.volunteer import (
     VolunteerCreate,
@@ -30,7 +30,7 @@ router = APIRouter(prefix="/volunteers", tags=["ボランティア管理"])
 @router.get("", response_model=VolunteerListResponse)
 def list_volunteers(
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
     page: int = Query(1, ge=1, description="ページ番号"),
     page_size: int = Query(20, ge=1, le=100, description="1ページあたりの件数"),
     status: str | None = Query(
@@ -62,7 +62,9 @@ def list_volunteers(
 def create_volunteer(
     volunteer_data: VolunteerCreate,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("volunteer:write"))],
+    current_user: Annotated[
+        UserPrincipal, Depends(require_permission("volunteer:write"))
+    ],
 ) -> Volunteer:
     """
     ボランティアを登録
@@ -84,7 +86,7 @@ def create_volunteer(
 def get_volunteer(
     volunteer_id: int,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
 ) -> Volunteer:
     """
     ボランティア詳細を取得
@@ -107,7 +109,9 @@ def update_volunteer(
     volunteer_id: int,
     volunteer_data: VolunteerUpdate,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(require_permission("volunteer:write"))],
+    current_user: Annotated[
+        UserPrincipal, Depends(require_permission("volunteer:write"))
+    ],
 ) -> Volunteer:
     """
     ボランティア情報を更新
@@ -132,7 +136,7 @@ def update_volunteer(
 def get_activity_history(
     volunteer_id: int,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
 ) -> dict[str, int | str | None]:
     """
     ボランティアの活動履歴を取得
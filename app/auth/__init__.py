@@ -11,13 +11,21 @@ from app.auth.dependencies import (
 )
 from app.auth.jwt import create_access_token, decode_access_token
 from app.auth.password import hash_password, validate_password_policy, verify_password
-from app.auth.permissions import has_permission, require_permission, require_role
+from app.auth.permissions import (
+    granted_permissions,
+    has_permission,
+    require_permission,
+    require_role,
+)
+from app.auth.user_cache import UserPrincipal
 
 __all__ = [
+    "UserPrincipal",
     "create_access_token",
     "decode_access_token",
     "get_current_active_user",
     "get_current_user",
+    "granted_permissions",
     "has_permission",
     "hash_password",
     "oauth2_scheme",
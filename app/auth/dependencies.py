@@ -8,6 +8,9 @@ Context7参照: /fastapi/fastapi
 - get_current_user依存性（トークンからユーザー取得）
 - get_current_user_optional依存性（オプショナル認証）
 - get_current_active_user依存性（アクティブユーザーのみ）
+
+ユーザーはリクエストごとにデータベースから取得せず、app.auth.user_cache の
+キャッシュから認証済みユーザー（UserPrincipal）として取得します。
 """
 
 from __future__ import annotations
@@ -20,29 +23,56 @@ from jwt.exceptions import InvalidTokenError
 from sqlalchemy.orm import Session
 
 from app.auth.jwt import decode_access_token
+from app.auth.user_cache import UserPrincipal, get_user_principal
 from app.database import get_db
-from app.models.user import User
 
 # OAuth2スキーム設定
 # tokenUrl: トークン取得エンドポイントのパス
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
 
+def get_request_token(request: Request) -> str | None:
+    """
+    CookieまたはAuthorizationヘッダーからアクセストークンを取得
+
+    Args:
+        request: FastAPIリクエストオブジェクト
+
+    Returns:
+        str | None: アクセストークン（"Bearer "プレフィックスなし）。ない場合はNone
+    """
+    # 1. Cookieからトークンを取得（HTMLページ用）
+    cookie_token = request.cookies.get("access_token")
+    if cookie_token:
+        # "Bearer "プレフィックスを削除
+        if cookie_token.startswith("Bearer "):
+            return cookie_token[7:]
+        return cookie_token
+
+    # 2. Authorizationヘッダーからトークンを取得（API用、後方互換性）
+    authorization = request.headers.get("authorization")
+    if authorization:
+        scheme, _, header_token = authorization.partition(" ")
+        if scheme.lower() == "bearer" and header_token:
+            return header_token
+    return None
+
+
 def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Annotated[Session, Depends(get_db)],
-) -> User:
+) -> UserPrincipal:
     """
     現在のユーザーを取得
 
-    JWTトークンを検証し、対応するユーザーをデータベースから取得します。
+    JWTトークンを検証し、対応するユーザーを取得します（キャッシュがなければデータベースから）。
 
     Args:
         token: JWTアクセストークン（OAuth2PasswordBearerから自動取得）
         db: データベースセッション
 
     Returns:
-        User: 認証されたユーザー
+        UserPrincipal: 認証されたユーザー
 
     Raises:
         HTTPException: トークンが無効、またはユーザーが見つからない場合
@@ -70,8 +100,8 @@ def get_current_user(
     except InvalidTokenError as e:
         raise credentials_exception from e
 
-    # データベースからユーザーを取得
-    user = db.query(User).filter(User.id == user_id).first()
+    # ユーザーを取得
+    user = get_user_principal(db, user_id)
 
     if user is None:
         raise credentials_exception
@@ -81,7 +111,7 @@ def get_current_user(
 
 def get_current_user_optional(
     request: Request, db: Annotated[Session, Depends(get_db)]
-) -> User | None:
+) -> UserPrincipal | None:
     """
     オプショナル認証（未認証でもエラーにしない）
 
@@ -96,13 +126,13 @@ def get_current_user_optional(
         db: データベースセッション
 
     Returns:
-        User | None: 認証済みユーザー、または未認証の場合はNone
+        UserPrincipal | None: 認証済みユーザー、または未認証の場合はNone
 
     Example:
         @router.get("/login")
         async def login_page(
             request: Request,
-            current_user: User | None = Depends(get_current_user_optional)
+            current_user: UserPrincipal | None = Depends(get_current_user_optional)
         ):
             if current_user:
                 return RedirectResponse(url="/admin")
@@ -111,26 +141,7 @@ def get_current_user_optional(
             )
     """
     try:
-        token = None
-
-        # 1. Cookieからトークンを取得（HTMLページ用）
-        cookie_token = request.cookies.get("access_token")
-        if cookie_token:
-            # "Bearer "プレフィックスを削除
-            if cookie_token.startswith("Bearer "):
-                token = cookie_token[7:]
-            else:
-                token = cookie_token
-
-        # 2. Authorizationヘッダーからトークンを取得（API用、後方互換性）
-        if not token:
-            authorization = request.headers.get("authorization")
-            if authorization:
-                # "Bearer "プレフィックスを削除
-                scheme, _, header_token = authorization.partition(" ")
-                if scheme.lower() == "bearer":
-                    token = header_token
-
+        token = get_request_token(request)
         if not token:
             return None
 
@@ -147,9 +158,8 @@ def get_current_user_optional(
         except ValueError:
             return None
 
-        # データベースからユーザーを取得
-        user = db.query(User).filter(User.id == user_id).first()
-        return user
+        # ユーザーを取得
+        return get_user_principal(db, user_id)
 
     except (InvalidTokenError, HTTPException):
         return None
@@ -157,7 +167,7 @@ def get_current_user_optional(
 
 def get_current_user_from_cookie_or_header(
     request: Request, db: Annotated[Session, Depends(get_db)]
-) -> User:
+) -> UserPrincipal:
     """
     CookieまたはAuthorizationヘッダーから認証情報を取得
 
@@ -169,7 +179,7 @@ def get_current_user_from_cookie_or_header(
         db: データベースセッション
 
     Returns:
-        User: 認証されたユーザー
+        UserPrincipal: 認証されたユーザー
 
     Raises:
         HTTPException: 認証に失敗した場合
@@ -181,24 +191,7 @@ def get_current_user_from_cookie_or_header(
     )
 
     try:
-        token = None
-
-        # 1. Cookieからトークンを取得（HTMLページ用）
-        cookie_token = request.cookies.get("access_token")
-        if cookie_token:
-            if cookie_token.startswith("Bearer "):
-                token = cookie_token[7:]
-            else:
-                token = cookie_token
-
-        # 2. Authorizationヘッダーからトークンを取得（API用、後方互換性）
-        if not token:
-            authorization = request.headers.get("authorization")
-            if authorization:
-                scheme, _, header_token = authorization.partition(" ")
-                if scheme.lower() == "bearer":
-                    token = header_token
-
+        token = get_request_token(request)
         if not token:
             raise credentials_exception
 
@@ -215,8 +208,8 @@ def get_current_user_from_cookie_or_header(
         except ValueError as e:
             raise credentials_exception from e
 
-        # データベースからユーザーを取得
-        user = db.query(User).filter(User.id == user_id).first()
+        # ユーザーを取得
+        user = get_user_principal(db, user_id)
 
         if user is None:
             raise credentials_exception
@@ -228,8 +221,10 @@ def get_current_user_from_cookie_or_header(
 
 
 def get_current_active_user(
-    current_user: Annotated[User, Depends(get_current_user_from_cookie_or_header)],
-) -> User:
+    current_user: Annotated[
+        UserPrincipal, Depends(get_current_user_from_cookie_or_header)
+    ],
+) -> UserPrincipal:
     """
     現在のアクティブユーザーを取得
 
@@ -239,7 +234,7 @@ def get_current_active_user(
         current_user: 認証されたユーザー
 
     Returns:
-        User: アクティブなユーザー
+        UserPrincipal: アクティブなユーザー
 
     Raises:
         HTTPException: ユーザーが非アクティブまたはロックされている場合
@@ -3,14 +3,22 @@
 
 ロールベースのアクセス制御（RBAC）を実装します。
 
+権限マトリクスはインポート時にロールごとの frozenset へコンパイルし、
+リクエストごとのチェックはハッシュ参照のみで行います。
+"medical:*" のような階層ワイルドカードもコンパイル時に名前空間として展開します。
+
 Requirements: Requirement 10.1-10.5
 """
 
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import cache
 from typing import Annotated, Any
 
 from fastapi import Depends, HTTPException, status
 
 from app.auth.dependencies import get_current_active_user
+from app.auth.user_cache import UserPrincipal
 from app.models.user import User
 
 # ロール別権限マトリクス
@@ -21,9 +29,7 @@ PERMISSIONS = {
         "animal:write",
         "care:read",
         "care:write",
-        "medical:read",
-        "medical:write",
-        "medical:delete",
+        "medical:*",
         "report:read",
         "volunteer:read",
     ],
@@ -51,7 +57,71 @@ PERMISSIONS = {
 }
 
 
-def has_permission(user: User, permission: str) -> bool:
+@dataclass(frozen=True)
+class RolePermissions:
+    """
+    コンパイル済みのロールの権限
+
+    Attributes:
+        exact: 個別に付与された権限（例: "animal:read"）
+        namespaces: ワイルドカードで付与された名前空間（"medical:*" なら "medical"）
+        all: 全権限（"*"）
+    """
+
+    exact: frozenset[str]
+    namespaces: frozenset[str]
+    all: bool = False
+
+    def allows(self, permission: str) -> bool:
+        """
+        権限を持っているかチェック
+
+        "medical:record:read" は "medical:*" と "medical:record:*" のどちらでも許可されます。
+        """
+        if self.all or permission in self.exact:
+            return True
+        index = permission.find(":")
+        while index != -1:
+            if permission[:index] in self.namespaces:
+                return True
+            index = permission.find(":", index + 1)
+        return False
+
+
+def compile_permissions(
+    matrix: Mapping[str, Iterable[str]],
+) -> dict[str, RolePermissions]:
+    """
+    権限マトリクスをロールごとのコンパイル済み権限に変換
+
+    Args:
+        matrix: ロール別権限マトリクス（PERMISSIONS と同じ形式）
+
+    Returns:
+        dict[str, RolePermissions]: ロール名 → コンパイル済みの権限
+    """
+    compiled = {}
+    for role, permissions in matrix.items():
+        exact: set[str] = set()
+        namespaces: set[str] = set()
+        for permission in permissions:
+            if permission.endswith(":*"):
+                namespaces.add(permission[:-2])
+            elif permission != "*":
+                exact.add(permission)
+        compiled[role] = RolePermissions(
+            exact=frozenset(exact),
+            namespaces=frozenset(namespaces),
+            all="*" in permissions,
+        )
+    return compiled
+
+
+ROLE_PERMISSIONS = compile_permissions(PERMISSIONS)
+NO_PERMISSIONS = RolePermissions(exact=frozenset(), namespaces=frozenset())
+
+
+def has_permission(user: User | UserPrincipal, permission: str) -> bool:
     """
     ユーザーが指定された権限を持っているかチェック
 
@@ -62,13 +132,36 @@ def has_permission(user: User, permission: str) -> bool:
     Returns:
         bool: 権限がある場合True
     """
-    user_permissions = PERMISSIONS.get(user.role, [])
+    return ROLE_PERMISSIONS.get(user.role, NO_PERMISSIONS).allows(permission)
+
+
+def granted_permissions(
+    user: User | UserPrincipal | None, permissions: Iterable[str]
+) -> frozenset[str]:
+    """
+    指定した権限のうち、ユーザーが持っているものをまとめて取得
 
-    # adminは全権限を持つ
-    if "*" in user_permissions:
-        return True
+    複数の権限を判定する際に、権限ごとに has_permission() を呼ばずに
+    1回で判定するために使用します。
 
-    return permission in user_permissions
+    Args:
+        user: ユーザー（未認証の場合はNone）
+        permissions: 判定する権限
+
+    Returns:
+        frozenset[str]: ユーザーが持っている権限
+
+    Example:
+        >>> allowed = granted_permissions(user, ["csv:export", "pdf:generate"])
+        >>> "csv:export" in allowed
+        True
+    """
+    if user is None:
+        return frozenset()
+    role_permissions = ROLE_PERMISSIONS.get(user.role, NO_PERMISSIONS)
+    if role_permissions.all:
+        return frozenset(permissions)
+    return frozenset(p for p in permissions if role_permissions.allows(p))
 
 
 def require_role(allowed_roles: list[str]) -> Any:
@@ -88,8 +181,8 @@ def require_role(allowed_roles: list[str]) -> Any:
     """
 
     def role_checker(
-        current_user: Annotated[User, Depends(get_current_active_user)],
-    ) -> User:
+        current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
+    ) -> UserPrincipal:
         if current_user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -100,10 +193,13 @@ def require_role(allowed_roles: list[str]) -> Any:
     return role_checker
 
 
+@cache
 def require_permission(required_permission: str) -> Any:
     """
     指定された権限を要求する依存性を生成
 
+    同じ権限には同じ依存性関数を返します（FastAPIが1リクエスト内の解決結果を共有する）。
+
     Args:
         required_permission: 必要な権限（例: "animal:write"）
 
@@ -117,8 +213,8 @@ def require_permission(required_permission: str) -> Any:
     """
 
     def permission_checker(
-        current_user: Annotated[User, Depends(get_current_active_user)],
-    ) -> User:
+        current_user: Annotated[UserPrincipal, Depends(get_current_active_user)],
+    ) -> UserPrincipal:
         if not has_permission(current_user, required_permission):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,173 @@
+"""
+認証済みユーザーのキャッシュ
+
+管理画面の1ページは十数件のAPI呼び出しに分かれ、そのたびに認証依存性が
+同じユーザーをデータベースから取得していました。認証に必要な項目だけを持つ
+軽量なユーザー情報（UserPrincipal）を、ユーザーIDとユーザーのバージョン番号を
+キーにプロセス内でキャッシュします（有効期間・件数の上限付き）。
+
+ユーザーの更新・ロール変更・ログイン失敗によるロック・ログアウトでは
+invalidate_user_principal() でバージョン番号を進め、古いエントリを参照しなく
+します。バージョン番号もプロセス内で保持するため、他のプロセスでの更新は
+有効期間（user_cache_ttl_seconds）内は反映されません。
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.user import User
+from app.utils.timezone import get_jst_now
+
+settings = get_settings()
+
+# キャッシュするユーザー数の上限
+USER_CACHE_MAX_ENTRIES = 1024
+
+_cache_lock = threading.Lock()
+_cache: OrderedDict[tuple[int, int], tuple[UserPrincipal, float]] = OrderedDict()
+# ユーザーごとのバージョン番号（取得中に無効化されたユーザーを古いキーで保存するため）
+_versions: defaultdict[int, int] = defaultdict(int)
+_hits = 0
+_misses = 0
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """
+    認証済みユーザー（認証・権限チェックに必要な項目のみ）
+
+    リクエスト間で共有するため不変です。パスワードハッシュ等は保持しません。
+    ユーザーを更新する場合は user_service でデータベースから取得してください。
+    """
+
+    id: int
+    email: str
+    name: str
+    role: str
+    is_active: bool
+    locked_until: datetime | None = None
+
+    @classmethod
+    def from_user(cls, user: User) -> UserPrincipal:
+        """ORMのユーザーから生成"""
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            role=user.role,
+            is_active=user.is_active,
+            locked_until=user.locked_until,
+        )
+
+    def is_locked(self) -> bool:
+        """
+        アカウントがロックされているかチェック
+
+        Returns:
+            bool: ロックされている場合True
+        """
+        if self.locked_until is None:
+            return False
+        return get_jst_now() < self.locked_until
+
+
+def _load_user_principal(db: Session, user_id: int) -> UserPrincipal | None:
+    row = db.execute(
+        select(
+            User.id,
+            User.email,
+            User.name,
+            User.role,
+            User.is_active,
+            User.locked_until,
+        ).where(User.id == user_id)
+    ).first()
+    return None if row is None else UserPrincipal(*row)
+
+
+def get_user_principal(db: Session, user_id: int) -> UserPrincipal | None:
+    """
+    ユーザーIDから認証済みユーザーを取得（キャッシュがなければデータベースから取得）
+
+    Args:
+        db: データベースセッション
+        user_id: ユーザーID（JWTのsub）
+
+    Returns:
+        UserPrincipal | None: ユーザー。存在しない場合はNone（キャッシュしない）
+    """
+    global _hits, _misses
+
+    ttl = settings.user_cache_ttl_seconds
+    if ttl <= 0:
+        return _load_user_principal(db, user_id)
+
+    now = time.monotonic()
+    with _cache_lock:
+        key = (user_id, _versions[user_id])
+        cached = _cache.get(key)
+        if cached is not None and now < cached[1]:
+            _cache.move_to_end(key)
+            _hits += 1
+            return cached[0]
+        _misses += 1
+
+    principal = _load_user_principal(db, user_id)
+    if principal is None:
+        return None
+    with _cache_lock:
+        _cache[key] = (principal, now + ttl)
+        _cache.move_to_end(key)
+        while len(_cache) > USER_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return principal
+
+
+def invalidate_user_principal(user_id: int) -> None:
+    """
+    ユーザーのキャッシュを無効化（ユーザーの更新・ロール変更・ログアウト時）
+
+    Args:
+        user_id: ユーザーID
+    """
+    with _cache_lock:
+        _versions[user_id] += 1
+        for key in [key for key in _cache if key[0] == user_id]:
+            del _cache[key]
+
+
+def get_user_cache_stats() -> dict[str, float]:
+    """
+    ユーザーキャッシュの統計情報を取得
+
+    Returns:
+        dict[str, float]: ヒット数、ミス数、ヒット率、エントリ数、最大エントリ数
+    """
+    with _cache_lock:
+        lookups = _hits + _misses
+        return {
+            "hits": _hits,
+            "misses": _misses,
+            "hit_rate": _hits / lookups if lookups else 0.0,
+            "entries": len(_cache),
+            "max_entries": USER_CACHE_MAX_ENTRIES,
+        }
+
+
+def clear_user_cache() -> None:
+    """ユーザーキャッシュと統計情報を全削除"""
+    global _hits, _misses
+    with _cache_lock:
+        _cache.clear()
+        _versions.clear()
+        _hits = 0
+        _misses = 0
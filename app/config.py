@@ -15,6 +15,25 @@ from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def normalize_database_url(url: str) -> str:
+    """
+    PostgreSQLの接続URLをpsycopg（v3）ドライバーの指定に正規化
+
+    Heroku/Render等が発行する postgres:// や、ドライバー未指定の postgresql://
+    （SQLAlchemyの既定はpsycopg2）を postgresql+psycopg:// に変換します。
+
+    Args:
+        url: データベース接続URL
+
+    Returns:
+        str: 正規化した接続URL
+    """
+    for prefix in ("postgres://", "postgresql://"):
+        if url.startswith(prefix):
+            return "postgresql+psycopg://" + url[len(prefix) :]
+    return url
+
+
 class Settings(BaseSettings):
     """
     アプリケーション設定クラス
@@ -74,17 +93,84 @@ class Settings(BaseSettings):
         description="セッション有効期限（秒）",
         gt=0,
     )
+    user_cache_ttl_seconds: float = Field(
+        default=30.0,
+        description="認証済みユーザーのキャッシュ有効期間（秒、0でキャッシュしない）",
+        ge=0,
+    )
 
     # データベース設定
     database_url: str = Field(
         default="sqlite:///./data/necokeeper.db", description="データベース接続URL"
     )
     database_echo: bool = Field(default=False, description="SQLクエリのログ出力")
+    database_read_url: str | None = Field(
+        default=None,
+        description="帳票・エクスポート用の読み取り専用接続URL（レプリカ等、"
+        "未指定時は主DBを読み取り専用で開く）",
+    )
+
+    # 接続プール設定（PostgreSQL等のサーバー型DBで使用、SQLiteには適用しない）
+    database_pool_size: int = Field(default=10, description="常時保持する接続数", ge=1)
+    database_max_overflow: int = Field(
+        default=20, description="混雑時に一時的に追加できる接続数", ge=0
+    )
+    database_pool_timeout_seconds: float = Field(
+        default=30.0, description="空き接続を待つ時間（秒）", gt=0
+    )
+    database_pool_recycle_seconds: int = Field(
+        default=1800,
+        description="接続を作り直すまでの時間（秒、サーバー側のアイドル切断対策、-1で無効）",
+        ge=-1,
+    )
+    database_pool_pre_ping: bool = Field(
+        default=True, description="貸し出し前に接続の生存を確認する"
+    )
+
+    # SQLite性能設定（接続ごとにPRAGMAとして適用）
+    sqlite_journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST"] = Field(
+        default="WAL",
+        description="ジャーナルモード（WALでは書き込み中も読み取りがブロックされない）",
+    )
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        default="NORMAL",
+        description="同期モード（WALではNORMALでもコミット済みデータの破損は起きない）",
+    )
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000, description="ロック解放を待つ時間（ミリ秒）", ge=0
+    )
+    sqlite_cache_size_mb: int = Field(
+        default=64, description="接続ごとのページキャッシュの大きさ（MB）", ge=0
+    )
+    sqlite_mmap_size_mb: int = Field(
+        default=256, description="メモリマップで読み取る大きさ（MB、0で無効）", ge=0
+    )
+    sqlite_temp_store_memory: bool = Field(
+        default=True, description="一時テーブル・ソート用の領域をメモリに置く"
+    )
+    sqlite_foreign_keys: bool = Field(
+        default=True, description="外部キー制約（ON DELETE CASCADE等）を有効にする"
+    )
+    sqlite_wal_checkpoint_seconds: float = Field(
+        default=300.0,
+        description="WALのチェックポイントを実行する間隔（秒、0で実行しない）",
+        ge=0,
+    )
+    sqlite_wal_checkpoint_mode: Literal["PASSIVE", "FULL", "RESTART", "TRUNCATE"] = (
+        Field(
+            default="TRUNCATE",
+            description="定期チェックポイントのモード（TRUNCATEはWALファイルを切り詰める）",
+        )
+    )
 
     # ファイルストレージ設定
     media_dir: str = Field(
         default="./media", description="メディアファイル保存ディレクトリ"
     )
+    upload_staging_dir: str = Field(
+        default="./data/uploads",
+        description="アップロードされた元画像の一時保存ディレクトリ（/media では配信しない）",
+    )
     backup_dir: str = Field(
         default="./backups", description="バックアップファイル保存ディレクトリ"
     )
@@ -100,6 +186,11 @@ class Settings(BaseSettings):
         gt=0,
         le=100.0,
     )
+    image_variant_workers: int = Field(
+        default=2,
+        description="サムネイル等の派生画像を生成するワーカー数（0でリクエスト内で同期生成）",
+        ge=0,
+    )
 
     # ログ設定
     log_level: Literal[
@@ -126,6 +217,79 @@ class Settings(BaseSettings):
         default="IPAGothic",
         description="PDF生成時に使用するフォントファミリー（カンマ区切りで複数指定可能）",
     )
+    pdf_cache_enabled: bool = Field(
+        default=True, description="生成済みPDFのディスクキャッシュを有効化"
+    )
+    pdf_cache_dir: str = Field(
+        default="./data/pdf_cache", description="PDFキャッシュの保存ディレクトリ"
+    )
+    pdf_cache_max_mb: float = Field(
+        default=200.0,
+        description="PDFキャッシュの最大合計サイズ（MB、超過時は古い順に削除）",
+        gt=0,
+    )
+    pdf_render_workers: int = Field(
+        default=2,
+        description="PDF描画用ワーカープロセス数（0の場合はプロセスを使わずスレッドで描画）",
+        ge=0,
+    )
+    pdf_render_max_pending: int = Field(
+        default=8,
+        description="同時に受け付けるPDF描画ジョブ数の上限（超過時は503を返す）",
+        ge=1,
+    )
+    pdf_render_timeout_seconds: float = Field(
+        default=60.0, description="PDF描画ジョブ1件あたりのタイムアウト（秒）", gt=0
+    )
+    pdf_job_dir: str = Field(
+        default="./data/pdf_jobs", description="非同期PDF生成ジョブの出力ディレクトリ"
+    )
+    pdf_job_poll_seconds: float = Field(
+        default=2.0, description="PDF生成ジョブワーカーのポーリング間隔（秒）", gt=0
+    )
+    pdf_job_timeout_seconds: float = Field(
+        default=600.0, description="PDF生成ジョブ1件あたりのタイムアウト（秒）", gt=0
+    )
+    pdf_job_lease_seconds: float = Field(
+        default=900.0,
+        description=(
+            "処理中のジョブを中断されたとみなして待機中に戻すまでの時間"
+            "（秒、PDF生成ジョブのタイムアウトより長くする）"
+        ),
+        gt=0,
+    )
+    pdf_job_retention_hours: int = Field(
+        default=24, description="完了したPDF生成ジョブの保持時間（時間）", ge=1
+    )
+
+    # ダッシュボード設定
+    dashboard_stats_ttl_seconds: float = Field(
+        default=30.0,
+        description="ダッシュボード統計のキャッシュ有効期間（秒、0でキャッシュしない）",
+        ge=0,
+    )
+
+    # 一覧のカーソル方式ページネーション設定
+    list_total_cache_ttl_seconds: float = Field(
+        default=60.0,
+        description="カーソル方式の一覧の総件数のキャッシュ有効期間（秒、0でキャッシュしない）",
+        ge=0,
+    )
+
+    # 世話記録イベント配信（SSE）設定
+    care_log_events_max_subscribers: int = Field(
+        default=200, description="世話記録イベントの同時接続数の上限", ge=1
+    )
+    care_log_events_queue_size: int = Field(
+        default=100,
+        description="接続ごとに保持する未送信イベント数の上限（超過時は再取得を促す）",
+        ge=1,
+    )
+    care_log_events_heartbeat_seconds: float = Field(
+        default=15.0,
+        description="ハートビートの送信と、他のプロセスでの更新の確認の間隔（秒）",
+        gt=0,
+    )
 
     # バックアップ設定
     auto_backup_enabled: bool = Field(
@@ -267,6 +431,12 @@ class Settings(BaseSettings):
 
         return int(self.max_image_size_mb * 1024 * 1024)
 
+    @property
+    def pdf_cache_max_bytes(self) -> int:
+        """PDFキャッシュの最大合計サイズ（バイト）"""
+
+        return int(self.pdf_cache_max_mb * 1024 * 1024)
+
     @property
     def max_upload_size(self) -> int:
         """後方互換性のためのエイリアス"""
@@ -326,7 +496,13 @@ class Settings(BaseSettings):
         """
         if not v:
             raise ValueError("DATABASE_URLは必須です")
-        return v
+        return normalize_database_url(v)
+
+    @field_validator("database_read_url")
+    @classmethod
+    def validate_database_read_url(cls, v: str | None) -> str | None:
+        """読み取り専用接続URLのドライバー指定を正規化"""
+        return normalize_database_url(v) if v else v
 
     def model_post_init(self, __context: Any) -> None:
         """
@@ -7,18 +7,21 @@ SQLAlchemyエンジンとセッション管理を提供します。
 
 from __future__ import annotations
 
+import logging
 import os
-from collections.abc import Generator
+import threading
+from collections.abc import Generator, Sequence
 from pathlib import Path
-from typing import Final
+from typing import Any, Final
 
-from sqlalchemy import MetaData, create_engine
+from sqlalchemy import Engine, MetaData, QueuePool, create_engine, event, make_url
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
-from app.config import get_settings
+from app.config import Settings, get_settings
 
 # 設定を取得
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 # DB パスの決定（環境変数で制御可能）
 # Free Plan: data/necokeeper.db（イメージに含まれる）
@@ -48,6 +51,86 @@ def _ensure_sqlite_dir(db_url: str) -> None:
     db_file.parent.mkdir(parents=True, exist_ok=True)
 
 
+def sqlite_pragma_statements(config: Settings) -> list[str]:
+    """
+    SQLiteの性能プロファイル（接続ごとに適用するPRAGMA文）を生成
+
+    WALでは書き込み中も読み取りがブロックされず、ボランティアの同時記録と
+    一覧の参照が互いに待たなくなります。busy_timeout はロック待ちを
+    「database is locked」エラーにせず待機させるため、最初に設定します。
+
+    Args:
+        config: アプリケーション設定
+
+    Returns:
+        list[str]: PRAGMA文のリスト
+    """
+    return [
+        f"PRAGMA busy_timeout={config.sqlite_busy_timeout_ms}",
+        f"PRAGMA journal_mode={config.sqlite_journal_mode}",
+        f"PRAGMA synchronous={config.sqlite_synchronous}",
+        # 負の値はKiB単位
+        f"PRAGMA cache_size={-config.sqlite_cache_size_mb * 1024}",
+        f"PRAGMA mmap_size={config.sqlite_mmap_size_mb * 1024 * 1024}",
+        f"PRAGMA temp_store={'MEMORY' if config.sqlite_temp_store_memory else 'DEFAULT'}",
+        f"PRAGMA foreign_keys={'ON' if config.sqlite_foreign_keys else 'OFF'}",
+    ]
+
+
+def install_sqlite_pragmas(target_engine: Engine, statements: Sequence[str]) -> None:
+    """
+    新しい接続を開くたびにPRAGMA文を実行するようエンジンに登録
+
+    Args:
+        target_engine: SQLiteのエンジン
+        statements: 実行するPRAGMA文
+    """
+
+    @event.listens_for(target_engine, "connect")
+    def _apply_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def engine_options(db_url: str, config: Settings) -> dict[str, Any]:
+    """
+    接続先の種類に応じた create_engine() の引数を生成
+
+    SQLiteはファイルを直接開くため、スレッド間で接続を共有できるようにするだけです。
+    PostgreSQL等のサーバー型DBでは接続の確立が高価なため、QueuePoolで接続を
+    使い回します。サーバー側のアイドル切断やフェイルオーバーで切れた接続を
+    貸し出さないよう、一定時間で作り直し（pool_recycle）、貸し出し前に
+    生存を確認します（pool_pre_ping）。
+    接続プールはワーカープロセスごとに作られるため、サーバーへの最大接続数は
+    （pool_size + max_overflow）× ワーカー数になります。
+
+    Args:
+        db_url: データベース接続URL
+        config: アプリケーション設定
+
+    Returns:
+        dict[str, Any]: create_engine() のキーワード引数
+    """
+    if make_url(db_url).get_backend_name() == "sqlite":
+        return {
+            "echo": config.database_echo,
+            "connect_args": {"check_same_thread": False},
+        }
+    return {
+        "echo": config.database_echo,
+        "poolclass": QueuePool,
+        "pool_size": config.database_pool_size,
+        "max_overflow": config.database_max_overflow,
+        "pool_timeout": config.database_pool_timeout_seconds,
+        "pool_recycle": config.database_pool_recycle_seconds,
+        "pool_pre_ping": config.database_pool_pre_ping,
+    }
+
+
 # PostgreSQL互換の命名規則
 # Alembicマイグレーションと統合し、一貫性のある制約名を生成
 NAMING_CONVENTION = {
@@ -60,17 +143,58 @@ NAMING_CONVENTION = {
 
 # SQLAlchemyエンジンの作成
 # SQLiteの場合、check_same_threadをFalseに設定してマルチスレッド対応
+# PostgreSQLの場合、接続プールの設定を適用
 # NECOKEEPER_DB_PATH が設定されている場合はそちらを優先
 effective_db_url = (
     DATABASE_URL if os.getenv("NECOKEEPER_DB_PATH") else settings.database_url
 )
 _ensure_sqlite_dir(effective_db_url)
 
-engine = create_engine(
-    effective_db_url,
-    echo=settings.database_echo,
-    connect_args={"check_same_thread": False} if "sqlite" in effective_db_url else {},
-)
+engine = create_engine(effective_db_url, **engine_options(effective_db_url, settings))
+if engine.dialect.name == "sqlite":
+    install_sqlite_pragmas(engine, sqlite_pragma_statements(settings))
+
+
+def create_read_engine(primary: Engine, config: Settings) -> Engine:
+    """
+    帳票・エクスポート用の読み取り専用エンジンを作成
+
+    長時間の集計・出力を、公開フォームからの書き込みと別の接続プールで実行します。
+    database_read_url が指定されていればその接続先（レプリカ等）を使い、
+    未指定のSQLiteでは同じファイルを query_only で開きます
+    （WALでは読み取りが書き込みをブロックせず、誤って書き込むこともない）。
+    PostgreSQLの接続先では、既定のトランザクションを読み取り専用にします。
+
+    Args:
+        primary: 主DBのエンジン
+        config: アプリケーション設定
+
+    Returns:
+        Engine: 読み取り専用エンジン（別に用意できない場合は主DBのエンジン）
+    """
+    read_url = config.database_read_url
+    if read_url is None:
+        # インメモリDBは接続ごとに別のDBになり、SQLite以外は読み取り専用の接続先がない
+        if primary.dialect.name != "sqlite" or primary.url.database in (
+            None,
+            "",
+            ":memory:",
+        ):
+            return primary
+        read_url = primary.url.render_as_string(hide_password=False)
+
+    options = engine_options(read_url, config)
+    if make_url(read_url).get_backend_name() == "postgresql":
+        options["connect_args"] = {"options": "-c default_transaction_read_only=on"}
+    read_engine = create_engine(read_url, **options)
+    if read_engine.dialect.name == "sqlite":
+        install_sqlite_pragmas(
+            read_engine, [*sqlite_pragma_statements(config), "PRAGMA query_only=ON"]
+        )
+    return read_engine
+
+
+read_engine = create_read_engine(engine, settings)
 
 
 # セッションファクトリーの作成
@@ -82,6 +206,14 @@ SessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
+# 帳票・エクスポート用（読み取り専用）
+ReadSessionLocal = sessionmaker(
+    bind=read_engine,
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 
 # Declarative Baseクラスの定義
 # すべてのORMモデルはこのクラスを継承します
@@ -121,6 +253,149 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    読み取り専用のデータベースセッションの依存性注入用ジェネレーター
+
+    帳票・エクスポートなど、長時間の読み取りを行うエンドポイントで使用します。
+    書き込みを行うエンドポイントでは get_db を使用してください。
+
+    Yields:
+        Session: 読み取り専用エンジンにバインドされたセッション
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def open_streaming_session(db: Session) -> Session:
+    """
+    ストリーミングレスポンス用の独立したセッションを作成
+
+    FastAPIのyield依存関係（get_db）はレスポンス本体の送信前に終了する場合があるため、
+    StreamingResponseのジェネレーター内では、リクエストのセッションと同じ接続先に
+    バインドした専用セッションを使用します。呼び出し側でクローズしてください。
+
+    Args:
+        db: リクエストのデータベースセッション（接続先の取得に使用）
+
+    Returns:
+        Session: 同じエンジンにバインドされた新しいセッション
+
+    Example:
+        ```python
+        def rows() -> Iterator[bytes]:
+            with open_streaming_session(db) as session:
+                yield from iter_csv(session)
+        ```
+    """
+    return Session(
+        bind=db.get_bind(),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+class WalCheckpointScheduler:
+    """
+    WALのチェックポイントを定期的に実行するバックグラウンドワーカー
+
+    SQLiteの自動チェックポイント（1000ページごと）は、読み取り中の接続が
+    参照しているページを書き戻せないため、参照が途切れない間はWALファイルが
+    大きくなり続けます。一定間隔で明示的にチェックポイントを実行し、
+    WALの内容をデータベース本体に反映します（TRUNCATEではWALファイルも切り詰める）。
+
+    Args:
+        target_engine: SQLiteのエンジン
+        interval: 実行間隔（秒）
+        mode: チェックポイントのモード（PASSIVE, FULL, RESTART, TRUNCATE）
+    """
+
+    def __init__(self, target_engine: Engine, interval: float, mode: str) -> None:
+        self.engine = target_engine
+        self.interval = interval
+        self.mode = mode
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """ワーカースレッドを起動"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="sqlite-wal-checkpoint", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """ワーカースレッドを停止"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def checkpoint(self) -> tuple[int, int, int]:
+        """
+        チェックポイントを実行
+
+        Returns:
+            tuple[int, int, int]: (完了できなかった場合は1, WALのページ数, 反映したページ数)
+        """
+        with self.engine.connect() as conn:
+            busy, log_pages, checkpointed = conn.exec_driver_sql(
+                f"PRAGMA wal_checkpoint({self.mode})"
+            ).one()
+        if busy:
+            logger.warning(
+                f"WALのチェックポイントを完了できませんでした（使用中）: "
+                f"WAL={log_pages}ページ, 反映={checkpointed}ページ"
+            )
+        else:
+            logger.debug(
+                f"WALのチェックポイントを実行しました: "
+                f"WAL={log_pages}ページ, 反映={checkpointed}ページ"
+            )
+        return busy, log_pages, checkpointed
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.checkpoint()
+            except Exception as e:
+                logger.error(f"WALのチェックポイントでエラーが発生しました: {e}")
+
+
+_checkpoint_scheduler: WalCheckpointScheduler | None = None
+
+
+def start_wal_checkpoint_scheduler() -> None:
+    """WALの定期チェックポイントを開始（アプリケーション起動時、SQLiteのWAL時のみ）"""
+    global _checkpoint_scheduler
+    if (
+        _checkpoint_scheduler is not None
+        or engine.dialect.name != "sqlite"
+        or settings.sqlite_journal_mode != "WAL"
+        or settings.sqlite_wal_checkpoint_seconds <= 0
+    ):
+        return
+    _checkpoint_scheduler = WalCheckpointScheduler(
+        engine,
+        settings.sqlite_wal_checkpoint_seconds,
+        settings.sqlite_wal_checkpoint_mode,
+    )
+    _checkpoint_scheduler.start()
+
+
+def stop_wal_checkpoint_scheduler() -> None:
+    """WALの定期チェックポイントを停止（アプリケーション終了時）"""
+    global _checkpoint_scheduler
+    if _checkpoint_scheduler is not None:
+        _checkpoint_scheduler.stop()
+        _checkpoint_scheduler = None
+
+
 def init_db() -> None:
     """
     データベースの初期化
@@ -42,7 +42,16 @@ from app.api.v1 import (
     volunteers,
 )
 from app.config import get_settings
+from app.database import (
+    SessionLocal,
+    start_wal_checkpoint_scheduler,
+    stop_wal_checkpoint_scheduler,
+)
 from app.middleware.auth_redirect import AuthRedirectMiddleware
+from app.services import pdf_job_service, pdf_service
+from app.services.care_log_events import care_log_event_broker
+from app.utils.image_pipeline import shutdown_image_variant_pool
+from app.utils.pdf_renderer import get_pdf_render_pool, shutdown_pdf_render_pool
 
 # 設定を取得
 settings = get_settings()
@@ -66,9 +75,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Path(settings.media_dir).mkdir(parents=True, exist_ok=True)
     Path(settings.backup_dir).mkdir(parents=True, exist_ok=True)
     Path(settings.log_file).parent.mkdir(parents=True, exist_ok=True)
-    Path(settings.database_url.replace("sqlite:///", "")).parent.mkdir(
-        parents=True, exist_ok=True
-    )
+    # SQLiteのDBディレクトリは app.database のインポート時に作成済み
+
+    # PDF描画の準備（ワーカーのウォームアップはバックグラウンドで進む）
+    pdf_service.preload_templates()
+    get_pdf_render_pool().start()
+    pdf_job_service.start_pdf_job_worker(SessionLocal)
+
+    # WALファイルの肥大化を防ぐ定期チェックポイント
+    start_wal_checkpoint_scheduler()
 
     print("✅ 起動完了")
 
@@ -76,6 +91,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # 終了時の処理
     print("👋 アプリケーションを終了しています...")
+    care_log_event_broker.close()
+    pdf_job_service.stop_pdf_job_worker()
+    shutdown_pdf_render_pool()
+    shutdown_image_variant_pool()
+    stop_wal_checkpoint_scheduler()
 
 
 # FastAPIアプリケーションの初期化
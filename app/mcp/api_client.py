@@ -9,6 +9,7 @@ Context7 Reference: /encode/httpx (Benchmark Score: 91.8)
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import httpx
@@ -184,12 +185,24 @@ class NecoKeeperAPIClient:
                 f"Network error while communicating with NecoKeeper API: {exc}"
             ) from exc
 
-    async def generate_qr_pdf(self, animal_ids: list[int]) -> bytes:
+    async def generate_qr_pdf(
+        self,
+        animal_ids: list[int],
+        poll_interval: float = 1.0,
+        max_wait: float = 600.0,
+    ) -> bytes:
         """
         Generate QR code grid PDF for multiple animals (A4 size, 2x5 layout)
 
+        Uses the asynchronous PDF job API so that large batches are not bound
+        by the HTTP client timeout: the job is submitted, polled until it
+        finishes, and the resulting PDF is downloaded. Any number of animal
+        IDs may be given; every 10 cards start a new A4 page.
+
         Args:
             animal_ids: List of animal IDs to include in the PDF
+            poll_interval: Seconds to wait between job status checks
+            max_wait: Maximum seconds to wait for the job to finish
 
         Returns:
             bytes: PDF file content
@@ -199,14 +212,118 @@ class NecoKeeperAPIClient:
             httpx.ConnectError: For connection failures
             httpx.TimeoutException: For request timeouts
             httpx.NetworkError: For network-level errors
+            TimeoutError: If the job does not finish within max_wait
+            RuntimeError: If the job fails on the server
         """
-        try:
-            response = await self.client.post(
-                "/api/automation/pdf/qr-card-grid", json={"animal_ids": animal_ids}
+        job = await self.submit_pdf_job(
+            {"kind": "qr_card_grid", "animal_ids": animal_ids}
+        )
+        job = await self.wait_for_pdf_job(job, poll_interval, max_wait)
+        return await self.download_pdf_job(job["id"])
+
+    async def submit_pdf_job(self, job_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Submit an asynchronous PDF generation job
+
+        Args:
+            job_data: Job parameters (kind, animal_id/animal_ids, etc.)
+
+        Returns:
+            dict: Job status with id and status
+        """
+        response = await self._request(
+            "POST", "/api/automation/pdf/jobs", json=job_data
+        )
+        result: dict[str, Any] = response.json()
+        return result
+
+    async def get_pdf_job(self, job_id: str) -> dict[str, Any]:
+        """
+        Get the status of a PDF generation job
+
+        Args:
+            job_id: Job ID returned by submit_pdf_job
+
+        Returns:
+            dict: Job status (queued, running, completed or failed)
+        """
+        response = await self._request("GET", f"/api/automation/pdf/jobs/{job_id}")
+        result: dict[str, Any] = response.json()
+        return result
+
+    async def download_pdf_job(self, job_id: str) -> bytes:
+        """
+        Download the PDF produced by a completed job
+
+        Args:
+            job_id: Job ID returned by submit_pdf_job
+
+        Returns:
+            bytes: PDF file content
+        """
+        response = await self._request(
+            "GET", f"/api/automation/pdf/jobs/{job_id}/download"
+        )
+        content: bytes = response.content
+        return content
+
+    async def wait_for_pdf_job(
+        self,
+        job: dict[str, Any],
+        poll_interval: float = 1.0,
+        max_wait: float = 600.0,
+    ) -> dict[str, Any]:
+        """
+        Poll a PDF generation job until it completes
+
+        Args:
+            job: Job status returned by submit_pdf_job
+            poll_interval: Seconds to wait between job status checks
+            max_wait: Maximum seconds to wait for the job to finish
+
+        Returns:
+            dict: Final job status (completed)
+
+        Raises:
+            TimeoutError: If the job does not finish within max_wait
+            RuntimeError: If the job fails on the server
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        while job["status"] in ("queued", "running"):
+            if loop.time() >= deadline:
+                raise TimeoutError(
+                    f"PDF generation job {job['id']} did not finish "
+                    f"within {max_wait:.0f} seconds"
+                )
+            await asyncio.sleep(poll_interval)
+            job = await self.get_pdf_job(job["id"])
+
+        if job["status"] != "completed":
+            raise RuntimeError(
+                f"PDF generation job {job['id']} failed: {job.get('error')}"
             )
+        return job
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request and translate transport errors
+
+        Args:
+            method: HTTP method
+            url: Request path
+            **kwargs: Extra arguments passed to httpx
+
+        Returns:
+            httpx.Response: Successful (2xx) response
+        """
+        try:
+            if method == "POST":
+                response = await self.client.post(url, **kwargs)
+            else:
+                response = await self.client.get(url, **kwargs)
             response.raise_for_status()
-            content: bytes = response.content
-            return content
+            return response
 
         except httpx.HTTPStatusError as exc:
             self._handle_http_status_error(exc)
@@ -71,8 +71,9 @@ def register_tool(mcp: FastMCP, api_client: NecoKeeperAPIClient) -> None:
 
             logger.info(f"Generating QR PDF for animal_id={animal_id}")
 
-            # Call NecoKeeper API to generate PDF
-            # Requirements 2.2: Call /api/automation/pdf/qr-card-grid endpoint
+            # Generate PDF via the asynchronous job API
+            # (submit -> poll -> download) so rendering is not bound by the
+            # HTTP client timeout
             pdf_content = await api_client.generate_qr_pdf([animal_id])
 
             # Create directory if it doesn't exist
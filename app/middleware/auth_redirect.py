@@ -12,18 +12,55 @@ Context7参照: /fastapi/fastapi
 - APIリクエスト（/api/v1/で始まるパス）: JSONエラーレスポンスを返す
 - ページリクエスト（/adminで始まるパス）: ログインページにリダイレクト
 - その他のリクエスト: そのまま処理
+
+BaseHTTPMiddleware はすべてのレスポンス（PDF・CSV・Excel・静的ファイル等の
+大きなストリームを含む）を別タスクとボディのストリームで包み直すため、
+ステータスコードを見るだけの処理には重すぎます。このミドルウェアは純粋な
+ASGIミドルウェアとして http.response.start メッセージだけを検査し、
+ボディのメッセージは加工せずにそのまま送信します。
 """
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from starlette.responses import JSONResponse, RedirectResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# 401エラーを差し替える可能性のあるパスの接頭辞
+HANDLED_PATH_PREFIXES = ("/api/v1/", "/admin")
 
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse, RedirectResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 
+def _unauthorized_response(path: str) -> Response | None:
+    """
+    401エラー時に差し替えるレスポンスを決定
+
+    Args:
+        path: リクエストのパス
 
-class AuthRedirectMiddleware(BaseHTTPMiddleware):
+    Returns:
+        Response | None: 差し替えるレスポンス。差し替えない場合はNone
+    """
+    # APIリクエストの場合はJSONレスポンスを返す
+    if path.startswith("/api/v1/"):
+        return JSONResponse(
+            status_code=401,
+            content={
+                "detail": "認証が必要です。ログインしてください。",
+            },
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # 管理画面へのリクエストの場合はログインページにリダイレクト
+    # ログインページ自体へのアクセスは除外
+    if path.startswith("/admin") and not path.startswith("/admin/login"):
+        return RedirectResponse(
+            url="/admin/login",
+            status_code=302,  # 一時的なリダイレクト
+        )
+
+    return None
+
+
+class AuthRedirectMiddleware:
     """
     401エラーを検出してログインページにリダイレクトするミドルウェア
 
@@ -33,52 +70,50 @@ class AuthRedirectMiddleware(BaseHTTPMiddleware):
     処理フロー:
     1. /api/v1/で始まるAPIリクエスト -> 401 JSONレスポンス
     2. /adminで始まるページリクエスト -> /admin/loginにリダイレクト
-    3. その他 -> そのまま通過
+    3. その他 -> そのまま通過（sendを包まない）
 
     Example:
         >>> app.add_middleware(AuthRedirectMiddleware)
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         リクエストを処理し、401エラーをハンドリング
 
-        Args:
-            request: FastAPIリクエストオブジェクト
-            call_next: 次のミドルウェア/ハンドラー
+        401以外のレスポンスは、開始・ボディのメッセージとも受け取ったものを
+        そのまま送信します（バッファリングしない）。
 
-        Returns:
-            Response: レスポンスオブジェクト
-                - 401エラー時は適切な処理を実行
-                - それ以外はそのまま返す
+        Args:
+            scope: ASGIスコープ
+            receive: ASGI receive
+            send: ASGI send
         """
-        # リクエストを次のハンドラーに渡す
-        response = await call_next(request)
-
-        # 401エラーの場合のみ処理
-        if response.status_code == 401:
-            # APIリクエストの場合はJSONレスポンスを返す
-            if request.url.path.startswith("/api/v1/"):
-                return JSONResponse(
-                    status_code=401,
-                    content={
-                        "detail": "認証が必要です。ログインしてください。",
-                    },
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-
-            # 管理画面へのリクエストの場合はログインページにリダイレクト
-            # ログインページ自体へのアクセスは除外
-            if request.url.path.startswith(
-                "/admin"
-            ) and not request.url.path.startswith("/admin/login"):
-                return RedirectResponse(
-                    url="/admin/login",
-                    status_code=302,  # 一時的なリダイレクト
-                )
-
-        return response
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path: str = scope["path"]
+        if not path.startswith(HANDLED_PATH_PREFIXES):
+            # 差し替え対象外のパス（静的ファイル・メディア等）はsendを包まない
+            await self.app(scope, receive, send)
+            return
+
+        replaced = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal replaced
+            if message["type"] == "http.response.start" and message["status"] == 401:
+                response = _unauthorized_response(path)
+                if response is not None:
+                    replaced = True
+                    await response(scope, receive, send)
+                    return
+            if replaced:
+                # 差し替えた元のレスポンスのボディは破棄する
+                return
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
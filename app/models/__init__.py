@@ -10,8 +10,11 @@ from app.models.animal_image import AnimalImage
 from app.models.applicant import Applicant
 from app.models.audit_log import AuditLog
 from app.models.care_log import CareLog
+from app.models.daily_care_status import DailyCareStatus
 from app.models.medical_action import MedicalAction
 from app.models.medical_record import MedicalRecord
+from app.models.pdf_job import PDFJob
+from app.models.resource_version import ResourceVersion
 from app.models.setting import Setting
 from app.models.status_history import StatusHistory
 from app.models.user import User
@@ -24,8 +27,11 @@ __all__ = [
     "Applicant",
     "AuditLog",
     "CareLog",
+    "DailyCareStatus",
     "MedicalAction",
     "MedicalRecord",
+    "PDFJob",
+    "ResourceVersion",
     "Setting",
     "StatusHistory",
     "User",
@@ -135,6 +135,8 @@ class Animal(Base):
         Index("ix_animals_status", "status"),
         Index("ix_animals_protected_at", "protected_at"),
         Index("ix_animals_name", "name"),
+        # 一覧のカーソル方式ページネーション（登録日時・IDの降順）
+        Index("ix_animals_created_at", "created_at"),
     )
 
     def __repr__(self) -> str:
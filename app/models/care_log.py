@@ -19,6 +19,7 @@ from sqlalchemy import (
     SmallInteger,
     String,
     Text,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -35,6 +36,7 @@ class CareLog(Base):
 
     猫の日々の世話記録（食欲、元気、排尿、清掃など）を管理します。
     ボランティアがPublicフォームから入力した記録を保存します。
+    猫・記録日・時点の組ごとに1件で、同じ組の再登録は既存の記録を更新します。
 
     Attributes:
         id: 主キー（自動採番）
@@ -52,6 +54,7 @@ class CareLog(Base):
         ip_address: IPアドレス（記録時の接続元）
         user_agent: ユーザーエージェント（ブラウザ情報）
         device_tag: デバイスタグ（端末識別用）
+        idempotency_key: 冪等キー（登録リクエストの再送検知用、任意）
         from_paper: 紙記録からの転記フラグ
         created_at: 記録日時（自動設定）
         last_updated_at: 最終更新日時（自動更新）
@@ -158,6 +161,13 @@ class CareLog(Base):
         String(100), nullable=True, comment="デバイスタグ（端末識別用）"
     )
 
+    idempotency_key: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        unique=True,
+        comment="冪等キー（クライアントが登録リクエストごとに発行）",
+    )
+
     from_paper: Mapped[bool] = mapped_column(
         Boolean,
         nullable=False,
@@ -193,11 +203,22 @@ class CareLog(Base):
     animal: Mapped[Animal] = relationship("Animal", back_populates="care_logs")
 
     # インデックス定義
+    # - 猫・日付・時点の一意制約: 時点の検索、猫ごとの日付範囲（日次ビュー、直近7日）
+    # - 猫ID＋記録日時: 最新の記録、猫で絞り込んだ一覧（記録日時の降順）
+    # - 記録日＋記録日時: 日付範囲の帳票・CSV（記録日・記録日時の降順）、当日件数
+    # - 記録者ID＋記録日時: ボランティアの記録件数・最終記録日時
+    # 猫ID・記録日・記録者IDの単一列インデックスは上記の先頭列で代替できるため持たない
     __table_args__ = (
-        Index("ix_care_logs_animal_id", "animal_id"),
-        Index("ix_care_logs_log_date", "log_date"),
+        UniqueConstraint(
+            "animal_id",
+            "log_date",
+            "time_slot",
+            name="uq_care_logs_animal_id_log_date_time_slot",
+        ),
+        Index("ix_care_logs_animal_id_created_at", "animal_id", "created_at"),
+        Index("ix_care_logs_log_date_created_at", "log_date", "created_at"),
         Index("ix_care_logs_created_at", "created_at"),
-        Index("ix_care_logs_recorder_id", "recorder_id"),
+        Index("ix_care_logs_recorder_id_created_at", "recorder_id", "created_at"),
         Index("ix_care_logs_time_slot", "time_slot"),
     )
 
@@ -0,0 +1,78 @@
+"""
+当日記録状況（DailyCareStatus）モデル
+
+全猫の当日記録状況一覧を1回の読み取りで返すため、
+猫と日付ごとに記録済みの時点をビットマスクで保持するORMモデルです。
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.utils.timezone import get_jst_now
+
+# 時点ごとのビット（記録済みの時点のビットを立てる）
+TIME_SLOT_BITS: dict[str, int] = {
+    "morning": 1,
+    "noon": 2,
+    "evening": 4,
+}
+
+
+class DailyCareStatus(Base):
+    """
+    当日記録状況モデル
+
+    世話記録の登録・更新時に同じトランザクション内で更新します。
+    日付ごとに行が分かれるため、JSTの日付が変わると自動的に新しい日の状況になります。
+
+    Attributes:
+        log_date: 記録日（複合主キー）
+        animal_id: 猫ID（複合主キー、外部キー）
+        slots: 記録済みの時点のビットマスク（朝=1, 昼=2, 夕=4）
+        updated_at: 更新日時（自動更新）
+    """
+
+    __tablename__ = "daily_care_statuses"
+
+    # 複合主キー（日付で絞り込んで猫ごとに引くため日付を先頭にする）
+    log_date: Mapped[date] = mapped_column(
+        Date, primary_key=True, comment="記録日（年月日）"
+    )
+
+    animal_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("animals.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="猫ID",
+    )
+
+    slots: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+        default=0,
+        comment="記録済みの時点のビットマスク（朝=1, 昼=2, 夕=4）",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=get_jst_now,
+        onupdate=get_jst_now,
+        comment="更新日時（JST）",
+    )
+
+    def is_recorded(self, time_slot: str) -> bool:
+        """指定した時点が記録済みか"""
+        return bool(self.slots & TIME_SLOT_BITS[time_slot])
+
+    def __repr__(self) -> str:
+        """文字列表現"""
+        return (
+            f"<DailyCareStatus(log_date={self.log_date}, "
+            f"animal_id={self.animal_id}, slots={self.slots})>"
+        )
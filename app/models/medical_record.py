@@ -128,7 +128,8 @@ class MedicalRecord(Base):
 
     # インデックス定義
     __table_args__ = (
-        Index("ix_medical_records_animal_id", "animal_id"),
+        # 猫ごとの時系列表示（猫IDの単一列インデックスを兼ねる）
+        Index("ix_medical_records_animal_id_date", "animal_id", "date"),
         Index("ix_medical_records_date", "date"),
         Index("ix_medical_records_vet_id", "vet_id"),
         Index("ix_medical_records_medical_action_id", "medical_action_id"),
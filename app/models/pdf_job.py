@@ -0,0 +1,98 @@
+"""
+PDF生成ジョブ（PDFJob）モデル
+
+時間のかかるPDF生成を非同期に処理するためのジョブキューのORMモデルです。
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.utils.timezone import get_jst_now
+
+
+class PDFJob(Base):
+    """
+    PDF生成ジョブモデル
+
+    投入されたジョブはバックグラウンドのワーカーが順に処理し、
+    生成したPDFをファイルとして保存します。
+
+    Attributes:
+        id: ジョブID（推測困難なランダム文字列）
+        kind: PDF種別（qr_card, qr_card_grid, paper_form, report）
+        params: 生成パラメータ（JSON形式）
+        status: 状態（queued, running, completed, failed）
+        error: 失敗理由（任意）
+        result_path: 生成したPDFの保存パス（任意）
+        requested_by: 依頼者のユーザーID（Automation APIの場合はNone）
+        created_at: 投入日時（自動設定）
+        started_at: 処理開始日時（任意）
+        finished_at: 処理完了日時（任意）
+    """
+
+    __tablename__ = "pdf_jobs"
+
+    # 主キー
+    id: Mapped[str] = mapped_column(String(32), primary_key=True, comment="ジョブID")
+
+    # ジョブ内容
+    kind: Mapped[str] = mapped_column(
+        String(30), nullable=False, comment="PDF種別（qr_card, qr_card_grid等）"
+    )
+
+    params: Mapped[str] = mapped_column(
+        Text, nullable=False, comment="生成パラメータ（JSON形式）"
+    )
+
+    # 処理状態
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default="queued",
+        comment="状態（queued, running, completed, failed）",
+    )
+
+    error: Mapped[str | None] = mapped_column(Text, nullable=True, comment="失敗理由")
+
+    result_path: Mapped[str | None] = mapped_column(
+        String(255), nullable=True, comment="生成したPDFの保存パス"
+    )
+
+    # 依頼者
+    requested_by: Mapped[int | None] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+        comment="依頼者のユーザーID",
+    )
+
+    # タイムスタンプ
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=get_jst_now,
+        comment="投入日時（JST）",
+    )
+
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime, nullable=True, comment="処理開始日時（JST）"
+    )
+
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime, nullable=True, comment="処理完了日時（JST）"
+    )
+
+    # インデックス定義
+    __table_args__ = (
+        Index("ix_pdf_jobs_status_created_at", "status", "created_at"),
+        Index("ix_pdf_jobs_finished_at", "finished_at"),
+    )
+
+    def __repr__(self) -> str:
+        """文字列表現"""
+        return f"<PDFJob(id={self.id!r}, kind={self.kind!r}, status={self.status!r})>"
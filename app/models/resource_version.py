@@ -0,0 +1,56 @@
+"""
+リソースバージョン（ResourceVersion）モデル
+
+Public APIのETagや一覧の総件数キャッシュの検証に使うバージョン番号を、
+複数のワーカープロセスで共有するためのORMモデルです。
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+# テーブル全体（キーを持たないリソース）のバージョンに使うキー
+TABLE_RESOURCE_KEY = 0
+
+
+class ResourceVersion(Base):
+    """
+    リソースバージョンモデル
+
+    データの登録・更新・削除と同じトランザクション内でバージョンを進めます。
+    テーブル単位のバージョンは、同じリソース種別の全行のバージョンの合計とします
+    （更新のたびに同じ1行をロックしないため）。
+
+    Attributes:
+        resource: リソース種別（複合主キー、animals, care_logs等）
+        resource_key: 猫IDなどのキー（複合主キー、テーブル全体は0）
+        version: バージョン番号（更新のたびに1ずつ進む）
+    """
+
+    __tablename__ = "resource_versions"
+
+    # 複合主キー
+    resource: Mapped[str] = mapped_column(
+        String(30), primary_key=True, comment="リソース種別"
+    )
+
+    resource_key: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        default=TABLE_RESOURCE_KEY,
+        comment="猫IDなどのキー（テーブル全体は0）",
+    )
+
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="バージョン番号"
+    )
+
+    def __repr__(self) -> str:
+        """文字列表現"""
+        return (
+            f"<ResourceVersion(resource={self.resource!r}, "
+            f"resource_key={self.resource_key}, version={self.version})>"
+        )
@@ -101,3 +101,6 @@ class AnimalListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = Field(
+        None, description="次のページを取得するカーソル（次のページがない場合はNone）"
+    )
@@ -9,7 +9,9 @@ from __future__ import annotations
 from datetime import date as date_type
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
+
+from app.utils.image_pipeline import resolve_image_variant
 
 
 class AnimalImageBase(BaseModel):
@@ -43,6 +45,21 @@ class AnimalImageResponse(AnimalImageBase):
 
     model_config = {"from_attributes": True}
 
+    @computed_field(description="一覧表示用サムネイルのパス（未生成の場合は元画像）")  # type: ignore[prop-decorator]
+    @property
+    def thumbnail_path(self) -> str:
+        return resolve_image_variant(self.image_path, "thumb") or self.image_path
+
+    @computed_field(description="サムネイル（WebP）のパス（未生成の場合はNone）")  # type: ignore[prop-decorator]
+    @property
+    def thumbnail_webp_path(self) -> str | None:
+        return resolve_image_variant(self.image_path, "thumb", "webp", fallback=False)
+
+    @computed_field(description="拡大表示用画像のパス（未生成の場合は元画像）")  # type: ignore[prop-decorator]
+    @property
+    def large_path(self) -> str:
+        return resolve_image_variant(self.image_path, "large") or self.image_path
+
     def get_file_size_mb(self) -> float:
         """
         ファイルサイズをMB単位で取得
@@ -66,6 +66,14 @@ class CareLogCreate(CareLogBase):
         None, max_length=255, description="ユーザーエージェント"
     )
     device_tag: str | None = Field(None, max_length=100, description="デバイスタグ")
+    idempotency_key: str | None = Field(
+        None,
+        min_length=1,
+        max_length=64,
+        description=(
+            "冪等キー（任意）。登録済みのキーで再送された場合は何もせずに既存の記録を返す"
+        ),
+    )
 
 
 class CareLogUpdate(BaseModel):
@@ -137,6 +145,46 @@ class CareLogListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = Field(
+        None, description="次のページを取得するカーソル（次のページがない場合はNone）"
+    )
+
+
+# 一括登録で1リクエストに含められる件数の上限
+CARE_LOG_BATCH_MAX_ITEMS = 500
+
+
+class CareLogBatchCreate(BaseModel):
+    """世話記録一括登録リクエストスキーマ"""
+
+    items: list[CareLogCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=CARE_LOG_BATCH_MAX_ITEMS,
+        description=f"登録する世話記録（最大{CARE_LOG_BATCH_MAX_ITEMS}件）",
+    )
+
+
+class CareLogBatchItemResult(BaseModel):
+    """世話記録一括登録の行ごとの結果"""
+
+    index: int = Field(..., description="リクエスト内の位置（0始まり）")
+    status: str = Field(..., description="結果（created/updated/unchanged/error）")
+    id: int | None = Field(None, description="登録された世話記録ID")
+    animal_id: int = Field(..., description="猫ID")
+    detail: str | None = Field(None, description="エラー内容（error の場合）")
+
+
+class CareLogBatchResponse(BaseModel):
+    """世話記録一括登録レスポンススキーマ"""
+
+    created: int = Field(..., description="新規登録件数")
+    updated: int = Field(..., description="既存の記録（同じ猫・日付・時点）の更新件数")
+    unchanged: int = Field(..., description="登録済みのため変更しなかった件数")
+    failed: int = Field(..., description="エラー件数")
+    results: list[CareLogBatchItemResult] = Field(
+        ..., description="行ごとの結果（リクエストと同じ順序）"
+    )
 
 
 class CareLogSummary(BaseModel):
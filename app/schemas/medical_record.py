@@ -10,7 +10,7 @@ from datetime import date as date_type
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class MedicalRecordBase(BaseModel):
@@ -92,3 +92,6 @@ class MedicalRecordListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = Field(
+        None, description="次のページを取得するカーソル（次のページがない場合はNone）"
+    )
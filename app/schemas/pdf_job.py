@@ -0,0 +1,80 @@
+"""
+PDF生成ジョブスキーマ
+
+非同期PDF生成ジョブの投入・状態確認のためのPydanticスキーマです。
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+PDFJobKind = Literal["qr_card", "qr_card_grid", "paper_form", "report"]
+PDFJobStatus = Literal["queued", "running", "completed", "failed"]
+
+# 1ジョブで指定できる猫IDの上限（A4で100ページ分）
+MAX_PDF_JOB_ANIMAL_IDS = 1000
+
+
+class PDFJobCreate(BaseModel):
+    """
+    PDF生成ジョブ投入スキーマ
+
+    PDF種別ごとに必要な項目:
+        - qr_card: animal_id
+        - qr_card_grid: animal_ids（件数制限なし、10枚ごとにA4を1ページ）
+        - paper_form: animal_id, year, month
+        - report: report_type, start_date, end_date（individualの場合はanimal_id）
+    """
+
+    kind: PDFJobKind = Field(..., description="PDF種別")
+    animal_id: int | None = Field(None, description="猫のID", gt=0)
+    animal_ids: list[int] | None = Field(
+        None,
+        description="猫のIDリスト（qr_card_grid用）",
+        min_length=1,
+        max_length=MAX_PDF_JOB_ANIMAL_IDS,
+    )
+    year: int | None = Field(None, description="年（paper_form用）", ge=2000, le=2100)
+    month: int | None = Field(None, description="月（paper_form用）", ge=1, le=12)
+    report_type: str | None = Field(
+        None, description="帳票種別（daily/weekly/monthly/individual/medical_summary）"
+    )
+    start_date: date | None = Field(None, description="開始日（report用）")
+    end_date: date | None = Field(None, description="終了日（report用）")
+    base_url: str | None = Field(None, description="ベースURL（省略時は設定から取得）")
+    locale: str = Field("ja", description="ロケール（ja/en）")
+
+    @model_validator(mode="after")
+    def validate_required_fields(self) -> PDFJobCreate:
+        """PDF種別ごとの必須項目を検証"""
+        required: dict[str, tuple[str, ...]] = {
+            "qr_card": ("animal_id",),
+            "qr_card_grid": ("animal_ids",),
+            "paper_form": ("animal_id", "year", "month"),
+            "report": ("report_type", "start_date", "end_date"),
+        }
+        missing = [name for name in required[self.kind] if getattr(self, name) is None]
+        if missing:
+            raise ValueError(f"{self.kind} には {', '.join(missing)} が必要です")
+        return self
+
+    def to_params(self) -> dict[str, object]:
+        """ジョブに保存する生成パラメータ（未指定の項目は除く）"""
+        return self.model_dump(mode="json", exclude={"kind"}, exclude_none=True)
+
+
+class PDFJobResponse(BaseModel):
+    """PDF生成ジョブの状態レスポンススキーマ"""
+
+    id: str = Field(..., description="ジョブID")
+    kind: PDFJobKind = Field(..., description="PDF種別")
+    status: PDFJobStatus = Field(..., description="状態")
+    error: str | None = Field(None, description="失敗理由")
+    created_at: datetime = Field(..., description="投入日時")
+    started_at: datetime | None = Field(None, description="処理開始日時")
+    finished_at: datetime | None = Field(None, description="処理完了日時")
+
+    model_config = {"from_attributes": True}
@@ -23,6 +23,8 @@ from app.schemas.adoption import (
     ApplicantCreate,
     ApplicantUpdate,
 )
+from app.services.dashboard_service import invalidate_dashboard_stats
+from app.utils.http_cache import RESOURCE_ANIMALS, bump_resource_version
 
 logger = logging.getLogger(__name__)
 
@@ -314,9 +316,11 @@ def create_adoption_record(
             new_status="譲渡済み",
         )
         db.add(status_history)
+        bump_resource_version(db, RESOURCE_ANIMALS, animal_id)
 
         db.commit()
         db.refresh(record)
+        invalidate_dashboard_stats()
 
         logger.info(
             f"譲渡記録を登録しました: ID={record.id}, 猫ID={animal_id}, "
@@ -7,14 +7,26 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Hashable
+from datetime import datetime
+from typing import Any
 
 from fastapi import HTTPException, status
 from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
 from app.models.animal import Animal
 from app.models.status_history import StatusHistory
 from app.schemas.animal import AnimalCreate, AnimalListResponse, AnimalUpdate
+from app.services.dashboard_service import invalidate_dashboard_stats
+from app.utils.http_cache import RESOURCE_ANIMALS, bump_resource_version
+from app.utils.pagination import (
+    cached_total,
+    decode_cursor,
+    encode_cursor,
+    keyset_before,
+)
+from app.utils.pdf_cache import invalidate_animal_pdfs
 
 logger = logging.getLogger(__name__)
 
@@ -49,9 +61,11 @@ def create_animal(db: Session, animal_data: AnimalCreate, user_id: int) -> Anima
             reason="初回登録",
         )
         db.add(status_history)
+        bump_resource_version(db, RESOURCE_ANIMALS, animal.id)
 
         db.commit()
         db.refresh(animal)
+        invalidate_dashboard_stats()
 
         logger.info(f"猫を登録しました: ID={animal.id}, 名前={animal.name}")
         return animal
@@ -137,9 +151,12 @@ def update_animal(
         # 猫情報を更新
         for key, value in update_dict.items():
             setattr(animal, key, value)
+        bump_resource_version(db, RESOURCE_ANIMALS, animal.id)
 
         db.commit()
         db.refresh(animal)
+        invalidate_animal_pdfs(animal.id)
+        invalidate_dashboard_stats()
 
         logger.info(f"猫情報を更新しました: ID={animal.id}")
         return animal
@@ -171,7 +188,10 @@ def delete_animal(db: Session, animal_id: int) -> None:
     try:
         animal = get_animal(db, animal_id)
         db.delete(animal)
+        bump_resource_version(db, RESOURCE_ANIMALS, animal_id)
         db.commit()
+        invalidate_animal_pdfs(animal_id)
+        invalidate_dashboard_stats()
 
         logger.info(f"猫を削除しました: ID={animal_id}")
 
@@ -186,8 +206,73 @@ def delete_animal(db: Session, animal_id: int) -> None:
         ) from e
 
 
+def _paginate_animals(
+    query: Query[Any],
+    page: int,
+    page_size: int,
+    cursor: str | None,
+    filters: tuple[Hashable, ...],
+) -> AnimalListResponse:
+    """
+    猫一覧のクエリをページネーション（登録日時の降順）
+
+    cursor を指定した場合はカーソル方式で取得し、総件数はキャッシュを使います。
+
+    Args:
+        query: 絞り込み済みのクエリ
+        page: ページ番号（カーソル方式では無視）
+        page_size: 1ページあたりの件数
+        cursor: 直前のページの next_cursor（カーソル方式）
+        filters: 絞り込み条件（総件数のキャッシュキー）
+
+    Returns:
+        AnimalListResponse: 猫一覧とページネーション情報
+    """
+    order_by = (Animal.created_at.desc(), Animal.id.desc())
+    if cursor is None:
+        # 総件数を取得
+        total = query.count()
+
+        # ページネーション
+        offset = (page - 1) * page_size
+        animals = query.order_by(*order_by).offset(offset).limit(page_size).all()
+        has_next = offset + len(animals) < total
+    else:
+        # カーソル方式（1件多く取得して次のページの有無を判定）
+        after = decode_cursor(cursor, datetime)
+        total = cached_total(query.session, RESOURCE_ANIMALS, filters, query.count)
+        animals = (
+            query.filter(keyset_before(Animal.created_at, Animal.id, after))
+            .order_by(*order_by)
+            .limit(page_size + 1)
+            .all()
+        )
+        has_next = len(animals) > page_size
+        animals = animals[:page_size]
+
+    # 総ページ数を計算
+    total_pages = (total + page_size - 1) // page_size
+
+    next_cursor = None
+    if has_next and animals:
+        next_cursor = encode_cursor(animals[-1].created_at, animals[-1].id)
+
+    return AnimalListResponse(
+        items=animals,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        next_cursor=next_cursor,
+    )
+
+
 def list_animals(
-    db: Session, page: int = 1, page_size: int = 20, status_filter: str | None = None
+    db: Session,
+    page: int = 1,
+    page_size: int = 20,
+    status_filter: str | None = None,
+    cursor: str | None = None,
 ) -> AnimalListResponse:
     """
     猫一覧を取得（ページネーション付き）
@@ -197,9 +282,13 @@ def list_animals(
         page: ページ番号（1から開始）
         page_size: 1ページあたりの件数
         status_filter: ステータスフィルター
+        cursor: 直前のページの next_cursor（指定時はカーソル方式、page は無視）
 
     Returns:
         AnimalListResponse: 猫一覧とページネーション情報
+
+    Raises:
+        HTTPException: カーソルが不正な場合（400）
     """
     # クエリを構築
     query = db.query(Animal)
@@ -208,29 +297,17 @@ def list_animals(
     if status_filter:
         query = query.filter(Animal.status == status_filter)
 
-    # 総件数を取得
-    total = query.count()
-
-    # ページネーション
-    offset = (page - 1) * page_size
-    animals = (
-        query.order_by(Animal.created_at.desc()).offset(offset).limit(page_size).all()
-    )
-
-    # 総ページ数を計算
-    total_pages = (total + page_size - 1) // page_size
-
-    return AnimalListResponse(
-        items=animals,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
+    return _paginate_animals(
+        query, page, page_size, cursor, filters=("list", status_filter)
     )
 
 
 def search_animals(
-    db: Session, query: str, page: int = 1, page_size: int = 20
+    db: Session,
+    query: str,
+    page: int = 1,
+    page_size: int = 20,
+    cursor: str | None = None,
 ) -> AnimalListResponse:
     """
     猫を検索
@@ -242,9 +319,13 @@ def search_animals(
         query: 検索クエリ
         page: ページ番号
         page_size: 1ページあたりの件数
+        cursor: 直前のページの next_cursor（指定時はカーソル方式、page は無視）
 
     Returns:
         AnimalListResponse: 検索結果とページネーション情報
+
+    Raises:
+        HTTPException: カーソルが不正な場合（400）
     """
     # 検索クエリを構築
     search_query = db.query(Animal).filter(
@@ -255,27 +336,8 @@ def search_animals(
         )
     )
 
-    # 総件数を取得
-    total = search_query.count()
-
-    # ページネーション
-    offset = (page - 1) * page_size
-    animals = (
-        search_query.order_by(Animal.created_at.desc())
-        .offset(offset)
-        .limit(page_size)
-        .all()
-    )
-
-    # 総ページ数を計算
-    total_pages = (total + page_size - 1) // page_size
-
-    return AnimalListResponse(
-        items=animals,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
+    return _paginate_animals(
+        search_query, page, page_size, cursor, filters=("search", query)
     )
 
 
@@ -0,0 +1,293 @@
+"""
+世話記録イベント配信サービス
+
+世話記録の登録・更新を、Server-Sent Events（SSE）で接続中の端末に配信するための
+プロセス内のpub/subです。`care_log_service` がコミット後に `publish_care_log_event()`
+を呼び出し、購読中の各クライアントのキューにイベントを積みます。
+
+- 同期エンドポイント（ワーカースレッド）から発行されるため、
+  各購読者のイベントループに `call_soon_threadsafe` で受け渡します。
+- キューは購読者ごとに上限があり、溢れた場合は溜まったイベントを破棄して
+  「再取得が必要」を表す resync イベントに置き換えます（遅い端末がメモリを占有しない）。
+- 一定間隔でハートビート（SSEコメント行）を送り、
+  プロキシによる切断を防ぎつつ切断済みのクライアントを検知します。
+
+pub/sub自体はプロセス内で完結するため、複数ワーカープロセスで起動する構成では
+同じプロセスで発生した更新のみがイベントとして配信されます。他のプロセスでの更新は、
+ハートビートの間隔ごとにデータベースで共有しているバージョン番号（`app.utils.http_cache`）
+を確認し、変わっていれば resync イベントで再取得を促します（最大でハートビートの間隔だけ遅れる）。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import date
+from typing import Any
+
+from app.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# キューが溢れた購読者に送る、全件の再取得を促すイベント
+RESYNC_EVENT: dict[str, Any] = {"type": "resync"}
+
+
+class CareLogSubscription:
+    """
+    世話記録イベントの購読
+
+    Args:
+        loop: 購読者のイベントループ
+        animal_id: 絞り込む猫ID（Noneの場合は全件）
+        max_queue: キューに保持するイベント数の上限
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        animal_id: int | None,
+        max_queue: int,
+    ) -> None:
+        self.loop = loop
+        self.animal_id = animal_id
+        self.queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(max_queue)
+        self.dropped = 0
+
+    def matches(self, event: dict[str, Any]) -> bool:
+        """イベントがこの購読の対象か"""
+        if self.animal_id is None:
+            return True
+        return self.animal_id in (
+            event.get("animal_id"),
+            event.get("previous_animal_id"),
+        )
+
+    def offer(self, event: dict[str, Any] | None) -> None:
+        """
+        イベントをキューに積む（購読者のイベントループ上で実行）
+
+        キューが溢れた場合は未送信のイベントを破棄し、resyncイベントに置き換えます。
+        None は配信終了を表します。
+        """
+        try:
+            self.queue.put_nowait(event)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(None if event is None else RESYNC_EVENT)
+
+    async def get(self) -> dict[str, Any] | None:
+        """次のイベントを待つ（Noneは配信終了）"""
+        return await self.queue.get()
+
+
+class CareLogEventBroker:
+    """
+    世話記録イベントのプロセス内pub/sub
+
+    Args:
+        max_subscribers: 同時に接続できる購読者数の上限
+        max_queue: 購読者ごとのキューの上限
+    """
+
+    def __init__(self, max_subscribers: int, max_queue: int) -> None:
+        self.max_subscribers = max_subscribers
+        self.max_queue = max_queue
+        self._subscriptions: set[CareLogSubscription] = set()
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+
+    @property
+    def subscriber_count(self) -> int:
+        """接続中の購読者数"""
+        with self._lock:
+            return len(self._subscriptions)
+
+    @property
+    def is_full(self) -> bool:
+        """同時接続数が上限に達しているか（購読は予約しない）"""
+        return self.subscriber_count >= self.max_subscribers
+
+    def subscribe(self, animal_id: int | None = None) -> CareLogSubscription | None:
+        """
+        購読を開始（イベントループ上で呼び出す）
+
+        Args:
+            animal_id: 絞り込む猫ID（Noneの場合は全件）
+
+        Returns:
+            CareLogSubscription | None: 購読（上限に達している場合はNone）
+        """
+        subscription = CareLogSubscription(
+            asyncio.get_running_loop(), animal_id, self.max_queue
+        )
+        with self._lock:
+            if len(self._subscriptions) >= self.max_subscribers:
+                return None
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: CareLogSubscription) -> None:
+        """購読を終了（切断時）"""
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, event: dict[str, Any]) -> int:
+        """
+        イベントを配信（任意のスレッドから呼び出し可能）
+
+        Args:
+            event: イベント内容（idは自動で付与）
+
+        Returns:
+            int: 配信対象の購読者数
+        """
+        event = {**event, "id": next(self._sequence)}
+        with self._lock:
+            targets = [s for s in self._subscriptions if s.matches(event)]
+
+        delivered = 0
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+                delivered += 1
+            except RuntimeError:
+                # イベントループが終了済みの購読者は破棄
+                self.unsubscribe(subscription)
+        return delivered
+
+    def close(self) -> None:
+        """すべての購読者に配信終了を通知（アプリケーション終了時）"""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+            self._subscriptions.clear()
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, None)
+            except RuntimeError:
+                continue
+
+
+care_log_event_broker = CareLogEventBroker(
+    max_subscribers=settings.care_log_events_max_subscribers,
+    max_queue=settings.care_log_events_queue_size,
+)
+
+
+def publish_care_log_event(
+    event_type: str,
+    log_id: int,
+    animal_id: int,
+    log_date: date,
+    time_slot: str,
+    previous_animal_id: int | None = None,
+) -> None:
+    """
+    世話記録の登録・更新イベントを配信
+
+    配信内容は公開APIで参照できる識別情報のみとし、
+    端末はイベントを受けて該当のAPIを再取得します。
+
+    Args:
+        event_type: イベント種別（created, updated）
+        log_id: 世話記録ID
+        animal_id: 猫ID
+        log_date: 記録日
+        time_slot: 時点
+        previous_animal_id: 更新で猫が変わった場合の変更前の猫ID
+    """
+    event: dict[str, Any] = {
+        "type": event_type,
+        "log_id": log_id,
+        "animal_id": animal_id,
+        "log_date": log_date.isoformat(),
+        "time_slot": time_slot,
+    }
+    if previous_animal_id is not None and previous_animal_id != animal_id:
+        event["previous_animal_id"] = previous_animal_id
+
+    try:
+        care_log_event_broker.publish(event)
+    except Exception as e:
+        # 配信の失敗で記録の登録・更新を失敗させない
+        logger.warning(f"世話記録イベントの配信に失敗しました: {e}")
+
+
+def format_sse(event: dict[str, Any]) -> str:
+    """イベントをSSE形式に変換"""
+    lines = []
+    if "id" in event:
+        lines.append(f"id: {event['id']}")
+    lines.append(f"event: {event['type']}")
+    lines.append(f"data: {json.dumps(event, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def stream_care_log_events(
+    animal_id: int | None,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    heartbeat_seconds: float,
+    get_version: Callable[[], int] | None = None,
+) -> AsyncIterator[str]:
+    """
+    イベントを購読し、SSE形式で送出
+
+    購読はジェネレーターの開始時に行うため、送出が始まる前にクライアントが
+    切断した場合も購読は残りません。クライアントの切断・配信終了・
+    ジェネレーターのキャンセルのいずれでも購読を解除します。
+    開始時に接続数が上限に達していた場合は、再接続の待ち時間だけを送って終了します。
+
+    get_version を指定した場合は、ハートビートの間隔ごとに世話記録のバージョン番号を
+    確認し、変わっていればハートビートの代わりに resync イベントを送ります
+    （他のプロセスでの更新の検知用。同じプロセスでの更新の後にも送られることがあります）。
+
+    Args:
+        animal_id: 絞り込む猫ID（Noneの場合は全件）
+        is_disconnected: クライアントの切断を確認する関数
+        heartbeat_seconds: ハートビートの間隔（秒）
+        get_version: 世話記録のバージョン番号を取得する関数（ブロッキング、任意）
+
+    Yields:
+        str: SSE形式のメッセージ
+    """
+    # 切断時の再接続待ち時間（ミリ秒）
+    retry = "retry: 3000\n\n"
+    subscription = care_log_event_broker.subscribe(animal_id)
+    if subscription is None:
+        yield retry
+        return
+    try:
+        yield retry
+        loop = asyncio.get_running_loop()
+        version = None if get_version is None else await asyncio.to_thread(get_version)
+        next_check = loop.time() + heartbeat_seconds
+        while not await is_disconnected():
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(), max(next_check - loop.time(), 0)
+                )
+            except TimeoutError:
+                next_check = loop.time() + heartbeat_seconds
+                if get_version is not None:
+                    current = await asyncio.to_thread(get_version)
+                    if current != version:
+                        version = current
+                        yield format_sse(RESYNC_EVENT)
+                        continue
+                yield ": heartbeat\n\n"
+                continue
+            if event is None:
+                break
+            yield format_sse(event)
+    finally:
+        care_log_event_broker.unsubscribe(subscription)
@@ -1,662 +1,1102 @@
-"""
-世話記録サービス
-
-世話記録のCRUD操作とCSVエクスポートを提供します。
-"""
-
-from __future__ import annotations
-
-import csv
-import io
-import logging
-from datetime import date, datetime
-
-from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
-
-from app.models.care_log import CareLog
-from app.schemas.care_log import (
-    CareLogCreate,
-    CareLogListResponse,
-    CareLogResponse,
-    CareLogUpdate,
-)
-from app.utils.i18n import tj
-
-logger = logging.getLogger(__name__)
-
-
-def _validate_defecation_fields(defecation: bool, stool_condition: int | None) -> None:
-    if defecation is False and stool_condition is not None:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="defecation=false の場合、stool_condition は null である必要があります",
-        )
-    if defecation is True:
-        if stool_condition is None:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="defecation=true の場合、stool_condition は必須です",
-            )
-        if not (1 <= stool_condition <= 5):
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="stool_condition は 1〜5 の範囲である必要があります",
-            )
-
-
-def create_care_log(db: Session, care_log_data: CareLogCreate) -> CareLog:
-    """
-    世話記録を登録
-
-    Args:
-        db: データベースセッション
-        care_log_data: 世話記録データ
-
-    Returns:
-        CareLog: 登録された世話記録
-
-    Raises:
-        HTTPException: データベースエラーが発生した場合
-    """
-    try:
-        _validate_defecation_fields(
-            care_log_data.defecation,
-            None
-            if care_log_data.stool_condition is None
-            else int(care_log_data.stool_condition),
-        )
-
-        care_log = CareLog(**care_log_data.model_dump())
-        db.add(care_log)
-        db.commit()
-        db.refresh(care_log)
-
-        logger.info(
-            f"世話記録を登録しました: ID={care_log.id}, 猫ID={care_log.animal_id}"
-        )
-        return care_log
-
-    except HTTPException:
-        raise
-
-    except Exception as e:
-        db.rollback()
-        logger.error(f"世話記録の登録に失敗しました: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="世話記録の登録に失敗しました",
-        ) from e
-
-
-def get_care_log(db: Session, care_log_id: int) -> CareLogResponse:
-    """
-    世話記録の詳細を取得
-
-    Args:
-        db: データベースセッション
-        care_log_id: 世話記録ID
-
-    Returns:
-        CareLogResponse: 世話記録（猫の名前を含む）
-
-    Raises:
-        HTTPException: 世話記録が見つからない場合
-    """
-    try:
-        care_log = db.query(CareLog).filter(CareLog.id == care_log_id).first()
-
-        if not care_log:
-            logger.warning(f"世話記録が見つかりません: ID={care_log_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"ID {care_log_id} の世話記録が見つかりません",
-            )
-
-        # 猫名を取得
-        animal_name = None
-        if care_log.animal:
-            animal_name = care_log.animal.name or f"ID:{care_log.animal_id}"
-
-        # CareLogResponseを作成
-        return CareLogResponse(
-            id=care_log.id,
-            animal_id=care_log.animal_id,
-            animal_name=animal_name,
-            recorder_id=care_log.recorder_id,
-            recorder_name=care_log.recorder_name,
-            log_date=care_log.log_date,
-            time_slot=care_log.time_slot,
-            appetite=care_log.appetite,
-            energy=care_log.energy,
-            urination=care_log.urination,
-            defecation=care_log.defecation,
-            stool_condition=care_log.stool_condition,
-            cleaning=care_log.cleaning,
-            memo=care_log.memo,
-            from_paper=care_log.from_paper,
-            ip_address=care_log.ip_address,
-            user_agent=care_log.user_agent,
-            device_tag=care_log.device_tag,
-            created_at=care_log.created_at,
-            last_updated_at=care_log.last_updated_at,
-            last_updated_by=care_log.last_updated_by,
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"世話記録の取得に失敗しました: ID={care_log_id}, エラー={e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="世話記録の取得に失敗しました",
-        ) from e
-
-
-def update_care_log(
-    db: Session,
-    care_log_id: int,
-    care_log_data: CareLogUpdate,
-    user_id: int | None,
-    expected_animal_id: int | None = None,
-    enforce_time_slot: str | None = None,
-    care_log: CareLog | None = None,
-) -> CareLogResponse:
-    """
-    世話記録を更新
-
-    Args:
-        db: データベースセッション
-        care_log_id: 世話記録ID
-        care_log_data: 更新データ
-        user_id: 更新者のユーザーID
-        expected_animal_id: 期待される猫ID（指定時のみ検証）
-        enforce_time_slot: 強制する時点（指定時のみ検証）
-        care_log: 既に取得済みのCareLogオブジェクト（省略時は自動取得）
-
-    Returns:
-        CareLogResponse: 更新された世話記録（猫の名前を含む）
-
-    Raises:
-        HTTPException: 世話記録が見つからない場合、またはデータベースエラーが発生した場合
-        ValueError: care_logのIDがcare_log_idと一致しない場合
-    """
-    try:
-        # CareLogオブジェクトを直接取得（未提供の場合のみ）
-        if care_log is None:
-            care_log = db.query(CareLog).filter(CareLog.id == care_log_id).first()
-
-        if not care_log:
-            logger.warning(f"世話記録が見つかりません: ID={care_log_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"ID {care_log_id} の世話記録が見つかりません",
-            )
-
-        if expected_animal_id is not None and care_log.animal_id != expected_animal_id:
-            logger.warning(
-                "世話記録の猫IDが一致しません: care_log_id=%s, expected=%s, actual=%s",
-                care_log_id,
-                expected_animal_id,
-                care_log.animal_id,
-            )
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"ID {care_log_id} の世話記録が見つかりません",
-            )
-
-        update_dict = care_log_data.model_dump(exclude_unset=True)
-
-        if (
-            enforce_time_slot
-            and "time_slot" in update_dict
-            and update_dict["time_slot"] != enforce_time_slot
-        ):
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="この記録の時点は変更できません",
-            )
-
-        # defecation=False に変更する場合、stool_condition が明示的に指定されていなければ自動的にクリアする。
-        # ただし defecation=False と同時に stool_condition に値が指定された場合は不整合として弾く。
-        if "defecation" in update_dict and update_dict["defecation"] is False:
-            if "stool_condition" not in update_dict:
-                update_dict["stool_condition"] = None
-            elif update_dict["stool_condition"] is not None:
-                raise HTTPException(
-                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                    detail="defecation=false の場合、stool_condition は null である必要があります",
-                )
-
-        proposed_defecation = update_dict.get("defecation", care_log.defecation)
-        proposed_stool_condition = update_dict.get(
-            "stool_condition", care_log.stool_condition
-        )
-
-        _validate_defecation_fields(
-            bool(proposed_defecation),
-            None if proposed_stool_condition is None else int(proposed_stool_condition),
-        )
-
-        for key, value in update_dict.items():
-            setattr(care_log, key, value)
-
-        if user_id is not None:
-            care_log.last_updated_by = user_id
-
-        db.commit()
-        db.refresh(care_log)
-
-        logger.info(f"世話記録を更新しました: ID={care_log_id}")
-
-        # 猫名を取得してCareLogResponseを返す
-        animal_name = None
-        if care_log.animal:
-            animal_name = care_log.animal.name or f"ID:{care_log.animal_id}"
-
-        return CareLogResponse(
-            id=care_log.id,
-            animal_id=care_log.animal_id,
-            animal_name=animal_name,
-            recorder_id=care_log.recorder_id,
-            recorder_name=care_log.recorder_name,
-            log_date=care_log.log_date,
-            time_slot=care_log.time_slot,
-            appetite=care_log.appetite,
-            energy=care_log.energy,
-            urination=care_log.urination,
-            defecation=care_log.defecation,
-            stool_condition=care_log.stool_condition,
-            cleaning=care_log.cleaning,
-            memo=care_log.memo,
-            from_paper=care_log.from_paper,
-            ip_address=care_log.ip_address,
-            user_agent=care_log.user_agent,
-            device_tag=care_log.device_tag,
-            created_at=care_log.created_at,
-            last_updated_at=care_log.last_updated_at,
-            last_updated_by=care_log.last_updated_by,
-        )
-
-    except HTTPException:
-        raise
-    except ValueError as e:
-        # プログラミングエラー（care_logとcare_log_idの不一致）
-        logger.error(f"無効なパラメータ: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="無効なリクエストです",
-        ) from e
-    except Exception as e:
-        db.rollback()
-        logger.error(f"世話記録の更新に失敗しました: ID={care_log_id}, エラー={e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="世話記録の更新に失敗しました",
-        ) from e
-
-
-def list_care_logs(
-    db: Session,
-    page: int = 1,
-    page_size: int = 20,
-    animal_id: int | None = None,
-    start_date: date | None = None,
-    end_date: date | None = None,
-    time_slot: str | None = None,
-) -> CareLogListResponse:
-    """
-    世話記録一覧を取得（ページネーション付き）
-
-    Args:
-        db: データベースセッション
-        page: ページ番号（1から開始）
-        page_size: 1ページあたりの件数
-        animal_id: 猫IDフィルター
-        start_date: 開始日フィルター
-        end_date: 終了日フィルター
-        time_slot: 時点フィルター
-
-    Returns:
-        CareLogListResponse: 世話記録一覧とページネーション情報
-    """
-    # クエリを構築
-    query = db.query(CareLog)
-
-    # フィルター
-    if animal_id:
-        query = query.filter(CareLog.animal_id == animal_id)
-
-    if start_date:
-        start_datetime = datetime.combine(start_date, datetime.min.time())
-        query = query.filter(CareLog.created_at >= start_datetime)
-
-    if end_date:
-        end_datetime = datetime.combine(end_date, datetime.max.time())
-        query = query.filter(CareLog.created_at <= end_datetime)
-
-    if time_slot:
-        query = query.filter(CareLog.time_slot == time_slot)
-
-    # 総件数を取得
-    total = query.count()
-
-    # ページネーション
-    offset = (page - 1) * page_size
-    care_logs = (
-        query.order_by(CareLog.created_at.desc()).offset(offset).limit(page_size).all()
-    )
-
-    # 総ページ数を計算
-    total_pages = (total + page_size - 1) // page_size
-
-    # レスポンスアイテムを作成（animal_nameを追加）
-    items: list[CareLogResponse] = []
-    for log in care_logs:
-        # 猫名を取得
-        animal_name = None
-        if log.animal:
-            animal_name = log.animal.name or f"ID:{log.animal_id}"
-
-        # CareLogResponseを作成
-        log_response = CareLogResponse(
-            id=log.id,
-            animal_id=log.animal_id,
-            animal_name=animal_name,
-            recorder_id=log.recorder_id,
-            recorder_name=log.recorder_name,
-            log_date=log.log_date,
-            time_slot=log.time_slot,
-            appetite=log.appetite,
-            energy=log.energy,
-            urination=log.urination,
-            defecation=log.defecation,
-            stool_condition=log.stool_condition,
-            cleaning=log.cleaning,
-            memo=log.memo,
-            from_paper=log.from_paper,
-            ip_address=log.ip_address,
-            user_agent=log.user_agent,
-            device_tag=log.device_tag,
-            created_at=log.created_at,
-            last_updated_at=log.last_updated_at,
-            last_updated_by=log.last_updated_by,
-        )
-        items.append(log_response)
-
-    return CareLogListResponse(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
-    )
-
-
-def export_care_logs_csv(
-    db: Session,
-    animal_id: int | None = None,
-    start_date: date | None = None,
-    end_date: date | None = None,
-) -> str:
-    """
-    世話記録をCSV形式でエクスポート
-
-    Args:
-        db: データベースセッション
-        animal_id: 猫IDフィルター
-        start_date: 開始日フィルター
-        end_date: 終了日フィルター
-
-    Returns:
-        str: CSV文字列
-    """
-    # クエリを構築
-    query = db.query(CareLog)
-
-    # フィルター
-    if animal_id:
-        query = query.filter(CareLog.animal_id == animal_id)
-
-    if start_date:
-        start_datetime = datetime.combine(start_date, datetime.min.time())
-        query = query.filter(CareLog.created_at >= start_datetime)
-
-    if end_date:
-        end_datetime = datetime.combine(end_date, datetime.max.time())
-        query = query.filter(CareLog.created_at <= end_datetime)
-
-    # データを取得
-    care_logs = query.order_by(CareLog.created_at.desc()).all()
-
-    # CSVを生成
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # ヘッダー
-    writer.writerow(
-        [
-            "ID",
-            "猫ID",
-            "記録者名",
-            "時点",
-            "食欲",
-            "元気",
-            "排尿",
-            "清掃",
-            "メモ",
-            "記録日時",
-        ]
-    )
-
-    # データ行
-    for log in care_logs:
-        writer.writerow(
-            [
-                log.id,
-                log.animal_id,
-                log.recorder_name,
-                tj(f"time_slots.{log.time_slot}"),
-                log.appetite,
-                log.energy,
-                "有" if log.urination else "無",
-                "済" if log.cleaning else "未",
-                log.memo or "",
-                log.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-            ]
-        )
-
-    return output.getvalue()
-
-
-def get_latest_care_log(db: Session, animal_id: int) -> CareLog | None:
-    """
-    指定された猫の最新の世話記録を取得
-
-    前回入力値コピー機能で使用します。
-
-    Args:
-        db: データベースセッション
-        animal_id: 猫ID
-
-    Returns:
-        Optional[CareLog]: 最新の世話記録（存在しない場合はNone）
-    """
-    return (
-        db.query(CareLog)
-        .filter(CareLog.animal_id == animal_id)
-        .order_by(CareLog.created_at.desc(), CareLog.id.desc())
-        .first()
-    )
-
-
-def get_daily_view(
-    db: Session,
-    animal_id: int | None = None,
-    start_date: date | None = None,
-    end_date: date | None = None,
-    page: int = 1,
-    page_size: int = 20,
-) -> dict[str, object]:
-    """
-    日次ビュー形式のデータを取得
-
-    Args:
-        db: データベースセッション
-        animal_id: 猫ID（Noneの場合は全猫）
-        start_date: 開始日（デフォルト: 7日前）
-        end_date: 終了日（デフォルト: 今日）
-        page: ページ番号
-        page_size: ページサイズ
-
-    Returns:
-        dict: 日次ビュー形式のデータ
-            - items: list[dict]
-            - total: int
-            - page: int
-            - page_size: int
-            - total_pages: int
-    """
-    from datetime import timedelta
-
-    from sqlalchemy import and_
-
-    from app.models.animal import Animal
-
-    # デフォルト日付範囲を設定（過去7日間）
-    if end_date is None:
-        end_date = date.today()
-    if start_date is None:
-        start_date = end_date - timedelta(days=6)
-
-    # 日付範囲のバリデーション
-    if start_date > end_date:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="開始日は終了日以前である必要があります",
-        )
-
-    # 対象猫を取得
-    animal_query = db.query(Animal)
-    if animal_id is not None:
-        animal_query = animal_query.filter(Animal.id == animal_id)
-    animals = animal_query.all()
-
-    if not animals:
-        return {
-            "items": [],
-            "total": 0,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": 0,
-        }
-
-    # 日付×猫の組み合わせを生成
-    daily_records = []
-    current_date = start_date
-    while current_date <= end_date:
-        for animal in animals:
-            # 各時点の記録を取得
-            morning_log = (
-                db.query(CareLog)
-                .filter(
-                    and_(
-                        CareLog.animal_id == animal.id,
-                        CareLog.log_date == current_date,
-                        CareLog.time_slot == "morning",
-                    )
-                )
-                .first()
-            )
-
-            noon_log = (
-                db.query(CareLog)
-                .filter(
-                    and_(
-                        CareLog.animal_id == animal.id,
-                        CareLog.log_date == current_date,
-                        CareLog.time_slot == "noon",
-                    )
-                )
-                .first()
-            )
-
-            evening_log = (
-                db.query(CareLog)
-                .filter(
-                    and_(
-                        CareLog.animal_id == animal.id,
-                        CareLog.log_date == current_date,
-                        CareLog.time_slot == "evening",
-                    )
-                )
-                .first()
-            )
-
-            # 辞書形式で作成
-            morning_record = {
-                "exists": morning_log is not None,
-                "log_id": morning_log.id if morning_log else None,
-                "appetite": morning_log.appetite if morning_log else None,
-                "energy": morning_log.energy if morning_log else None,
-                "urination": morning_log.urination if morning_log else None,
-                "cleaning": morning_log.cleaning if morning_log else None,
-            }
-
-            noon_record = {
-                "exists": noon_log is not None,
-                "log_id": noon_log.id if noon_log else None,
-                "appetite": noon_log.appetite if noon_log else None,
-                "energy": noon_log.energy if noon_log else None,
-                "urination": noon_log.urination if noon_log else None,
-                "cleaning": noon_log.cleaning if noon_log else None,
-            }
-
-            evening_record = {
-                "exists": evening_log is not None,
-                "log_id": evening_log.id if evening_log else None,
-                "appetite": evening_log.appetite if evening_log else None,
-                "energy": evening_log.energy if evening_log else None,
-                "urination": evening_log.urination if evening_log else None,
-                "cleaning": evening_log.cleaning if evening_log else None,
-            }
-
-            # 辞書形式で作成
-            daily_record = {
-                "date": current_date.isoformat(),
-                "animal_id": animal.id,
-                "animal_name": animal.name if animal.name else f"猫 {animal.id}",
-                "morning": morning_record,
-                "noon": noon_record,
-                "evening": evening_record,
-            }
-
-            daily_records.append(daily_record)
-
-        current_date += timedelta(days=1)
-
-    # 日付降順でソート（新しい日付が上）
-    daily_records.sort(key=lambda x: str(x["date"]), reverse=True)
-
-    # ページネーション
-    total = len(daily_records)
-    total_pages = (total + page_size - 1) // page_size if total > 0 else 0
-
-    # ページ番号のバリデーション
-    if page < 1:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="ページ番号は1以上である必要があります",
-        )
-
-    start_idx = (page - 1) * page_size
-    end_idx = start_idx + page_size
-    paginated_records = daily_records[start_idx:end_idx]
-
-    return {
-        "items": paginated_records,
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": total_pages,
-    }
+"""
+世話記録サービス
+
+世話記録のCRUD操作とCSVエクスポートを提供します。
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import Any, cast
+
+from fastapi import HTTPException, status
+from sqlalchemy import Insert, and_, func, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.animal import Animal
+from app.models.care_log import CareLog
+from app.schemas.care_log import (
+    CareLogBatchItemResult,
+    CareLogCreate,
+    CareLogListResponse,
+    CareLogResponse,
+    CareLogUpdate,
+)
+from app.services.care_log_events import publish_care_log_event
+from app.services.care_status_service import (
+    mark_time_slot_recorded,
+    mark_time_slots_recorded,
+    rebuild_daily_care_status,
+)
+from app.services.csv_service import (
+    CSV_FETCH_BATCH_SIZE,
+    iter_csv_chunks,
+    stream_in_session,
+)
+from app.services.dashboard_service import invalidate_dashboard_stats
+from app.utils.http_cache import (
+    RESOURCE_CARE_LOGS,
+    bump_resource_version,
+    bump_resource_versions,
+)
+from app.utils.i18n import get_catalog
+from app.utils.pagination import (
+    cached_total,
+    decode_cursor,
+    encode_cursor,
+    keyset_before,
+)
+
+logger = logging.getLogger(__name__)
+
+# 同じ猫・日付・時点の再登録で比較する項目（すべて同じなら何もしない）
+UPSERT_CONTENT_FIELDS: tuple[str, ...] = (
+    "recorder_name",
+    "appetite",
+    "energy",
+    "urination",
+    "defecation",
+    "stool_condition",
+    "cleaning",
+    "memo",
+    "from_paper",
+)
+# 同じ猫・日付・時点の再登録で更新する項目
+UPSERT_UPDATE_FIELDS: tuple[str, ...] = (
+    *UPSERT_CONTENT_FIELDS,
+    "recorder_id",
+    "ip_address",
+    "user_agent",
+    "device_tag",
+)
+
+# 日次ビューで横に並べる時点
+DAILY_VIEW_TIME_SLOTS: tuple[str, ...] = ("morning", "noon", "evening")
+
+
+def _validate_defecation_fields(defecation: bool, stool_condition: int | None) -> None:
+    if defecation is False and stool_condition is not None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="defecation=false の場合、stool_condition は null である必要があります",
+        )
+    if defecation is True:
+        if stool_condition is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="defecation=true の場合、stool_condition は必須です",
+            )
+        if not (1 <= stool_condition <= 5):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="stool_condition は 1〜5 の範囲である必要があります",
+            )
+
+
+def _care_log_upsert_statement(db: Session) -> Insert:
+    """
+    猫・日付・時点の組でUPSERTするINSERT文を作成
+
+    同じ組の記録が既にある場合は内容を更新します。
+    作成日時は最初の登録のものを保持し、冪等キーは未設定の場合のみ設定します。
+    """
+    table = CareLog.__table__
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(table)
+    # 方言モジュールを実行時に選ぶため、mypyには戻り値の型が伝わらない
+    return cast(
+        Insert,
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.animal_id, table.c.log_date, table.c.time_slot],
+            set_={
+                **{field: stmt.excluded[field] for field in UPSERT_UPDATE_FIELDS},
+                "idempotency_key": func.coalesce(
+                    table.c.idempotency_key, stmt.excluded.idempotency_key
+                ),
+                "last_updated_at": stmt.excluded.last_updated_at,
+            },
+        ),
+    )
+
+
+def _has_same_content(existing: CareLog, care_log_data: CareLogCreate) -> bool:
+    """既存の記録と登録内容が同じか（再送・再取り込みの判定）"""
+    return all(
+        getattr(existing, field) == getattr(care_log_data, field)
+        for field in UPSERT_CONTENT_FIELDS
+    )
+
+
+def _find_care_log_by_slot(
+    db: Session, animal_id: int, log_date: date, time_slot: str
+) -> CareLog | None:
+    return db.scalar(
+        select(CareLog)
+        .where(
+            CareLog.animal_id == animal_id,
+            CareLog.log_date == log_date,
+            CareLog.time_slot == time_slot,
+        )
+        .execution_options(populate_existing=True)
+    )
+
+
+def create_care_log(db: Session, care_log_data: CareLogCreate) -> CareLog:
+    """
+    世話記録を登録（同じ猫・日付・時点の記録がある場合は更新）
+
+    冪等キーが登録済みの場合、または同じ内容の記録が既にある場合は
+    何も変更せずに既存の記録を返します（再送・再取り込みは何もしない）。
+
+    Args:
+        db: データベースセッション
+        care_log_data: 世話記録データ
+
+    Returns:
+        CareLog: 登録または更新された世話記録
+
+    Raises:
+        HTTPException: データベースエラーが発生した場合
+    """
+    try:
+        _validate_defecation_fields(
+            care_log_data.defecation,
+            None
+            if care_log_data.stool_condition is None
+            else int(care_log_data.stool_condition),
+        )
+
+        if care_log_data.idempotency_key is not None:
+            replayed = db.scalar(
+                select(CareLog).where(
+                    CareLog.idempotency_key == care_log_data.idempotency_key
+                )
+            )
+            if replayed is not None:
+                logger.info(
+                    f"冪等キーが登録済みのため世話記録を変更しません: ID={replayed.id}"
+                )
+                return replayed
+
+        existing = _find_care_log_by_slot(
+            db, care_log_data.animal_id, care_log_data.log_date, care_log_data.time_slot
+        )
+        if existing is not None and _has_same_content(existing, care_log_data):
+            logger.info(f"同じ内容の世話記録が登録済みです: ID={existing.id}")
+            return existing
+
+        db.execute(_care_log_upsert_statement(db), [care_log_data.model_dump()])
+        mark_time_slot_recorded(
+            db, care_log_data.animal_id, care_log_data.log_date, care_log_data.time_slot
+        )
+        bump_resource_version(db, RESOURCE_CARE_LOGS, care_log_data.animal_id)
+        db.commit()
+        care_log = _find_care_log_by_slot(
+            db, care_log_data.animal_id, care_log_data.log_date, care_log_data.time_slot
+        )
+        assert care_log is not None
+        invalidate_dashboard_stats()
+        publish_care_log_event(
+            "created" if existing is None else "updated",
+            care_log.id,
+            care_log.animal_id,
+            care_log.log_date,
+            care_log.time_slot,
+        )
+
+        logger.info(
+            f"世話記録を{'登録' if existing is None else '更新'}しました: "
+            f"ID={care_log.id}, 猫ID={care_log.animal_id}"
+        )
+        return care_log
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"世話記録の登録に失敗しました: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="世話記録の登録に失敗しました",
+        ) from e
+
+
+def create_care_logs_batch(
+    db: Session, items: list[CareLogCreate]
+) -> list[CareLogBatchItemResult]:
+    """
+    世話記録を一括登録（紙記録の取り込み等）
+
+    各行を検証し、猫の存在確認・冪等キーの照合・既存の記録の取得は
+    それぞれ1クエリでまとめて行います。新規・変更のある行は1つのトランザクションで
+    executemanyによりUPSERTし、同じ内容の行（再取り込み）は何もしません。
+    エラーの行は登録せずに行ごとの結果として返します。
+
+    Args:
+        db: データベースセッション
+        items: 世話記録データ
+
+    Returns:
+        list[CareLogBatchItemResult]: 行ごとの結果（リクエストと同じ順序）
+
+    Raises:
+        HTTPException: データベースエラーが発生した場合
+    """
+    results: list[CareLogBatchItemResult | None] = [None] * len(items)
+
+    def _result(index: int, result_status: str, **kwargs: Any) -> None:
+        results[index] = CareLogBatchItemResult(
+            index=index,
+            status=result_status,
+            animal_id=items[index].animal_id,
+            **kwargs,
+        )
+
+    valid: list[tuple[int, CareLogCreate]] = []
+    for index, item in enumerate(items):
+        try:
+            _validate_defecation_fields(
+                item.defecation,
+                None if item.stool_condition is None else int(item.stool_condition),
+            )
+        except HTTPException as e:
+            _result(index, "error", detail=e.detail)
+            continue
+        valid.append((index, item))
+
+    animal_ids = {item.animal_id for _, item in valid}
+    existing_ids = (
+        set(db.scalars(select(Animal.id).where(Animal.id.in_(animal_ids))).all())
+        if animal_ids
+        else set()
+    )
+    idempotency_keys = {
+        item.idempotency_key for _, item in valid if item.idempotency_key is not None
+    }
+    replayed = (
+        {
+            care_log.idempotency_key: care_log.id
+            for care_log in db.scalars(
+                select(CareLog).where(CareLog.idempotency_key.in_(idempotency_keys))
+            )
+        }
+        if idempotency_keys
+        else {}
+    )
+
+    # 同じ猫・日付・時点の行がバッチ内に複数ある場合は最後の行を適用する
+    rows: dict[tuple[int, date, str], tuple[int, CareLogCreate]] = {}
+    for index, item in valid:
+        if item.animal_id not in existing_ids:
+            _result(index, "error", detail=f"ID {item.animal_id} の猫が見つかりません")
+            continue
+        if item.idempotency_key in replayed:
+            _result(index, "unchanged", id=replayed[item.idempotency_key])
+            continue
+        slot_key = (item.animal_id, item.log_date, item.time_slot)
+        if slot_key in rows:
+            _result(
+                rows[slot_key][0],
+                "error",
+                detail="同じ猫・日付・時点の行が後に続くため適用しませんでした",
+            )
+        rows[slot_key] = (index, item)
+
+    # 冪等キーは1件の記録にしか付けられないため、別の時点の行で同じキーが
+    # 繰り返された場合は最初の行だけを適用する
+    claimed_keys: set[str] = set()
+    for slot_key, (index, item) in sorted(rows.items(), key=lambda row: row[1][0]):
+        if item.idempotency_key is None:
+            continue
+        if item.idempotency_key in claimed_keys:
+            _result(index, "error", detail="同じ冪等キーの行がバッチ内に既にあります")
+            del rows[slot_key]
+            continue
+        claimed_keys.add(item.idempotency_key)
+
+    existing_logs = _load_care_logs_by_slot(db, list(rows))
+    writes: list[tuple[int, CareLogCreate, bool]] = []
+    for slot_key, (index, item) in rows.items():
+        existing = existing_logs.get(slot_key)
+        if existing is not None and _has_same_content(existing, item):
+            _result(index, "unchanged", id=existing.id)
+        else:
+            writes.append((index, item, existing is None))
+
+    if writes:
+        try:
+            db.execute(
+                _care_log_upsert_statement(db),
+                [item.model_dump() for _, item, _ in writes],
+            )
+            mark_time_slots_recorded(
+                db,
+                [
+                    (item.animal_id, item.log_date, item.time_slot)
+                    for _, item, created in writes
+                    if created
+                ],
+            )
+            bump_resource_versions(
+                db, RESOURCE_CARE_LOGS, (item.animal_id for _, item, _ in writes)
+            )
+            db.commit()
+            saved_logs = _load_care_logs_by_slot(
+                db,
+                [
+                    (item.animal_id, item.log_date, item.time_slot)
+                    for _, item, _ in writes
+                ],
+            )
+        except Exception as e:
+            db.rollback()
+            logger.error(f"世話記録の一括登録に失敗しました: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="世話記録の一括登録に失敗しました",
+            ) from e
+
+        invalidate_dashboard_stats()
+        for index, item, created in writes:
+            care_log = saved_logs[(item.animal_id, item.log_date, item.time_slot)]
+            _result(index, "created" if created else "updated", id=care_log.id)
+            publish_care_log_event(
+                "created" if created else "updated",
+                care_log.id,
+                item.animal_id,
+                item.log_date,
+                item.time_slot,
+            )
+
+    logger.info(
+        f"世話記録を一括登録しました: 登録・更新={len(writes)}件, 全{len(items)}件"
+    )
+    return [result for result in results if result is not None]
+
+
+def _load_care_logs_by_slot(
+    db: Session, slot_keys: list[tuple[int, date, str]]
+) -> dict[tuple[int, date, str], CareLog]:
+    """
+    猫・日付・時点の組に対応する世話記録を1クエリで取得
+
+    行値のIN（(a, b, c) IN (...)）はSQLiteで全件走査になるため、
+    組ごとの条件のORとして一意制約のインデックスを引きます。
+    """
+    if not slot_keys:
+        return {}
+    care_logs = db.scalars(
+        select(CareLog)
+        .where(
+            or_(
+                *(
+                    and_(
+                        CareLog.animal_id == animal_id,
+                        CareLog.log_date == log_date,
+                        CareLog.time_slot == time_slot,
+                    )
+                    for animal_id, log_date, time_slot in slot_keys
+                )
+            )
+        )
+        .execution_options(populate_existing=True)
+    )
+    return {
+        (care_log.animal_id, care_log.log_date, care_log.time_slot): care_log
+        for care_log in care_logs
+    }
+
+
+def get_care_log(db: Session, care_log_id: int) -> CareLogResponse:
+    """
+    世話記録の詳細を取得
+
+    Args:
+        db: データベースセッション
+        care_log_id: 世話記録ID
+
+    Returns:
+        CareLogResponse: 世話記録（猫の名前を含む）
+
+    Raises:
+        HTTPException: 世話記録が見つからない場合
+    """
+    try:
+        care_log = db.query(CareLog).filter(CareLog.id == care_log_id).first()
+
+        if not care_log:
+            logger.warning(f"世話記録が見つかりません: ID={care_log_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"ID {care_log_id} の世話記録が見つかりません",
+            )
+
+        # 猫名を取得
+        animal_name = None
+        if care_log.animal:
+            animal_name = care_log.animal.name or f"ID:{care_log.animal_id}"
+
+        # CareLogResponseを作成
+        return CareLogResponse(
+            id=care_log.id,
+            animal_id=care_log.animal_id,
+            animal_name=animal_name,
+            recorder_id=care_log.recorder_id,
+            recorder_name=care_log.recorder_name,
+            log_date=care_log.log_date,
+            time_slot=care_log.time_slot,
+            appetite=care_log.appetite,
+            energy=care_log.energy,
+            urination=care_log.urination,
+            defecation=care_log.defecation,
+            stool_condition=care_log.stool_condition,
+            cleaning=care_log.cleaning,
+            memo=care_log.memo,
+            from_paper=care_log.from_paper,
+            ip_address=care_log.ip_address,
+            user_agent=care_log.user_agent,
+            device_tag=care_log.device_tag,
+            created_at=care_log.created_at,
+            last_updated_at=care_log.last_updated_at,
+            last_updated_by=care_log.last_updated_by,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"世話記録の取得に失敗しました: ID={care_log_id}, エラー={e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="世話記録の取得に失敗しました",
+        ) from e
+
+
+def update_care_log(
+    db: Session,
+    care_log_id: int,
+    care_log_data: CareLogUpdate,
+    user_id: int | None,
+    expected_animal_id: int | None = None,
+    enforce_time_slot: str | None = None,
+    care_log: CareLog | None = None,
+) -> CareLogResponse:
+    """
+    世話記録を更新
+
+    Args:
+        db: データベースセッション
+        care_log_id: 世話記録ID
+        care_log_data: 更新データ
+        user_id: 更新者のユーザーID
+        expected_animal_id: 期待される猫ID（指定時のみ検証）
+        enforce_time_slot: 強制する時点（指定時のみ検証）
+        care_log: 既に取得済みのCareLogオブジェクト（省略時は自動取得）
+
+    Returns:
+        CareLogResponse: 更新された世話記録（猫の名前を含む）
+
+    Raises:
+        HTTPException: 世話記録が見つからない場合、またはデータベースエラーが発生した場合
+        ValueError: care_logのIDがcare_log_idと一致しない場合
+    """
+    try:
+        # CareLogオブジェクトを直接取得（未提供の場合のみ）
+        if care_log is None:
+            care_log = db.query(CareLog).filter(CareLog.id == care_log_id).first()
+
+        if not care_log:
+            logger.warning(f"世話記録が見つかりません: ID={care_log_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"ID {care_log_id} の世話記録が見つかりません",
+            )
+
+        if expected_animal_id is not None and care_log.animal_id != expected_animal_id:
+            logger.warning(
+                "世話記録の猫IDが一致しません: care_log_id=%s, expected=%s, actual=%s",
+                care_log_id,
+                expected_animal_id,
+                care_log.animal_id,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"ID {care_log_id} の世話記録が見つかりません",
+            )
+
+        update_dict = care_log_data.model_dump(exclude_unset=True)
+
+        if (
+            enforce_time_slot
+            and "time_slot" in update_dict
+            and update_dict["time_slot"] != enforce_time_slot
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="この記録の時点は変更できません",
+            )
+
+        # defecation=False に変更する場合、stool_condition が明示的に指定されていなければ自動的にクリアする。
+        # ただし defecation=False と同時に stool_condition に値が指定された場合は不整合として弾く。
+        if "defecation" in update_dict and update_dict["defecation"] is False:
+            if "stool_condition" not in update_dict:
+                update_dict["stool_condition"] = None
+            elif update_dict["stool_condition"] is not None:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail="defecation=false の場合、stool_condition は null である必要があります",
+                )
+
+        proposed_defecation = update_dict.get("defecation", care_log.defecation)
+        proposed_stool_condition = update_dict.get(
+            "stool_condition", care_log.stool_condition
+        )
+
+        _validate_defecation_fields(
+            bool(proposed_defecation),
+            None if proposed_stool_condition is None else int(proposed_stool_condition),
+        )
+
+        previous_key = (care_log.animal_id, care_log.log_date, care_log.time_slot)
+
+        for key, value in update_dict.items():
+            setattr(care_log, key, value)
+
+        if user_id is not None:
+            care_log.last_updated_by = user_id
+
+        # 猫・日付・時点が変わった場合は当日記録状況を移動元と移動先で再計算
+        current_key = (care_log.animal_id, care_log.log_date, care_log.time_slot)
+        if current_key != previous_key:
+            db.flush()
+            rebuild_daily_care_status(db, previous_key[0], previous_key[1])
+            rebuild_daily_care_status(db, current_key[0], current_key[1])
+
+        bump_resource_versions(
+            db, RESOURCE_CARE_LOGS, (previous_key[0], current_key[0])
+        )
+        db.commit()
+        db.refresh(care_log)
+        invalidate_dashboard_stats()
+        publish_care_log_event(
+            "updated",
+            care_log.id,
+            care_log.animal_id,
+            care_log.log_date,
+            care_log.time_slot,
+            previous_animal_id=previous_key[0],
+        )
+
+        logger.info(f"世話記録を更新しました: ID={care_log_id}")
+
+        # 猫名を取得してCareLogResponseを返す
+        animal_name = None
+        if care_log.animal:
+            animal_name = care_log.animal.name or f"ID:{care_log.animal_id}"
+
+        return CareLogResponse(
+            id=care_log.id,
+            animal_id=care_log.animal_id,
+            animal_name=animal_name,
+            recorder_id=care_log.recorder_id,
+            recorder_name=care_log.recorder_name,
+            log_date=care_log.log_date,
+            time_slot=care_log.time_slot,
+            appetite=care_log.appetite,
+            energy=care_log.energy,
+            urination=care_log.urination,
+            defecation=care_log.defecation,
+            stool_condition=care_log.stool_condition,
+            cleaning=care_log.cleaning,
+            memo=care_log.memo,
+            from_paper=care_log.from_paper,
+            ip_address=care_log.ip_address,
+            user_agent=care_log.user_agent,
+            device_tag=care_log.device_tag,
+            created_at=care_log.created_at,
+            last_updated_at=care_log.last_updated_at,
+            last_updated_by=care_log.last_updated_by,
+        )
+
+    except HTTPException:
+        raise
+    except IntegrityError as e:
+        db.rollback()
+        logger.warning(
+            f"同じ猫・日付・時点の世話記録が既に存在します: ID={care_log_id}"
+        )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="同じ猫・日付・時点の世話記録が既に存在します",
+        ) from e
+    except ValueError as e:
+        # プログラミングエラー（care_logとcare_log_idの不一致）
+        logger.error(f"無効なパラメータ: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="無効なリクエストです",
+        ) from e
+    except Exception as e:
+        db.rollback()
+        logger.error(f"世話記録の更新に失敗しました: ID={care_log_id}, エラー={e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="世話記録の更新に失敗しました",
+        ) from e
+
+
+def list_care_logs(
+    db: Session,
+    page: int = 1,
+    page_size: int = 20,
+    animal_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    time_slot: str | None = None,
+    cursor: str | None = None,
+) -> CareLogListResponse:
+    """
+    世話記録一覧を取得（ページネーション付き、記録日時の降順）
+
+    cursor を指定した場合はカーソル方式で取得します（page は無視）。
+    直前のページの next_cursor を渡すと、どの深さのページでも
+    インデックスの範囲検索で取得でき、総件数はキャッシュした概算値になります。
+
+    Args:
+        db: データベースセッション
+        page: ページ番号（1から開始）
+        page_size: 1ページあたりの件数
+        animal_id: 猫IDフィルター
+        start_date: 開始日フィルター
+        end_date: 終了日フィルター
+        time_slot: 時点フィルター
+        cursor: 直前のページの next_cursor（カーソル方式）
+
+    Returns:
+        CareLogListResponse: 世話記録一覧とページネーション情報
+
+    Raises:
+        HTTPException: カーソルが不正な場合（400）
+    """
+    after = decode_cursor(cursor, datetime) if cursor is not None else None
+
+    # クエリを構築
+    query = db.query(CareLog)
+
+    # フィルター
+    if animal_id:
+        query = query.filter(CareLog.animal_id == animal_id)
+
+    if start_date:
+        start_datetime = datetime.combine(start_date, datetime.min.time())
+        query = query.filter(CareLog.created_at >= start_datetime)
+
+    if end_date:
+        end_datetime = datetime.combine(end_date, datetime.max.time())
+        query = query.filter(CareLog.created_at <= end_datetime)
+
+    if time_slot:
+        query = query.filter(CareLog.time_slot == time_slot)
+
+    order_by = (CareLog.created_at.desc(), CareLog.id.desc())
+    if after is None:
+        # 総件数を取得
+        total = query.count()
+
+        # ページネーション
+        offset = (page - 1) * page_size
+        care_logs = query.order_by(*order_by).offset(offset).limit(page_size).all()
+        has_next = offset + len(care_logs) < total
+    else:
+        # カーソル方式（1件多く取得して次のページの有無を判定）
+        total = cached_total(
+            db,
+            RESOURCE_CARE_LOGS,
+            ("list", animal_id, start_date, end_date, time_slot),
+            query.count,
+        )
+        care_logs = (
+            query.filter(keyset_before(CareLog.created_at, CareLog.id, after))
+            .order_by(*order_by)
+            .limit(page_size + 1)
+            .all()
+        )
+        has_next = len(care_logs) > page_size
+        care_logs = care_logs[:page_size]
+
+    # 総ページ数を計算
+    total_pages = (total + page_size - 1) // page_size
+
+    # レスポンスアイテムを作成（animal_nameを追加）
+    items: list[CareLogResponse] = []
+    for log in care_logs:
+        # 猫名を取得
+        animal_name = None
+        if log.animal:
+            animal_name = log.animal.name or f"ID:{log.animal_id}"
+
+        # CareLogResponseを作成
+        log_response = CareLogResponse(
+            id=log.id,
+            animal_id=log.animal_id,
+            animal_name=animal_name,
+            recorder_id=log.recorder_id,
+            recorder_name=log.recorder_name,
+            log_date=log.log_date,
+            time_slot=log.time_slot,
+            appetite=log.appetite,
+            energy=log.energy,
+            urination=log.urination,
+            defecation=log.defecation,
+            stool_condition=log.stool_condition,
+            cleaning=log.cleaning,
+            memo=log.memo,
+            from_paper=log.from_paper,
+            ip_address=log.ip_address,
+            user_agent=log.user_agent,
+            device_tag=log.device_tag,
+            created_at=log.created_at,
+            last_updated_at=log.last_updated_at,
+            last_updated_by=log.last_updated_by,
+        )
+        items.append(log_response)
+
+    next_cursor = None
+    if has_next and care_logs:
+        next_cursor = encode_cursor(care_logs[-1].created_at, care_logs[-1].id)
+
+    return CareLogListResponse(
+        items=items,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        next_cursor=next_cursor,
+    )
+
+
+def iter_care_logs_csv(
+    db: Session,
+    animal_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> Iterator[bytes]:
+    """
+    世話記録のCSVをチャンク単位で生成
+
+    Args:
+        db: データベースセッション
+        animal_id: 猫IDフィルター
+        start_date: 開始日フィルター
+        end_date: 終了日フィルター
+
+    Yields:
+        bytes: CSVのチャンク（UTF-8）
+    """
+    # クエリを構築
+    query = db.query(CareLog)
+
+    # フィルター
+    if animal_id:
+        query = query.filter(CareLog.animal_id == animal_id)
+
+    if start_date:
+        start_datetime = datetime.combine(start_date, datetime.min.time())
+        query = query.filter(CareLog.created_at >= start_datetime)
+
+    if end_date:
+        end_datetime = datetime.combine(end_date, datetime.max.time())
+        query = query.filter(CareLog.created_at <= end_datetime)
+
+    # データをバッチ単位で取得
+    care_logs = query.order_by(CareLog.created_at.desc()).yield_per(
+        CSV_FETCH_BATCH_SIZE
+    )
+
+    # ヘッダー
+    header = [
+        "ID",
+        "猫ID",
+        "記録者名",
+        "時点",
+        "食欲",
+        "元気",
+        "排尿",
+        "清掃",
+        "メモ",
+        "記録日時",
+    ]
+
+    # データ行
+    time_slot_label = get_catalog().labeler("time_slots")
+    rows = (
+        [
+            log.id,
+            log.animal_id,
+            log.recorder_name,
+            time_slot_label(log.time_slot),
+            log.appetite,
+            log.energy,
+            "有" if log.urination else "無",
+            "済" if log.cleaning else "未",
+            log.memo or "",
+            log.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+        ]
+        for log in care_logs
+    )
+
+    yield from iter_csv_chunks(header, rows, with_bom=False)
+
+
+def stream_care_logs_csv(
+    db: Session,
+    animal_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> Iterator[bytes]:
+    """
+    世話記録のCSVをストリーミング生成（StreamingResponse用）
+
+    CSVの生成はリクエストのセッションとは別の専用セッションで遅延実行します。
+
+    Args:
+        db: データベースセッション
+        animal_id: 猫IDフィルター
+        start_date: 開始日フィルター
+        end_date: 終了日フィルター
+
+    Returns:
+        Iterator[bytes]: CSVのチャンク（UTF-8）
+    """
+    return stream_in_session(
+        db,
+        partial(
+            iter_care_logs_csv,
+            animal_id=animal_id,
+            start_date=start_date,
+            end_date=end_date,
+        ),
+    )
+
+
+def export_care_logs_csv(
+    db: Session,
+    animal_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> str:
+    """
+    世話記録をCSV形式でエクスポート
+
+    Args:
+        db: データベースセッション
+        animal_id: 猫IDフィルター
+        start_date: 開始日フィルター
+        end_date: 終了日フィルター
+
+    Returns:
+        str: CSV文字列
+    """
+    return b"".join(
+        iter_care_logs_csv(
+            db, animal_id=animal_id, start_date=start_date, end_date=end_date
+        )
+    ).decode("utf-8")
+
+
+def get_latest_care_log(db: Session, animal_id: int) -> CareLog | None:
+    """
+    指定された猫の最新の世話記録を取得
+
+    前回入力値コピー機能で使用します。
+
+    Args:
+        db: データベースセッション
+        animal_id: 猫ID
+
+    Returns:
+        Optional[CareLog]: 最新の世話記録（存在しない場合はNone）
+    """
+    return (
+        db.query(CareLog)
+        .filter(CareLog.animal_id == animal_id)
+        .order_by(CareLog.created_at.desc(), CareLog.id.desc())
+        .first()
+    )
+
+
+def get_daily_view(
+    db: Session,
+    animal_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    page: int = 1,
+    page_size: int = 20,
+) -> dict[str, object]:
+    """
+    日次ビュー形式のデータを取得
+
+    (日付, 猫) の組み合わせを先にページネーションし、ページ内の世話記録だけを
+    1回の範囲クエリで取得してメモリ上で朝・昼・夕に展開します。
+    発行されるクエリ数は猫の数・日数に依存しません。
+
+    Args:
+        db: データベースセッション
+        animal_id: 猫ID（Noneの場合は全猫）
+        start_date: 開始日（デフォルト: 7日前）
+        end_date: 終了日（デフォルト: 今日）
+        page: ページ番号
+        page_size: ページサイズ
+
+    Returns:
+        dict: 日次ビュー形式のデータ
+            - items: list[dict]
+            - total: int
+            - page: int
+            - page_size: int
+            - total_pages: int
+    """
+    # デフォルト日付範囲を設定（過去7日間）
+    if end_date is None:
+        end_date = date.today()
+    if start_date is None:
+        start_date = end_date - timedelta(days=6)
+
+    # 日付範囲のバリデーション
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="開始日は終了日以前である必要があります",
+        )
+
+    # 対象猫を取得（IDと名前のみ）
+    animal_query = db.query(Animal.id, Animal.name)
+    if animal_id is not None:
+        animal_query = animal_query.filter(Animal.id == animal_id)
+    animals = [(row.id, row.name) for row in animal_query.order_by(Animal.id)]
+
+    if not animals:
+        return {
+            "items": [],
+            "total": 0,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": 0,
+        }
+
+    # 日付×猫の組み合わせ数（日付降順、同一日内は猫ID順）
+    day_count = (end_date - start_date).days + 1
+    total = day_count * len(animals)
+    total_pages = (total + page_size - 1) // page_size
+
+    # ページ番号のバリデーション
+    if page < 1:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="ページ番号は1以上である必要があります",
+        )
+
+    start_idx = (page - 1) * page_size
+    end_idx = min(start_idx + page_size, total)
+    cells = _daily_matrix_cells(animals, end_date, start_idx, end_idx)
+
+    if not cells:
+        return {
+            "items": [],
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+        }
+
+    logs_by_key = _load_daily_matrix_logs(db, cells)
+
+    items: list[dict[str, object]] = []
+    for current_date, cell_animal_id, animal_name in cells:
+        record: dict[str, object] = {
+            "date": current_date.isoformat(),
+            "animal_id": cell_animal_id,
+            "animal_name": animal_name if animal_name else f"猫 {cell_animal_id}",
+        }
+        for time_slot in DAILY_VIEW_TIME_SLOTS:
+            record[time_slot] = _time_slot_record(
+                logs_by_key.get((cell_animal_id, current_date, time_slot))
+            )
+        items.append(record)
+
+    return {
+        "items": items,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+    }
+
+
+def _daily_matrix_cells(
+    animals: list[tuple[int, str | None]],
+    end_date: date,
+    start_idx: int,
+    end_idx: int,
+) -> list[tuple[date, int, str | None]]:
+    """
+    日次ビューの指定範囲の (日付, 猫ID, 猫名) を算出
+
+    行の並びは日付降順・同一日内は猫ID順で、行番号から直接求められるため
+    全組み合わせを生成する必要はありません。
+    """
+    animal_count = len(animals)
+    cells: list[tuple[date, int, str | None]] = []
+    for idx in range(start_idx, end_idx):
+        day_offset, animal_idx = divmod(idx, animal_count)
+        cell_animal_id, animal_name = animals[animal_idx]
+        cells.append(
+            (end_date - timedelta(days=day_offset), cell_animal_id, animal_name)
+        )
+    return cells
+
+
+def _load_daily_matrix_logs(
+    db: Session, cells: list[tuple[date, int, str | None]]
+) -> dict[tuple[int, date, str], CareLog]:
+    """
+    ページ内の世話記録を1回のクエリで取得し (猫ID, 記録日, 時点) で索引化
+
+    同一キーに複数の記録がある場合はIDが最も小さい記録を採用します。
+    """
+    animal_ids = {cell_animal_id for _, cell_animal_id, _ in cells}
+    dates = [current_date for current_date, _, _ in cells]
+
+    logs = (
+        db.query(CareLog)
+        .filter(
+            CareLog.animal_id.in_(animal_ids),
+            CareLog.log_date >= min(dates),
+            CareLog.log_date <= max(dates),
+            CareLog.time_slot.in_(DAILY_VIEW_TIME_SLOTS),
+        )
+        .order_by(CareLog.id)
+        .all()
+    )
+
+    logs_by_key: dict[tuple[int, date, str], CareLog] = {}
+    for log in logs:
+        logs_by_key.setdefault((log.animal_id, log.log_date, log.time_slot), log)
+    return logs_by_key
+
+
+def _time_slot_record(log: CareLog | None) -> dict[str, object]:
+    """時点ごとの記録を日次ビューの辞書形式に変換"""
+    return {
+        "exists": log is not None,
+        "log_id": log.id if log else None,
+        "appetite": log.appetite if log else None,
+        "energy": log.energy if log else None,
+        "urination": log.urination if log else None,
+        "cleaning": log.cleaning if log else None,
+    }
@@ -0,0 +1,217 @@
+"""
+当日記録状況サービス
+
+全猫の当日記録状況一覧（ボランティアの記録漏れ確認用）を、
+世話記録の登録・更新時に増分更新する daily_care_statuses テーブルから返します。
+
+一覧の取得は猫テーブルとの1回の結合クエリで済み、当日の世話記録を
+すべて読み込んで猫ごとに走査する必要はありません。
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.animal import Animal
+from app.models.care_log import CareLog
+from app.models.daily_care_status import TIME_SLOT_BITS, DailyCareStatus
+from app.utils.timezone import get_jst_date, get_jst_now
+
+logger = logging.getLogger(__name__)
+
+# 当日記録状況一覧に表示する猫のステータス
+BOARD_ANIMAL_STATUSES = ("保護中", "治療中", "譲渡可能")
+
+
+@dataclass(frozen=True)
+class CareStatusBoardRow:
+    """当日記録状況一覧の1行"""
+
+    animal_id: int
+    animal_name: str | None
+    animal_photo: str | None
+    slots: int
+
+    def is_recorded(self, time_slot: str) -> bool:
+        """指定した時点が記録済みか"""
+        return bool(self.slots & TIME_SLOT_BITS[time_slot])
+
+
+def _upsert_slots_many(db: Session, rows: list[dict[str, object]], merge: bool) -> None:
+    """
+    記録状況をUPSERT（複数行はexecutemanyで1文として実行）
+
+    merge=True の場合は既存のビットマスクに論理和で追加し、
+    False の場合は指定したビットマスクで置き換えます。
+    """
+    if not rows:
+        return
+    table = DailyCareStatus.__table__
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(table)
+    new_slots = (
+        table.c.slots.op("|")(stmt.excluded.slots) if merge else stmt.excluded.slots
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.log_date, table.c.animal_id],
+            set_={"slots": new_slots, "updated_at": stmt.excluded.updated_at},
+        ),
+        rows,
+    )
+
+
+def _upsert_slots(
+    db: Session, animal_id: int, log_date: date, slots: int, merge: bool
+) -> None:
+    """記録状況を1文でUPSERT"""
+    _upsert_slots_many(
+        db,
+        [
+            {
+                "log_date": log_date,
+                "animal_id": animal_id,
+                "slots": slots,
+                "updated_at": get_jst_now(),
+            }
+        ],
+        merge,
+    )
+
+
+def mark_time_slot_recorded(
+    db: Session, animal_id: int, log_date: date, time_slot: str
+) -> None:
+    """
+    時点を記録済みにする（世話記録の登録時）
+
+    コミットは呼び出し元で行い、世話記録と同じトランザクションで反映します。
+
+    Args:
+        db: データベースセッション
+        animal_id: 猫ID
+        log_date: 記録日
+        time_slot: 時点（morning/noon/evening）
+    """
+    _upsert_slots(db, animal_id, log_date, TIME_SLOT_BITS[time_slot], merge=True)
+
+
+def mark_time_slots_recorded(
+    db: Session, entries: Iterable[tuple[int, date, str]]
+) -> None:
+    """
+    複数の時点をまとめて記録済みにする（世話記録の一括登録時）
+
+    猫と日付ごとにビットマスクを集約してから1文でUPSERTします。
+    コミットは呼び出し元で行います。
+
+    Args:
+        db: データベースセッション
+        entries: (猫ID, 記録日, 時点) の組
+    """
+    merged: dict[tuple[date, int], int] = {}
+    for animal_id, log_date, time_slot in entries:
+        key = (log_date, animal_id)
+        merged[key] = merged.get(key, 0) | TIME_SLOT_BITS[time_slot]
+
+    now = get_jst_now()
+    _upsert_slots_many(
+        db,
+        [
+            {
+                "log_date": log_date,
+                "animal_id": animal_id,
+                "slots": slots,
+                "updated_at": now,
+            }
+            for (log_date, animal_id), slots in merged.items()
+        ],
+        merge=True,
+    )
+
+
+def rebuild_daily_care_status(db: Session, animal_id: int, log_date: date) -> int:
+    """
+    猫と日付の記録状況を世話記録から再計算（世話記録の日付・時点・猫の変更時）
+
+    コミットは呼び出し元で行います。未反映の変更がある場合は先にflushしてください。
+
+    Args:
+        db: データベースセッション
+        animal_id: 猫ID
+        log_date: 記録日
+
+    Returns:
+        int: 再計算後のビットマスク
+    """
+    time_slots = db.scalars(
+        select(CareLog.time_slot)
+        .where(CareLog.animal_id == animal_id, CareLog.log_date == log_date)
+        .distinct()
+    ).all()
+    slots = 0
+    for time_slot in time_slots:
+        slots |= TIME_SLOT_BITS.get(time_slot, 0)
+
+    if slots:
+        _upsert_slots(db, animal_id, log_date, slots, merge=False)
+    else:
+        db.execute(
+            delete(DailyCareStatus).where(
+                DailyCareStatus.animal_id == animal_id,
+                DailyCareStatus.log_date == log_date,
+            )
+        )
+    return slots
+
+
+def get_care_status_board(
+    db: Session, target_date: date | None = None
+) -> tuple[date, list[CareStatusBoardRow]]:
+    """
+    全猫の記録状況一覧を取得
+
+    Args:
+        db: データベースセッション
+        target_date: 対象日（省略時はJSTの当日）
+
+    Returns:
+        tuple[date, list[CareStatusBoardRow]]: 対象日と猫ごとの記録状況（名前順）
+    """
+    if target_date is None:
+        target_date = get_jst_date()
+
+    rows = db.execute(
+        select(
+            Animal.id,
+            Animal.name,
+            Animal.photo,
+            func.coalesce(DailyCareStatus.slots, 0),
+        )
+        .outerjoin(
+            DailyCareStatus,
+            and_(
+                DailyCareStatus.animal_id == Animal.id,
+                DailyCareStatus.log_date == target_date,
+            ),
+        )
+        .where(Animal.status.in_(BOARD_ANIMAL_STATUSES))
+        .order_by(Animal.name)
+    ).all()
+
+    return target_date, [
+        CareStatusBoardRow(
+            animal_id=animal_id,
+            animal_name=name,
+            animal_photo=photo,
+            slots=slots,
+        )
+        for animal_id, name, photo, slots in rows
+    ]
@@ -2,6 +2,8 @@
 CSV出力サービス
 
 世話記録、診療記録などのCSV出力機能を提供します。
+大量データでもメモリ使用量が一定になるよう、CSVは行単位で生成し
+一定行数ごとにUTF-8バイト列のチャンクとして返します。
 
 Requirements: Requirement 8.1, Requirement 9.3, Requirement 25.2-25.3
 """
@@ -9,130 +11,286 @@ Requirements: Requirement 8.1, Requirement 9.3, Requirement 25.2-25.3
 from __future__ import annotations
 
 import csv
+from collections.abc import Callable, Iterable, Iterator
 from datetime import date
 from decimal import Decimal
+from functools import partial
 from io import StringIO
+from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.database import open_streaming_session
+from app.models.animal import Animal
 from app.models.care_log import CareLog
 from app.services.medical_report_service import get_medical_summary_rows
-from app.utils.i18n import tj
+from app.utils.i18n import get_catalog, tj
 
+# DBから一度にフェッチする行数（yield_per / サーバーサイドカーソル）
+CSV_FETCH_BATCH_SIZE = 1000
 
-def generate_care_log_csv(
+# 1チャンクにまとめて出力する行数
+CSV_CHUNK_ROWS = 500
+
+# UTF-8 BOM（Excelで正しく開くため）
+UTF8_BOM = "\ufeff"
+
+VALID_REPORT_TYPES = ["daily", "weekly", "monthly", "individual", "medical_summary"]
+
+
+def iter_csv_chunks(
+    header: list[str],
+    rows: Iterable[Iterable[Any]],
+    with_bom: bool = True,
+    chunk_rows: int = CSV_CHUNK_ROWS,
+) -> Iterator[bytes]:
+    """
+    CSV行を一定行数ごとのUTF-8バイト列チャンクに変換
+
+    Args:
+        header: ヘッダー行
+        rows: データ行（遅延評価されるイテラブル）
+        with_bom: 先頭にUTF-8 BOMを付与するか
+        chunk_rows: 1チャンクあたりの行数
+
+    Yields:
+        bytes: CSVのチャンク（UTF-8）
+    """
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    if with_bom:
+        buffer.write(UTF8_BOM)
+    writer.writerow(header)
+
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+
+    remaining = buffer.getvalue()
+    if remaining:
+        yield remaining.encode("utf-8")
+
+
+def stream_in_session(
+    db: Session, producer: Callable[[Session], Iterator[bytes]]
+) -> Iterator[bytes]:
+    """
+    専用セッションを開いてチャンクを生成（StreamingResponse用）
+
+    Args:
+        db: リクエストのデータベースセッション
+        producer: セッションを受け取りチャンクを生成する関数
+
+    Yields:
+        bytes: producerが生成したチャンク
+    """
+    with open_streaming_session(db) as session:
+        yield from producer(session)
+
+
+def iter_care_log_csv(
     db: Session,
     start_date: date,
     end_date: date,
     animal_id: int | None = None,
     locale: str = "ja",
-) -> str:
+) -> Iterator[bytes]:
     """
-    世話記録のCSVを生成
+    世話記録のCSVをチャンク単位で生成
 
     Args:
         db: データベースセッション
         start_date: 開始日
         end_date: 終了日
         animal_id: 猫のID（指定時は特定の猫のみ）
+        locale: ロケール（ja/en）
 
-    Returns:
-        str: CSV形式の文字列（UTF-8 BOM付き）
-
-    Example:
-        >>> from datetime import date
-        >>> csv_data = generate_care_log_csv(db, date(2024, 11, 1), date(2024, 11, 30))
-        >>> with open("care_logs.csv", "w", encoding="utf-8-sig") as f:
-        ...     f.write(csv_data)
+    Yields:
+        bytes: CSVのチャンク（UTF-8 BOM付き）
     """
-    # 世話記録を取得（実際の記録日でフィルタリング）
-    query = db.query(CareLog).filter(
-        CareLog.log_date >= start_date,
-        CareLog.log_date <= end_date,
+    # 世話記録を取得（実際の記録日でフィルタリング、猫名は結合して取得）
+    query = (
+        db.query(CareLog, Animal.name)
+        .outerjoin(Animal, Animal.id == CareLog.animal_id)
+        .filter(
+            CareLog.log_date >= start_date,
+            CareLog.log_date <= end_date,
+        )
     )
 
     # 個別猫の場合はフィルター
     if animal_id:
         query = query.filter(CareLog.animal_id == animal_id)
 
-    records = query.order_by(CareLog.log_date.desc(), CareLog.created_at.desc()).all()
-
-    # CSVデータを生成
-    output = StringIO()
-    # UTF-8 BOM を追加（Excelで正しく開くため）
-    output.write("\ufeff")
-
-    writer = csv.writer(output)
+    records = query.order_by(
+        CareLog.log_date.desc(), CareLog.created_at.desc()
+    ).yield_per(CSV_FETCH_BATCH_SIZE)
 
     # ヘッダー行（多言語化）
-    writer.writerow(
-        [
-            tj("headers.created_at", locale=locale),
-            tj("headers.log_date", locale=locale),
-            tj("headers.animal_id", locale=locale),
-            tj("headers.animal_name", locale=locale),
-            tj("headers.time_slot", locale=locale),
-            tj("headers.appetite", locale=locale),
-            tj("headers.energy", locale=locale),
-            tj("headers.urination", locale=locale),
-            tj("headers.cleaning", locale=locale),
-            tj("headers.recorder_id", locale=locale),
-            tj("headers.recorder_name", locale=locale),
-            tj("headers.memo", locale=locale),
-            tj("headers.ip_address", locale=locale),
-            tj("headers.device_tag", locale=locale),
-            tj("headers.from_paper", locale=locale),
-            tj("headers.last_updated_at", locale=locale),
-            tj("headers.last_updated_by", locale=locale),
-        ]
-    )
-
-    # データ行
-    for record in records:
-        # 猫名を取得
-        animal_name = ""
-        if record.animal:
-            animal_name = record.animal.name or tj(
-                "animal.no_name", locale=locale, id=record.animal_id
-            )
-        else:
-            animal_name = tj("animal.no_name", locale=locale, id=record.animal_id)
-
-        writer.writerow(
-            [
+    header = [
+        tj("headers.created_at", locale=locale),
+        tj("headers.log_date", locale=locale),
+        tj("headers.animal_id", locale=locale),
+        tj("headers.animal_name", locale=locale),
+        tj("headers.time_slot", locale=locale),
+        tj("headers.appetite", locale=locale),
+        tj("headers.energy", locale=locale),
+        tj("headers.urination", locale=locale),
+        tj("headers.cleaning", locale=locale),
+        tj("headers.recorder_id", locale=locale),
+        tj("headers.recorder_name", locale=locale),
+        tj("headers.memo", locale=locale),
+        tj("headers.ip_address", locale=locale),
+        tj("headers.device_tag", locale=locale),
+        tj("headers.from_paper", locale=locale),
+        tj("headers.last_updated_at", locale=locale),
+        tj("headers.last_updated_by", locale=locale),
+    ]
+
+    # 行ごとの翻訳はコンパイル済みカタログの辞書参照のみで行う
+    catalog = get_catalog(locale)
+    time_slot_label = catalog.labeler("time_slots")
+
+    def rows() -> Iterator[list[Any]]:
+        for record, name in records:
+            animal_name = name or catalog.gettext("animal.no_name", id=record.animal_id)
+            yield [
                 record.created_at.strftime("%Y-%m-%d %H:%M:%S"),
                 record.log_date.strftime("%Y-%m-%d"),
                 record.animal_id,
                 animal_name,
-                tj(
-                    f"time_slots.{record.time_slot}",
-                    locale=locale,
-                ),
+                time_slot_label(record.time_slot),
                 record.appetite,
                 record.energy,
-                tj(
-                    "boolean.yes" if record.urination else "boolean.no",
-                    locale=locale,
-                ),
-                tj(
-                    "boolean.yes" if record.cleaning else "boolean.no",
-                    locale=locale,
-                ),
+                catalog.yes_no(record.urination),
+                catalog.yes_no(record.cleaning),
                 record.recorder_id or "",
                 record.recorder_name,
                 record.memo or "",
                 record.ip_address or "",
                 record.device_tag or "",
-                tj(
-                    "boolean.yes" if record.from_paper else "boolean.no",
-                    locale=locale,
-                ),
+                catalog.yes_no(record.from_paper),
                 record.last_updated_at.strftime("%Y-%m-%d %H:%M:%S"),
                 record.last_updated_by or "",
             ]
+
+    yield from iter_csv_chunks(header, rows())
+
+
+def generate_care_log_csv(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    animal_id: int | None = None,
+    locale: str = "ja",
+) -> str:
+    """
+    世話記録のCSVを生成
+
+    Args:
+        db: データベースセッション
+        start_date: 開始日
+        end_date: 終了日
+        animal_id: 猫のID（指定時は特定の猫のみ）
+
+    Returns:
+        str: CSV形式の文字列（UTF-8 BOM付き）
+
+    Example:
+        >>> from datetime import date
+        >>> csv_data = generate_care_log_csv(db, date(2024, 11, 1), date(2024, 11, 30))
+        >>> with open("care_logs.csv", "w", encoding="utf-8-sig") as f:
+        ...     f.write(csv_data)
+    """
+    return b"".join(
+        iter_care_log_csv(db, start_date, end_date, animal_id, locale)
+    ).decode("utf-8")
+
+
+def validate_report_request(report_type: str, animal_id: int | None) -> None:
+    """
+    帳票種別と猫IDの組み合わせを検証
+
+    Raises:
+        ValueError: 不正な帳票種別の場合、または個別帳票で猫IDが未指定の場合
+    """
+    # 帳票種別のバリデーション
+    if report_type not in VALID_REPORT_TYPES:
+        raise ValueError(
+            f"不正な帳票種別です: {report_type}。有効な値: {', '.join(VALID_REPORT_TYPES)}"
+        )
+
+    # 個別帳票の場合は猫IDが必須
+    if report_type == "individual" and not animal_id:
+        raise ValueError("個別帳票の生成には猫IDが必要です")
+
+
+def _report_csv_producer(
+    report_type: str,
+    start_date: date,
+    end_date: date,
+    animal_id: int | None,
+    locale: str,
+) -> Callable[[Session], Iterator[bytes]]:
+    """帳票種別に応じたCSVチャンク生成関数を返す"""
+    if report_type == "medical_summary":
+        return partial(
+            iter_medical_summary_csv,
+            start_date=start_date,
+            end_date=end_date,
+            animal_id=animal_id,
+            locale=locale,
         )
 
-    return output.getvalue()
+    # 世話記録CSVを生成（全帳票種別で共通）
+    return partial(
+        iter_care_log_csv,
+        start_date=start_date,
+        end_date=end_date,
+        animal_id=animal_id,
+        locale=locale,
+    )
+
+
+def stream_report_csv(
+    db: Session,
+    report_type: str,
+    start_date: date,
+    end_date: date,
+    animal_id: int | None = None,
+    locale: str = "ja",
+) -> Iterator[bytes]:
+    """
+    帳票CSVをストリーミング生成（StreamingResponse用）
+
+    入力の検証は呼び出し時点で行い、CSVの生成は専用セッションで遅延実行します。
+
+    Args:
+        db: データベースセッション
+        report_type: 帳票種別（daily/weekly/monthly/individual/medical_summary）
+        start_date: 開始日
+        end_date: 終了日
+        animal_id: 猫のID（個別帳票の場合のみ必須）
+        locale: ロケール（ja/en）
+
+    Returns:
+        Iterator[bytes]: CSVのチャンク（UTF-8 BOM付き）
+
+    Raises:
+        ValueError: 不正な帳票種別の場合、または個別帳票で猫IDが未指定の場合
+    """
+    validate_report_request(report_type, animal_id)
+    producer = _report_csv_producer(
+        report_type, start_date, end_date, animal_id, locale
+    )
+    return stream_in_session(db, producer)
 
 
 def generate_report_csv(
@@ -168,22 +326,11 @@ def generate_report_csv(
         >>> with open("report.csv", "w", encoding="utf-8-sig") as f:
         ...     f.write(csv_data)
     """
-    # 帳票種別のバリデーション
-    valid_types = ["daily", "weekly", "monthly", "individual", "medical_summary"]
-    if report_type not in valid_types:
-        raise ValueError(
-            f"不正な帳票種別です: {report_type}。有効な値: {', '.join(valid_types)}"
-        )
-
-    # 個別帳票の場合は猫IDが必須
-    if report_type == "individual" and not animal_id:
-        raise ValueError("個別帳票の生成には猫IDが必要です")
-
-    if report_type == "medical_summary":
-        return generate_medical_summary_csv(db, start_date, end_date, animal_id, locale)
-
-    # 世話記録CSVを生成（全帳票種別で共通）
-    return generate_care_log_csv(db, start_date, end_date, animal_id, locale)
+    validate_report_request(report_type, animal_id)
+    producer = _report_csv_producer(
+        report_type, start_date, end_date, animal_id, locale
+    )
+    return b"".join(producer(db)).decode("utf-8")
 
 
 def _format_decimal(value: Decimal | None) -> str:
@@ -192,42 +339,37 @@ def _format_decimal(value: Decimal | None) -> str:
     return str(value)
 
 
-def generate_medical_summary_csv(
+def iter_medical_summary_csv(
     db: Session,
     start_date: date,
     end_date: date,
     animal_id: int | None = None,
     locale: str = "ja",
-) -> str:
-    """診療記録（利益計算用）CSVを生成"""
+) -> Iterator[bytes]:
+    """診療記録（利益計算用）CSVをチャンク単位で生成"""
 
     rows, _totals = get_medical_summary_rows(
         db=db, start_date=start_date, end_date=end_date, animal_id=animal_id
     )
 
-    output = StringIO()
-    output.write("\ufeff")
-    writer = csv.writer(output)
-
-    writer.writerow(
-        [
-            tj("headers.medical_record_id", locale=locale),
-            tj("headers.medical_date", locale=locale),
-            tj("headers.animal_id", locale=locale),
-            tj("headers.animal_name", locale=locale),
-            tj("headers.medical_action_name", locale=locale),
-            tj("headers.dosage", locale=locale),
-            tj("headers.dosage_unit", locale=locale),
-            tj("headers.cost_price", locale=locale),
-            tj("headers.selling_price", locale=locale),
-            tj("headers.procedure_fee", locale=locale),
-            tj("headers.billing_amount", locale=locale),
-            tj("headers.currency", locale=locale),
-        ]
-    )
-
-    for row in rows:
-        writer.writerow(
+    header = [
+        tj("headers.medical_record_id", locale=locale),
+        tj("headers.medical_date", locale=locale),
+        tj("headers.animal_id", locale=locale),
+        tj("headers.animal_name", locale=locale),
+        tj("headers.medical_action_name", locale=locale),
+        tj("headers.dosage", locale=locale),
+        tj("headers.dosage_unit", locale=locale),
+        tj("headers.cost_price", locale=locale),
+        tj("headers.selling_price", locale=locale),
+        tj("headers.procedure_fee", locale=locale),
+        tj("headers.billing_amount", locale=locale),
+        tj("headers.currency", locale=locale),
+    ]
+
+    yield from iter_csv_chunks(
+        header,
+        (
             [
                 row.medical_record_id,
                 row.medical_date.strftime("%Y-%m-%d"),
@@ -242,6 +384,19 @@ def generate_medical_summary_csv(
                 _format_decimal(row.billing_amount),
                 row.currency or "",
             ]
-        )
+            for row in rows
+        ),
+    )
+
 
-    return output.getvalue()
+def generate_medical_summary_csv(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    animal_id: int | None = None,
+    locale: str = "ja",
+) -> str:
+    """診療記録（利益計算用）CSVを生成"""
+    return b"".join(
+        iter_medical_summary_csv(db, start_date, end_date, animal_id, locale)
+    ).decode("utf-8")
@@ -0,0 +1,135 @@
+"""
+ダッシュボード統計サービス
+
+管理画面のダッシュボードに表示する統計情報を集計します。
+
+猫のステータス別件数・今日の記録数・アクティブボランティア数を1回のクエリで集計し、
+結果を短時間プロセス内にキャッシュします。猫・世話記録・ボランティアの更新時は
+各サービスから `invalidate_dashboard_stats()` を呼び出してキャッシュを破棄します。
+複数ワーカープロセスで起動する構成では、他のプロセスでの更新は有効期間
+（dashboard_stats_ttl_seconds）内は反映されません。
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date
+
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.animal import Animal
+from app.models.care_log import CareLog
+from app.models.volunteer import Volunteer
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DashboardStatsSnapshot:
+    """ダッシュボード統計の集計結果"""
+
+    status_counts: dict[str, int] = field(default_factory=dict)
+    today_logs_count: int = 0
+    active_volunteers_count: int = 0
+
+    @property
+    def total_animals(self) -> int:
+        """総猫数"""
+        return sum(self.status_counts.values())
+
+    def count_for(self, animal_status: str) -> int:
+        """指定ステータスの猫数（該当なしは0）"""
+        return self.status_counts.get(animal_status, 0)
+
+
+_cache_lock = threading.Lock()
+_cached: tuple[date, float, DashboardStatsSnapshot] | None = None
+# 無効化のたびに進める世代番号（集計中に無効化された結果をキャッシュしないため）
+_generation = 0
+
+
+def _query_dashboard_stats(db: Session, today: date) -> DashboardStatsSnapshot:
+    """ステータス別件数・今日の記録数・アクティブボランティア数を1クエリで集計"""
+    animal_counts = select(
+        literal("animal").label("kind"),
+        Animal.status.label("key"),
+        func.count(Animal.id).label("count"),
+    ).group_by(Animal.status)
+    today_logs = select(
+        literal("care_log").label("kind"),
+        literal("today").label("key"),
+        func.count(CareLog.id).label("count"),
+    ).where(CareLog.log_date == today)
+    active_volunteers = select(
+        literal("volunteer").label("kind"),
+        literal("active").label("key"),
+        func.count(Volunteer.id).label("count"),
+    ).where(Volunteer.status == "active")
+
+    status_counts: dict[str, int] = {}
+    today_logs_count = 0
+    active_volunteers_count = 0
+    for kind, key, count in db.execute(
+        union_all(animal_counts, today_logs, active_volunteers)
+    ):
+        if kind == "animal":
+            status_counts[key] = count
+        elif kind == "care_log":
+            today_logs_count = count
+        else:
+            active_volunteers_count = count
+
+    return DashboardStatsSnapshot(
+        status_counts=status_counts,
+        today_logs_count=today_logs_count,
+        active_volunteers_count=active_volunteers_count,
+    )
+
+
+def get_dashboard_stats(db: Session) -> DashboardStatsSnapshot:
+    """
+    ダッシュボード統計を取得
+
+    キャッシュが有効期限内であればDBに問い合わせずに返します。
+    日付が変わった場合は今日の記録数が変わるため、期限内でも再集計します。
+
+    Args:
+        db: データベースセッション
+
+    Returns:
+        DashboardStatsSnapshot: ダッシュボード統計
+    """
+    global _cached
+
+    today = date.today()
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _cached
+        generation = _generation
+    if cached is not None:
+        cached_date, expires_at, snapshot = cached
+        if cached_date == today and now < expires_at:
+            return snapshot
+
+    snapshot = _query_dashboard_stats(db, today)
+    logger.debug(f"ダッシュボード統計を集計しました: {snapshot}")
+    ttl = settings.dashboard_stats_ttl_seconds
+    if ttl > 0:
+        with _cache_lock:
+            if generation == _generation:
+                _cached = (today, now + ttl, snapshot)
+    return snapshot
+
+
+def invalidate_dashboard_stats() -> None:
+    """ダッシュボード統計のキャッシュを破棄（猫・世話記録・ボランティアの更新時）"""
+    global _cached, _generation
+    with _cache_lock:
+        _cached = None
+        _generation += 1
@@ -5,25 +5,45 @@ Excel出力サービス
 
 Requirements: Requirement 7.5, Requirement 9.4
 Context7: /openpyxl/openpyxl
+
+openpyxl は読み込みが重いため、アプリケーションの起動時ではなく
+Excelを生成する関数の中でインポートします。
 """
 
 from __future__ import annotations
 
+import tempfile
+import unicodedata
+from collections.abc import Iterable, Iterator
 from datetime import date
 from io import BytesIO
+from itertools import chain, islice
+from typing import IO, Any
 
-from openpyxl import Workbook  # type: ignore[import-untyped]
-from openpyxl.styles import (  # type: ignore[import-untyped]
-    Alignment,
-    Font,
-    PatternFill,
-)
-from openpyxl.utils import get_column_letter  # type: ignore[import-untyped]
 from sqlalchemy.orm import Session
 
+from app.models.animal import Animal
 from app.models.care_log import CareLog
+from app.services.csv_service import validate_report_request
 from app.services.medical_report_service import get_medical_summary_rows
-from app.utils.i18n import tj
+from app.utils.i18n import get_catalog, tj
+
+# ストリーミング出力でDBから一度にフェッチする行数
+EXCEL_FETCH_BATCH_SIZE = 1000
+
+# 列幅の算出に使う先頭行数
+EXCEL_WIDTH_SAMPLE_ROWS = 200
+
+# 列幅の下限・上限（文字数）
+EXCEL_MIN_COLUMN_WIDTH = 8
+EXCEL_MAX_COLUMN_WIDTH = 50
+
+# 一時ファイルから返送する際のチャンクサイズ
+EXCEL_STREAM_CHUNK_SIZE = 64 * 1024
+
+# 中央揃えにする列（1始まり）
+CARE_LOG_CENTER_COLUMNS = frozenset({5, 6, 7, 8, 9, 15})
+MEDICAL_SUMMARY_CENTER_COLUMNS = frozenset({1, 2, 3, 6, 8, 9, 10, 11, 12})
 
 
 def generate_care_log_excel(
@@ -53,6 +73,14 @@ def generate_care_log_excel(
         >>> with open("care_logs.xlsx", "wb") as f:
         ...     f.write(excel_data)
     """
+    from openpyxl import Workbook  # type: ignore[import-untyped]
+    from openpyxl.styles import (  # type: ignore[import-untyped]
+        Alignment,
+        Font,
+        PatternFill,
+    )
+    from openpyxl.utils import get_column_letter  # type: ignore[import-untyped]
+
     # 世話記録を取得（実際の記録日でフィルタリング）
     query = db.query(CareLog).filter(
         CareLog.log_date >= start_date,
@@ -106,41 +134,34 @@ def generate_care_log_excel(
         cell.alignment = header_alignment
 
     # データ行
+    catalog = get_catalog(locale)
+    time_slot_label = catalog.labeler("time_slots")
     for row_num, record in enumerate(records, 2):
         # 猫名を取得
         animal_name = ""
         if record.animal:
-            animal_name = record.animal.name or tj(
-                "animal.no_name", locale=locale, id=record.animal_id
+            animal_name = record.animal.name or catalog.gettext(
+                "animal.no_name", id=record.animal_id
             )
         else:
-            animal_name = tj("animal.no_name", locale=locale, id=record.animal_id)
+            animal_name = catalog.gettext("animal.no_name", id=record.animal_id)
 
         row_data = [
             record.created_at.strftime("%Y-%m-%d %H:%M:%S"),
             record.log_date.strftime("%Y-%m-%d"),
             record.animal_id,
             animal_name,
-            tj(f"time_slots.{record.time_slot}", locale=locale),
+            time_slot_label(record.time_slot),
             record.appetite,
             record.energy,
-            tj(
-                "boolean.yes" if record.urination else "boolean.no",
-                locale=locale,
-            ),
-            tj(
-                "boolean.yes" if record.cleaning else "boolean.no",
-                locale=locale,
-            ),
+            catalog.yes_no(record.urination),
+            catalog.yes_no(record.cleaning),
             record.recorder_id or "",
             record.recorder_name,
             record.memo or "",
             record.ip_address or "",
             record.device_tag or "",
-            tj(
-                "boolean.yes" if record.from_paper else "boolean.no",
-                locale=locale,
-            ),
+            catalog.yes_no(record.from_paper),
             record.last_updated_at.strftime("%Y-%m-%d %H:%M:%S"),
             record.last_updated_by or "",
         ]
@@ -208,16 +229,7 @@ def generate_report_excel(
         >>> with open("report.xlsx", "wb") as f:
         ...     f.write(excel_data)
     """
-    # 帳票種別のバリデーション
-    valid_types = ["daily", "weekly", "monthly", "individual", "medical_summary"]
-    if report_type not in valid_types:
-        raise ValueError(
-            f"不正な帳票種別です: {report_type}。有効な値: {', '.join(valid_types)}"
-        )
-
-    # 個別帳票の場合は猫IDが必須
-    if report_type == "individual" and not animal_id:
-        raise ValueError("個別帳票の生成には猫IDが必要です")
+    validate_report_request(report_type, animal_id)
 
     if report_type == "medical_summary":
         return generate_medical_summary_excel(
@@ -237,6 +249,14 @@ def generate_medical_summary_excel(
 ) -> bytes:
     """診療記録（利益計算用）Excelファイルを生成"""
 
+    from openpyxl import Workbook
+    from openpyxl.styles import (
+        Alignment,
+        Font,
+        PatternFill,
+    )
+    from openpyxl.utils import get_column_letter
+
     rows, _totals = get_medical_summary_rows(
         db=db, start_date=start_date, end_date=end_date, animal_id=animal_id
     )
@@ -314,3 +334,312 @@ def generate_medical_summary_excel(
     wb.save(output)
     output.seek(0)
     return output.getvalue()
+
+
+def _display_width(value: Any) -> int:
+    """セル値の表示幅を算出（全角文字は2として数える）"""
+    if value is None:
+        return 0
+    text = str(value)
+    return sum(2 if unicodedata.east_asian_width(ch) in "WF" else 1 for ch in text)
+
+
+def _estimate_column_widths(
+    headers: list[str], sample_rows: list[list[Any]]
+) -> list[int]:
+    """
+    ヘッダーとサンプル行から列幅を算出
+
+    書き込み専用ワークシートでは行の書き込み前に列幅を確定する必要があるため、
+    先頭の数百行だけを見て幅を決めます。
+    """
+    widths = [_display_width(header) for header in headers]
+    for row in sample_rows:
+        for index, value in enumerate(row):
+            widths[index] = max(widths[index], _display_width(value))
+    return [
+        min(max(width + 2, EXCEL_MIN_COLUMN_WIDTH), EXCEL_MAX_COLUMN_WIDTH)
+        for width in widths
+    ]
+
+
+def _build_write_only_workbook(
+    sheet_title: str,
+    headers: list[str],
+    rows: Iterable[list[Any]],
+    center_columns: frozenset[int],
+) -> IO[bytes]:
+    """
+    書き込み専用ワークブックを一時ファイルに書き出す
+
+    行は1行ずつディスクへ書き出されるため、メモリ使用量は行数に依存しません。
+    スタイルはNamedStyleとして1度だけ登録し、セルごとに生成しません。
+
+    Returns:
+        IO[bytes]: 書き出し済みの一時ファイル（先頭にシーク済み、呼び出し側でクローズ）
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell  # type: ignore[import-untyped]
+    from openpyxl.styles import (
+        Alignment,
+        Font,
+        NamedStyle,
+        PatternFill,
+    )
+    from openpyxl.utils import get_column_letter
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_title)
+
+    header_style = NamedStyle(
+        name="necokeeper_header",
+        font=Font(bold=True, color="FFFFFF"),
+        fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+        alignment=Alignment(horizontal="center", vertical="center"),
+    )
+    center_style = NamedStyle(
+        name="necokeeper_center", alignment=Alignment(horizontal="center")
+    )
+    wb.add_named_style(header_style)
+    wb.add_named_style(center_style)
+
+    # 先頭のサンプル行から列幅を確定（行の書き込み前に設定が必要）
+    row_iter = iter(rows)
+    sample_rows = list(islice(row_iter, EXCEL_WIDTH_SAMPLE_ROWS))
+    for col_num, width in enumerate(_estimate_column_widths(headers, sample_rows), 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+
+    # フリーズペイン（ヘッダー行を固定）
+    ws.freeze_panes = "A2"
+
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.style = header_style.name
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    center_indexes = sorted(col_num - 1 for col_num in center_columns)
+    for row in chain(sample_rows, row_iter):
+        values: list[Any] = list(row)
+        for index in center_indexes:
+            cell = WriteOnlyCell(ws, value=values[index])
+            cell.style = center_style.name
+            values[index] = cell
+        ws.append(values)
+
+    # 一時ファイルの所有権は呼び出し側（iter_spooled_file）へ移るためwithは使わない
+    spool = tempfile.TemporaryFile(suffix=".xlsx")  # noqa: SIM115
+    try:
+        wb.save(spool)
+        spool.seek(0)
+    except Exception:
+        spool.close()
+        raise
+    return spool
+
+
+def iter_spooled_file(
+    spool: IO[bytes], chunk_size: int = EXCEL_STREAM_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    一時ファイルをチャンク単位で読み出し、読み終えたらクローズする
+
+    Args:
+        spool: 読み出す一時ファイル
+        chunk_size: チャンクサイズ（バイト）
+
+    Yields:
+        bytes: ファイルのチャンク
+    """
+    try:
+        while chunk := spool.read(chunk_size):
+            yield chunk
+    finally:
+        spool.close()
+
+
+def _care_log_excel_rows(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    animal_id: int | None,
+    locale: str,
+) -> Iterator[list[Any]]:
+    """世話記録Excelのデータ行をバッチ取得しながら生成"""
+    query = (
+        db.query(CareLog, Animal.name)
+        .outerjoin(Animal, Animal.id == CareLog.animal_id)
+        .filter(
+            CareLog.log_date >= start_date,
+            CareLog.log_date <= end_date,
+        )
+    )
+
+    if animal_id:
+        query = query.filter(CareLog.animal_id == animal_id)
+
+    records = query.order_by(
+        CareLog.log_date.desc(), CareLog.created_at.desc()
+    ).yield_per(EXCEL_FETCH_BATCH_SIZE)
+
+    catalog = get_catalog(locale)
+    time_slot_label = catalog.labeler("time_slots")
+    for record, name in records:
+        yield [
+            record.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            record.log_date.strftime("%Y-%m-%d"),
+            record.animal_id,
+            name or catalog.gettext("animal.no_name", id=record.animal_id),
+            time_slot_label(record.time_slot),
+            record.appetite,
+            record.energy,
+            catalog.yes_no(record.urination),
+            catalog.yes_no(record.cleaning),
+            record.recorder_id or "",
+            record.recorder_name,
+            record.memo or "",
+            record.ip_address or "",
+            record.device_tag or "",
+            catalog.yes_no(record.from_paper),
+            record.last_updated_at.strftime("%Y-%m-%d %H:%M:%S"),
+            record.last_updated_by or "",
+        ]
+
+
+def spool_care_log_excel(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    animal_id: int | None = None,
+    locale: str = "ja",
+) -> IO[bytes]:
+    """
+    世話記録のExcelファイルを書き込み専用モードで一時ファイルに生成
+
+    Args:
+        db: データベースセッション
+        start_date: 開始日
+        end_date: 終了日
+        animal_id: 猫のID（指定時は特定の猫のみ）
+        locale: ロケール（ja/en）
+
+    Returns:
+        IO[bytes]: Excelファイルを書き出した一時ファイル（呼び出し側でクローズ）
+    """
+    headers = [
+        tj("headers.created_at", locale=locale),
+        tj("headers.log_date", locale=locale),
+        tj("headers.animal_id", locale=locale),
+        tj("headers.animal_name", locale=locale),
+        tj("headers.time_slot", locale=locale),
+        tj("headers.appetite", locale=locale),
+        tj("headers.energy", locale=locale),
+        tj("headers.urination", locale=locale),
+        tj("headers.cleaning", locale=locale),
+        tj("headers.recorder_id", locale=locale),
+        tj("headers.recorder_name", locale=locale),
+        tj("headers.memo", locale=locale),
+        tj("headers.ip_address", locale=locale),
+        tj("headers.device_tag", locale=locale),
+        tj("headers.from_paper", locale=locale),
+        tj("headers.last_updated_at", locale=locale),
+        tj("headers.last_updated_by", locale=locale),
+    ]
+
+    return _build_write_only_workbook(
+        tj("sheet_names.care_logs", locale=locale),
+        headers,
+        _care_log_excel_rows(db, start_date, end_date, animal_id, locale),
+        CARE_LOG_CENTER_COLUMNS,
+    )
+
+
+def spool_medical_summary_excel(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    animal_id: int | None = None,
+    locale: str = "ja",
+) -> IO[bytes]:
+    """診療記録（利益計算用）Excelファイルを書き込み専用モードで一時ファイルに生成"""
+
+    rows, _totals = get_medical_summary_rows(
+        db=db, start_date=start_date, end_date=end_date, animal_id=animal_id
+    )
+
+    headers = [
+        tj("headers.medical_record_id", locale=locale),
+        tj("headers.medical_date", locale=locale),
+        tj("headers.animal_id", locale=locale),
+        tj("headers.animal_name", locale=locale),
+        tj("headers.medical_action_name", locale=locale),
+        tj("headers.dosage", locale=locale),
+        tj("headers.dosage_unit", locale=locale),
+        tj("headers.cost_price", locale=locale),
+        tj("headers.selling_price", locale=locale),
+        tj("headers.procedure_fee", locale=locale),
+        tj("headers.billing_amount", locale=locale),
+        tj("headers.currency", locale=locale),
+    ]
+
+    return _build_write_only_workbook(
+        tj("sheet_names.medical_records", locale=locale),
+        headers,
+        (
+            [
+                row.medical_record_id,
+                row.medical_date.strftime("%Y-%m-%d"),
+                row.animal_id,
+                row.animal_name,
+                row.medical_action_name or "",
+                row.dosage,
+                row.dosage_unit or "",
+                float(row.cost_price) if row.cost_price is not None else None,
+                float(row.selling_price) if row.selling_price is not None else None,
+                float(row.procedure_fee) if row.procedure_fee is not None else None,
+                float(row.billing_amount) if row.billing_amount is not None else None,
+                row.currency or "",
+            ]
+            for row in rows
+        ),
+        MEDICAL_SUMMARY_CENTER_COLUMNS,
+    )
+
+
+def stream_report_excel(
+    db: Session,
+    report_type: str,
+    start_date: date,
+    end_date: date,
+    animal_id: int | None = None,
+    locale: str = "ja",
+) -> Iterator[bytes]:
+    """
+    帳票Excelを書き込み専用モードで生成し、チャンク単位で返す（StreamingResponse用）
+
+    ワークブックは呼び出し時点で一時ファイルへ書き出し、返送時は
+    一時ファイルをチャンク単位で読み出します（読み終えると削除されます）。
+
+    Args:
+        db: データベースセッション
+        report_type: 帳票種別（daily/weekly/monthly/individual/medical_summary）
+        start_date: 開始日
+        end_date: 終了日
+        animal_id: 猫のID（個別帳票の場合のみ必須）
+        locale: ロケール（ja/en）
+
+    Returns:
+        Iterator[bytes]: Excelファイルのチャンク
+
+    Raises:
+        ValueError: 不正な帳票種別の場合、または個別帳票で猫IDが未指定の場合
+    """
+    validate_report_request(report_type, animal_id)
+
+    if report_type == "medical_summary":
+        spool = spool_medical_summary_excel(db, start_date, end_date, animal_id, locale)
+    else:
+        spool = spool_care_log_excel(db, start_date, end_date, animal_id, locale)
+
+    return iter_spooled_file(spool)
@@ -12,17 +12,25 @@ from datetime import date
 from pathlib import Path
 
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import select
+from sqlalchemy import Connection, Engine, select, update
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.models.animal import Animal
 from app.models.animal_image import AnimalImage
+from app.utils.http_cache import RESOURCE_ANIMALS, bump_resource_version
 from app.utils.image import (
     delete_image_file,
-    save_and_optimize_image,
+    save_upload_file,
     validate_image_file,
 )
+from app.utils.image_pipeline import (
+    MEDIA_URL_PREFIX,
+    delete_image_variants,
+    resolve_image_variant,
+    schedule_image_variants,
+)
+from app.utils.pdf_cache import invalidate_animal_pdfs
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -103,22 +111,101 @@ def count_animal_images(db: Session, animal_id: int) -> int:
     return len(result.scalars().all())
 
 
+def profile_photo_path(image_path: str) -> str:
+    """
+    プロフィール画像（animal.photo）として保存するパスを取得
+
+    一覧・公開ページ・QRカードPDFで元画像（スマートフォンの原寸写真）を
+    そのまま使わないよう、大サイズの派生画像を指します。
+    派生画像の生成前は元画像のパスを返し、生成後に _promote_profile_photo() で
+    派生画像のパスに置き換えます。
+
+    Args:
+        image_path: 画像のパス（`/media/` 付きでも可）
+
+    Returns:
+        str: プロフィール画像のパス（渡したパスと同じ形式）
+    """
+    return resolve_image_variant(image_path, "large") or image_path
+
+
+def _promote_profile_photo(db: Session, animal_id: int, relative_path: str) -> bool:
+    """
+    派生画像の生成後、元画像を指しているプロフィール画像を大サイズの派生画像に置き換える
+
+    生成に失敗した場合は元画像のままにします（コミットは呼び出し元で行う）。
+
+    Returns:
+        bool: プロフィール画像を置き換えた場合True
+    """
+    large_path = resolve_image_variant(relative_path, "large", fallback=False)
+    if large_path is None:
+        return False
+
+    updated = 0
+    for original, promoted in (
+        (relative_path, large_path),
+        (f"{MEDIA_URL_PREFIX}{relative_path}", f"{MEDIA_URL_PREFIX}{large_path}"),
+    ):
+        result = db.execute(
+            update(Animal)
+            .where(Animal.id == animal_id, Animal.photo == original)
+            .values(photo=promoted)
+        )
+        updated += result.rowcount
+    if updated:
+        logger.info(
+            f"プロフィール画像を大サイズの派生画像に置き換えました: animal_id={animal_id}, path={large_path}"
+        )
+    return updated > 0
+
+
+def _on_image_variants_built(
+    bind: Engine | Connection, animal_id: int, relative_path: str
+) -> None:
+    """
+    派生画像の生成完了時の処理（ワーカー用、失敗してもログに残すのみ）
+
+    派生画像の生成ワーカーから呼び出されるため、リクエストとは別のセッションを使います。
+    """
+    try:
+        with Session(bind) as db:
+            promoted = _promote_profile_photo(db, animal_id, relative_path)
+            # 生成後はサムネイル・プロフィール画像のパスが変わるため、バージョンを進める
+            bump_resource_version(db, RESOURCE_ANIMALS, animal_id)
+            db.commit()
+    except Exception as e:
+        logger.warning(
+            f"プロフィール画像の置き換えに失敗しました: animal_id={animal_id}, エラー={e}"
+        )
+        return
+    if promoted:
+        invalidate_animal_pdfs(animal_id)
+
+
 def upload_image(
     db: Session,
     animal_id: int,
     file: UploadFile,
     taken_at: date | None = None,
     description: str | None = None,
+    set_as_profile: bool = False,
 ) -> AnimalImage:
     """
     猫の画像をアップロード
 
+    元画像をディスクに書き込んだ時点で返り、サムネイル等の派生画像は
+    バックグラウンドのワーカーで生成します。
+    プロフィール画像に設定した場合は、大サイズの派生画像の生成後に
+    プロフィール画像のパスを派生画像に置き換えます。
+
     Args:
         db: データベースセッション
         animal_id: 猫ID
         file: アップロードファイル
         taken_at: 撮影日（任意）
         description: 説明（任意）
+        set_as_profile: プロフィール画像として設定するか（最初の画像は常に設定）
 
     Returns:
         AnimalImage: 保存された画像レコード
@@ -167,8 +254,8 @@ def upload_image(
     file.file.seek(0)
 
     try:
-        # 画像を保存・最適化（同期処理）
-        relative_path = save_and_optimize_image(
+        # 元画像を保存（リサイズ・再エンコードは派生画像の生成時に行う）
+        relative_path = save_upload_file(
             file, destination_dir=f"animals/{animal_id}/gallery"
         )
 
@@ -181,17 +268,33 @@ def upload_image(
             file_size=file_size,
         )
         db.add(animal_image)
+
+        # 指定された場合・最初の画像の場合、プロフィール画像として設定
+        # （大サイズの派生画像の生成までは元画像を指す）
+        profile_photo = None
+        if set_as_profile:
+            profile_photo = f"{MEDIA_URL_PREFIX}{relative_path}"
+        elif current_count == 0 and not animal.photo:
+            profile_photo = relative_path
+        if profile_photo is not None:
+            animal.photo = profile_photo
+        bump_resource_version(db, RESOURCE_ANIMALS, animal_id)
         db.commit()
         db.refresh(animal_image)
-
-        # 最初の画像の場合、プロフィール画像として設定
-        if current_count == 0 and not animal.photo:
-            animal.photo = relative_path
-            db.commit()
+        if profile_photo is not None:
             logger.info(
-                f"プロフィール画像を設定しました: animal_id={animal_id}, path={relative_path}"
+                f"プロフィール画像を設定しました: animal_id={animal_id}, path={profile_photo}"
             )
 
+        # 写真が変わるとQRカードPDFの内容も変わるためキャッシュを破棄
+        invalidate_animal_pdfs(animal_id)
+
+        # サムネイル・中・大サイズの派生画像をバックグラウンドで生成
+        bind = db.get_bind()
+        schedule_image_variants(relative_path).add_done_callback(
+            lambda _: _on_image_variants_built(bind, animal_id, relative_path)
+        )
+
         logger.info(
             f"画像をアップロードしました: animal_id={animal_id}, image_id={animal_image.id}"
         )
@@ -327,10 +430,13 @@ def delete_image(db: Session, image_id: int) -> bool:
             logger.warning(
                 f"画像ファイルの削除に失敗しました: image_id={image_id}, path={image.image_path}"
             )
+        delete_image_variants(image.image_path)
 
         # データベースから削除
         db.delete(image)
+        bump_resource_version(db, RESOURCE_ANIMALS, image.animal_id)
         db.commit()
+        invalidate_animal_pdfs(image.animal_id)
 
         logger.info(f"画像を削除しました: image_id={image_id}")
         return True
@@ -8,9 +8,11 @@ from __future__ import annotations
 
 import logging
 from datetime import date
+from typing import Any
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session
 
 from app.models.animal import Animal
 from app.models.medical_action import MedicalAction
@@ -22,10 +24,75 @@ from app.schemas.medical_record import (
     MedicalRecordResponse,
     MedicalRecordUpdate,
 )
+from app.utils.http_cache import RESOURCE_MEDICAL_RECORDS, bump_resource_version
+from app.utils.pagination import (
+    cached_total,
+    decode_cursor,
+    encode_cursor,
+    keyset_before,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _medical_record_detail_query(db: Session) -> Query[Any]:
+    """
+    診療記録と表示用のリレーション情報をまとめて取得するクエリを構築
+
+    猫名・獣医師名・診療行為を外部結合し、
+    (MedicalRecord, 猫名, 獣医師名, MedicalAction | None) の行を返します。
+    """
+    return (
+        db.query(MedicalRecord, Animal.name, User.name, MedicalAction)
+        .outerjoin(Animal, Animal.id == MedicalRecord.animal_id)
+        .outerjoin(User, User.id == MedicalRecord.vet_id)
+        .outerjoin(MedicalAction, MedicalAction.id == MedicalRecord.medical_action_id)
+    )
+
+
+def _to_medical_record_response(
+    record: MedicalRecord,
+    animal_name: str | None,
+    vet_name: str | None,
+    medical_action: MedicalAction | None,
+) -> MedicalRecordResponse:
+    """結合クエリの1行をレスポンスオブジェクトに変換"""
+    # 診療行為名と投薬単位、請求価格
+    medical_action_name = None
+    dosage_unit = None
+    billing_amount = None
+    if medical_action is not None:
+        medical_action_name = medical_action.name
+        dosage_unit = medical_action.unit
+        # 請求価格を計算（投薬量がある場合は考慮）
+        dosage = record.dosage if record.dosage else 1
+        billing_amount = medical_action.calculate_total_price(dosage)
+
+    return MedicalRecordResponse(
+        id=record.id,
+        animal_id=record.animal_id,
+        vet_id=record.vet_id,
+        date=record.date,
+        time_slot=record.time_slot,
+        weight=record.weight,
+        temperature=record.temperature,
+        symptoms=record.symptoms,
+        medical_action_id=record.medical_action_id,
+        dosage=record.dosage,
+        other=record.other,
+        comment=record.comment,
+        created_at=record.created_at,
+        updated_at=record.updated_at,
+        last_updated_at=record.last_updated_at,
+        last_updated_by=record.last_updated_by,
+        animal_name=animal_name,
+        vet_name=vet_name,
+        medical_action_name=medical_action_name,
+        dosage_unit=dosage_unit,
+        billing_amount=billing_amount,
+    )
+
+
 def create_medical_record(
     db: Session, medical_record_data: MedicalRecordCreate
 ) -> MedicalRecord:
@@ -55,6 +122,7 @@ def create_medical_record(
     try:
         medical_record = MedicalRecord(**medical_record_data.model_dump())
         db.add(medical_record)
+        bump_resource_version(db, RESOURCE_MEDICAL_RECORDS, medical_record.animal_id)
         db.commit()
         db.refresh(medical_record)
 
@@ -91,68 +159,20 @@ def get_medical_record(db: Session, medical_record_id: int) -> MedicalRecordResp
         >>> record = get_medical_record(db, 1)
     """
     try:
-        medical_record = (
-            db.query(MedicalRecord)
+        row = (
+            _medical_record_detail_query(db)
             .filter(MedicalRecord.id == medical_record_id)
             .first()
         )
 
-        if not medical_record:
+        if not row:
             logger.warning(f"診療記録が見つかりません: ID={medical_record_id}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"ID {medical_record_id} の診療記録が見つかりません",
             )
 
-        # 猫名を取得
-        animal = db.query(Animal).filter(Animal.id == medical_record.animal_id).first()
-        animal_name = animal.name if animal else None
-
-        # 獣医師名を取得
-        vet = db.query(User).filter(User.id == medical_record.vet_id).first()
-        vet_name = vet.name if vet else None
-
-        # 診療行為名と投薬単位、請求価格を取得
-        medical_action_name = None
-        dosage_unit = None
-        billing_amount = None
-        if medical_record.medical_action_id:
-            medical_action = (
-                db.query(MedicalAction)
-                .filter(MedicalAction.id == medical_record.medical_action_id)
-                .first()
-            )
-            if medical_action:
-                medical_action_name = medical_action.name
-                dosage_unit = medical_action.unit
-                # 請求価格を計算
-                dosage = medical_record.dosage if medical_record.dosage else 1
-                billing_amount = medical_action.calculate_total_price(dosage)
-
-        # レスポンスオブジェクトを作成
-        return MedicalRecordResponse(
-            id=medical_record.id,
-            animal_id=medical_record.animal_id,
-            vet_id=medical_record.vet_id,
-            date=medical_record.date,
-            time_slot=medical_record.time_slot,
-            weight=medical_record.weight,
-            temperature=medical_record.temperature,
-            symptoms=medical_record.symptoms,
-            medical_action_id=medical_record.medical_action_id,
-            dosage=medical_record.dosage,
-            other=medical_record.other,
-            comment=medical_record.comment,
-            created_at=medical_record.created_at,
-            updated_at=medical_record.updated_at,
-            last_updated_at=medical_record.last_updated_at,
-            last_updated_by=medical_record.last_updated_by,
-            animal_name=animal_name,
-            vet_name=vet_name,
-            medical_action_name=medical_action_name,
-            dosage_unit=dosage_unit,
-            billing_amount=billing_amount,
-        )
+        return _to_medical_record_response(*row)
 
     except HTTPException:
         raise
@@ -174,10 +194,14 @@ def list_medical_records(
     vet_id: int | None = None,
     start_date: date | None = None,
     end_date: date | None = None,
+    cursor: str | None = None,
 ) -> MedicalRecordListResponse:
     """
     診療記録一覧を取得（ページネーション付き、時系列表示）
 
+    cursor を指定した場合はカーソル方式で取得します（page は無視）。
+    総件数はキャッシュした概算値になります。
+
     Args:
         db: データベースセッション
         page: ページ番号（1から開始）
@@ -186,15 +210,19 @@ def list_medical_records(
         vet_id: 獣医師IDフィルター
         start_date: 開始日フィルター
         end_date: 終了日フィルター
+        cursor: 直前のページの next_cursor（カーソル方式）
 
     Returns:
         MedicalRecordListResponse: 診療記録一覧とページネーション情報
 
+    Raises:
+        HTTPException: カーソルが不正な場合（400）
+
     Example:
         >>> records = list_medical_records(db, page=1, animal_id=1)
     """
-    # クエリを構築
-    query = db.query(MedicalRecord)
+    # クエリを構築（猫名・獣医師名・診療行為を結合して1回で取得）
+    query = _medical_record_detail_query(db)
 
     # フィルター
     if animal_id:
@@ -209,81 +237,53 @@ def list_medical_records(
     if end_date:
         query = query.filter(MedicalRecord.date <= end_date)
 
-    # 総件数を取得
-    total = query.count()
-
-    # ページネーション（時系列で降順）
-    offset = (page - 1) * page_size
-    medical_records = (
-        query.order_by(MedicalRecord.date.desc(), MedicalRecord.id.desc())
-        .offset(offset)
-        .limit(page_size)
-        .all()
-    )
-
-    # リレーション情報を含むレスポンスを作成
-    items: list[MedicalRecordResponse] = []
-    for record in medical_records:
-        # 猫名を取得
-        animal = db.query(Animal).filter(Animal.id == record.animal_id).first()
-        animal_name = animal.name if animal else None
-
-        # 獣医師名を取得
-        vet = db.query(User).filter(User.id == record.vet_id).first()
-        vet_name = vet.name if vet else None
-
-        # 診療行為名と投薬単位、請求価格を取得
-        medical_action_name = None
-        dosage_unit = None
-        billing_amount = None
-        if record.medical_action_id:
-            medical_action = (
-                db.query(MedicalAction)
-                .filter(MedicalAction.id == record.medical_action_id)
-                .first()
-            )
-            if medical_action:
-                medical_action_name = medical_action.name
-                dosage_unit = medical_action.unit
-                # 請求価格を計算（投薬量がある場合は考慮）
-                dosage = record.dosage if record.dosage else 1
-                billing_amount = medical_action.calculate_total_price(dosage)
-
-        # レスポンスオブジェクトを作成
-        response = MedicalRecordResponse(
-            id=record.id,
-            animal_id=record.animal_id,
-            vet_id=record.vet_id,
-            date=record.date,
-            time_slot=record.time_slot,
-            weight=record.weight,
-            temperature=record.temperature,
-            symptoms=record.symptoms,
-            medical_action_id=record.medical_action_id,
-            dosage=record.dosage,
-            other=record.other,
-            comment=record.comment,
-            created_at=record.created_at,
-            updated_at=record.updated_at,
-            last_updated_at=record.last_updated_at,
-            last_updated_by=record.last_updated_by,
-            animal_name=animal_name,
-            vet_name=vet_name,
-            medical_action_name=medical_action_name,
-            dosage_unit=dosage_unit,
-            billing_amount=billing_amount,
+    # 総件数（結合は外部結合のみのため診療記録の件数と一致）
+    def count() -> int:
+        return query.with_entities(func.count(MedicalRecord.id)).scalar() or 0
+
+    # 時系列で降順
+    order_by = (MedicalRecord.date.desc(), MedicalRecord.id.desc())
+    if cursor is None:
+        total = count()
+
+        # ページネーション
+        offset = (page - 1) * page_size
+        rows = query.order_by(*order_by).offset(offset).limit(page_size).all()
+        has_next = offset + len(rows) < total
+    else:
+        # カーソル方式（1件多く取得して次のページの有無を判定）
+        after = decode_cursor(cursor, date)
+        total = cached_total(
+            db,
+            RESOURCE_MEDICAL_RECORDS,
+            ("list", animal_id, vet_id, start_date, end_date),
+            count,
         )
-        items.append(response)
+        rows = (
+            query.filter(keyset_before(MedicalRecord.date, MedicalRecord.id, after))
+            .order_by(*order_by)
+            .limit(page_size + 1)
+            .all()
+        )
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+
+    items = [_to_medical_record_response(*row) for row in rows]
 
     # 総ページ数を計算
     total_pages = (total + page_size - 1) // page_size
 
+    next_cursor = None
+    if has_next and items:
+        next_cursor = encode_cursor(items[-1].date, items[-1].id)
+
     return MedicalRecordListResponse(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -334,6 +334,7 @@ def update_medical_record(
 
         # 更新者を記録
         medical_record.last_updated_by = user_id
+        bump_resource_version(db, RESOURCE_MEDICAL_RECORDS, medical_record.animal_id)
 
         db.commit()
         db.refresh(medical_record)
@@ -0,0 +1,438 @@
+"""
+PDF生成ジョブサービス
+
+時間のかかるPDF生成（大量の猫の面付けQRカード、全猫の月次帳票など）を
+HTTPリクエストから切り離して処理するジョブキューを提供します。
+
+ジョブはデータベース（pdf_jobs）に保存され、アプリケーション内のワーカースレッドが
+順に取り出してPDF描画プールで生成し、結果をファイルとして保存します。
+クライアントは投入 → 状態確認 → ダウンロードの順に操作します。
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import tempfile
+import threading
+import uuid
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.animal import Animal
+from app.models.pdf_job import PDFJob
+from app.schemas.pdf_job import PDFJobCreate
+from app.services import pdf_service
+from app.services.csv_service import validate_report_request
+from app.utils.pdf_renderer import PDFRenderBusyError
+from app.utils.timezone import get_jst_now
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# 中断されたジョブの再投入と期限切れジョブの削除を行う間隔（秒）
+PDF_JOB_PURGE_INTERVAL_SECONDS = 600
+
+
+def submit_pdf_job(
+    db: Session, job_data: PDFJobCreate, user_id: int | None = None
+) -> PDFJob:
+    """
+    PDF生成ジョブを投入
+
+    Args:
+        db: データベースセッション
+        job_data: ジョブ投入データ
+        user_id: 依頼者のユーザーID（Automation APIの場合はNone）
+
+    Returns:
+        PDFJob: 投入されたジョブ
+
+    Raises:
+        HTTPException: 帳票種別が不正な場合（400）、猫が存在しない場合（404）
+    """
+    animal_ids = job_data.animal_ids or (
+        [job_data.animal_id] if job_data.animal_id is not None else []
+    )
+    if animal_ids:
+        _ensure_animals_exist(db, animal_ids)
+
+    if job_data.kind == "report":
+        try:
+            validate_report_request(job_data.report_type or "", job_data.animal_id)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+            ) from e
+
+    job = PDFJob(
+        id=uuid.uuid4().hex,
+        kind=job_data.kind,
+        params=json.dumps(job_data.to_params(), ensure_ascii=False),
+        status="queued",
+        requested_by=user_id,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+
+    logger.info(f"PDF生成ジョブを投入しました: id={job.id}, kind={job.kind}")
+
+    # ワーカーを起こしてポーリング間隔を待たずに処理させる
+    if _worker is not None:
+        _worker.wake()
+
+    return job
+
+
+def _ensure_animals_exist(db: Session, animal_ids: list[int]) -> None:
+    """指定された猫がすべて存在することを1回のクエリで確認"""
+    unique_ids = set(animal_ids)
+    existing_ids = {
+        row.id for row in db.query(Animal.id).filter(Animal.id.in_(unique_ids)).all()
+    }
+    for animal_id in animal_ids:
+        if animal_id not in existing_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"猫ID {animal_id} が見つかりません",
+            )
+
+
+def get_pdf_job(db: Session, job_id: str) -> PDFJob:
+    """
+    PDF生成ジョブを取得
+
+    Args:
+        db: データベースセッション
+        job_id: ジョブID
+
+    Returns:
+        PDFJob: ジョブ
+
+    Raises:
+        HTTPException: ジョブが存在しない場合（404）
+    """
+    job = db.get(PDFJob, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"PDF生成ジョブ {job_id} が見つかりません",
+        )
+    return job
+
+
+def get_pdf_job_result(db: Session, job_id: str) -> tuple[PDFJob, Path]:
+    """
+    完了したPDF生成ジョブの出力ファイルを取得
+
+    Args:
+        db: データベースセッション
+        job_id: ジョブID
+
+    Returns:
+        tuple[PDFJob, Path]: ジョブと生成されたPDFのパス
+
+    Raises:
+        HTTPException: ジョブが存在しない・期限切れの場合（404）、未完了の場合（409）
+    """
+    job = get_pdf_job(db, job_id)
+    if job.status != "completed" or not job.result_path:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"PDF生成ジョブ {job_id} は完了していません（状態: {job.status}）",
+        )
+
+    result_path = Path(job.result_path)
+    if not result_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"PDF生成ジョブ {job_id} の出力ファイルが見つかりません",
+        )
+    return job, result_path
+
+
+def _prepare_render_job(db: Session, job: PDFJob) -> pdf_service.PDFRenderJob:
+    """ジョブのパラメータからPDFの描画を準備"""
+    params = json.loads(job.params)
+    locale = params.get("locale", "ja")
+
+    if job.kind == "qr_card":
+        return pdf_service.prepare_qr_card_pdf(
+            db, params["animal_id"], params.get("base_url"), locale
+        )
+    if job.kind == "qr_card_grid":
+        return pdf_service.prepare_qr_card_pages_pdf(
+            db, params["animal_ids"], params.get("base_url"), locale
+        )
+    if job.kind == "paper_form":
+        return pdf_service.prepare_paper_form_pdf(
+            db, params["animal_id"], params["year"], params["month"]
+        )
+    if job.kind == "report":
+        return pdf_service.prepare_report_pdf(
+            db,
+            report_type=params["report_type"],
+            start_date=date.fromisoformat(params["start_date"]),
+            end_date=date.fromisoformat(params["end_date"]),
+            animal_id=params.get("animal_id"),
+            locale=locale,
+        )
+    raise ValueError(f"不正なPDF種別です: {job.kind}")
+
+
+def _write_result(job_id: str, pdf_bytes: bytes) -> Path:
+    """生成したPDFを出力ディレクトリに保存"""
+    output_dir = Path(settings.pdf_job_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    result_path = output_dir / f"{job_id}.pdf"
+
+    # 書き込み途中のファイルをダウンロードさせないよう一時ファイルから置き換える
+    with tempfile.NamedTemporaryFile(
+        dir=output_dir, suffix=".tmp", delete=False
+    ) as tmp_file:
+        tmp_file.write(pdf_bytes)
+    Path(tmp_file.name).replace(result_path)
+    return result_path
+
+
+def claim_next_pdf_job(db: Session) -> PDFJob | None:
+    """
+    待機中のジョブを1件取り出して処理中にする
+
+    複数のワーカー（複数プロセス）が同時に取り出しても、
+    状態を条件にした更新により1件のジョブは1つのワーカーにしか渡りません。
+
+    Args:
+        db: データベースセッション
+
+    Returns:
+        PDFJob | None: 取り出したジョブ（待機中のジョブがない場合はNone）
+    """
+    candidate = (
+        db.query(PDFJob.id)
+        .filter(PDFJob.status == "queued")
+        .order_by(PDFJob.created_at, PDFJob.id)
+        .first()
+    )
+    if candidate is None:
+        return None
+
+    claimed = (
+        db.query(PDFJob)
+        .filter(PDFJob.id == candidate.id, PDFJob.status == "queued")
+        .update(
+            {PDFJob.status: "running", PDFJob.started_at: get_jst_now()},
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    if claimed != 1:
+        return None
+    return db.get(PDFJob, candidate.id)
+
+
+def run_pdf_job(db: Session, job: PDFJob) -> None:
+    """
+    処理中のジョブを実行し、結果を保存
+
+    描画プールが混雑している場合はジョブを待機中に戻します。
+
+    Args:
+        db: データベースセッション
+        job: 処理中のジョブ
+    """
+    try:
+        render_job = _prepare_render_job(db, job)
+        pdf_bytes = pdf_service.render_pdf_blocking(
+            render_job, timeout_seconds=settings.pdf_job_timeout_seconds
+        )
+        result_path = _write_result(job.id, pdf_bytes)
+    except PDFRenderBusyError:
+        job.status = "queued"
+        job.started_at = None
+        db.commit()
+        logger.info(
+            f"描画プールが混雑しているためジョブを待機に戻しました: id={job.id}"
+        )
+        return
+    except Exception as e:
+        db.rollback()
+        job.status = "failed"
+        job.error = str(e) or e.__class__.__name__
+        job.finished_at = get_jst_now()
+        db.commit()
+        logger.warning(f"PDF生成ジョブが失敗しました: id={job.id}, エラー={e}")
+        return
+
+    job.status = "completed"
+    job.result_path = str(result_path)
+    job.finished_at = get_jst_now()
+    db.commit()
+    logger.info(f"PDF生成ジョブが完了しました: id={job.id}, kind={job.kind}")
+
+
+def process_next_pdf_job(db: Session) -> PDFJob | None:
+    """
+    待機中のジョブを1件処理
+
+    Args:
+        db: データベースセッション
+
+    Returns:
+        PDFJob | None: 処理したジョブ（待機中のジョブがない場合はNone）
+    """
+    job = claim_next_pdf_job(db)
+    if job is not None:
+        run_pdf_job(db, job)
+    return job
+
+
+def requeue_interrupted_pdf_jobs(db: Session, now: datetime | None = None) -> int:
+    """
+    処理中のまま中断されたジョブを待機中に戻す
+
+    複数のプロセスがジョブを処理している場合もあるため、処理中のジョブのうち
+    開始からリース時間（pdf_job_lease_seconds）を過ぎたものだけを中断とみなします。
+    他のプロセスが処理しているジョブはタイムアウトまでに完了・失敗するため対象になりません。
+
+    Args:
+        db: データベースセッション
+        now: 基準日時（省略時は現在日時）
+
+    Returns:
+        int: 待機中に戻したジョブ数
+    """
+    threshold = (now or get_jst_now()) - timedelta(
+        seconds=settings.pdf_job_lease_seconds
+    )
+    count = (
+        db.query(PDFJob)
+        .filter(PDFJob.status == "running", PDFJob.started_at < threshold)
+        .update(
+            {PDFJob.status: "queued", PDFJob.started_at: None},
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return count
+
+
+def purge_expired_pdf_jobs(db: Session, now: datetime | None = None) -> int:
+    """
+    保持期間を過ぎた完了・失敗ジョブと出力ファイルを削除
+
+    Args:
+        db: データベースセッション
+        now: 基準日時（省略時は現在日時）
+
+    Returns:
+        int: 削除したジョブ数
+    """
+    threshold = (now or get_jst_now()) - timedelta(
+        hours=settings.pdf_job_retention_hours
+    )
+    expired = (
+        db.query(PDFJob)
+        .filter(
+            PDFJob.status.in_(("completed", "failed")),
+            PDFJob.finished_at < threshold,
+        )
+        .all()
+    )
+    for job in expired:
+        if job.result_path:
+            Path(job.result_path).unlink(missing_ok=True)
+        db.delete(job)
+    db.commit()
+    return len(expired)
+
+
+class PDFJobWorker:
+    """
+    PDF生成ジョブを順に処理するバックグラウンドワーカー
+
+    Args:
+        session_factory: データベースセッションを生成する関数
+        poll_interval: 待機中のジョブがない場合のポーリング間隔（秒）
+    """
+
+    def __init__(
+        self, session_factory: Callable[[], Session], poll_interval: float
+    ) -> None:
+        self.session_factory = session_factory
+        self.poll_interval = poll_interval
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """ワーカースレッドを起動"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="pdf-job-worker", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """ワーカースレッドを停止"""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def wake(self) -> None:
+        """新しいジョブの投入を通知"""
+        self._wake_event.set()
+
+    def _run(self) -> None:
+        last_purge = 0.0
+        while not self._stop_event.is_set():
+            processed = False
+            try:
+                with self.session_factory() as db:
+                    now = datetime.now().timestamp()
+                    if now - last_purge >= PDF_JOB_PURGE_INTERVAL_SECONDS:
+                        # 停止したプロセスが処理中のまま残したジョブも定期的に回収する
+                        requeued = requeue_interrupted_pdf_jobs(db)
+                        if requeued:
+                            logger.info(
+                                f"中断されていたPDF生成ジョブを再投入しました: {requeued}件"
+                            )
+                        purge_expired_pdf_jobs(db)
+                        last_purge = now
+                    job = process_next_pdf_job(db)
+                    processed = job is not None and job.status != "queued"
+            except Exception as e:
+                logger.error(f"PDF生成ジョブワーカーでエラーが発生しました: {e}")
+
+            # 処理したジョブがあれば続けて次を取り出す
+            if not processed:
+                self._wake_event.wait(timeout=self.poll_interval)
+                self._wake_event.clear()
+
+
+_worker: PDFJobWorker | None = None
+
+
+def start_pdf_job_worker(session_factory: Callable[[], Session]) -> None:
+    """PDF生成ジョブワーカーを起動（アプリケーション起動時）"""
+    global _worker
+    if _worker is None:
+        _worker = PDFJobWorker(session_factory, settings.pdf_job_poll_seconds)
+        _worker.start()
+
+
+def stop_pdf_job_worker() -> None:
+    """PDF生成ジョブワーカーを停止（アプリケーション終了時）"""
+    global _worker
+    if _worker is not None:
+        _worker.stop()
+        _worker = None
@@ -10,19 +10,28 @@ Context7: /websites/doc_courtbouillon_weasyprint_stable
 from __future__ import annotations
 
 import base64
+from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 from pathlib import Path
 
+from fastapi import HTTPException, status
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from sqlalchemy.orm import Session
-from weasyprint import HTML
 
 from app.config import get_settings
 from app.models.animal import Animal
 from app.services.medical_report_service import get_medical_summary_rows
-from app.utils.i18n import tj
-from app.utils.qr_code import generate_animal_qr_code_bytes
+from app.utils import image as image_utils
+from app.utils.i18n import get_catalog, tj
+from app.utils.image_pipeline import resolve_image_variant
+from app.utils.pdf_cache import file_mtime_ns, get_pdf_cache
+from app.utils.pdf_renderer import (
+    PDFRenderUnavailableError,
+    get_pdf_render_pool,
+    render_html_to_pdf,
+)
+from app.utils.qr_code import generate_animal_qr_code_svg
 
 settings = get_settings()
 
@@ -33,6 +42,142 @@ jinja_env = Environment(
     autoescape=select_autoescape(["html", "xml"]),
 )
 
+# 描画プールが混雑している場合にクライアントへ返す再試行までの秒数
+PDF_RENDER_RETRY_AFTER_SECONDS = 5
+
+# 面付けQRカードの1ページ（A4）あたりの枚数
+QR_CARDS_PER_PAGE = 10
+
+
+def preload_templates() -> None:
+    """PDFテンプレートを事前にコンパイル（起動時のウォームアップ）"""
+    for template_name in jinja_env.list_templates(extensions=["html"]):
+        jinja_env.get_template(template_name)
+
+
+@dataclass(frozen=True)
+class PDFRenderJob:
+    """
+    描画待ちのPDF
+
+    DB参照とテンプレート展開までを済ませた状態で、WeasyPrintによる描画のみが残っています。
+    キャッシュにヒットした場合は ``cached_pdf`` にPDFが入っています。
+    """
+
+    html: str = ""
+    cache_key: str | None = None
+    cached_pdf: bytes | None = None
+
+
+def render_pdf(job: PDFRenderJob) -> bytes:
+    """
+    PDFを描画（呼び出し元のスレッドで実行）
+
+    Args:
+        job: 描画待ちのPDF
+
+    Returns:
+        bytes: 生成されたPDFのバイト列
+    """
+    if job.cached_pdf is not None:
+        return job.cached_pdf
+
+    pdf_bytes = render_html_to_pdf(job.html, base_url=str(template_dir))
+    if job.cache_key is not None:
+        get_pdf_cache().put(job.cache_key, pdf_bytes)
+    return pdf_bytes
+
+
+def render_pdf_blocking(job: PDFRenderJob, timeout_seconds: float) -> bytes:
+    """
+    PDFを描画プールで描画（呼び出し元スレッドで待機、PDF生成ジョブ用）
+
+    Args:
+        job: 描画待ちのPDF
+        timeout_seconds: タイムアウト（秒）
+
+    Returns:
+        bytes: 生成されたPDFのバイト列
+
+    Raises:
+        PDFRenderUnavailableError: 描画プールが混雑している、またはタイムアウトした場合
+    """
+    if job.cached_pdf is not None:
+        return job.cached_pdf
+
+    pdf_bytes = get_pdf_render_pool().render_blocking(
+        job.html, base_url=str(template_dir), timeout_seconds=timeout_seconds
+    )
+    if job.cache_key is not None:
+        get_pdf_cache().put(job.cache_key, pdf_bytes)
+    return pdf_bytes
+
+
+async def render_pdf_async(job: PDFRenderJob) -> bytes:
+    """
+    PDFを描画プールで描画（完了まで待機）
+
+    Args:
+        job: 描画待ちのPDF
+
+    Returns:
+        bytes: 生成されたPDFのバイト列
+
+    Raises:
+        HTTPException: 描画プールが混雑している、またはタイムアウトした場合（503）
+    """
+    if job.cached_pdf is not None:
+        return job.cached_pdf
+
+    try:
+        pdf_bytes = await get_pdf_render_pool().render(
+            job.html, base_url=str(template_dir)
+        )
+    except PDFRenderUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(PDF_RENDER_RETRY_AFTER_SECONDS)},
+        ) from e
+
+    if job.cache_key is not None:
+        get_pdf_cache().put(job.cache_key, pdf_bytes)
+    return pdf_bytes
+
+
+def _resolve_photo_path(photo: str | None) -> Path | None:
+    """
+    猫の写真パスから実際のファイルパスを構築
+
+    DBに /media/animals/... と保存されている場合と animals/... の場合の両方に対応します。
+    派生画像と同じく、メディアディレクトリ（image_utils.MEDIA_BASE_DIR）を基準にします。
+    """
+    if not photo:
+        return None
+
+    photo_path_str = photo.lstrip("/")
+
+    # /media/ で始まる場合は、プレフィックスを除いてメディアディレクトリからの相対パスにする
+    if photo_path_str.startswith("media/"):
+        photo_path_str = photo_path_str.removeprefix("media/")
+
+    return image_utils.MEDIA_BASE_DIR / photo_path_str
+
+
+def _template_mtime_ns(template_name: str) -> int | None:
+    """テンプレートファイルの更新日時（キャッシュキー用）"""
+    return file_mtime_ns(template_dir / template_name)
+
+
+def _render_inputs(base_url: str | None, locale: str) -> dict[str, object]:
+    """全PDF種別に共通するキャッシュキーの入力"""
+    return {
+        "base_url": base_url,
+        "locale": locale,
+        "font_family": settings.pdf_font_family,
+        "kiroween_mode": settings.kiroween_mode,
+    }
+
 
 def generate_qr_card_pdf(
     db: Session,
@@ -60,6 +205,30 @@ def generate_qr_card_pdf(
         >>> with open("qr_card.pdf", "wb") as f:
         ...     f.write(pdf_bytes)
     """
+    return render_pdf(prepare_qr_card_pdf(db, animal_id, base_url, locale))
+
+
+def prepare_qr_card_pdf(
+    db: Session,
+    animal_id: int,
+    base_url: str | None = None,
+    locale: str = "ja",
+) -> PDFRenderJob:
+    """
+    QRカードPDF（A6サイズ）の描画を準備
+
+    Args:
+        db: データベースセッション
+        animal_id: 猫のID
+        base_url: ベースURL（省略時は設定から取得）
+        locale: ロケール（ja/en）
+
+    Returns:
+        PDFRenderJob: 描画待ちのPDF
+
+    Raises:
+        ValueError: 猫が見つからない場合
+    """
     # 猫情報を取得
     animal = db.query(Animal).filter(Animal.id == animal_id).first()
     if not animal:
@@ -69,26 +238,33 @@ def generate_qr_card_pdf(
     if base_url is None:
         base_url = settings.base_url
 
-    # QRコードを生成
-    qr_code_bytes = generate_animal_qr_code_bytes(base_url, animal_id, box_size=8)
-    qr_code_base64 = base64.b64encode(qr_code_bytes).decode("utf-8")
+    # 写真は大サイズの派生画像を埋め込む（生成前の場合・旧データは保存されている画像）
+    photo = resolve_image_variant(animal.photo, "large")
+
+    # キャッシュ済みのPDFがあれば再生成しない
+    photo_path = _resolve_photo_path(photo)
+    pdf_cache = get_pdf_cache()
+    cache_key = pdf_cache.build_key(
+        "qr_card",
+        [animal.id],
+        updated_at=animal.updated_at,
+        photo=photo,
+        photo_mtime=file_mtime_ns(photo_path),
+        template_mtime=_template_mtime_ns("qr_card.html"),
+        **_render_inputs(base_url, locale),
+    )
+    cached_pdf = pdf_cache.get(cache_key)
+    if cached_pdf is not None:
+        return PDFRenderJob(cache_key=cache_key, cached_pdf=cached_pdf)
+
+    # QRコードを生成（SVGで埋め込み、PNGのエンコードとbase64変換を省く）
+    qr_code_svg = generate_animal_qr_code_svg(base_url, animal_id)
 
     # 写真をbase64エンコード
     photo_base64 = None
     photo_mime_type = "image/jpeg"  # デフォルト
-    if animal.photo:
+    if photo_path is not None:
         try:
-            # photoパスから実際のファイルパスを構築
-            # DBに /media/animals/... と保存されている場合と animals/... の場合の両方に対応
-            photo_path_str = animal.photo.lstrip("/")
-
-            # /media/ で始まる場合は、そのまま使用
-            if photo_path_str.startswith("media/"):
-                photo_path = Path(photo_path_str)
-            else:
-                # media/ プレフィックスを追加
-                photo_path = Path("media") / photo_path_str
-
             if photo_path.exists():
                 photo_bytes = photo_path.read_bytes()
                 photo_base64 = base64.b64encode(photo_bytes).decode("utf-8")
@@ -112,18 +288,14 @@ def generate_qr_card_pdf(
         animal=animal,
         photo_base64=photo_base64,
         photo_mime_type=photo_mime_type,
-        qr_code_base64=qr_code_base64,
+        qr_code_svg=qr_code_svg,
         font_family=settings.pdf_font_family,
         base_url=base_url,
         kiroween_mode=settings.kiroween_mode,
         locale=locale,
     )
 
-    # PDFを生成
-    html_doc = HTML(string=html_content, base_url=str(template_dir))
-    pdf_bytes = html_doc.write_pdf()
-
-    return pdf_bytes  # type: ignore[no-any-return]
+    return PDFRenderJob(html=html_content, cache_key=cache_key)
 
 
 def generate_qr_card_grid_pdf(
@@ -152,46 +324,117 @@ def generate_qr_card_grid_pdf(
         >>> with open("qr_card_grid.pdf", "wb") as f:
         ...     f.write(pdf_bytes)
     """
+    return render_pdf(prepare_qr_card_grid_pdf(db, animal_ids, base_url, locale))
+
+
+def prepare_qr_card_grid_pdf(
+    db: Session,
+    animal_ids: list[int],
+    base_url: str | None = None,
+    locale: str = "ja",
+) -> PDFRenderJob:
+    """
+    面付けQRカードPDF（A4サイズ、2×5枚）の描画を準備
+
+    Args:
+        db: データベースセッション
+        animal_ids: 猫のIDリスト（最大10個）
+        base_url: ベースURL（省略時は設定から取得）
+        locale: ロケール（ja/en）
+
+    Returns:
+        PDFRenderJob: 描画待ちのPDF
+
+    Raises:
+        ValueError: 猫が見つからない場合、またはIDが10個を超える場合
+    """
+    # 枚数チェック
+    if len(animal_ids) > QR_CARDS_PER_PAGE:
+        raise ValueError(f"一度に生成できるQRカードは最大{QR_CARDS_PER_PAGE}枚です")
+
+    return prepare_qr_card_pages_pdf(db, animal_ids, base_url, locale)
+
+
+def prepare_qr_card_pages_pdf(
+    db: Session,
+    animal_ids: list[int],
+    base_url: str | None = None,
+    locale: str = "ja",
+) -> PDFRenderJob:
+    """
+    面付けQRカードPDFの描画を準備（枚数制限なし、10枚ごとにA4を1ページ）
+
+    PDF生成ジョブから大量の猫をまとめて印刷する場合に使用します。
+
+    Args:
+        db: データベースセッション
+        animal_ids: 猫のIDリスト
+        base_url: ベースURL（省略時は設定から取得）
+        locale: ロケール（ja/en）
+
+    Returns:
+        PDFRenderJob: 描画待ちのPDF
+
+    Raises:
+        ValueError: 猫が見つからない場合
+    """
     # ベースURLの設定
     if base_url is None:
         base_url = settings.base_url
 
-    # 枚数チェック
-    if len(animal_ids) > 10:
-        raise ValueError("一度に生成できるQRカードは最大10枚です")
-
-    # 猫情報とQRコードを取得
-    animals_with_qr: list[dict[str, Animal | str]] = []
+    # 猫情報をまとめて取得（指定順を維持）
+    animals_by_id = {
+        animal.id: animal
+        for animal in db.query(Animal).filter(Animal.id.in_(set(animal_ids))).all()
+    }
+    animals: list[Animal] = []
     for animal_id in animal_ids:
-        animal = db.query(Animal).filter(Animal.id == animal_id).first()
+        animal = animals_by_id.get(animal_id)
         if not animal:
             raise ValueError(f"猫ID {animal_id} が見つかりません")
+        animals.append(animal)
+
+    # 1ページに収まる場合のみキャッシュする（キーに全猫IDを含むため）
+    pdf_cache = get_pdf_cache()
+    cache_key: str | None = None
+    if len(animal_ids) <= QR_CARDS_PER_PAGE:
+        cache_key = pdf_cache.build_key(
+            "qr_card_grid",
+            animal_ids,
+            updated_at=[animal.updated_at for animal in animals],
+            template_mtime=_template_mtime_ns("qr_card_grid.html"),
+            **_render_inputs(base_url, locale),
+        )
+        cached_pdf = pdf_cache.get(cache_key)
+        if cached_pdf is not None:
+            return PDFRenderJob(cache_key=cache_key, cached_pdf=cached_pdf)
 
-        qr_code_bytes = generate_animal_qr_code_bytes(base_url, animal_id, box_size=8)
-        qr_code_base64 = base64.b64encode(qr_code_bytes).decode("utf-8")
-
+    # QRコードを取得（SVGで埋め込み、PNGのエンコードとbase64変換を省く）
+    animals_with_qr: list[dict[str, Animal | str]] = []
+    for animal_id, animal in zip(animal_ids, animals, strict=True):
         animals_with_qr.append(
             {
                 "animal": animal,
-                "qr_code_base64": qr_code_base64,
+                "qr_code_svg": generate_animal_qr_code_svg(base_url, animal_id),
             }
         )
 
+    pages = [
+        animals_with_qr[i : i + QR_CARDS_PER_PAGE]
+        for i in range(0, len(animals_with_qr), QR_CARDS_PER_PAGE)
+    ]
+
     # テンプレートをレンダリング
     template = jinja_env.get_template("qr_card_grid.html")
     html_content = template.render(
-        animals_with_qr=animals_with_qr,
+        pages=pages,
         base_url=base_url,
         font_family=settings.pdf_font_family,
         kiroween_mode=settings.kiroween_mode,
         locale=locale,
     )
 
-    # PDFを生成
-    html_doc = HTML(string=html_content, base_url=str(template_dir))
-    pdf_bytes = html_doc.write_pdf()
-
-    return pdf_bytes  # type: ignore[no-any-return]
+    return PDFRenderJob(html=html_content, cache_key=cache_key)
 
 
 def generate_paper_form_pdf(
@@ -220,11 +463,50 @@ def generate_paper_form_pdf(
         >>> with open("paper_form.pdf", "wb") as f:
         ...     f.write(pdf_bytes)
     """
+    return render_pdf(prepare_paper_form_pdf(db, animal_id, year, month))
+
+
+def prepare_paper_form_pdf(
+    db: Session,
+    animal_id: int,
+    year: int,
+    month: int,
+) -> PDFRenderJob:
+    """
+    紙記録フォームPDF（A4サイズ、1ヶ月分）の描画を準備
+
+    Args:
+        db: データベースセッション
+        animal_id: 猫のID
+        year: 年
+        month: 月
+
+    Returns:
+        PDFRenderJob: 描画待ちのPDF
+
+    Raises:
+        ValueError: 猫が見つからない場合
+    """
     # 猫情報を取得
     animal = db.query(Animal).filter(Animal.id == animal_id).first()
     if not animal:
         raise ValueError(f"猫ID {animal_id} が見つかりません")
 
+    # キャッシュ済みのPDFがあれば再生成しない
+    pdf_cache = get_pdf_cache()
+    cache_key = pdf_cache.build_key(
+        "paper_form",
+        [animal.id],
+        updated_at=animal.updated_at,
+        year=year,
+        month=month,
+        template_mtime=_template_mtime_ns("paper_form.html"),
+        font_family=settings.pdf_font_family,
+    )
+    cached_pdf = pdf_cache.get(cache_key)
+    if cached_pdf is not None:
+        return PDFRenderJob(cache_key=cache_key, cached_pdf=cached_pdf)
+
     # 月の日数を計算
     import calendar
 
@@ -245,11 +527,7 @@ def generate_paper_form_pdf(
         dates=dates,
     )
 
-    # PDFを生成
-    html_doc = HTML(string=html_content, base_url=str(template_dir))
-    pdf_bytes = html_doc.write_pdf()
-
-    return pdf_bytes  # type: ignore[no-any-return]
+    return PDFRenderJob(html=html_content, cache_key=cache_key)
 
 
 def generate_medical_detail_pdf(
@@ -311,6 +589,28 @@ def generate_report_pdf(
         >>> with open("report.pdf", "wb") as f:
         ...     f.write(pdf_bytes)
     """
+    return render_pdf(
+        prepare_report_pdf(db, report_type, start_date, end_date, animal_id, locale)
+    )
+
+
+def prepare_report_pdf(
+    db: Session,
+    report_type: str,
+    start_date: date,
+    end_date: date,
+    animal_id: int | None = None,
+    locale: str = "ja",
+) -> PDFRenderJob:
+    """
+    帳票PDF（日報・週報・月次集計・個別帳票）の描画を準備
+
+    Returns:
+        PDFRenderJob: 描画待ちのPDF
+
+    Raises:
+        ValueError: 不正な帳票種別の場合、または個別帳票で猫IDが未指定の場合
+    """
     from datetime import datetime
 
     from app.models.care_log import CareLog
@@ -327,7 +627,7 @@ def generate_report_pdf(
         raise ValueError("個別帳票の生成には猫IDが必要です")
 
     if report_type == "medical_summary":
-        return generate_medical_summary_report_pdf(
+        return prepare_medical_summary_report_pdf(
             db=db,
             start_date=start_date,
             end_date=end_date,
@@ -355,18 +655,20 @@ def generate_report_pdf(
     )
 
     # レコードに表示用データを追加
-    for record in records:
-        record.time_slot_display = tj(  # type: ignore[attr-defined]
-            f"time_slots.{record.time_slot}", locale=locale
-        )
+    catalog = get_catalog(locale)
+    time_slots = catalog.translate_column(
+        "time_slots", [record.time_slot for record in records]
+    )
+    for record, time_slot in zip(records, time_slots, strict=True):
+        record.time_slot_display = time_slot  # type: ignore[attr-defined]
         # 猫名を取得
         if record.animal:
-            record.animal_name = record.animal.name or tj(  # type: ignore[attr-defined]
-                "animal.no_name", locale=locale, id=record.animal_id
+            record.animal_name = record.animal.name or catalog.gettext(  # type: ignore[attr-defined]
+                "animal.no_name", id=record.animal_id
             )
         else:
-            record.animal_name = tj(  # type: ignore[attr-defined]
-                "animal.no_name", locale=locale, id=record.animal_id
+            record.animal_name = catalog.gettext(  # type: ignore[attr-defined]
+                "animal.no_name", id=record.animal_id
             )
 
     # テンプレートをレンダリング
@@ -405,11 +707,7 @@ def generate_report_pdf(
         t=tj,
     )
 
-    # PDFを生成
-    html_doc = HTML(string=html_content, base_url=str(template_dir))
-    pdf_bytes = html_doc.write_pdf()
-
-    return pdf_bytes  # type: ignore[no-any-return]
+    return PDFRenderJob(html=html_content)
 
 
 def generate_medical_summary_report_pdf(
@@ -419,6 +717,18 @@ def generate_medical_summary_report_pdf(
     animal_id: int | None = None,
     locale: str = "ja",
 ) -> bytes:
+    return render_pdf(
+        prepare_medical_summary_report_pdf(db, start_date, end_date, animal_id, locale)
+    )
+
+
+def prepare_medical_summary_report_pdf(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    animal_id: int | None = None,
+    locale: str = "ja",
+) -> PDFRenderJob:
     from datetime import datetime
 
     rows, totals = get_medical_summary_rows(
@@ -477,6 +787,4 @@ def generate_medical_summary_report_pdf(
         t=tj,
     )
 
-    html_doc = HTML(string=html_content, base_url=str(template_dir))
-    pdf_bytes = html_doc.write_pdf()
-    return pdf_bytes  # type: ignore[no-any-return]
+    return PDFRenderJob(html=html_content)
@@ -8,10 +8,12 @@ from __future__ import annotations
 
 import logging
 
+from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.auth.user_cache import invalidate_user_principal
 from app.models.user import User
-from app.schemas.user import UserListResponse
+from app.schemas.user import UserListResponse, UserUpdate
 
 logger = logging.getLogger(__name__)
 
@@ -66,3 +68,37 @@ def list_users(
         page_size=page_size,
         total_pages=total_pages,
     )
+
+
+def update_user(db: Session, user_id: int, user_data: UserUpdate) -> User:
+    """
+    ユーザー情報を更新（ロール変更・無効化を含む）
+
+    認証済みユーザーのキャッシュを無効化し、次のリクエストから変更を反映します。
+
+    Args:
+        db: データベースセッション
+        user_id: ユーザーID
+        user_data: 更新データ（指定した項目のみ更新）
+
+    Returns:
+        User: 更新されたユーザー
+
+    Raises:
+        HTTPException: ユーザーが見つからない場合（404）
+    """
+    user = db.get(User, user_id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ID {user_id} のユーザーが見つかりません",
+        )
+
+    for field, value in user_data.model_dump(exclude_unset=True).items():
+        setattr(user, field, value)
+    db.commit()
+    db.refresh(user)
+    invalidate_user_principal(user_id)
+
+    logger.info(f"ユーザーを更新しました: ID={user_id}")
+    return user
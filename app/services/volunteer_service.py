@@ -20,6 +20,8 @@ from app.schemas.volunteer import (
     VolunteerListResponse,
     VolunteerUpdate,
 )
+from app.services.dashboard_service import invalidate_dashboard_stats
+from app.utils.http_cache import RESOURCE_VOLUNTEERS, bump_resource_version
 
 logger = logging.getLogger(__name__)
 
@@ -47,8 +49,10 @@ def create_volunteer(db: Session, volunteer_data: VolunteerCreate) -> Volunteer:
     try:
         volunteer = Volunteer(**volunteer_data.model_dump())
         db.add(volunteer)
+        bump_resource_version(db, RESOURCE_VOLUNTEERS)
         db.commit()
         db.refresh(volunteer)
+        invalidate_dashboard_stats()
 
         logger.info(
             f"ボランティアを登録しました: ID={volunteer.id}, 名前={volunteer.name}"
@@ -196,9 +200,11 @@ def update_volunteer(
         update_dict = volunteer_data.model_dump(exclude_unset=True)
         for key, value in update_dict.items():
             setattr(volunteer, key, value)
+        bump_resource_version(db, RESOURCE_VOLUNTEERS)
 
         db.commit()
         db.refresh(volunteer)
+        invalidate_dashboard_stats()
 
         logger.info(f"ボランティア情報を更新しました: ID={volunteer.id}")
         return volunteer
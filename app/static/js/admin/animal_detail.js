@@ -543,9 +543,13 @@ async function loadGallery() {
 
     images.forEach(image => {
       // 画像パスに/media/プレフィックスを追加
-      const imageSrc = image.image_path.startsWith('/')
-        ? image.image_path
-        : `/media/${image.image_path}`;
+      const toMediaUrl = path => (path.startsWith('/') ? path : `/media/${path}`);
+      // 一覧はサムネイル、拡大表示は大サイズ（未生成の場合はどちらも元画像）
+      const thumbnailSrc = toMediaUrl(image.thumbnail_path || image.image_path);
+      const thumbnailWebpSrc = image.thumbnail_webp_path
+        ? toMediaUrl(image.thumbnail_webp_path)
+        : null;
+      const imageSrc = toMediaUrl(image.large_path || image.image_path);
       const rawDescription = (image.description || '').trim();
       const displayDescription =
         rawDescription === 'プロフィール画像'
@@ -558,11 +562,15 @@ async function loadGallery() {
 
       html += `
         <div class="relative group">
-          <img src="${imageSrc}"
-               alt="${imageAlt}"
-              onerror="this.onerror=null; this.src='${DEFAULT_IMAGE_PLACEHOLDER}';"
-               class="w-full h-48 object-cover rounded-lg cursor-pointer"
-               onclick="openImageModal('${imageSrc}', '${imageAlt}')">
+          <picture>
+            ${thumbnailWebpSrc ? `<source srcset="${thumbnailWebpSrc}" type="image/webp">` : ''}
+            <img src="${thumbnailSrc}"
+                 alt="${imageAlt}"
+                 loading="lazy"
+                onerror="this.onerror=null; this.src='${DEFAULT_IMAGE_PLACEHOLDER}';"
+                 class="w-full h-48 object-cover rounded-lg cursor-pointer"
+                 onclick="openImageModal('${imageSrc}', '${imageAlt}')">
+          </picture>
           <div class="absolute top-2 right-2 opacity-0 group-hover:opacity-100 transition-opacity">
             <button onclick="deleteImage(${image.id})" class="p-2 bg-red-600 text-white rounded-full hover:bg-red-700">
               <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -1116,8 +1124,9 @@ async function loadGalleryImages() {
       .map(
         image => `
         <div class="relative group cursor-pointer" onclick="selectGalleryImage(${image.id}, '/media/${image.image_path}')">
-          <img src="/media/${image.image_path}"
+          <img src="/media/${image.thumbnail_path || image.image_path}"
                alt="${image.description || ''}"
+               loading="lazy"
                class="w-full h-32 object-cover rounded-lg border-2 border-gray-300 hover:border-indigo-600 transition-colors">
           <div class="absolute inset-0 bg-black bg-opacity-0 group-hover:bg-opacity-30 transition-opacity rounded-lg flex items-center justify-center">
             <span class="text-white opacity-0 group-hover:opacity-100 font-medium">${selectLabel}</span>
@@ -17,6 +17,7 @@ document.addEventListener('DOMContentLoaded', () => {
   loadAnimals();
   loadDailyView();
   setupEventListeners();
+  subscribeCareLogEvents();
 
   // 言語切り替えで「すべての猫」を現在の言語に再設定
   window.addEventListener('languageChanged', () => {
@@ -71,6 +72,28 @@ function setupEventListeners() {
   });
 }
 
+/**
+ * 世話記録の登録・更新イベントを購読し、一覧を自動で再読み込み
+ *
+ * 短時間に続けて届いたイベントはまとめて1回の再読み込みにします。
+ * 接続が切れた場合はEventSourceが自動で再接続します。
+ */
+function subscribeCareLogEvents() {
+  if (typeof EventSource === 'undefined') return;
+
+  const source = new EventSource('/api/v1/public/care-logs/events');
+  let reloadTimer = null;
+  const scheduleReload = () => {
+    clearTimeout(reloadTimer);
+    reloadTimer = setTimeout(loadDailyView, 500);
+  };
+
+  ['created', 'updated', 'resync'].forEach(eventType => {
+    source.addEventListener(eventType, scheduleReload);
+  });
+  window.addEventListener('beforeunload', () => source.close());
+}
+
 /**
  * 猫リストを取得
  */
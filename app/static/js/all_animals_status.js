@@ -131,5 +131,28 @@ function formatDate(dateString) {
   return `${year}年${month}月${day}日（${weekday}）`;
 }
 
+/**
+ * 世話記録の登録・更新イベントを購読し、記録状況を自動で再取得
+ *
+ * 短時間に続けて届いたイベントはまとめて1回の再取得にします。
+ * 接続が切れた場合はEventSourceが自動で再接続します。
+ */
+function subscribeCareLogEvents() {
+  if (typeof EventSource === 'undefined') return;
+
+  const source = new EventSource(`${API_BASE}/care-logs/events`);
+  let reloadTimer = null;
+  const scheduleReload = () => {
+    clearTimeout(reloadTimer);
+    reloadTimer = setTimeout(loadAllAnimalsStatus, 300);
+  };
+
+  ['created', 'updated', 'resync'].forEach(eventType => {
+    source.addEventListener(eventType, scheduleReload);
+  });
+  window.addEventListener('beforeunload', () => source.close());
+}
+
 // 初期化
 loadAllAnimalsStatus();
+subscribeCareLogEvents();
@@ -357,10 +357,12 @@ async function loadAnimalInfo() {
       animal.name || fallbackText('No name set', '名前未設定');
 
     // 画像のフォールバック処理（photoパスに/media/プレフィックスを追加）
+    // 顔写真は小さく表示するため、生成済みであればサムネイルを使う
     const photoElement = document.getElementById('animalPhoto');
+    const photoPath = animal.photo_thumbnail || animal.photo;
     let photoUrl = DEFAULT_IMAGE_PLACEHOLDER;
-    if (animal.photo && animal.photo.trim() !== '') {
-      photoUrl = animal.photo.startsWith('/') ? animal.photo : `/media/${animal.photo}`;
+    if (photoPath && photoPath.trim() !== '') {
+      photoUrl = photoPath.startsWith('/') ? photoPath : `/media/${photoPath}`;
     }
     photoElement.src = photoUrl;
     photoElement.onerror = function () {
@@ -34,6 +34,17 @@ const OFFLINE_FALLBACKS = {
   },
 };
 
+/**
+ * 登録リクエストごとの冪等キーを発行
+ * オフライン保存した記録は同じキーで再送し、サーバー側で重複登録を防ぐ
+ */
+const createIdempotencyKey = () => {
+  if (typeof crypto !== 'undefined' && typeof crypto.randomUUID === 'function') {
+    return crypto.randomUUID();
+  }
+  return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 12)}`;
+};
+
 const getOfflineFallback = key => {
   const entry = OFFLINE_FALLBACKS[key];
   if (!entry) return '';
@@ -149,6 +160,8 @@ class OfflineManager {
    * 世話記録を保存（オンライン/オフライン対応）
    */
   async saveCareLog(careLogData) {
+    // 通信エラーでオフライン保存に切り替えた場合も同じキーで再送する
+    const idempotencyKey = createIdempotencyKey();
     if (this.isOnline) {
       // オンライン: 直接APIに送信
       try {
@@ -156,6 +169,7 @@ class OfflineManager {
           method: 'POST',
           headers: {
             'Content-Type': 'application/json',
+            'Idempotency-Key': idempotencyKey,
           },
           body: JSON.stringify(careLogData),
         });
@@ -176,24 +190,25 @@ class OfflineManager {
         }
         // オンラインだが通信エラー → オフライン保存にフォールバック
         console.warn('[Offline] Online save failed, falling back to offline:', error);
-        return await this.saveToIndexedDB(careLogData);
+        return await this.saveToIndexedDB(careLogData, idempotencyKey);
       }
     } else {
       // オフライン: IndexedDBに保存
-      return await this.saveToIndexedDB(careLogData);
+      return await this.saveToIndexedDB(careLogData, idempotencyKey);
     }
   }
 
   /**
    * IndexedDBに保存
    */
-  async saveToIndexedDB(careLogData) {
+  async saveToIndexedDB(careLogData, idempotencyKey = createIdempotencyKey()) {
     try {
       const transaction = this.db.transaction(['pendingLogs'], 'readwrite');
       const store = transaction.objectStore('pendingLogs');
 
       const record = {
         data: careLogData,
+        idempotencyKey,
         timestamp: new Date().toISOString(),
         synced: false,
       };
@@ -240,11 +255,13 @@ class OfflineManager {
 
       for (const log of pendingLogs) {
         try {
+          const headers = { 'Content-Type': 'application/json' };
+          if (log.idempotencyKey) {
+            headers['Idempotency-Key'] = log.idempotencyKey;
+          }
           const response = await fetch('/api/v1/public/care-logs', {
             method: 'POST',
-            headers: {
-              'Content-Type': 'application/json',
-            },
+            headers,
             body: JSON.stringify(log.data),
           });
 
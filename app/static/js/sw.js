@@ -75,6 +75,11 @@ self.addEventListener('fetch', event => {
   const { request } = event;
   const url = new URL(request.url);
 
+  // 世話記録イベント（SSE）は終わらないストリームのため、キャッシュせずブラウザに任せる
+  if (url.pathname === '/api/v1/public/care-logs/events') {
+    return;
+  }
+
   // API リクエストの処理（Network First戦略）
   if (url.pathname.startsWith('/api/v1/public/')) {
     event.respondWith(networkFirstStrategy(request, CACHE_NAMES.api));
@@ -178,11 +183,14 @@ async function syncCareLogs() {
     // 各記録を送信
     for (const log of pendingLogs) {
       try {
+        // 保存時に発行した冪等キーで再送（送信済みの記録は重複登録されない）
+        const headers = { 'Content-Type': 'application/json' };
+        if (log.idempotencyKey) {
+          headers['Idempotency-Key'] = log.idempotencyKey;
+        }
         const response = await fetch('/api/v1/public/care-logs', {
           method: 'POST',
-          headers: {
-            'Content-Type': 'application/json',
-          },
+          headers,
           body: JSON.stringify(log.data),
         });
 
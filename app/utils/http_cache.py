@@ -0,0 +1,162 @@
+"""
+条件付きリクエスト（ETag）ユーティリティ
+
+Public APIの読み取りエンドポイントは、ボランティアの端末から頻繁にポーリングされます。
+更新時に進めるリソースのバージョン番号から弱いETagを導出し、
+`If-None-Match` が一致する場合は一覧や集計のクエリを実行せずに 304 Not Modified を返します。
+
+バージョン番号はデータベース（resource_versions）に保持し、データの更新と同じ
+トランザクション内で進めます。複数のワーカープロセスで起動する構成でも、
+どのプロセスで更新してもすべてのプロセスのETagが変わります。
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+
+from fastapi import Request, Response, status
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.resource_version import TABLE_RESOURCE_KEY, ResourceVersion
+
+# リソース種別（テーブル単位のバージョンと、猫ID単位のバージョンを持つ）
+RESOURCE_ANIMALS = "animals"
+RESOURCE_CARE_LOGS = "care_logs"
+RESOURCE_MEDICAL_RECORDS = "medical_records"
+RESOURCE_VOLUNTEERS = "volunteers"
+
+
+def bump_resource_version(db: Session, resource: str, key: int | None = None) -> None:
+    """
+    リソースのバージョンを進める（更新時、コミット前に呼び出す）
+
+    key を指定した場合は、キー単位とテーブル単位の両方のバージョンが進みます。
+    更新と同じトランザクションで進めるため、ロールバックした場合はバージョンも戻ります。
+
+    Args:
+        db: データベースセッション
+        resource: リソース種別（animals, care_logs, medical_records, volunteers）
+        key: 猫IDなどのキー（省略時はテーブル単位のみ）
+    """
+    bump_resource_versions(db, resource, [TABLE_RESOURCE_KEY if key is None else key])
+
+
+def bump_resource_versions(db: Session, resource: str, keys: Iterable[int]) -> None:
+    """
+    複数のキーのバージョンを1回のUPSERTで進める（一括登録時、コミット前に呼び出す）
+
+    同時に更新する他のトランザクションとデッドロックしないよう、キーの昇順に進めます。
+
+    Args:
+        db: データベースセッション
+        resource: リソース種別
+        keys: 猫IDなどのキー
+    """
+    params = [
+        {"resource": resource, "resource_key": key, "version": 1}
+        for key in sorted(set(keys))
+    ]
+    if not params:
+        return
+    table = ResourceVersion.__table__
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(table).on_conflict_do_update(
+        index_elements=[table.c.resource, table.c.resource_key],
+        set_={"version": table.c.version + 1},
+    )
+    db.execute(stmt, params)
+
+
+def get_resource_version(db: Session, resource: str, key: int | None = None) -> int:
+    """
+    リソースのバージョンを取得
+
+    テーブル単位のバージョンは、同じリソース種別の全行のバージョンの合計です。
+
+    Args:
+        db: データベースセッション
+        resource: リソース種別
+        key: 猫IDなどのキー（省略時はテーブル単位）
+
+    Returns:
+        int: バージョン番号（未更新の場合は0）
+    """
+    if key is None:
+        query = select(func.coalesce(func.sum(ResourceVersion.version), 0)).where(
+            ResourceVersion.resource == resource
+        )
+    else:
+        query = select(ResourceVersion.version).where(
+            ResourceVersion.resource == resource,
+            ResourceVersion.resource_key == key,
+        )
+    return db.execute(query).scalar() or 0
+
+
+def make_weak_etag(*parts: object) -> str:
+    """
+    バージョン番号等から弱いETagを生成
+
+    Args:
+        *parts: ETagに反映する値（バージョン番号、対象日など）
+
+    Returns:
+        str: 弱いETag（例: W/"1a2b3c4d5e6f7a8b"）
+    """
+    source = ":".join(str(part) for part in parts)
+    digest = hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _strip_weak(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    If-None-Match ヘッダーがETagと一致するか（弱い比較）
+
+    Args:
+        request: HTTPリクエスト
+        etag: 現在のETag
+
+    Returns:
+        bool: 一致する場合はTrue
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    current = _strip_weak(etag)
+    return any(
+        _strip_weak(candidate.strip()) == current for candidate in header.split(",")
+    )
+
+
+def conditional_response(
+    request: Request, response: Response, etag: str, cache_control: str
+) -> Response | None:
+    """
+    条件付きリクエストを処理
+
+    ETagが一致する場合は本文なしの304レスポンスを返します。
+    一致しない場合は、通常のレスポンスにETagとCache-Controlを設定してNoneを返します。
+
+    Args:
+        request: HTTPリクエスト
+        response: 通常のレスポンス（ヘッダー設定用）
+        etag: 現在のETag
+        cache_control: Cache-Controlヘッダーの値
+
+    Returns:
+        Response | None: 304レスポンス（一致しない場合はNone）
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
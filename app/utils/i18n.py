@@ -8,12 +8,19 @@ Context7ベストプラクティスに基づいた実装:
 - FastAPI依存性注入
 - 複数形対応（ngettext）
 
+帳票・エクスポート用のJSON翻訳は、(ロケール, 名前空間) ごとに
+"headers.animal_name" のようなフラットなキー → 文字列の辞書（TranslationCatalog）へ
+一度だけ変換してキャッシュします。行・列ごとの翻訳はキーの分割や
+ネストした辞書の探索をせずに辞書参照のみで行います。
+
 参照: /websites/babel_pocoo-en
 """
 
 from __future__ import annotations
 
 import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Annotated, Any
 
@@ -26,6 +33,9 @@ _translations_cache: dict[str, Translations | NullTranslations] = {}
 # JSON翻訳データのキャッシュ
 _json_translations: dict[str, dict[str, Any]] = {}
 
+# コンパイル済みJSON翻訳カタログのキャッシュ
+_catalogs: dict[tuple[str, str], TranslationCatalog] = {}
+
 # ロケールディレクトリ
 LOCALES_DIR = Path(__file__).parent.parent / "locales"
 
@@ -91,8 +101,21 @@ def get_translations(
         >>>     _ = translations.gettext
         >>>     return {"message": _("Items list")}
     """
-    if locale in _translations_cache:
-        cached = _translations_cache[locale]
+    return load_babel_translations(locale)
+
+
+def load_babel_translations(locale: str) -> Translations | NullTranslations:
+    """
+    Babel翻訳カタログを読み込む（ロケールごとに一度だけディスクから読み込む）
+
+    Args:
+        locale: 言語コード
+
+    Returns:
+        Translations: Babel翻訳カタログ
+    """
+    cached = _translations_cache.get(locale)
+    if cached is not None:
         return cached
 
     translations = Translations.load(str(LOCALES_DIR), [locale])
@@ -172,8 +195,7 @@ def translate(key: str, language: str = "ja", **kwargs: Any) -> str:
 
     新しいコードでは Translations.gettext を使用してください。
     """
-    translations = Translations.load(str(LOCALES_DIR), [language])
-    text: str = translations.gettext(key)
+    text: str = load_babel_translations(language).gettext(key)
 
     # 補間処理
     result: str = text
@@ -213,6 +235,134 @@ def load_json_translations(locale: str, namespace: str) -> dict[str, Any]:
     return {}
 
 
+def flatten_translations(data: dict[str, Any], prefix: str = "") -> dict[str, str]:
+    """
+    ネストした翻訳データをフラットなキーの辞書に変換
+
+    Args:
+        data: 翻訳データ（load_json_translations の戻り値）
+        prefix: キーの接頭辞
+
+    Returns:
+        dict[str, str]: "headers.animal_name" → "猫名" のような辞書
+
+    Example:
+        >>> flatten_translations({"time_slots": {"morning": "朝"}})
+        {'time_slots.morning': '朝'}
+    """
+    messages: dict[str, str] = {}
+    for key, value in data.items():
+        full_key = f"{prefix}{key}"
+        if isinstance(value, dict):
+            messages.update(flatten_translations(value, f"{full_key}."))
+        elif value is not None:
+            messages[full_key] = str(value)
+    return messages
+
+
+@dataclass(frozen=True)
+class TranslationCatalog:
+    """
+    コンパイル済みのJSON翻訳カタログ（ロケール・名前空間ごと）
+
+    Attributes:
+        locale: ロケール (ja, en)
+        namespace: 名前空間 (reports, など)
+        messages: フラットなキー → 翻訳文字列
+    """
+
+    locale: str
+    namespace: str
+    messages: dict[str, str]
+
+    def gettext(self, key: str, **kwargs: Any) -> str:
+        """
+        翻訳キーから翻訳文字列を取得（tj と同じ仕様）
+
+        キーが見つからない場合は最後のキーをそのまま返します。
+        """
+        value = self.messages.get(key)
+        if value is None:
+            return key.rpartition(".")[2]
+        if kwargs:
+            try:
+                return value.format(**kwargs)
+            except (KeyError, ValueError):
+                return value
+        return value
+
+    def labeler(self, prefix: str) -> Callable[[Any], str]:
+        """
+        列の値を翻訳する関数を取得（値ごとの翻訳結果をメモ化）
+
+        行を1件ずつ生成するストリーミング出力で、列ごとに使用します。
+
+        Args:
+            prefix: キーの接頭辞（例: "time_slots"）
+
+        Returns:
+            Callable[[Any], str]: 値 → 翻訳文字列（"time_slots.{値}" の翻訳）
+
+        Example:
+            >>> time_slot_label = get_catalog("en").labeler("time_slots")
+            >>> time_slot_label("morning")
+            'Morning'
+        """
+        labels: dict[Any, str] = {}
+
+        def label(value: Any) -> str:
+            text = labels.get(value)
+            if text is None:
+                text = labels[value] = self.gettext(f"{prefix}.{value}")
+            return text
+
+        return label
+
+    def translate_column(self, prefix: str, values: Iterable[Any]) -> list[str]:
+        """
+        列の値をまとめて翻訳
+
+        Args:
+            prefix: キーの接頭辞（例: "time_slots", "headers"）
+            values: 列の値
+
+        Returns:
+            list[str]: 翻訳文字列（values と同じ順序）
+
+        Example:
+            >>> get_catalog("ja").translate_column("time_slots", ["morning", "noon"])
+            ['朝', '昼']
+        """
+        return list(map(self.labeler(prefix), values))
+
+    def yes_no(self, value: Any) -> str:
+        """真偽値を "boolean.yes" / "boolean.no" の翻訳に変換"""
+        return self.gettext("boolean.yes" if value else "boolean.no")
+
+
+def get_catalog(locale: str = "ja", namespace: str = "reports") -> TranslationCatalog:
+    """
+    コンパイル済みのJSON翻訳カタログを取得（初回のみ読み込み・変換）
+
+    Args:
+        locale: ロケール (ja, en)
+        namespace: 名前空間 (reports, など)
+
+    Returns:
+        TranslationCatalog: 翻訳カタログ
+    """
+    key = (locale, namespace)
+    catalog = _catalogs.get(key)
+    if catalog is None:
+        catalog = TranslationCatalog(
+            locale=locale,
+            namespace=namespace,
+            messages=flatten_translations(load_json_translations(locale, namespace)),
+        )
+        _catalogs[key] = catalog
+    return catalog
+
+
 def tj(key: str, locale: str = "ja", namespace: str = "reports", **kwargs: Any) -> str:
     """
     JSON翻訳キーから翻訳文字列を取得
@@ -232,27 +382,4 @@ def tj(key: str, locale: str = "ja", namespace: str = "reports", **kwargs: Any)
         >>> tj("animal.no_name", locale="ja", id=123)
         'ID:123'
     """
-    translations = load_json_translations(locale, namespace)
-
-    # ネストされたキーに対応
-    keys = key.split(".")
-    value: Any = translations
-    for k in keys:
-        if isinstance(value, dict):
-            value = value.get(k)
-        else:
-            value = None
-            break
-
-    if value is None:
-        # キーが見つからない場合は最後のキーをそのまま返す
-        return keys[-1]
-
-    # 文字列補間
-    if isinstance(value, str) and kwargs:
-        try:
-            return value.format(**kwargs)
-        except (KeyError, ValueError):
-            return value
-
-    return str(value)
+    return get_catalog(locale, namespace).gettext(key, **kwargs)
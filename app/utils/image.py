@@ -1,14 +1,21 @@
 """
 画像処理ユーティリティ
 
-画像のアップロード、検証、最適化を行います。
+画像のアップロード、検証、削除を行います。
+リサイズ・再エンコードは app.utils.image_pipeline の派生画像の生成で行います。
+
+アップロードされたファイルはEXIF（撮影位置等）を含んだままのため、
+/media では配信しない一時保存ディレクトリに書き込みます。メタデータを除いて
+縮小した元画像と派生画像をメディアディレクトリに書き出すのは派生画像の生成時です。
 """
 
+import os
+import shutil
+import tempfile
 import uuid
 from pathlib import Path
 
 from fastapi import HTTPException, UploadFile, status
-from PIL import Image
 
 from app.config import get_settings
 
@@ -38,6 +45,12 @@ def _resolve_media_dir() -> Path:
 
 MEDIA_BASE_DIR = _resolve_media_dir()
 
+# アップロード直後の元画像の保存先（非公開）
+UPLOAD_STAGING_DIR = Path(settings.upload_staging_dir)
+
+# アップロードファイルをディスクへ書き込む際のチャンクサイズ
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 # 許可される画像拡張子
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 
@@ -117,17 +130,20 @@ def generate_unique_filename(original_filename: str) -> str:
 
 def save_upload_file(file: UploadFile, destination_dir: str = "animals") -> str:
     """
-    アップロードされたファイルを保存
+    アップロードされたファイルを一時保存ディレクトリに保存
+
+    公開用の元画像（メタデータなし）は派生画像の生成時にメディアディレクトリへ
+    同じ相対パスで書き出されます。
 
     Args:
         file: アップロードされたファイル
         destination_dir: 保存先ディレクトリ（media_dir内のサブディレクトリ）
 
     Returns:
-        str: 保存されたファイルの相対パス
+        str: 保存されたファイルの相対パス（メディアディレクトリからの相対パス）
     """
     # 保存先ディレクトリを作成
-    save_dir = MEDIA_BASE_DIR / destination_dir
+    save_dir = UPLOAD_STAGING_DIR / destination_dir
     save_dir.mkdir(parents=True, exist_ok=True)
 
     # ユニークなファイル名を生成
@@ -139,79 +155,21 @@ def save_upload_file(file: UploadFile, destination_dir: str = "animals") -> str:
     filename = generate_unique_filename(file.filename)
     file_path = save_dir / filename
 
-    # ファイルを保存（同期I/O）
+    # チャンク単位で一時ファイルに書き込み、ディスクへの書き込み完了後に配置する
+    # （アップロード全体をメモリに読み込まず、書き込み途中のファイルも公開しない）
     file.file.seek(0)
-    contents = file.file.read()
-    file_path.write_bytes(contents)
+    with tempfile.NamedTemporaryFile(
+        dir=save_dir, suffix=".upload", delete=False
+    ) as tmp_file:
+        shutil.copyfileobj(file.file, tmp_file, UPLOAD_CHUNK_SIZE)
+        tmp_file.flush()
+        os.fsync(tmp_file.fileno())
+    Path(tmp_file.name).replace(file_path)
 
     # 相対パスを返す
     return f"{destination_dir}/{filename}"
 
 
-def optimize_image(
-    image_path: Path, max_size: tuple[int, int] = (1920, 1080), quality: int = 85
-) -> None:
-    """
-    画像を最適化（リサイズ、圧縮）
-
-    Args:
-        image_path: 画像ファイルのパス
-        max_size: 最大サイズ（幅、高さ）
-        quality: JPEG品質（1-100）
-    """
-    try:
-        with Image.open(image_path) as img:
-            # RGBAをRGBに変換（JPEGはアルファチャンネルをサポートしない）
-            if img.mode in ("RGBA", "LA", "P"):
-                # 白背景を作成
-                background = Image.new("RGB", img.size, color=255)
-                if img.mode == "P":
-                    img = img.convert("RGBA")
-                background.paste(
-                    img, mask=img.split()[-1] if img.mode in ("RGBA", "LA") else None
-                )
-                img = background
-
-            # サイズを調整（アスペクト比を維持）
-            img.thumbnail(max_size, Image.Resampling.LANCZOS)
-
-            # 最適化して保存
-            img.save(image_path, optimize=True, quality=quality)
-    except Exception as e:
-        # 最適化に失敗しても元のファイルは残す
-        print(f"画像の最適化に失敗しました: {e}")
-
-
-def save_and_optimize_image(
-    file: UploadFile,
-    destination_dir: str = "animals",
-    max_size: tuple[int, int] = (1920, 1080),
-    quality: int = 85,
-) -> str:
-    """
-    画像を保存して最適化
-
-    Args:
-        file: アップロードされたファイル
-        destination_dir: 保存先ディレクトリ
-        max_size: 最大サイズ（幅、高さ）
-        quality: JPEG品質（1-100）
-
-    Returns:
-        str: 保存されたファイルの相対パス
-    """
-    # ファイルを保存
-    relative_path = save_upload_file(file, destination_dir)
-
-    # 絶対パスを取得
-    absolute_path = MEDIA_BASE_DIR / relative_path
-
-    # 画像を最適化
-    optimize_image(absolute_path, max_size, quality)
-
-    return relative_path
-
-
 def delete_image_file(relative_path: str) -> bool:
     """
     画像ファイルを削除
@@ -223,11 +181,16 @@ def delete_image_file(relative_path: str) -> bool:
         bool: 削除に成功した場合True
     """
     try:
-        file_path = MEDIA_BASE_DIR / relative_path
-        if file_path.exists():
-            file_path.unlink()
-            return True
-        return False
+        # 派生画像の生成前に削除された場合は一時保存ディレクトリにのみ存在する
+        deleted = False
+        for file_path in (
+            MEDIA_BASE_DIR / relative_path,
+            UPLOAD_STAGING_DIR / relative_path,
+        ):
+            if file_path.exists():
+                file_path.unlink()
+                deleted = True
+        return deleted
     except Exception as e:
         print(f"画像ファイルの削除に失敗しました: {e}")
         return False
@@ -0,0 +1,332 @@
+"""
+画像派生サイズ生成パイプライン
+
+アップロードされた元画像から、一覧表示用のサムネイル・中サイズ・大サイズの
+派生画像（JPEGとWebP）をバックグラウンドのワーカーで生成します。
+
+派生画像は元画像と同じディレクトリに `<元のファイル名>_<サイズ>.<拡張子>` として
+保存するため、データベースに追加の列を持たずにパスを導出できます。
+生成前（または生成に失敗した場合）は元画像にフォールバックします。
+
+アップロードされた元画像はEXIF（撮影位置等）を含むため、非公開の一時保存ディレクトリ
+（app.utils.image.UPLOAD_STAGING_DIR）に置かれます。派生画像の生成時に、向きを補正して
+大サイズ以下に縮小し、メタデータを除いた元画像をメディアディレクトリに書き出してから
+一時保存ディレクトリのファイルを削除します。
+猫のプロフィール画像（animal.photo）には大サイズの派生画像のパスを保存するため、
+派生画像のパスから別のサイズのパスも導出できるようにしています。
+
+Pillowは起動時ではなく、ワーカーで派生画像を初めて生成するときにインポートします。
+"""
+
+from __future__ import annotations
+
+import logging
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from app.config import get_settings
+from app.utils import image as image_utils
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# 派生サイズ（大きい順。小さいサイズは1つ前のサイズから縮小する）
+IMAGE_VARIANT_SIZES: dict[str, tuple[int, int]] = {
+    "large": (1920, 1080),
+    "medium": (800, 800),
+    "thumb": (320, 320),
+}
+
+# 派生画像の保存形式（拡張子: (Pillowの形式名, 保存オプション)）
+IMAGE_VARIANT_FORMATS: dict[str, tuple[str, dict[str, Any]]] = {
+    "jpg": ("JPEG", {"quality": 85, "optimize": True, "progressive": True}),
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+}
+
+# 公開用の元画像の保存形式（拡張子: (Pillowの形式名, 保存オプション)）
+# EXIF・ICCプロファイル等のメタデータは保存オプションに渡さないため書き出されない
+ORIGINAL_IMAGE_FORMATS: dict[str, tuple[str, dict[str, Any]]] = {
+    "jpg": ("JPEG", {"quality": 90, "optimize": True}),
+    "jpeg": ("JPEG", {"quality": 90, "optimize": True}),
+    "png": ("PNG", {"optimize": True}),
+    "gif": ("GIF", {}),
+    "webp": ("WEBP", {"quality": 90, "method": 4}),
+}
+
+MEDIA_URL_PREFIX = "/media/"
+
+
+def _media_relative(path: str) -> str:
+    """`/media/` 付きのパスをメディアディレクトリからの相対パスに変換"""
+    if path.startswith(MEDIA_URL_PREFIX):
+        return path[len(MEDIA_URL_PREFIX) :]
+    return path.lstrip("/")
+
+
+def variant_relative_path(relative_path: str, variant: str, ext: str = "jpg") -> str:
+    """
+    派生画像の相対パスを取得
+
+    Args:
+        relative_path: 元画像の相対パス（例: "animals/1/gallery/abc.png"）
+        variant: 派生サイズ（thumb, medium, large）
+        ext: 拡張子（jpg, webp）
+
+    Returns:
+        str: 派生画像の相対パス（例: "animals/1/gallery/abc_thumb.jpg"、
+            "animals/1/gallery/abc_large.jpg" を渡した場合も同じ）
+    """
+    path = Path(_media_relative(relative_path))
+    stem = path.stem
+    # 派生画像のパスが渡された場合は元画像のファイル名に戻してから導出する
+    if path.suffix.lstrip(".") in IMAGE_VARIANT_FORMATS:
+        base, _, suffix = stem.rpartition("_")
+        if base and suffix in IMAGE_VARIANT_SIZES:
+            stem = base
+    return str(path.with_name(f"{stem}_{variant}.{ext}").as_posix())
+
+
+def resolve_image_variant(
+    path: str | None, variant: str, ext: str = "jpg", fallback: bool = True
+) -> str | None:
+    """
+    生成済みの派生画像のパスを取得
+
+    派生画像がまだ生成されていない場合は元画像のパス（fallback=Falseの場合はNone）を返します。
+    `/media/` 付きのパスを渡した場合は `/media/` 付きのパスを返します。
+
+    Args:
+        path: 元画像のパス
+        variant: 派生サイズ（thumb, medium, large）
+        ext: 拡張子（jpg, webp）
+        fallback: 派生画像がない場合に元画像のパスを返すか
+
+    Returns:
+        str | None: 表示に使う画像のパス
+    """
+    if not path:
+        return None
+
+    candidate = variant_relative_path(path, variant, ext)
+    if (image_utils.MEDIA_BASE_DIR / candidate).exists():
+        return f"{MEDIA_URL_PREFIX}{candidate}" if path.startswith("/") else candidate
+    return path if fallback else None
+
+
+def _flatten_alpha(img: Image.Image) -> Image.Image:
+    """透過を白背景に合成してRGBに変換（JPEGはアルファチャンネル非対応）"""
+    from PIL import Image
+
+    if img.mode in ("RGBA", "LA", "P"):
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        background = Image.new("RGB", img.size, color=(255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        return background
+    if img.mode != "RGB":
+        return img.convert("RGB")
+    return img
+
+
+def _save_atomic(
+    img: Image.Image,
+    destination: Path,
+    ext: str,
+    formats: dict[str, tuple[str, dict[str, Any]]] = IMAGE_VARIANT_FORMATS,
+) -> None:
+    """画像を一時ファイル経由で保存（生成途中のファイルを配信しない）"""
+    image_format, options = formats[ext]
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=destination.parent, suffix=f".{ext}.tmp", delete=False
+    ) as tmp_file:
+        img.save(tmp_file, format=image_format, **options)
+    Path(tmp_file.name).replace(destination)
+
+
+def _publish_original(img: Image.Image, relative_path: str) -> None:
+    """公開用の元画像（大サイズ以下に縮小、メタデータなし）をメディアディレクトリに保存"""
+    from PIL import Image
+
+    ext = Path(relative_path).suffix.lstrip(".").lower()
+    image_format, _ = ORIGINAL_IMAGE_FORMATS[ext]
+    published = img.copy()
+    published.thumbnail(IMAGE_VARIANT_SIZES["large"], Image.Resampling.LANCZOS)
+    if image_format == "JPEG":
+        published = _flatten_alpha(published)
+    _save_atomic(
+        published,
+        image_utils.MEDIA_BASE_DIR / relative_path,
+        ext,
+        ORIGINAL_IMAGE_FORMATS,
+    )
+
+
+def build_image_variants(relative_path: str) -> list[str]:
+    """
+    元画像から派生画像（JPEGとWebP）を生成
+
+    元画像は1回だけデコードし、大きいサイズから順に縮小した画像を
+    次のサイズの入力にすることで、サイズごとに元画像を読み直さないようにしています。
+    元画像が一時保存ディレクトリにある（アップロード直後の）場合は、公開用の元画像も
+    書き出し、成否にかかわらず一時保存ディレクトリのファイルを削除します。
+
+    Args:
+        relative_path: 元画像の相対パス
+
+    Returns:
+        list[str]: 生成した派生画像の相対パス
+    """
+    from PIL import Image, ImageOps
+
+    relative_path = _media_relative(relative_path)
+    staged = image_utils.UPLOAD_STAGING_DIR / relative_path
+    is_staged = staged.exists()
+    source = staged if is_staged else image_utils.MEDIA_BASE_DIR / relative_path
+    created: list[str] = []
+
+    try:
+        with Image.open(source) as original:
+            # JPEGは縮小デコードで最大サイズ付近まで読み込み量を減らす
+            original.draft("RGB", IMAGE_VARIANT_SIZES["large"])
+            oriented = ImageOps.exif_transpose(original)
+            if is_staged:
+                _publish_original(oriented, relative_path)
+            img = _flatten_alpha(oriented)
+
+            for variant, max_size in IMAGE_VARIANT_SIZES.items():
+                img.thumbnail(max_size, Image.Resampling.LANCZOS)
+                for ext in IMAGE_VARIANT_FORMATS:
+                    variant_path = variant_relative_path(relative_path, variant, ext)
+                    _save_atomic(img, image_utils.MEDIA_BASE_DIR / variant_path, ext)
+                    created.append(variant_path)
+    finally:
+        if is_staged:
+            staged.unlink(missing_ok=True)
+
+    return created
+
+
+def delete_image_variants(relative_path: str) -> int:
+    """
+    派生画像を削除
+
+    Args:
+        relative_path: 元画像の相対パス
+
+    Returns:
+        int: 削除したファイル数
+    """
+    deleted = 0
+    for variant in IMAGE_VARIANT_SIZES:
+        for ext in IMAGE_VARIANT_FORMATS:
+            path = image_utils.MEDIA_BASE_DIR / variant_relative_path(
+                relative_path, variant, ext
+            )
+            try:
+                path.unlink()
+                deleted += 1
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.warning(f"派生画像の削除に失敗しました: {path}, エラー={e}")
+    return deleted
+
+
+def _build_image_variants_logged(relative_path: str) -> list[str]:
+    """派生画像を生成（ワーカー用、失敗してもログに残すのみ）"""
+    try:
+        created = build_image_variants(relative_path)
+        logger.info(
+            f"派生画像を生成しました: path={relative_path}, count={len(created)}"
+        )
+        return created
+    except Exception as e:
+        logger.warning(
+            f"派生画像の生成に失敗しました: path={relative_path}, エラー={e}"
+        )
+        return []
+
+
+class ImageVariantPool:
+    """
+    派生画像を生成するワーカープール
+
+    Pillowの縮小・エンコード処理はGILを解放するため、スレッドで並列に処理します。
+    max_workers=0 の場合はワーカーを使わず呼び出し元で同期的に生成します。
+
+    Args:
+        max_workers: ワーカー数
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, relative_path: str) -> Future[list[str]]:
+        """
+        派生画像の生成を依頼
+
+        Args:
+            relative_path: 元画像の相対パス
+
+        Returns:
+            Future[list[str]]: 生成した派生画像の相対パス
+        """
+        if self.max_workers == 0:
+            future: Future[list[str]] = Future()
+            future.set_result(_build_image_variants_logged(relative_path))
+            return future
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="image-variant"
+                )
+            return self._executor.submit(_build_image_variants_logged, relative_path)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """ワーカーを停止"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+
+_image_variant_pool: ImageVariantPool | None = None
+
+
+def get_image_variant_pool() -> ImageVariantPool:
+    """派生画像ワーカープールを取得"""
+    global _image_variant_pool
+    if _image_variant_pool is None:
+        _image_variant_pool = ImageVariantPool(settings.image_variant_workers)
+    return _image_variant_pool
+
+
+def schedule_image_variants(relative_path: str) -> Future[list[str]]:
+    """
+    派生画像の生成をバックグラウンドで開始
+
+    Args:
+        relative_path: 元画像の相対パス
+
+    Returns:
+        Future[list[str]]: 生成した派生画像の相対パス
+    """
+    return get_image_variant_pool().submit(relative_path)
+
+
+def shutdown_image_variant_pool() -> None:
+    """派生画像ワーカープールを停止（アプリケーション終了時）"""
+    global _image_variant_pool
+    if _image_variant_pool is not None:
+        _image_variant_pool.shutdown()
+        _image_variant_pool = None
@@ -0,0 +1,155 @@
+"""
+キーセット（カーソル）ページネーションユーティリティ
+
+管理画面の無限スクロールでは、OFFSET方式だと深いページほど読み飛ばす行が増え、
+ページごとに総件数も数え直すことになります。カーソル方式では直前のページの
+最後の行の並び替えキー（日時・日付とID）を不透明なカーソルとして受け取り、
+`(キー, id) < (カーソルのキー, カーソルのid)` の範囲検索で次のページを取得します。
+並び替えキーのインデックスを使うため、どの深さのページでも取得コストは一定です。
+
+カーソル方式の総件数は、リソースのバージョン番号（`app.utils.http_cache`）と
+絞り込み条件をキーにプロセス内でキャッシュします。バージョン番号はデータベースで
+共有するため、どのプロセスでの更新でも次の取得時に数え直します。
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from datetime import date, datetime
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, literal, tuple_
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.utils.http_cache import get_resource_version
+
+settings = get_settings()
+
+# キャッシュする総件数の上限（絞り込み条件の組み合わせ数）
+TOTAL_CACHE_MAX_ENTRIES = 256
+
+_total_cache_lock = threading.Lock()
+_total_cache: OrderedDict[tuple[Hashable, ...], tuple[int, float, int]] = OrderedDict()
+
+
+def encode_cursor(sort_value: date | datetime, row_id: int) -> str:
+    """
+    行の並び替えキーとIDからカーソルを生成
+
+    Args:
+        sort_value: 並び替えキー（作成日時・診療日など）
+        row_id: 行のID
+
+    Returns:
+        str: URLに含められる不透明なカーソル
+    """
+    payload = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_type: type[date]) -> tuple[date, int]:
+    """
+    カーソルを並び替えキーとIDに復元
+
+    Args:
+        cursor: encode_cursor() で生成したカーソル
+        sort_type: 並び替えキーの型（datetime または date）
+
+    Returns:
+        tuple[date, int]: (並び替えキー, ID)
+
+    Raises:
+        HTTPException: カーソルが不正な場合（400）
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        sort_value = sort_type.fromisoformat(raw_value)
+        # 別の種類の一覧のカーソル（日時と日付の取り違え）も不正とする
+        if type(row_id) is not int or sort_value.isoformat() != raw_value:
+            raise ValueError(cursor)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="カーソルが不正です",
+        ) from e
+    return sort_value, row_id
+
+
+def keyset_before(
+    sort_column: Any, id_column: Any, cursor: tuple[date, int]
+) -> ColumnElement[bool]:
+    """
+    降順（並び替えキー、ID）でカーソルより後ろの行を絞り込む条件
+
+    行値の比較にすることで、並び替えキーのインデックスの範囲検索になります。
+    カーソルの値は列と同じ型のバインドパラメータとして渡します。
+
+    Args:
+        sort_column: 並び替えキーの列
+        id_column: IDの列
+        cursor: decode_cursor() で復元した (並び替えキー, ID)
+
+    Returns:
+        ColumnElement[bool]: 絞り込み条件
+    """
+    sort_value, row_id = cursor
+    return tuple_(sort_column, id_column) < tuple_(
+        literal(sort_value, sort_column.type), literal(row_id, id_column.type)
+    )
+
+
+def cached_total(
+    db: Session,
+    resource: str,
+    filters: tuple[Hashable, ...],
+    count: Callable[[], int],
+) -> int:
+    """
+    一覧の総件数を取得（リソースのバージョンと絞り込み条件ごとにキャッシュ）
+
+    Args:
+        db: データベースセッション
+        resource: リソース種別（http_cache のバージョン番号を参照）
+        filters: 絞り込み条件（キャッシュのキー）
+        count: 総件数を数える関数（キャッシュがない場合に呼び出す）
+
+    Returns:
+        int: 総件数
+    """
+    ttl = settings.list_total_cache_ttl_seconds
+    if ttl <= 0:
+        return count()
+
+    key = (resource, *filters)
+    version = get_resource_version(db, resource)
+    now = time.monotonic()
+    with _total_cache_lock:
+        cached = _total_cache.get(key)
+        if cached is not None:
+            total, expires_at, cached_version = cached
+            if cached_version == version and now < expires_at:
+                _total_cache.move_to_end(key)
+                return total
+
+    total = count()
+    with _total_cache_lock:
+        _total_cache[key] = (total, now + ttl, version)
+        _total_cache.move_to_end(key)
+        while len(_total_cache) > TOTAL_CACHE_MAX_ENTRIES:
+            _total_cache.popitem(last=False)
+    return total
+
+
+def clear_total_cache() -> None:
+    """総件数のキャッシュを破棄"""
+    with _total_cache_lock:
+        _total_cache.clear()
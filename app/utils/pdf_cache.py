@@ -0,0 +1,280 @@
+"""
+PDFキャッシュユーティリティ
+
+WeasyPrintによるPDF生成結果を、描画入力のハッシュをキーとしてディスクに保存します。
+猫情報・写真・テンプレート・ロケール等が変わるとキーが変わるため、
+古いエントリは参照されなくなり、合計サイズ上限を超えた時点で古い順（LRU）に削除されます。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# キー形式を変更した場合に古いキャッシュを無効化するためのバージョン
+PDF_CACHE_KEY_VERSION = 1
+
+PDF_CACHE_SUFFIX = ".pdf"
+
+# ファイル名の区切り（種別__猫ID__ハッシュ）
+_KEY_SEPARATOR = "__"
+
+
+def file_mtime_ns(path: Path | None) -> int | None:
+    """
+    ファイルの更新日時（ナノ秒）を取得
+
+    Args:
+        path: ファイルパス（Noneの場合はNoneを返す）
+
+    Returns:
+        int | None: 更新日時。ファイルが存在しない場合はNone
+    """
+    if path is None:
+        return None
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class PDFRenderCache:
+    """
+    ディスク上のPDFキャッシュ（サイズ上限付きLRU）
+
+    エントリは ``<種別>__<猫ID>__<ハッシュ>.pdf`` というファイル名で保存し、
+    参照時にファイルの更新日時を更新することでLRU順序を保持します。
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int, enabled: bool = True):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def build_key(kind: str, animal_ids: Iterable[int], **inputs: Any) -> str:
+        """
+        描画入力からキャッシュキーを生成
+
+        Args:
+            kind: PDF種別（qr_card/qr_card_grid/paper_form等）
+            animal_ids: 対象の猫ID（無効化に使用）
+            **inputs: 描画結果に影響する入力（JSONシリアライズ可能な値）
+
+        Returns:
+            str: キャッシュキー（ファイル名の語幹）
+        """
+        ids = list(animal_ids)
+        payload = json.dumps(
+            {
+                "version": PDF_CACHE_KEY_VERSION,
+                "kind": kind,
+                "animal_ids": ids,
+                "inputs": inputs,
+            },
+            sort_keys=True,
+            default=str,
+            ensure_ascii=False,
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        id_part = "-".join(str(animal_id) for animal_id in sorted(set(ids)))
+        return _KEY_SEPARATOR.join([kind, id_part, digest])
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{PDF_CACHE_SUFFIX}"
+
+    def get(self, key: str) -> bytes | None:
+        """
+        キャッシュからPDFを取得
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            bytes | None: キャッシュされたPDF。存在しない場合はNone
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            # LRU順序の更新（アクセス日時はnoatime環境で更新されないため更新日時を使う）
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        PDFをキャッシュに保存し、サイズ上限を超えた分を削除
+
+        Args:
+            key: キャッシュキー
+            data: PDFのバイト列
+        """
+        if not self.enabled or len(data) > self.max_bytes:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # 書き込み途中のファイルを読まれないよう一時ファイルから置き換える
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                Path(tmp_name).replace(self._path(key))
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+            self._evict()
+        except OSError as e:
+            logger.warning(f"PDFキャッシュの保存に失敗しました: key={key}, エラー={e}")
+
+    def _entries(self) -> list[os.DirEntry[str]]:
+        try:
+            with os.scandir(self.cache_dir) as it:
+                return [
+                    entry
+                    for entry in it
+                    if entry.is_file() and entry.name.endswith(PDF_CACHE_SUFFIX)
+                ]
+        except FileNotFoundError:
+            return []
+
+    def _evict(self) -> None:
+        """合計サイズが上限以下になるまで最も古いエントリから削除"""
+        with self._lock:
+            entries: list[tuple[int, int, Path]] = []
+            total = 0
+            for entry in self._entries():
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, Path(entry.path)))
+                total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            entries.sort()
+            for _mtime, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                self.evictions += 1
+
+    def invalidate_animal(self, animal_id: int) -> int:
+        """
+        指定した猫を含むエントリを削除
+
+        Args:
+            animal_id: 猫ID
+
+        Returns:
+            int: 削除したエントリ数
+        """
+        target = str(animal_id)
+        removed = 0
+        with self._lock:
+            for entry in self._entries():
+                parts = entry.name[: -len(PDF_CACHE_SUFFIX)].split(_KEY_SEPARATOR)
+                if len(parts) == 3 and target in parts[1].split("-"):
+                    Path(entry.path).unlink(missing_ok=True)
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """全エントリを削除"""
+        with self._lock:
+            for entry in self._entries():
+                Path(entry.path).unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, int]:
+        """
+        キャッシュの統計情報を取得
+
+        Returns:
+            dict[str, int]: ヒット数、ミス数、削除数、エントリ数、合計サイズ
+        """
+        entries = self._entries()
+        size_bytes = 0
+        for entry in entries:
+            try:
+                size_bytes += entry.stat().st_size
+            except OSError:
+                continue
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(entries),
+                "size_bytes": size_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_pdf_cache: PDFRenderCache | None = None
+
+
+def get_pdf_cache() -> PDFRenderCache:
+    """
+    設定に基づくPDFキャッシュを取得（初回呼び出し時に生成）
+
+    Returns:
+        PDFRenderCache: PDFキャッシュ
+    """
+    global _pdf_cache
+    if _pdf_cache is None:
+        settings = get_settings()
+        _pdf_cache = PDFRenderCache(
+            cache_dir=Path(settings.pdf_cache_dir),
+            max_bytes=settings.pdf_cache_max_bytes,
+            enabled=settings.pdf_cache_enabled,
+        )
+    return _pdf_cache
+
+
+def invalidate_animal_pdfs(animal_id: int) -> None:
+    """
+    猫情報・写真の変更時にその猫のPDFキャッシュを削除
+
+    キャッシュの削除に失敗しても呼び出し元の更新処理は継続させます。
+
+    Args:
+        animal_id: 猫ID
+    """
+    try:
+        removed = get_pdf_cache().invalidate_animal(animal_id)
+    except OSError as e:
+        logger.warning(
+            f"PDFキャッシュの削除に失敗しました: animal_id={animal_id}, エラー={e}"
+        )
+        return
+    if removed:
+        logger.info(
+            f"PDFキャッシュを削除しました: animal_id={animal_id}, 件数={removed}"
+        )
@@ -0,0 +1,282 @@
+"""
+PDF描画プール
+
+WeasyPrintの ``HTML(...).write_pdf()`` はCPUを数秒占有しGILを保持するため、
+専用のプロセスプールで実行してイベントループとスレッドプールを塞がないようにします。
+
+- ワーカーは起動時にWeasyPrintとフォントを読み込んでおく（事前ウォームアップ）
+- 同時に受け付ける描画ジョブ数（実行中＋待機中）に上限を設け、超過時は即座に拒否する
+- 1ジョブごとにタイムアウトを設ける
+
+``max_workers=0`` の場合はプロセスを使わず1本のスレッドで描画します（テスト・小規模環境向け）。
+
+WeasyPrint（Pango・フォント関連を含む）は読み込みが重いため、アプリケーションの
+起動時ではなく、描画・ウォームアップを行うスレッド／ワーカーで初めてインポートします。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from concurrent.futures.process import BrokenProcessPool
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# ウォームアップ用の最小ドキュメント（フォント読み込みとページサイズ計算を済ませる）
+_WARMUP_HTML = """
+<html><head><style>
+@page {{ size: A4; margin: 10mm; }}
+@page small {{ size: A6; }}
+body {{ font-family: {font_family}; }}
+.small {{ page: small; }}
+</style></head>
+<body><p>NecoKeeper 保護猫 ABC 123</p><p class="small">QR</p></body></html>
+"""
+
+
+class PDFRenderUnavailableError(RuntimeError):
+    """描画プールがジョブを処理できない（混雑・タイムアウト）"""
+
+
+class PDFRenderBusyError(PDFRenderUnavailableError):
+    """待機中のジョブ数が上限に達している"""
+
+
+class PDFRenderTimeoutError(PDFRenderUnavailableError):
+    """ジョブがタイムアウトした"""
+
+
+def render_html_to_pdf(html: str, base_url: str) -> bytes:
+    """
+    HTMLをPDFに変換（ワーカープロセスで実行）
+
+    Args:
+        html: 描画するHTML
+        base_url: 相対パス解決用のベースURL
+
+    Returns:
+        bytes: PDFのバイト列
+    """
+    from weasyprint import HTML
+
+    pdf_bytes: bytes = HTML(string=html, base_url=base_url).write_pdf()
+    return pdf_bytes
+
+
+def _warm_up_worker(font_family: str) -> None:
+    """ワーカー起動時にフォントとレイアウトエンジンを読み込む"""
+    try:
+        from weasyprint import HTML
+
+        HTML(string=_WARMUP_HTML.format(font_family=font_family)).write_pdf()
+    except Exception as e:  # ウォームアップの失敗で描画自体を止めない
+        logger.warning(f"PDFワーカーのウォームアップに失敗しました: {e}")
+
+
+def _ping() -> bool:
+    return True
+
+
+class PDFRenderPool:
+    """
+    上限・タイムアウト付きのPDF描画プール
+
+    Args:
+        max_workers: ワーカープロセス数（0の場合はスレッドで描画）
+        max_pending: 同時に受け付けるジョブ数の上限（実行中＋待機中）
+        timeout_seconds: 1ジョブあたりのタイムアウト（秒）
+        font_family: ウォームアップに使用するフォントファミリー
+        render_func: 描画関数（プロセスに渡すためモジュールトップレベルの関数）
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        timeout_seconds: float,
+        font_family: str = "sans-serif",
+        render_func: Callable[[str, str], bytes] = render_html_to_pdf,
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout_seconds = timeout_seconds
+        self.font_family = font_family
+        self.render_func = render_func
+        self._executor: Executor | None = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """受付済みで未完了のジョブ数"""
+        with self._lock:
+            return self._pending
+
+    def start(self) -> None:
+        """ワーカーを起動してウォームアップを開始（完了は待たない）"""
+        with self._lock:
+            if self._executor is not None:
+                return
+            if self.max_workers <= 0:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="pdf-render"
+                )
+                return
+            # uvicornのスレッドを引き継がないよう spawn で起動する
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_up_worker,
+                initargs=(self.font_family,),
+            )
+            self._executor = executor
+        for _ in range(self.max_workers):
+            executor.submit(_ping)
+        logger.info(f"PDF描画プールを起動しました: workers={self.max_workers}")
+
+    def shutdown(self) -> None:
+        """ワーカーを停止"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.info("PDF描画プールを停止しました")
+
+    def _reserve(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise PDFRenderBusyError(
+                    "PDF生成が混み合っています。しばらくしてから再度お試しください"
+                )
+            self._pending += 1
+
+    def _release(self, _future: object = None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _submit(self, html: str, base_url: str) -> Future[bytes]:
+        self.start()
+        assert self._executor is not None
+        try:
+            return self._executor.submit(self.render_func, html, base_url)
+        except BrokenProcessPool:
+            # ワーカーが異常終了した場合はプールを作り直す
+            logger.warning("PDF描画プールが停止していたため再起動します")
+            self.shutdown()
+            self.start()
+            assert self._executor is not None
+            return self._executor.submit(self.render_func, html, base_url)
+
+    def submit(self, html: str, base_url: str) -> Future[bytes]:
+        """
+        描画ジョブを投入
+
+        Args:
+            html: 描画するHTML
+            base_url: 相対パス解決用のベースURL
+
+        Returns:
+            Future[bytes]: PDFのバイト列を返すFuture
+
+        Raises:
+            PDFRenderBusyError: 受付中のジョブ数が上限に達している場合
+        """
+        self._reserve()
+        try:
+            future = self._submit(html, base_url)
+        except BaseException:
+            self._release()
+            raise
+        # 枠の解放はタイムアウト時ではなくワーカーでの処理完了時に行う
+        future.add_done_callback(self._release)
+        return future
+
+    def render_blocking(
+        self, html: str, base_url: str, timeout_seconds: float | None = None
+    ) -> bytes:
+        """
+        HTMLをPDFに変換（呼び出し元スレッドで完了まで待機、バックグラウンド処理用）
+
+        Args:
+            html: 描画するHTML
+            base_url: 相対パス解決用のベースURL
+            timeout_seconds: タイムアウト（秒、省略時はプールの設定値）
+
+        Returns:
+            bytes: PDFのバイト列
+
+        Raises:
+            PDFRenderBusyError: 受付中のジョブ数が上限に達している場合
+            PDFRenderTimeoutError: ジョブがタイムアウトした場合
+        """
+        future = self.submit(html, base_url)
+        try:
+            return future.result(timeout=timeout_seconds or self.timeout_seconds)
+        except TimeoutError as e:
+            future.cancel()
+            raise PDFRenderTimeoutError("PDF生成がタイムアウトしました") from e
+
+    async def render(self, html: str, base_url: str) -> bytes:
+        """
+        HTMLをPDFに変換（完了まで待機）
+
+        Args:
+            html: 描画するHTML
+            base_url: 相対パス解決用のベースURL
+
+        Returns:
+            bytes: PDFのバイト列
+
+        Raises:
+            PDFRenderBusyError: 受付中のジョブ数が上限に達している場合
+            PDFRenderTimeoutError: ジョブがタイムアウトした場合
+        """
+        future = self.submit(html, base_url)
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=self.timeout_seconds
+            )
+        except TimeoutError as e:
+            future.cancel()
+            raise PDFRenderTimeoutError("PDF生成がタイムアウトしました") from e
+
+
+_render_pool: PDFRenderPool | None = None
+
+
+def get_pdf_render_pool() -> PDFRenderPool:
+    """
+    設定に基づくPDF描画プールを取得（初回呼び出し時に生成）
+
+    Returns:
+        PDFRenderPool: PDF描画プール
+    """
+    global _render_pool
+    if _render_pool is None:
+        settings = get_settings()
+        _render_pool = PDFRenderPool(
+            max_workers=settings.pdf_render_workers,
+            max_pending=settings.pdf_render_max_pending,
+            timeout_seconds=settings.pdf_render_timeout_seconds,
+            font_family=settings.pdf_font_family,
+        )
+    return _render_pool
+
+
+def shutdown_pdf_render_pool() -> None:
+    """PDF描画プールを停止（アプリケーション終了時）"""
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown()
+        _render_pool = None
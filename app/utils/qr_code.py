@@ -3,6 +3,14 @@ QRコード生成ユーティリティ
 
 猫の個体IDとPublicフォームURLを含むQRコードを生成します。
 
+QRコードの出力は（データ、サイズ、境界線、形式）だけで決まるため、
+画像のバイト列はサイズ上限付きのLRUキャッシュに保持し、
+QRカードの面付けや `GET /animals/{id}/qr` のたびに再生成しないようにしています。
+PDFテンプレート向けには、PNGのエンコードやbase64変換が不要なSVG出力も提供します。
+
+qrcode（PNG出力ではPillowも）は、アプリケーションの起動時ではなくQRコードを
+初めて生成するときにインポートします。
+
 Requirements: Requirement 2.3
 Context7: /lincolnloop/python-qrcode
 """
@@ -10,17 +18,26 @@ Context7: /lincolnloop/python-qrcode
 from __future__ import annotations
 
 import io
-from typing import BinaryIO
+from functools import lru_cache
+from typing import TYPE_CHECKING, BinaryIO
+
+if TYPE_CHECKING:
+    from qrcode.image.pil import PilImage  # type: ignore[import-untyped]
+
+# QRコードキャッシュの最大件数（猫1匹につき形式・サイズごとに1件）
+QR_CACHE_MAX_ENTRIES = 1024
+
+SVG_IMAGE_FORMAT = "SVG"
 
-import qrcode  # type: ignore[import-untyped]
-from qrcode.image.pil import PilImage  # type: ignore[import-untyped]
+# エラー訂正レベルL（qrcode.constants.ERROR_CORRECT_L と同じ値）
+ERROR_CORRECT_L = 1
 
 
 def generate_qr_code(
     data: str,
     box_size: int = 10,
     border: int = 4,
-    error_correction: int = qrcode.constants.ERROR_CORRECT_L,
+    error_correction: int = ERROR_CORRECT_L,
 ) -> PilImage:
     """
     QRコード画像を生成
@@ -44,6 +61,8 @@ def generate_qr_code(
     if not data:
         raise ValueError("QRコードに埋め込むデータが空です")
 
+    import qrcode  # type: ignore[import-untyped]
+
     qr = qrcode.QRCode(
         version=1,
         error_correction=error_correction,
@@ -61,7 +80,7 @@ def generate_qr_code_bytes(
     data: str,
     box_size: int = 10,
     border: int = 4,
-    error_correction: int = qrcode.constants.ERROR_CORRECT_L,
+    error_correction: int = ERROR_CORRECT_L,
     image_format: str = "PNG",
 ) -> bytes:
     """
@@ -85,6 +104,53 @@ def generate_qr_code_bytes(
         >>> with open("qr_code.png", "wb") as f:
         ...     f.write(qr_bytes)
     """
+    return _render_qr_code(data, box_size, border, error_correction, image_format)
+
+
+def generate_qr_code_svg(
+    data: str,
+    border: int = 4,
+    error_correction: int = ERROR_CORRECT_L,
+) -> str:
+    """
+    QRコードをSVG文字列として生成
+
+    暗いモジュールを行ごとに連結した1本のパスで描画するため、
+    HTMLやPDFテンプレートにそのまま埋め込めます。
+    表示サイズは親要素に合わせて伸縮します（viewBoxはモジュール単位）。
+
+    Args:
+        data: QRコードに埋め込むデータ（URL等）
+        border: QRコードの境界線の幅（デフォルト: 4）
+        error_correction: エラー訂正レベル（デフォルト: ERROR_CORRECT_L）
+
+    Returns:
+        str: SVG文字列
+
+    Raises:
+        ValueError: データが空の場合
+
+    Example:
+        >>> svg = generate_qr_code_svg("https://example.com/care/123")
+        >>> svg.startswith("<svg")
+        True
+    """
+    svg_bytes = _render_qr_code(data, 1, border, error_correction, SVG_IMAGE_FORMAT)
+    return svg_bytes.decode("utf-8")
+
+
+@lru_cache(maxsize=QR_CACHE_MAX_ENTRIES)
+def _render_qr_code(
+    data: str,
+    box_size: int,
+    border: int,
+    error_correction: int,
+    image_format: str,
+) -> bytes:
+    """QRコードを指定形式のバイト列に変換（結果はLRUキャッシュに保持）"""
+    if image_format == SVG_IMAGE_FORMAT:
+        return _qr_matrix_to_svg(_build_qr_matrix(data, border, error_correction))
+
     img = generate_qr_code(data, box_size, border, error_correction)
 
     # 画像をバイト列に変換
@@ -95,6 +161,70 @@ def generate_qr_code_bytes(
     return buffer.getvalue()  # type: ignore[no-any-return,attr-defined]
 
 
+def _build_qr_matrix(data: str, border: int, error_correction: int) -> list[list[bool]]:
+    """QRコードのモジュール配列（境界線を含む）を生成"""
+    if not data:
+        raise ValueError("QRコードに埋め込むデータが空です")
+
+    import qrcode
+
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=error_correction,
+        box_size=1,
+        border=border,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr.get_matrix()  # type: ignore[no-any-return]
+
+
+def _qr_matrix_to_svg(matrix: list[list[bool]]) -> bytes:
+    """モジュール配列をSVGに変換（横に連続する暗いモジュールを1つの矩形にまとめる）"""
+    size = len(matrix)
+    commands: list[str] = []
+    for y, row in enumerate(matrix):
+        x = 0
+        while x < size:
+            if not row[x]:
+                x += 1
+                continue
+            start = x
+            while x < size and row[x]:
+                x += 1
+            commands.append(f"M{start} {y}h{x - start}v1h-{x - start}z")
+
+    svg = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {size} {size}" '
+        'width="100%" height="100%" shape-rendering="crispEdges">'
+        f'<path fill="#fff" d="M0 0h{size}v{size}H0z"/>'
+        f'<path fill="#000" d="{"".join(commands)}"/>'
+        "</svg>"
+    )
+    return svg.encode("utf-8")
+
+
+def get_qr_cache_stats() -> dict[str, int]:
+    """
+    QRコードキャッシュの統計情報を取得
+
+    Returns:
+        dict[str, int]: ヒット数、ミス数、エントリ数、最大エントリ数
+    """
+    info = _render_qr_code.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "entries": info.currsize,
+        "max_entries": info.maxsize or 0,
+    }
+
+
+def clear_qr_cache() -> None:
+    """QRコードキャッシュを全削除"""
+    _render_qr_code.cache_clear()
+
+
 def generate_animal_qr_url(base_url: str, animal_id: int) -> str:
     """
     猫のPublicフォーム用QR URL を生成
@@ -171,3 +301,22 @@ def generate_animal_qr_code_bytes(
     """
     url = generate_animal_qr_url(base_url, animal_id)
     return generate_qr_code_bytes(url, box_size, border, image_format=image_format)
+
+
+def generate_animal_qr_code_svg(base_url: str, animal_id: int, border: int = 4) -> str:
+    """
+    猫のPublicフォーム用QRコードをSVG文字列として生成
+
+    Args:
+        base_url: ベースURL（例: "https://necokeeper.example.com"）
+        animal_id: 猫のID
+        border: QRコードの境界線の幅（デフォルト: 4）
+
+    Returns:
+        str: SVG文字列（PDFテンプレートにそのまま埋め込み可能）
+
+    Example:
+        >>> svg = generate_animal_qr_code_svg("https://necokeeper.example.com", 123)
+    """
+    url = generate_animal_qr_url(base_url, animal_id)
+    return generate_qr_code_svg(url, border)
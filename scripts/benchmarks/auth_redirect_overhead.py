@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+認証リダイレクトミドルウェアのリクエストあたりのオーバーヘッド計測ベンチマーク
+
+ASGIアプリを（HTTPサーバーを介さずに）直接呼び出し、次の構成で
+1リクエストあたりの処理時間を比較します。
+
+- none: ミドルウェアなし
+- base_http: 従来の BaseHTTPMiddleware による実装
+- asgi: 現在の純粋なASGIミドルウェアによる実装
+
+リクエストは小さなJSON（/api/v1/ping）、ストリーミング（/api/v1/export、
+64KBのチャンク）、差し替え対象外のパス（/static/app.css）の3種類です。
+
+Usage:
+    python scripts/benchmarks/auth_redirect_overhead.py --requests 2000 --stream-mb 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message
+
+from app.middleware.auth_redirect import AuthRedirectMiddleware
+
+CHUNK_SIZE = 64 * 1024
+PATHS = {
+    "json": "/api/v1/ping",
+    "stream": "/api/v1/export",
+    "static": "/static/app.css",
+}
+
+
+class BaseHTTPAuthRedirectMiddleware(BaseHTTPMiddleware):
+    """比較用: 従来の BaseHTTPMiddleware による実装"""
+
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        response = await call_next(request)
+        if response.status_code == 401:
+            if request.url.path.startswith("/api/v1/"):
+                return JSONResponse(
+                    status_code=401,
+                    content={"detail": "認証が必要です。ログインしてください。"},
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            if request.url.path.startswith(
+                "/admin"
+            ) and not request.url.path.startswith("/admin/login"):
+                return RedirectResponse(url="/admin/login", status_code=302)
+        return response
+
+
+def build_app(middleware: type | None, stream_bytes: int) -> FastAPI:
+    """計測用のアプリケーションを作成"""
+    app = FastAPI()
+    if middleware is not None:
+        app.add_middleware(middleware)
+    chunk = b"x" * CHUNK_SIZE
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for _ in range(stream_bytes // CHUNK_SIZE):
+            yield chunk
+
+    @app.get("/api/v1/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/api/v1/export")
+    async def export() -> StreamingResponse:
+        return StreamingResponse(chunks(), media_type="text/csv")
+
+    @app.get("/static/app.css")
+    async def static() -> Response:
+        return Response(b"body{}", media_type="text/css")
+
+    return app
+
+
+async def call(app: ASGIApp, path: str) -> int:
+    """ASGIアプリを1回呼び出し、受信したボディのバイト数を返す"""
+    disconnected = asyncio.Event()
+    request_sent = False
+    received = 0
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal received
+        if message["type"] == "http.response.body":
+            received += len(message.get("body", b""))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("benchmark", 50000),
+        "server": ("benchmark", 80),
+    }
+    await app(scope, receive, send)
+    disconnected.set()
+    return received
+
+
+async def run_mode(app: ASGIApp, path: str, requests: int) -> tuple[float, float]:
+    """リクエストを繰り返し、中央値・p95（マイクロ秒）を返す"""
+    for _ in range(min(requests, 50)):  # ウォームアップ
+        await call(app, path)
+    timings: list[float] = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await call(app, path)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    timings.sort()
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    return statistics.median(timings), p95
+
+
+async def run(requests: int, stream_bytes: int) -> None:
+    """各構成・各リクエストの処理時間とミドルウェアなしとの差を出力"""
+    modes: dict[str, type | None] = {
+        "none": None,
+        "base_http": BaseHTTPAuthRedirectMiddleware,
+        "asgi": AuthRedirectMiddleware,
+    }
+    apps = {name: build_app(mw, stream_bytes) for name, mw in modes.items()}
+
+    print(
+        f"{'request':<8}{'mode':<11}{'median(us)':>12}{'p95(us)':>11}"
+        f"{'overhead(us)':>14}"
+    )
+    for kind, path in PATHS.items():
+        # ストリーミングは1リクエストが重いため回数を減らす
+        count = requests if kind != "stream" else max(1, requests // 10)
+        baseline: float | None = None
+        for name, app in apps.items():
+            median, p95 = await run_mode(app, path, count)
+            if baseline is None:
+                baseline = median
+            print(
+                f"{kind:<8}{name:<11}{median:>12.1f}{p95:>11.1f}"
+                f"{median - baseline:>14.1f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="認証リダイレクトミドルウェアのオーバーヘッド計測ベンチマーク"
+    )
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="各構成のリクエスト数"
+    )
+    parser.add_argument(
+        "--stream-mb",
+        type=int,
+        default=4,
+        help="ストリーミングのレスポンスサイズ（MB）",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{args.requests:,} リクエスト（ストリーミングは {args.stream_mb}MB x "
+        f"{max(1, args.requests // 10):,} リクエスト）"
+    )
+    asyncio.run(run(args.requests, args.stream_mb * 1024 * 1024))
+
+
+if __name__ == "__main__":
+    main()
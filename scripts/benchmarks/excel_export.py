@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Excel出力ベンチマーク
+
+通常モード（Workbook全体をメモリ上に構築）と書き込み専用ストリーミングモードで
+世話記録Excelを生成し、処理時間とピークRSSを比較します。
+各モードは独立した子プロセスで実行するため、ピークRSSは互いに影響しません。
+
+Usage:
+    python scripts/benchmarks/excel_export.py --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-not-for-production")
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.animal import Animal
+from app.models.care_log import CareLog
+
+START_DATE = date(2024, 1, 1)
+MODES = ("in_memory", "streaming")
+
+
+def seed_database(db_path: Path, rows: int, animals: int = 120) -> None:
+    """ベンチマーク用のSQLiteデータベースを作成"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    now = datetime(2024, 1, 1, 9, 0, 0)
+
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Animal),
+            [
+                {
+                    "name": f"猫{i}",
+                    "pattern": "キジトラ",
+                    "tail_length": "長い",
+                    "age": "成猫",
+                    "gender": "female",
+                    "status": "保護中",
+                }
+                for i in range(animals)
+            ],
+        )
+        slots = ("morning", "noon", "evening")
+        batch: list[dict[str, object]] = []
+        for i in range(rows):
+            batch.append(
+                {
+                    "animal_id": i % animals + 1,
+                    "recorder_name": "ベンチマーク",
+                    "log_date": START_DATE + timedelta(days=i // (animals * 3)),
+                    "time_slot": slots[(i // animals) % 3],
+                    "appetite": 3,
+                    "energy": 4,
+                    "urination": True,
+                    "cleaning": i % 2 == 0,
+                    "memo": "特記事項なし" if i % 5 else None,
+                    "created_at": now,
+                    "last_updated_at": now,
+                }
+            )
+            if len(batch) >= 10000:
+                conn.execute(insert(CareLog), batch)
+                batch.clear()
+        if batch:
+            conn.execute(insert(CareLog), batch)
+
+
+def run_mode(db_path: Path, mode: str) -> None:
+    """子プロセス: 指定モードでExcelを生成し結果を出力"""
+    from app.services import excel_service
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    end_date = START_DATE + timedelta(days=3650)
+
+    with Session(bind=engine) as db:
+        started = time.perf_counter()
+        if mode == "in_memory":
+            size = len(
+                excel_service.generate_report_excel(db, "monthly", START_DATE, end_date)
+            )
+        else:
+            size = sum(
+                len(chunk)
+                for chunk in excel_service.stream_report_excel(
+                    db, "monthly", START_DATE, end_date
+                )
+            )
+        elapsed = time.perf_counter() - started
+
+    # Linuxではru_maxrssはKB単位
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{mode}\t{elapsed:.2f}\t{peak_rss_mb:.1f}\t{size}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Excel出力ベンチマーク")
+    parser.add_argument("--rows", type=int, default=100_000, help="世話記録の件数")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--db", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.db, args.mode)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / "benchmark.db"
+        print(f"世話記録 {args.rows:,} 件を作成中...")
+        seed_database(db_path, args.rows)
+
+        print(f"{'mode':<12}{'time (s)':>10}{'peak RSS (MB)':>16}{'size (bytes)':>16}")
+        for mode in MODES:
+            result = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--db", str(db_path)],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            name, elapsed, peak, size = (
+                result.stdout.strip().splitlines()[-1].split("\t")
+            )
+            print(f"{name:<12}{elapsed:>10}{peak:>16}{int(size):>16,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+エクスポートの翻訳処理ベンチマーク（10万行）
+
+世話記録CSVと同じ列構成の行（時点・排尿・清掃・紙記録の翻訳、猫名なしの
+フォールバック）を生成し、次の方式で翻訳にかかる時間を比較します。
+CSVへの書き込み（iter_csv_chunks）まで含めた時間も出力します。
+
+- legacy_tj: キーを分割してネストした辞書を辿る従来の tj（比較用に再実装）
+- tj: コンパイル済みカタログを使う現在の tj（セルごとに呼び出し）
+- catalog: カタログの labeler / yes_no（csv_service と同じ使い方）
+
+あわせて、Babel の translate() を従来（毎回ディスクから読み込み）と
+キャッシュ済みの読み込みで比較します。
+
+Usage:
+    python scripts/benchmarks/i18n_export.py --rows 100000 --locale en
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from babel.support import Translations
+
+from app.services.csv_service import iter_csv_chunks
+from app.utils.i18n import (
+    LOCALES_DIR,
+    get_catalog,
+    load_babel_translations,
+    load_json_translations,
+    tj,
+    translate,
+)
+
+
+class Row(NamedTuple):
+    """世話記録1件分の翻訳対象の値"""
+
+    animal_id: int
+    name: str | None
+    time_slot: str
+    urination: bool
+    cleaning: bool
+    from_paper: bool
+
+
+def legacy_tj(key: str, locale: str = "ja", **kwargs: Any) -> str:
+    """比較用: 従来の tj（キーの分割とネストした辞書の探索を毎回行う）"""
+    translations = load_json_translations(locale, "reports")
+    keys = key.split(".")
+    value: Any = translations
+    for k in keys:
+        if isinstance(value, dict):
+            value = value.get(k)
+        else:
+            value = None
+            break
+    if value is None:
+        return keys[-1]
+    if isinstance(value, str) and kwargs:
+        try:
+            return value.format(**kwargs)
+        except (KeyError, ValueError):
+            return value
+    return str(value)
+
+
+def make_rows(count: int) -> list[Row]:
+    """ランダムな世話記録の行を生成（猫名なしは約1%）"""
+    rng = random.Random(0)
+    return [
+        Row(
+            animal_id=rng.randint(1, 300),
+            name=None if rng.random() < 0.01 else "たま",
+            time_slot=rng.choice(("morning", "noon", "evening")),
+            urination=rng.random() < 0.8,
+            cleaning=rng.random() < 0.9,
+            from_paper=rng.random() < 0.1,
+        )
+        for _ in range(count)
+    ]
+
+
+def per_cell(
+    translate_key: Callable[..., str], rows: list[Row], locale: str
+) -> Iterator[list[Any]]:
+    """セルごとに翻訳関数を呼び出して行を生成"""
+    for row in rows:
+        yield [
+            row.animal_id,
+            row.name
+            or translate_key("animal.no_name", locale=locale, id=row.animal_id),
+            translate_key(f"time_slots.{row.time_slot}", locale=locale),
+            translate_key(
+                "boolean.yes" if row.urination else "boolean.no", locale=locale
+            ),
+            translate_key(
+                "boolean.yes" if row.cleaning else "boolean.no", locale=locale
+            ),
+            translate_key(
+                "boolean.yes" if row.from_paper else "boolean.no", locale=locale
+            ),
+        ]
+
+
+def with_catalog(rows: list[Row], locale: str) -> Iterator[list[Any]]:
+    """コンパイル済みカタログで行を生成（csv_service と同じ使い方）"""
+    catalog = get_catalog(locale)
+    time_slot_label = catalog.labeler("time_slots")
+    for row in rows:
+        yield [
+            row.animal_id,
+            row.name or catalog.gettext("animal.no_name", id=row.animal_id),
+            time_slot_label(row.time_slot),
+            catalog.yes_no(row.urination),
+            catalog.yes_no(row.cleaning),
+            catalog.yes_no(row.from_paper),
+        ]
+
+
+MODES: dict[str, Callable[[list[Row], str], Iterator[list[Any]]]] = {
+    "legacy_tj": lambda rows, locale: per_cell(legacy_tj, rows, locale),
+    "tj": lambda rows, locale: per_cell(tj, rows, locale),
+    "catalog": with_catalog,
+}
+
+HEADER = ["animal_id", "animal_name", "time_slot", "urination", "cleaning", "paper"]
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """処理を繰り返し、中央値（ミリ秒）を返す"""
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def legacy_translate(key: str, language: str) -> str:
+    """比較用: 従来の translate（毎回ディスクから翻訳カタログを読み込む）"""
+    return str(Translations.load(str(LOCALES_DIR), [language]).gettext(key))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="エクスポートの翻訳処理ベンチマーク")
+    parser.add_argument("--rows", type=int, default=100_000, help="行数")
+    parser.add_argument("--locale", default="en", help="ロケール（ja/en）")
+    parser.add_argument("--repeat", type=int, default=5, help="各方式の繰り返し回数")
+    parser.add_argument(
+        "--babel-calls", type=int, default=1000, help="translate() の呼び出し回数"
+    )
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    expected = list(MODES["legacy_tj"](rows, args.locale))
+
+    print(f"{args.rows:,} 行 x {args.repeat}回（ロケール: {args.locale}）")
+    print(f"{'mode':<11}{'translate(ms)':>15}{'csv(ms)':>11}")
+    for name, mode in MODES.items():
+        assert list(mode(rows, args.locale)) == expected, name
+        translate_ms = measure(
+            lambda mode=mode: deque(mode(rows, args.locale), maxlen=0), args.repeat
+        )
+        csv_ms = measure(
+            lambda mode=mode: deque(
+                iter_csv_chunks(HEADER, mode(rows, args.locale)), maxlen=0
+            ),
+            args.repeat,
+        )
+        print(f"{name:<11}{translate_ms:>15.1f}{csv_ms:>11.1f}")
+
+    print(f"\nBabel translate() x {args.babel_calls:,}回")
+    load_babel_translations(args.locale)  # ウォームアップ
+    for name, func in (("legacy", legacy_translate), ("cached", translate)):
+        elapsed = measure(
+            lambda func=func: [
+                func("Save", args.locale) for _ in range(args.babel_calls)
+            ],
+            1,
+        )
+        print(f"{name:<11}{elapsed:>15.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+面付けQRカード（10枚）のQRコード生成ベンチマーク
+
+面付けQRカードPDF 1ページ分（10匹）のQRコードを用意する処理について、
+次の方式の処理時間とテンプレートに埋め込むデータ量を比較します。
+
+- png_uncached: 毎回QRを生成してPNGエンコードし、base64に変換（従来方式）
+- png_cached: PNGをLRUキャッシュから取得し、base64に変換
+- svg_cold: キャッシュを空にしてからSVGを生成
+- svg_cached: SVGをLRUキャッシュから取得
+
+Usage:
+    python scripts/benchmarks/qr_grid.py --iterations 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import qrcode  # type: ignore[import-untyped]
+
+from app.utils import qr_code
+
+BASE_URL = "https://necokeeper.example.com"
+ANIMAL_IDS = list(range(1, 11))
+
+
+def png_uncached() -> int:
+    """従来方式: キャッシュを使わずPNGを生成してbase64に変換"""
+    size = 0
+    for animal_id in ANIMAL_IDS:
+        url = qr_code.generate_animal_qr_url(BASE_URL, animal_id)
+        # キャッシュを経由しない元の関数を呼ぶ
+        png_bytes = qr_code._render_qr_code.__wrapped__(
+            url, 8, 4, qrcode.constants.ERROR_CORRECT_L, "PNG"
+        )
+        size += len(base64.b64encode(png_bytes))
+    return size
+
+
+def png_cached() -> int:
+    """PNGをキャッシュから取得してbase64に変換"""
+    size = 0
+    for animal_id in ANIMAL_IDS:
+        png_bytes = qr_code.generate_animal_qr_code_bytes(
+            BASE_URL, animal_id, box_size=8
+        )
+        size += len(base64.b64encode(png_bytes))
+    return size
+
+
+def svg_cold() -> int:
+    """キャッシュを空にしてSVGを生成"""
+    qr_code.clear_qr_cache()
+    return svg_cached()
+
+
+def svg_cached() -> int:
+    """SVGをキャッシュから取得"""
+    return sum(
+        len(qr_code.generate_animal_qr_code_svg(BASE_URL, animal_id))
+        for animal_id in ANIMAL_IDS
+    )
+
+
+MODES: dict[str, Callable[[], int]] = {
+    "png_uncached": png_uncached,
+    "png_cached": png_cached,
+    "svg_cold": svg_cold,
+    "svg_cached": svg_cached,
+}
+
+
+def run_mode(func: Callable[[], int], iterations: int) -> tuple[float, float, int]:
+    """指定方式を繰り返し実行し、中央値・p95（ミリ秒）と埋め込みサイズを返す"""
+    payload_size = func()  # ウォームアップ
+    timings: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    return statistics.median(timings), p95, payload_size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="面付けQRカードのQR生成ベンチマーク")
+    parser.add_argument(
+        "--iterations", type=int, default=200, help="各方式の繰り返し回数"
+    )
+    args = parser.parse_args()
+
+    print(f"10枚の面付けQRカード x {args.iterations}回")
+    print(f"{'mode':<14}{'median(ms)':>12}{'p95(ms)':>10}{'payload(bytes)':>16}")
+    for name, func in MODES.items():
+        median, p95, payload_size = run_mode(func, args.iterations)
+        print(f"{name:<14}{median:>12.3f}{p95:>10.3f}{payload_size:>16,}")
+
+    stats = qr_code.get_qr_cache_stats()
+    print(
+        f"\nQRキャッシュ: hits={stats['hits']:,} misses={stats['misses']:,} "
+        f"entries={stats['entries']}/{stats['max_entries']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
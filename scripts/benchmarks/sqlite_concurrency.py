@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+SQLite同時書き込み・読み取りベンチマーク
+
+PRAGMAを設定しない従来の接続（ロールバックジャーナル）と、
+SQLite性能プロファイル（WAL, synchronous=NORMAL, busy_timeout 等）を適用した接続で、
+複数のボランティアが同時に世話記録を登録しながら管理画面が一覧を参照する負荷をかけ、
+書き込み・読み取りのスループットとレイテンシを比較します。
+
+- writer: 世話記録を1件ずつ登録してコミット（公開フォームからの登録に相当）
+- reader: 直近7日間の世話記録一覧を取得（管理画面の一覧表示に相当）
+
+Usage:
+    python scripts/benchmarks/sqlite_concurrency.py --writers 4 --readers 4 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-not-for-production")
+
+from sqlalchemy import Engine, create_engine, insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import Base, install_sqlite_pragmas, sqlite_pragma_statements
+from app.models.animal import Animal
+from app.models.care_log import CareLog
+
+START_DATE = date(2024, 1, 1)
+ANIMALS = 120
+PROFILES = ("default", "tuned")
+SLOTS = ("morning", "noon", "evening")
+
+
+@dataclass
+class WorkerStats:
+    """スレッドごとの計測結果"""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+def seed_database(engine: Engine, rows: int) -> date:
+    """ベンチマーク用の世話記録を作成し、最終日を返す"""
+    Base.metadata.create_all(bind=engine)
+    now = datetime(2024, 1, 1, 9, 0, 0)
+    last_date = START_DATE
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Animal),
+            [
+                {
+                    "name": f"猫{i}",
+                    "pattern": "キジトラ",
+                    "tail_length": "長い",
+                    "age": "成猫",
+                    "gender": "female",
+                    "status": "保護中",
+                }
+                for i in range(ANIMALS)
+            ],
+        )
+        batch: list[dict[str, object]] = []
+        for i in range(rows):
+            last_date = START_DATE + timedelta(days=i // (ANIMALS * 3))
+            batch.append(
+                {
+                    "animal_id": i % ANIMALS + 1,
+                    "recorder_name": "ベンチマーク",
+                    "log_date": last_date,
+                    "time_slot": SLOTS[(i // ANIMALS) % 3],
+                    "appetite": 3,
+                    "energy": 4,
+                    "urination": True,
+                    "cleaning": i % 2 == 0,
+                    "created_at": now + timedelta(minutes=i),
+                    "last_updated_at": now,
+                }
+            )
+            if len(batch) >= 10000:
+                conn.execute(insert(CareLog), batch)
+                batch.clear()
+        if batch:
+            conn.execute(insert(CareLog), batch)
+    return last_date
+
+
+def writer(
+    engine: Engine, writer_id: int, stop: threading.Event, stats: WorkerStats
+) -> None:
+    """世話記録を1件ずつ登録（猫・日付・時点が他の記録と重複しないよう未来日を使用）"""
+    first_date = START_DATE + timedelta(days=36500 * (writer_id + 1))
+    i = 0
+    while not stop.is_set():
+        record = CareLog(
+            animal_id=i % ANIMALS + 1,
+            recorder_name=f"ボランティア{writer_id}",
+            log_date=first_date + timedelta(days=i // ANIMALS),
+            time_slot="morning",
+            appetite=3,
+            energy=3,
+            urination=True,
+            cleaning=True,
+        )
+        started = time.perf_counter()
+        try:
+            with Session(engine) as db:
+                db.add(record)
+                db.commit()
+            stats.latencies.append(time.perf_counter() - started)
+        except OperationalError:
+            # database is locked（busy_timeout を超えた）
+            stats.errors += 1
+        i += 1
+
+
+def reader(
+    engine: Engine, last_date: date, stop: threading.Event, stats: WorkerStats
+) -> None:
+    """直近7日間の世話記録一覧を取得"""
+    from app.services import care_log_service
+
+    while not stop.is_set():
+        started = time.perf_counter()
+        try:
+            with Session(engine) as db:
+                care_log_service.list_care_logs(
+                    db,
+                    page_size=50,
+                    start_date=last_date - timedelta(days=6),
+                    end_date=last_date,
+                )
+            stats.latencies.append(time.perf_counter() - started)
+        except OperationalError:
+            stats.errors += 1
+
+
+def run_workers(
+    engine: Engine, last_date: date, writers: int, readers: int, seconds: float
+) -> tuple[list[WorkerStats], list[WorkerStats]]:
+    """書き込み・読み取りスレッドで指定時間負荷をかけ、スレッドごとの結果を返す"""
+    stop = threading.Event()
+    write_stats = [WorkerStats() for _ in range(writers)]
+    read_stats = [WorkerStats() for _ in range(readers)]
+    threads = [
+        threading.Thread(target=writer, args=(engine, i, stop, stats))
+        for i, stats in enumerate(write_stats)
+    ] + [
+        threading.Thread(target=reader, args=(engine, last_date, stop, stats))
+        for stats in read_stats
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return write_stats, read_stats
+
+
+def print_stats(
+    profile: str,
+    seconds: float,
+    write_stats: list[WorkerStats],
+    read_stats: list[WorkerStats],
+) -> None:
+    """書き込み・読み取りのスループットとレイテンシを1行ずつ出力"""
+    for kind, stats_list in (("write", write_stats), ("read", read_stats)):
+        latencies = sorted(x for stats in stats_list for x in stats.latencies)
+        errors = sum(stats.errors for stats in stats_list)
+        p95 = latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0
+        median = statistics.median(latencies) * 1000 if latencies else 0.0
+        print(
+            f"{profile:<9}{kind:<7}{len(latencies) / seconds:>10.1f}"
+            f"{median:>12.2f}{p95:>12.2f}{errors:>9}"
+        )
+
+
+def print_header() -> None:
+    """結果の見出しを出力"""
+    print(
+        f"{'profile':<9}{'kind':<7}{'ops/s':>10}{'p50 (ms)':>12}"
+        f"{'p95 (ms)':>12}{'errors':>9}"
+    )
+
+
+def run_profile(
+    profile: str, rows: int, writers: int, readers: int, seconds: float
+) -> None:
+    """指定プロファイルで負荷をかけ、結果を出力"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(
+            f"sqlite:///{Path(tmp_dir) / 'benchmark.db'}",
+            connect_args={"check_same_thread": False},
+            pool_size=writers + readers,
+        )
+        if profile == "tuned":
+            install_sqlite_pragmas(engine, sqlite_pragma_statements(get_settings()))
+        last_date = seed_database(engine, rows)
+        write_stats, read_stats = run_workers(
+            engine, last_date, writers, readers, seconds
+        )
+        engine.dispose()
+
+    print_stats(profile, seconds, write_stats, read_stats)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="SQLite同時書き込み・読み取りベンチマーク"
+    )
+    parser.add_argument("--rows", type=int, default=50_000, help="初期の世話記録の件数")
+    parser.add_argument("--writers", type=int, default=4, help="書き込みスレッド数")
+    parser.add_argument("--readers", type=int, default=4, help="読み取りスレッド数")
+    parser.add_argument("--seconds", type=float, default=10.0, help="計測時間（秒）")
+    args = parser.parse_args()
+
+    print(
+        f"世話記録 {args.rows:,} 件, 書き込み {args.writers} / 読み取り {args.readers} "
+        f"スレッド, {args.seconds:.0f} 秒"
+    )
+    print_header()
+    for profile in PROFILES:
+        run_profile(profile, args.rows, args.writers, args.readers, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,7 @@ Requirements:
 - 7.2: Log processing status
 - 7.4: Display summary with success/failed counts
 - 7.5: List skipped records with reasons
-- 8.1: Use /api/automation/care-logs endpoint
+- 8.1: Use /api/automation/care-logs endpoint (batch: /api/automation/care-logs/batch)
 - 8.2: Include X-Automation-Key header
 - 8.3: Read from AUTOMATION_API_KEY environment variable
 - 8.4: Log error and display user-friendly message on authentication failure
@@ -29,6 +29,11 @@ Environment Variables:
     NECOKEEPER_API_URL: Base URL of NecoKeeper API (default: http://localhost:8000)
     AUTOMATION_API_KEY: API Key for Automation API authentication (required)
 
+Records are sent in chunks of DEFAULT_CHUNK_SIZE to the batch endpoint, so a
+month of paper forms is a handful of requests instead of one request per record.
+Re-running an import is safe: records already registered for the same
+cat/date/time slot are reported as "unchanged" (or "updated" if edited).
+
 JSON Format:
     入力JSONは以下の形式の配列である必要があります:
 
@@ -60,7 +65,7 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, NoReturn
 
 import requests
 from dotenv import load_dotenv
@@ -73,6 +78,9 @@ from scripts.utils.logging_config import setup_ocr_logger
 # Setup logger
 logger = setup_ocr_logger(log_file="logs/ocr-import.log", log_level="INFO")
 
+# Number of records per batch request (server accepts up to 500)
+DEFAULT_CHUNK_SIZE = 200
+
 
 class RegistrationError(Exception):
     """Exception raised when registration fails"""
@@ -86,6 +94,12 @@ class AuthenticationError(Exception):
     pass
 
 
+class BatchValidationError(RegistrationError):
+    """Exception raised when a batch contains a record the API schema rejects"""
+
+    pass
+
+
 class RegistrationSummary:
     """Summary of the registration process"""
 
@@ -245,55 +259,157 @@ def register_care_log(
         response = requests.post(
             register_url, json=care_log_data, headers=headers, timeout=30
         )
+    except requests.exceptions.RequestException as e:
+        raise RegistrationError(f"Network error during registration: {e}") from e
 
-        if response.status_code == 201:
-            return response.json()
-        elif response.status_code == 401:
-            error_detail = response.json().get("detail", "API Key is missing")
-            raise AuthenticationError(
-                f"Authentication failed: {error_detail}\n"
-                "Please check that AUTOMATION_API_KEY is set correctly."
-            )
-        elif response.status_code == 403:
-            error_detail = response.json().get("detail", "Invalid API Key")
-            raise AuthenticationError(
-                f"Authentication failed: {error_detail}\n"
-                "The API Key is invalid. Please check your AUTOMATION_API_KEY."
-            )
-        elif response.status_code == 503:
-            error_detail = response.json().get("detail", "Automation API is disabled")
-            raise AuthenticationError(
-                f"Service unavailable: {error_detail}\n"
-                "Please enable the Automation API by setting ENABLE_AUTOMATION_API=true"
-            )
-        else:
-            error_detail = response.json().get("detail", "Unknown error")
-            raise RegistrationError(
-                f"Registration failed (status {response.status_code}): {error_detail}"
-            )
+    if response.status_code == 201:
+        return response.json()
+    _raise_for_error_status(response)
+
+
+def _raise_for_error_status(response: requests.Response) -> NoReturn:
+    """
+    Raise the appropriate exception for an error response.
+
+    Args:
+        response: Response from the Automation API
+
+    Raises:
+        AuthenticationError: If API Key is invalid or Automation API is disabled
+        RegistrationError: For any other error status
+    """
+    if response.status_code == 401:
+        error_detail = response.json().get("detail", "API Key is missing")
+        raise AuthenticationError(
+            f"Authentication failed: {error_detail}\n"
+            "Please check that AUTOMATION_API_KEY is set correctly."
+        )
+    elif response.status_code == 403:
+        error_detail = response.json().get("detail", "Invalid API Key")
+        raise AuthenticationError(
+            f"Authentication failed: {error_detail}\n"
+            "The API Key is invalid. Please check your AUTOMATION_API_KEY."
+        )
+    elif response.status_code == 503:
+        error_detail = response.json().get("detail", "Automation API is disabled")
+        raise AuthenticationError(
+            f"Service unavailable: {error_detail}\n"
+            "Please enable the Automation API by setting ENABLE_AUTOMATION_API=true"
+        )
+    else:
+        error_detail = response.json().get("detail", "Unknown error")
+        raise RegistrationError(
+            f"Registration failed (status {response.status_code}): {error_detail}"
+        )
+
+
+def register_care_logs_chunk(
+    base_url: str, api_key: str, care_logs: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """
+    Register a chunk of care log records in one request via the batch endpoint.
 
+    Args:
+        base_url: Base URL of the API
+        api_key: Automation API Key
+        care_logs: Care log records (at most 500)
+
+    Returns:
+        list: Per-record results ({"index", "status", "id", "animal_id", "detail"})
+
+    Raises:
+        BatchValidationError: If any record fails schema validation (422)
+        RegistrationError: If registration fails
+        AuthenticationError: If API Key is invalid
+    """
+    batch_url = f"{base_url}/api/automation/care-logs/batch"
+
+    headers = {
+        "X-Automation-Key": api_key,
+        "Content-Type": "application/json",
+    }
+
+    try:
+        response = requests.post(
+            batch_url, json={"items": care_logs}, headers=headers, timeout=120
+        )
     except requests.exceptions.RequestException as e:
         raise RegistrationError(f"Network error during registration: {e}") from e
 
+    if response.status_code == 200:
+        return response.json()["results"]
+    if response.status_code == 422:
+        raise BatchValidationError(
+            f"Batch rejected by validation: {response.json().get('detail')}"
+        )
+    _raise_for_error_status(response)
+
+
+def _register_records_one_by_one(
+    summary: RegistrationSummary,
+    care_logs: list[dict[str, Any]],
+    offset: int,
+    api_base_url: str,
+    api_key: str,
+) -> None:
+    """
+    Register records individually so each invalid record gets its own error.
+
+    Used as a fallback when the batch endpoint rejects a chunk as a whole.
+
+    Raises:
+        AuthenticationError: If API Key is invalid
+    """
+    for position, care_log_data in enumerate(care_logs):
+        index = offset + position
+        try:
+            result = register_care_log(api_base_url, api_key, care_log_data)
+            summary.add_success()
+            logger.info(
+                f"  ✓ Successfully registered record {index + 1} (ID: {result.get('id')})"
+            )
+        except RegistrationError as e:
+            summary.add_failure(
+                record_index=index,
+                record=care_log_data,
+                error_message=str(e),
+                error_type="registration_error",
+            )
+            logger.error(f"  ✗ Failed to register record {index + 1}: {e}")
+        except AuthenticationError:
+            raise
+        except Exception as e:
+            summary.add_failure(
+                record_index=index,
+                record=care_log_data,
+                error_message=f"Unexpected error: {e}",
+                error_type="unexpected_error",
+            )
+            logger.error(f"  ✗ Unexpected error for record {index + 1}: {e}")
+
 
 def register_care_logs_batch(
     care_logs: list[dict[str, Any]],
     api_base_url: str,
     api_key: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
 ) -> dict[str, Any]:
     """
     Register care log records via NecoKeeper Automation API.
 
     This function:
     1. Verifies API Key configuration
-    2. Registers each record in a batch loop
-    3. Continues processing on individual failures
-    4. Generates a summary with success/failed counts
+    2. Sends the records to the batch endpoint in chunks of chunk_size
+    3. Continues processing on individual failures (per-record results)
+    4. Falls back to one request per record for a chunk the API rejects as a
+       whole, so the invalid records are reported individually
+    5. Generates a summary with success/failed counts
 
     Args:
         care_logs: List of care log data dictionaries
         api_base_url: Base URL of NecoKeeper API
         api_key: Automation API Key
+        chunk_size: Number of records per batch request
 
     Returns:
         dict: Summary with success_count, failed_count, errors
@@ -328,68 +444,88 @@ def register_care_logs_batch(
             )
         return summary.to_dict()
 
-    # Step 2: Register each record
+    # Step 2: Register the records chunk by chunk
     authentication_failed = False
-    for index, care_log_data in enumerate(care_logs):
-        log_date = care_log_data.get("log_date", "N/A")
-        time_slot = care_log_data.get("time_slot", "N/A")
-        animal_id = care_log_data.get("animal_id", "N/A")
+    for offset in range(0, len(care_logs), chunk_size):
+        chunk = care_logs[offset : offset + chunk_size]
 
         logger.info(
-            f"Registering record {index + 1}/{summary.total_records}: "
-            f"Date={log_date}, TimeSlot={time_slot}, AnimalID={animal_id}"
+            f"Registering records {offset + 1}-{offset + len(chunk)}"
+            f"/{summary.total_records}"
         )
 
         try:
-            # Register the record
-            result = register_care_log(api_base_url, api_key, care_log_data)
-
-            # Success
-            summary.add_success()
-            logger.info(
-                f"  ✓ Successfully registered record {index + 1} (ID: {result.get('id')})"
-            )
+            try:
+                results = register_care_logs_chunk(api_base_url, api_key, chunk)
+            except BatchValidationError as e:
+                logger.warning(f"  Chunk rejected, registering one by one: {e}")
+                _register_records_one_by_one(
+                    summary, chunk, offset, api_base_url, api_key
+                )
+                continue
+
+            for result in results:
+                index = offset + result["index"]
+                if result["status"] != "error":
+                    # created / updated / unchanged (already imported)
+                    summary.add_success()
+                    logger.info(
+                        f"  ✓ Successfully registered record {index + 1} "
+                        f"(ID: {result.get('id')}, {result['status']})"
+                    )
+                else:
+                    summary.add_failure(
+                        record_index=index,
+                        record=care_logs[index],
+                        error_message=str(result.get("detail")),
+                        error_type="registration_error",
+                    )
+                    logger.error(
+                        f"  ✗ Failed to register record {index + 1}: "
+                        f"{result.get('detail')}"
+                    )
 
         except AuthenticationError as e:
             # Authentication failed - stop processing remaining records
             authentication_failed = True
-            summary.add_failure(
-                record_index=index,
-                record=care_log_data,
-                error_message=str(e),
-                error_type="authentication_error",
-            )
-            logger.error(f"  ✗ Authentication failed for record {index + 1}: {e}")
+            logger.error(f"  ✗ Authentication failed for record {offset + 1}: {e}")
 
-            # Mark all remaining records as failed due to authentication
-            for remaining_index in range(index + 1, len(care_logs)):
+            # Mark all records not yet registered as failed
+            processed = summary.successful + summary.failed
+            for index in range(processed, len(care_logs)):
                 summary.add_failure(
-                    record_index=remaining_index,
-                    record=care_logs[remaining_index],
-                    error_message="Skipped due to authentication failure",
+                    record_index=index,
+                    record=care_logs[index],
+                    error_message=(
+                        str(e)
+                        if index == processed
+                        else "Skipped due to authentication failure"
+                    ),
                     error_type="authentication_error",
                 )
             break
 
         except RegistrationError as e:
-            # Individual record failed - log and continue
-            summary.add_failure(
-                record_index=index,
-                record=care_log_data,
-                error_message=str(e),
-                error_type="registration_error",
-            )
-            logger.error(f"  ✗ Failed to register record {index + 1}: {e}")
+            # Whole chunk failed (network/server error) - log and continue
+            for position, record in enumerate(chunk):
+                summary.add_failure(
+                    record_index=offset + position,
+                    record=record,
+                    error_message=str(e),
+                    error_type="registration_error",
+                )
+            logger.error(f"  ✗ Failed to register records from {offset + 1}: {e}")
 
         except Exception as e:
             # Unexpected error - log and continue
-            summary.add_failure(
-                record_index=index,
-                record=care_log_data,
-                error_message=f"Unexpected error: {e}",
-                error_type="unexpected_error",
-            )
-            logger.error(f"  ✗ Unexpected error for record {index + 1}: {e}")
+            for position, record in enumerate(chunk):
+                summary.add_failure(
+                    record_index=offset + position,
+                    record=record,
+                    error_message=f"Unexpected error: {e}",
+                    error_type="unexpected_error",
+                )
+            logger.error(f"  ✗ Unexpected error for records from {offset + 1}: {e}")
 
     # Step 3: Generate summary
     logger.info(
@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session
 
 from app.models.animal import Animal
 from app.models.animal_image import AnimalImage
+from app.utils.image_pipeline import variant_relative_path
 
 
 class TestUploadAnimalImageAutomation:
@@ -307,10 +308,10 @@ class TestUploadAnimalImageAutomation:
         assert response.status_code == status.HTTP_201_CREATED
         uploaded_path = response.json()["image_path"]
 
-        # Then: 猫のプロフィール画像が設定される
+        # Then: 猫のプロフィール画像が設定される（大サイズの派生画像を指す）
         test_db.refresh(new_animal)
         assert new_animal.photo is not None
-        assert new_animal.photo == uploaded_path
+        assert new_animal.photo == variant_relative_path(uploaded_path, "large")
 
         # クリーンアップ
         test_db.delete(new_animal)
@@ -348,7 +349,9 @@ class TestUploadAnimalImageAutomation:
             headers={"X-Automation-Key": automation_api_key},
         )
         assert response1.status_code == status.HTTP_201_CREATED
-        first_image_path = response1.json()["image_path"]
+        first_image_path = variant_relative_path(
+            response1.json()["image_path"], "large"
+        )
 
         # Then: プロフィール画像が1枚目に設定される
         test_db.refresh(new_animal)
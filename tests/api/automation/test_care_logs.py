@@ -529,3 +529,83 @@ class TestCreateCareLogAutomation:
 
         # クリーンアップ
         get_settings.cache_clear()
+
+
+class TestCreateCareLogsBatchAutomation:
+    """POST /api/automation/care-logs/batch のテスト"""
+
+    @staticmethod
+    def _row(animal_id: int, time_slot: str = "morning") -> dict[str, object]:
+        return {
+            "animal_id": animal_id,
+            "recorder_name": "OCR自動取込",
+            "log_date": "2025-11-24",
+            "time_slot": time_slot,
+            "from_paper": True,
+            "device_tag": "OCR-Import",
+        }
+
+    def test_batch_returns_per_row_results(
+        self,
+        test_client: TestClient,
+        test_db: Session,
+        test_animal: Animal,
+        automation_api_key: str,
+    ):
+        """正常系: 存在しない猫の行のみエラーとなり、他の行は登録される"""
+        # Given
+        items = [
+            self._row(test_animal.id, "morning"),
+            self._row(99999, "noon"),
+            self._row(test_animal.id, "evening"),
+        ]
+
+        # When
+        response = test_client.post(
+            "/api/automation/care-logs/batch",
+            json={"items": items},
+            headers={"X-Automation-Key": automation_api_key},
+        )
+
+        # Then
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 2
+        assert data["failed"] == 1
+        assert [r["index"] for r in data["results"]] == [0, 1, 2]
+        assert data["results"][1]["status"] == "error"
+        assert "99999" in data["results"][1]["detail"]
+        assert test_db.query(CareLog).count() == 2
+        assert all(log.recorder_id is None for log in test_db.query(CareLog))
+
+    def test_batch_invalid_row_returns_422(
+        self,
+        test_client: TestClient,
+        test_db: Session,
+        test_animal: Animal,
+        automation_api_key: str,
+    ):
+        """異常系: スキーマに合わない行を含む場合はリクエスト全体が422"""
+        # When
+        response = test_client.post(
+            "/api/automation/care-logs/batch",
+            json={"items": [self._row(test_animal.id, "afternoon")]},
+            headers={"X-Automation-Key": automation_api_key},
+        )
+
+        # Then
+        assert response.status_code == 422
+        assert test_db.query(CareLog).count() == 0
+
+    def test_batch_requires_api_key(
+        self, test_client: TestClient, test_animal: Animal, automation_api_key: str
+    ):
+        """異常系: API Keyがない場合は401"""
+        # When
+        response = test_client.post(
+            "/api/automation/care-logs/batch",
+            json={"items": [self._row(test_animal.id)]},
+        )
+
+        # Then
+        assert response.status_code == 401
@@ -6,8 +6,13 @@ Requirements: 2.2
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from fastapi import status
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.services import pdf_job_service
 
 
 class TestGenerateQRCardGridAutomation:
@@ -265,3 +270,60 @@ class TestPDFAutomationIntegration:
         assert pdf_response.status_code == status.HTTP_200_OK
         assert pdf_response.headers["content-type"] == "application/pdf"
         assert len(pdf_response.content) > 0
+
+
+class TestPDFJobAutomation:
+    """PDF生成ジョブAutomation APIのテスト"""
+
+    def test_submit_poll_and_download(
+        self,
+        test_client: TestClient,
+        test_db: Session,
+        test_animals_bulk,
+        automation_api_key: str,
+        pdf_job_dir: Path,
+    ):
+        """正常系: 10枚を超えるQRカードをジョブで生成してダウンロードできる"""
+        # Given
+        headers = {"X-Automation-Key": automation_api_key}
+        animal_ids = [animal.id for animal in test_animals_bulk]
+
+        # When
+        submit_response = test_client.post(
+            "/api/automation/pdf/jobs",
+            json={"kind": "qr_card_grid", "animal_ids": animal_ids},
+            headers=headers,
+        )
+        job_id = submit_response.json()["id"]
+        pdf_job_service.process_next_pdf_job(test_db)
+        status_response = test_client.get(
+            f"/api/automation/pdf/jobs/{job_id}", headers=headers
+        )
+        download_response = test_client.get(
+            f"/api/automation/pdf/jobs/{job_id}/download", headers=headers
+        )
+
+        # Then
+        assert submit_response.status_code == status.HTTP_202_ACCEPTED
+        assert status_response.json()["status"] == "completed"
+        assert download_response.status_code == status.HTTP_200_OK
+        assert download_response.headers["content-type"] == "application/pdf"
+
+    def test_submit_job_nonexistent_animal(
+        self, test_client: TestClient, automation_api_key: str
+    ):
+        """異常系: 存在しない猫を指定すると404"""
+        response = test_client.post(
+            "/api/automation/pdf/jobs",
+            json={"kind": "qr_card_grid", "animal_ids": [99999]},
+            headers={"X-Automation-Key": automation_api_key},
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_submit_job_without_api_key(self, test_client: TestClient, test_animal):
+        """異常系: API Key未設定（401）"""
+        response = test_client.post(
+            "/api/automation/pdf/jobs",
+            json={"kind": "qr_card", "animal_id": test_animal.id},
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
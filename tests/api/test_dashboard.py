@@ -0,0 +1,38 @@
+"""
+ダッシュボードAPIのテスト
+"""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app.models.animal import Animal
+
+
+class TestDashboardStats:
+    """GET /api/v1/dashboard/stats のテスト"""
+
+    def test_get_dashboard_stats(
+        self,
+        test_client: TestClient,
+        auth_headers: dict[str, str],
+        test_animal: Animal,
+    ):
+        """正常系: 従来の項目とステータス別の内訳を返す"""
+        # When
+        response = test_client.get("/api/v1/dashboard/stats", headers=auth_headers)
+
+        # Then
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_animals"] == 1
+        assert data["protected_count"] == 1
+        assert data["adoptable_count"] == 0
+        assert data["treatment_count"] == 0
+        assert data["today_logs_count"] == 0
+        assert data["status_counts"] == {"保護中": 1}
+
+    def test_requires_authentication(self, test_client: TestClient):
+        """異常系: 未認証の場合は401"""
+        response = test_client.get("/api/v1/dashboard/stats")
+        assert response.status_code == 401
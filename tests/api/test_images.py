@@ -9,6 +9,7 @@ from __future__ import annotations
 import io
 from datetime import date
 
+import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 from PIL import Image
@@ -310,6 +311,37 @@ class TestProfileImage:
         assert test_animal.photo != "/media/animals/1/old.png"
         assert test_animal.photo == data["image_path"]
 
+    def test_upload_profile_image_not_set_returns_500(
+        self,
+        test_client: TestClient,
+        test_db: Session,
+        test_animal: Animal,
+        auth_headers: dict[str, str],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """異常系: アップロード後にプロフィール画像が設定されていない場合は500"""
+        # Given: プロフィール画像が未設定の猫と、プロフィール画像を設定しないアップロード処理
+        from app.services import image_service
+
+        test_animal.photo = None
+        test_db.commit()
+
+        monkeypatch.setattr(image_service, "upload_image", lambda **kwargs: None)
+        img_bytes = io.BytesIO()
+        Image.new("RGB", (100, 100), color="red").save(img_bytes, format="PNG")
+        img_bytes.seek(0)
+
+        # When
+        response = test_client.post(
+            f"/api/v1/animals/{test_animal.id}/profile-image",
+            headers=auth_headers,
+            files={"file": ("profile.png", img_bytes, "image/png")},
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.json()["detail"] == "プロフィール画像の設定に失敗しました"
+
     def test_set_profile_image_from_gallery_success(
         self,
         test_client: TestClient,
@@ -7,12 +7,16 @@ Requirements: Requirement 2, Requirement 7, Requirement 9
 from __future__ import annotations
 
 from datetime import datetime
+from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.models.animal import Animal
+from app.services import pdf_job_service
+from app.utils import pdf_renderer
 
 
 class TestQRCardEndpoint:
@@ -73,6 +77,35 @@ class TestQRCardEndpoint:
         assert response.status_code == 404
 
 
+class TestPDFRenderBackpressure:
+    """PDF描画プール混雑時のテスト"""
+
+    def test_returns_503_when_render_queue_is_full(
+        self,
+        test_client: TestClient,
+        auth_token: str,
+        test_animal: Animal,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """異常系: 描画待ちが上限に達している場合は503とRetry-Afterを返す"""
+        # Given
+        full_pool = pdf_renderer.PDFRenderPool(
+            max_workers=0, max_pending=0, timeout_seconds=10
+        )
+        monkeypatch.setattr(pdf_renderer, "_render_pool", full_pool)
+
+        # When
+        response = test_client.post(
+            "/api/v1/pdf/qr-card",
+            json={"animal_id": test_animal.id, "base_url": "https://test.example.com"},
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+
+        # Then
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "5"
+
+
 class TestQRCardGridEndpoint:
     """面付けQRカードPDF生成エンドポイントのテスト"""
 
@@ -123,6 +156,65 @@ class TestQRCardGridEndpoint:
         assert "animal_ids" in response.json()["detail"][0]["loc"]
 
 
+class TestPDFJobEndpoints:
+    """PDF生成ジョブエンドポイントのテスト"""
+
+    def test_submit_poll_and_download(
+        self,
+        test_client: TestClient,
+        auth_token: str,
+        test_db: Session,
+        test_animals_bulk: list[Animal],
+        pdf_job_dir: Path,
+    ):
+        """正常系: 投入 → 状態確認 → ダウンロードで10枚超のQRカードを取得できる"""
+        # Given
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        animal_ids = [animal.id for animal in test_animals_bulk]
+
+        # When
+        submit_response = test_client.post(
+            "/api/v1/pdf/jobs",
+            json={"kind": "qr_card_grid", "animal_ids": animal_ids},
+            headers=headers,
+        )
+        job_id = submit_response.json()["id"]
+        pending_response = test_client.get(
+            f"/api/v1/pdf/jobs/{job_id}/download", headers=headers
+        )
+        pdf_job_service.process_next_pdf_job(test_db)
+        status_response = test_client.get(f"/api/v1/pdf/jobs/{job_id}", headers=headers)
+        download_response = test_client.get(
+            f"/api/v1/pdf/jobs/{job_id}/download", headers=headers
+        )
+
+        # Then
+        assert submit_response.status_code == 202
+        assert submit_response.json()["status"] == "queued"
+        assert pending_response.status_code == 409
+        assert status_response.json()["status"] == "completed"
+        assert download_response.status_code == 200
+        assert download_response.headers["content-type"] == "application/pdf"
+        assert download_response.content.startswith(b"%PDF")
+
+    def test_get_nonexistent_job(self, test_client: TestClient, auth_token: str):
+        """異常系: 存在しないジョブは404"""
+        response = test_client.get(
+            "/api/v1/pdf/jobs/unknown",
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        assert response.status_code == 404
+
+    def test_submit_job_unauthorized(
+        self, test_client: TestClient, test_animal: Animal
+    ):
+        """異常系: 認証なしで401エラー"""
+        response = test_client.post(
+            "/api/v1/pdf/jobs", json={"kind": "qr_card", "animal_id": test_animal.id}
+        )
+        assert response.status_code == 401
+
+
 class TestPaperFormEndpoint:
     """紙記録フォームPDF生成エンドポイントのテスト"""
 
@@ -6,14 +6,28 @@ Public APIエンドポイントのテスト
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 from datetime import date
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.api.v1 import public as public_api
 from app.models.animal import Animal
 from app.models.care_log import CareLog
+from app.models.user import User
 from app.models.volunteer import Volunteer
+from app.schemas.animal import AnimalUpdate
+from app.schemas.care_log import CareLogCreate
+from app.schemas.volunteer import VolunteerCreate
+from app.services import animal_service, care_log_service, volunteer_service
+from app.services.care_log_events import CareLogEventBroker
+from app.utils.http_cache import make_weak_etag
+from app.utils.timezone import get_jst_date
+
+QueryCounter = Callable[[], AbstractContextManager[list[str]]]
 
 
 class TestGetAnimalInfo:
@@ -339,6 +353,35 @@ class TestCreateCareLogPublic:
         # Then
         assert response.status_code == 422
 
+    def test_create_care_log_public_idempotency_key_replay(
+        self, test_client: TestClient, test_animal: Animal, test_db: Session
+    ):
+        """正常系: 同じIdempotency-Keyでの再送（オフライン同期の再試行）は重複登録しない"""
+        # Given
+        care_log_data = {
+            "animal_id": test_animal.id,
+            "recorder_name": "テストボランティア",
+            "log_date": "2025-11-15",
+            "time_slot": "morning",
+        }
+        headers = {"Idempotency-Key": "0b6c8f3e-offline-1"}
+        first = test_client.post(
+            "/api/v1/public/care-logs", json=care_log_data, headers=headers
+        )
+
+        # When
+        replayed = test_client.post(
+            "/api/v1/public/care-logs",
+            json={**care_log_data, "appetite": 1},
+            headers=headers,
+        )
+
+        # Then
+        assert first.status_code == replayed.status_code == 201
+        assert replayed.json()["id"] == first.json()["id"]
+        assert replayed.json()["appetite"] == 3
+        assert test_db.query(CareLog).count() == 1
+
 
 class TestGetLatestCareLog:
     """最新世話記録取得エンドポイントのテスト"""
@@ -771,8 +814,6 @@ class TestGetAllAnimalsStatusToday:
         self, test_client: TestClient, test_db: Session, test_animal: Animal
     ):
         """正常系: 全猫の当日記録状況を取得できる"""
-        from datetime import date
-
         # Given
         # test_animalのステータスを譲渡済みに変更（表示されないようにする）
         test_animal.status = "譲渡済み"
@@ -821,10 +862,10 @@ class TestGetAllAnimalsStatusToday:
         test_db.commit()
         test_db.refresh(volunteer)
 
-        today = date.today()
+        today = get_jst_date()
 
         # 猫1の記録（朝・夕）
-        log1_morning = CareLog(
+        log1_morning = CareLogCreate(
             animal_id=animal1.id,
             recorder_id=volunteer.id,
             recorder_name="テストボランティア",
@@ -835,7 +876,7 @@ class TestGetAllAnimalsStatusToday:
             urination=True,
             cleaning=True,
         )
-        log1_evening = CareLog(
+        log1_evening = CareLogCreate(
             animal_id=animal1.id,
             recorder_id=volunteer.id,
             recorder_name="テストボランティア",
@@ -848,7 +889,7 @@ class TestGetAllAnimalsStatusToday:
         )
 
         # 猫2の記録（昼のみ）
-        log2_noon = CareLog(
+        log2_noon = CareLogCreate(
             animal_id=animal2.id,
             recorder_id=volunteer.id,
             recorder_name="テストボランティア",
@@ -860,10 +901,8 @@ class TestGetAllAnimalsStatusToday:
             cleaning=True,
         )
 
-        test_db.add(log1_morning)
-        test_db.add(log1_evening)
-        test_db.add(log2_noon)
-        test_db.commit()
+        for care_log_data in (log1_morning, log1_evening, log2_noon):
+            care_log_service.create_care_log(test_db, care_log_data)
 
         # When
         response = test_client.get("/api/v1/public/care-logs/status/today")
@@ -896,8 +935,6 @@ class TestGetAllAnimalsStatusToday:
         self, test_client: TestClient, test_db: Session, test_animal: Animal
     ):
         """正常系: 記録がない場合は全てFalse"""
-        from datetime import date
-
         # Given
         # test_animalのステータスを譲渡済みに変更（表示されないようにする）
         test_animal.status = "譲渡済み"
@@ -922,7 +959,7 @@ class TestGetAllAnimalsStatusToday:
         # Then
         assert response.status_code == 200
         data = response.json()
-        assert data["target_date"] == date.today().isoformat()
+        assert data["target_date"] == get_jst_date().isoformat()
         assert len(data["animals"]) == 1
 
         animal_status = data["animals"][0]
@@ -935,8 +972,6 @@ class TestGetAllAnimalsStatusToday:
         self, test_client: TestClient, test_db: Session, test_animal: Animal
     ):
         """正常系: 猫がいない場合は空リスト"""
-        from datetime import date
-
         # Given
         # test_animalのステータスを譲渡済みに変更（表示されないようにする）
         test_animal.status = "譲渡済み"
@@ -948,5 +983,165 @@ class TestGetAllAnimalsStatusToday:
         # Then
         assert response.status_code == 200
         data = response.json()
-        assert data["target_date"] == date.today().isoformat()
+        assert data["target_date"] == get_jst_date().isoformat()
         assert len(data["animals"]) == 0
+
+
+class TestConditionalRequests:
+    """Public読み取りAPIの条件付きリクエスト（ETag）のテスト"""
+
+    def test_status_today_not_modified(
+        self,
+        test_client: TestClient,
+        test_animals_bulk: list[Animal],
+        query_counter: QueryCounter,
+    ):
+        """正常系: ETagが一致すればバージョン番号の確認のみで本文なしの304を返す"""
+        # Given
+        url = "/api/v1/public/care-logs/status/today"
+        first = test_client.get(url)
+        etag = first.headers["etag"]
+
+        # When
+        with query_counter() as statements:
+            second = test_client.get(url, headers={"If-None-Match": etag})
+
+        # Then
+        assert first.status_code == 200
+        assert etag.startswith('W/"')
+        assert first.headers["cache-control"] == "public, no-cache"
+        assert len(first.content) > 1000
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert second.content == b""
+        assert all("FROM resource_versions" in s for s in statements)
+
+    def test_status_today_changes_after_care_log(
+        self, test_client: TestClient, test_db: Session, test_animal: Animal
+    ):
+        """正常系: 世話記録を登録するとETagが変わり200で最新の状況を返す"""
+        # Given
+        url = "/api/v1/public/care-logs/status/today"
+        etag = test_client.get(url).headers["etag"]
+        care_log_service.create_care_log(
+            test_db,
+            CareLogCreate(
+                animal_id=test_animal.id,
+                recorder_name="記録者",
+                log_date=get_jst_date(),
+                time_slot="morning",
+            ),
+        )
+
+        # When
+        response = test_client.get(url, headers={"If-None-Match": etag})
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["animals"][0]["morning_recorded"] is True
+
+    def test_animal_care_logs_not_modified(
+        self, test_client: TestClient, test_animal: Animal, query_counter: QueryCounter
+    ):
+        """正常系: 個別猫の記録一覧もETagが一致すれば304を返す"""
+        # Given
+        url = f"/api/v1/public/care-logs/animal/{test_animal.id}"
+        etag = test_client.get(url).headers["etag"]
+
+        # When
+        with query_counter() as statements:
+            response = test_client.get(url, headers={"If-None-Match": etag})
+
+        # Then
+        assert response.status_code == 304
+        assert sum("FROM animals" in s for s in statements) == 1
+        assert not any("FROM care_logs" in s for s in statements)
+
+    @pytest.mark.parametrize(
+        ("url", "etag_parts"),
+        [
+            ("/api/v1/public/animals/99999", ("animal", 99999, 0)),
+            (
+                "/api/v1/public/care-logs/animal/99999",
+                ("animal-care-logs", 99999, 0, 0, date.today()),
+            ),
+        ],
+    )
+    def test_unknown_animal_is_not_found_even_if_etag_matches(
+        self, test_client: TestClient, url: str, etag_parts: tuple[object, ...]
+    ):
+        """異常系: 存在しない猫IDはETagが一致しても304ではなく404を返す"""
+        # Given: 存在しない猫IDのバージョン番号（0）から作ったETag
+        etag = make_weak_etag(*etag_parts)
+
+        # When
+        response = test_client.get(url, headers={"If-None-Match": etag})
+
+        # Then
+        assert response.status_code == 404
+
+    def test_animal_info_changes_after_update(
+        self,
+        test_client: TestClient,
+        test_db: Session,
+        test_animal: Animal,
+        test_user: User,
+    ):
+        """正常系: 猫情報を更新するとETagが変わる"""
+        # Given
+        url = f"/api/v1/public/animals/{test_animal.id}"
+        first = test_client.get(url)
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "public, max-age=60"
+        assert test_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+        # When
+        animal_service.update_animal(
+            test_db, test_animal.id, AnimalUpdate(name="新しい名前"), test_user.id
+        )
+        response = test_client.get(url, headers={"If-None-Match": etag})
+
+        # Then
+        assert response.status_code == 200
+        assert response.json()["name"] == "新しい名前"
+
+    def test_volunteers_changes_after_create(
+        self, test_client: TestClient, test_db: Session
+    ):
+        """正常系: ボランティアを登録するとETagが変わる"""
+        # Given
+        url = "/api/v1/public/volunteers"
+        etag = test_client.get(url).headers["etag"]
+        assert test_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+        # When
+        volunteer_service.create_volunteer(
+            test_db, VolunteerCreate(name="新しいボランティア", status="active")
+        )
+        response = test_client.get(url, headers={"If-None-Match": etag})
+
+        # Then
+        assert response.status_code == 200
+        assert [v["name"] for v in response.json()] == ["新しいボランティア"]
+
+
+class TestCareLogEventsEndpoint:
+    """世話記録イベント（SSE）エンドポイントのテスト"""
+
+    def test_rejects_when_subscriber_limit_reached(
+        self, test_client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """異常系: 同時接続数の上限に達している場合は503"""
+        # Given
+        monkeypatch.setattr(
+            public_api,
+            "care_log_event_broker",
+            CareLogEventBroker(max_subscribers=0, max_queue=1),
+        )
+
+        # When
+        response = test_client.get("/api/v1/public/care-logs/events")
+
+        # Then
+        assert response.status_code == 503
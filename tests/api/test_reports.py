@@ -111,6 +111,9 @@ class TestReportExportEndpoint:
         content = response.content.decode("utf-8-sig")
         assert "Created At" in content
         assert "Animal Name" in content
+        # BOMは先頭に1つだけ（チャンク分割されても重複しない）
+        assert response.content.startswith(b"\xef\xbb\xbf")
+        assert response.content.count(b"\xef\xbb\xbf") == 1
 
     def test_export_weekly_report_excel_japanese(
         self,
@@ -10,7 +10,7 @@ from __future__ import annotations
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from app.models.user import User
+from app.auth.user_cache import UserPrincipal
 
 
 class TestGetCurrentUserOptional:
@@ -44,7 +44,7 @@ class TestGetCurrentUserOptional:
 
         # Then
         assert result is not None
-        assert isinstance(result, User)
+        assert isinstance(result, UserPrincipal)
         assert result.email == "test@example.com"
 
     def test_returns_none_when_unauthenticated(
@@ -14,6 +14,8 @@ from fastapi import HTTPException
 
 from app.auth.permissions import (
     PERMISSIONS,
+    compile_permissions,
+    granted_permissions,
     has_permission,
     require_permission,
     require_role,
@@ -317,6 +319,91 @@ class TestRequirePermission:
         assert exc_info.value.status_code == 403
 
 
+class TestCompiledPermissions:
+    """コンパイル済み権限（ワイルドカード・一括判定）のテスト"""
+
+    def test_namespace_wildcard(self):
+        """正常系: "medical:*" は medical 名前空間の権限をすべて許可する"""
+        # Given
+        compiled = compile_permissions({"vet": ["medical:*", "animal:read"]})["vet"]
+
+        # When/Then
+        assert compiled.allows("medical:delete")
+        assert compiled.allows("medical:record:read")
+        assert compiled.allows("animal:read")
+        assert not compiled.allows("animal:write")
+
+    def test_namespace_wildcard_does_not_match_prefix(self):
+        """異常系: 名前空間は ":" 区切りで判定し、前方一致では許可しない"""
+        # Given
+        compiled = compile_permissions({"role": ["medical:*"]})["role"]
+
+        # When/Then
+        assert not compiled.allows("medicalx:read")
+        assert not compiled.allows("medical")
+
+    def test_nested_namespace_wildcard(self):
+        """正常系: 下位の名前空間のワイルドカードは上位の権限を許可しない"""
+        # Given
+        compiled = compile_permissions({"role": ["medical:record:*"]})["role"]
+
+        # When/Then
+        assert compiled.allows("medical:record:write")
+        assert not compiled.allows("medical:read")
+
+    def test_unknown_role_has_no_permissions(self):
+        """異常系: 未定義のロールは権限を持たない"""
+        # Given
+        user = User(
+            email="ghost@example.com",
+            password_hash="hash",
+            name="Ghost",
+            role="ghost",
+            is_active=True,
+        )
+
+        # When/Then
+        assert not has_permission(user, "animal:read")
+        assert granted_permissions(user, ["animal:read"]) == frozenset()
+
+    def test_granted_permissions_by_role(self):
+        """正常系: 指定した権限のうちロールが持つものだけを返す"""
+        # Given
+        requested = ["medical:delete", "csv:export", "animal:read", "user:manage"]
+        users = {
+            role: User(
+                email=f"{role}@example.com",
+                password_hash="hash",
+                name=role,
+                role=role,
+                is_active=True,
+            )
+            for role in ("admin", "vet", "staff", "read_only")
+        }
+
+        # When
+        granted = {
+            role: granted_permissions(user, requested) for role, user in users.items()
+        }
+
+        # Then
+        assert granted["admin"] == frozenset(requested)
+        assert granted["vet"] == {"medical:delete", "animal:read"}
+        assert granted["staff"] == {"csv:export", "animal:read"}
+        assert granted["read_only"] == {"animal:read"}
+
+    def test_granted_permissions_without_user(self):
+        """異常系: 未認証（None）の場合は空集合を返す"""
+        assert granted_permissions(None, ["animal:read"]) == frozenset()
+
+    def test_require_permission_returns_shared_dependency(self):
+        """性能: 同じ権限には同じ依存性関数を返す"""
+        assert require_permission("animal:write") is require_permission("animal:write")
+        assert require_permission("animal:write") is not require_permission(
+            "animal:read"
+        )
+
+
 class TestPermissionsMatrixCompleteness:
     """権限マトリクスの完全性テスト（設定ミス検出）"""
 
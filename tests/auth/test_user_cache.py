@@ -0,0 +1,190 @@
+"""
+認証済みユーザーのキャッシュのテスト
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.auth import user_cache
+from app.auth.password import hash_password
+from app.models.user import User
+from app.schemas.user import UserUpdate
+from app.services import user_service
+
+
+def _user_queries(statements: list[str]) -> list[str]:
+    return [s for s in statements if "FROM users" in s]
+
+
+class TestAuthenticatedRequests:
+    """認証依存性でのキャッシュ利用のテスト"""
+
+    def test_repeated_requests_skip_user_lookup(
+        self,
+        test_client: TestClient,
+        auth_headers: dict[str, str],
+        query_counter: Callable[[], AbstractContextManager[list[str]]],
+    ):
+        """性能: 2回目以降のリクエストではユーザーを取得するSQLを発行しない"""
+        # Given
+        test_client.get("/api/v1/auth/me", headers=auth_headers)
+
+        # When
+        with query_counter() as statements:
+            for _ in range(5):
+                response = test_client.get("/api/v1/auth/me", headers=auth_headers)
+
+        # Then
+        assert response.status_code == 200
+        assert response.json()["email"] == "test@example.com"
+        assert _user_queries(statements) == []
+        stats = user_cache.get_user_cache_stats()
+        assert (stats["hits"], stats["misses"]) == (5, 1)
+        assert stats["hit_rate"] == pytest.approx(5 / 6)
+
+    def test_role_change_is_applied_immediately(
+        self,
+        test_client: TestClient,
+        auth_headers: dict[str, str],
+        test_db: Session,
+        test_user: User,
+    ):
+        """正常系: user_service でロールを変更すると次のリクエストから反映される"""
+        # Given
+        assert (
+            test_client.get("/api/v1/auth/me", headers=auth_headers).json()["role"]
+            == "staff"
+        )
+
+        # When
+        user_service.update_user(test_db, test_user.id, UserUpdate(role="read_only"))
+
+        # Then
+        response = test_client.get("/api/v1/auth/me", headers=auth_headers)
+        assert response.json()["role"] == "read_only"
+
+    def test_deactivated_user_is_rejected(
+        self,
+        test_client: TestClient,
+        auth_headers: dict[str, str],
+        test_db: Session,
+        test_user: User,
+    ):
+        """異常系: 無効化したユーザーはキャッシュ済みでも拒否される"""
+        # Given
+        test_client.get("/api/v1/auth/me", headers=auth_headers)
+
+        # When
+        user_service.update_user(test_db, test_user.id, UserUpdate(is_active=False))
+
+        # Then
+        response = test_client.get("/api/v1/auth/me", headers=auth_headers)
+        assert response.status_code == 400
+
+    def test_failed_login_reloads_cached_user(
+        self, test_client: TestClient, auth_headers: dict[str, str]
+    ):
+        """正常系: ログイン失敗（ロック状態の更新）でキャッシュを破棄し、取得し直す"""
+        # Given
+        test_client.get("/api/v1/auth/me", headers=auth_headers)
+
+        # When
+        test_client.post(
+            "/api/v1/auth/token",
+            data={"username": "test@example.com", "password": "WrongPassword1"},
+        )
+        test_client.get("/api/v1/auth/me", headers=auth_headers)
+
+        # Then
+        stats = user_cache.get_user_cache_stats()
+        assert (stats["hits"], stats["misses"]) == (0, 2)
+
+    def test_logout_drops_cached_user(
+        self, test_client: TestClient, auth_headers: dict[str, str]
+    ):
+        """正常系: ログアウトでキャッシュを破棄する"""
+        # Given
+        test_client.get("/api/v1/auth/me", headers=auth_headers)
+        assert user_cache.get_user_cache_stats()["entries"] == 1
+
+        # When
+        test_client.post("/api/v1/auth/logout", headers=auth_headers)
+
+        # Then
+        assert user_cache.get_user_cache_stats()["entries"] == 0
+
+
+class TestUserPrincipalCache:
+    """キャッシュ本体のテスト"""
+
+    def _create_users(self, db: Session, count: int) -> list[User]:
+        users = [
+            User(
+                email=f"user{i}@example.com",
+                password_hash=hash_password("Password123"),
+                name=f"ユーザー{i}",
+                role="staff",
+            )
+            for i in range(count)
+        ]
+        db.add_all(users)
+        db.commit()
+        return users
+
+    def test_bounded_entries(self, test_db: Session, monkeypatch: pytest.MonkeyPatch):
+        """正常系: キャッシュの件数は上限を超えない（古いものから破棄）"""
+        # Given
+        monkeypatch.setattr(user_cache, "USER_CACHE_MAX_ENTRIES", 2)
+        users = self._create_users(test_db, 3)
+
+        # When
+        for user in users:
+            user_cache.get_user_principal(test_db, user.id)
+
+        # Then
+        cached_ids = {user_id for user_id, _ in user_cache._cache}
+        assert cached_ids == {users[1].id, users[2].id}
+
+    def test_expired_entries_are_reloaded(
+        self, test_db: Session, monkeypatch: pytest.MonkeyPatch
+    ):
+        """正常系: 有効期間を過ぎたエントリはデータベースから取得し直す"""
+        # Given
+        (user,) = self._create_users(test_db, 1)
+        now = 1000.0
+        monkeypatch.setattr(user_cache.time, "monotonic", lambda: now)
+        user_cache.get_user_principal(test_db, user.id)
+
+        # When
+        now += user_cache.settings.user_cache_ttl_seconds + 1
+        user_cache.get_user_principal(test_db, user.id)
+
+        # Then
+        assert user_cache.get_user_cache_stats()["misses"] == 2
+
+    def test_disabled_when_ttl_is_zero(
+        self, test_db: Session, monkeypatch: pytest.MonkeyPatch
+    ):
+        """正常系: 有効期間が0ならキャッシュしない"""
+        # Given
+        monkeypatch.setattr(user_cache.settings, "user_cache_ttl_seconds", 0)
+        (user,) = self._create_users(test_db, 1)
+
+        # When
+        principal = user_cache.get_user_principal(test_db, user.id)
+
+        # Then
+        assert principal is not None
+        assert principal.name == "ユーザー0"
+        assert user_cache.get_user_cache_stats()["entries"] == 0
+
+    def test_unknown_user_is_not_cached(self, test_db: Session):
+        """異常系: 存在しないユーザーはNoneを返し、キャッシュしない"""
+        assert user_cache.get_user_principal(test_db, 9999) is None
+        assert user_cache.get_user_cache_stats()["entries"] == 0
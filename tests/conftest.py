@@ -8,33 +8,46 @@ from __future__ import annotations
 
 import os
 import warnings
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 # テスト用のSECRET_KEYを設定（warningを抑制）
 os.environ.setdefault("SECRET_KEY", "test-secret-key-for-testing-only")
 
+# PDFはワーカープロセスを起動せずスレッドで描画する
+os.environ.setdefault("PDF_RENDER_WORKERS", "0")
+
+# 派生画像はワーカーを使わずアップロード処理内で生成する
+os.environ.setdefault("IMAGE_VARIANT_WORKERS", "0")
+
 # テスト環境でのSECRET_KEY warningを抑制
 warnings.filterwarnings("ignore", message="デフォルトのSECRET_KEYが使用されています")
 
 # ruff: noqa: E402
 from app.auth.password import hash_password
-from app.database import Base, get_db
+from app.database import Base, get_db, get_read_db
 from app.main import app
 from app.models.adoption_record import AdoptionRecord
 from app.models.animal import Animal
 from app.models.animal_image import AnimalImage
 from app.models.applicant import Applicant
 from app.models.care_log import CareLog
+from app.models.daily_care_status import DailyCareStatus
+from app.models.pdf_job import PDFJob
+from app.models.resource_version import ResourceVersion
 from app.models.setting import Setting
 from app.models.status_history import StatusHistory
 from app.models.user import User
 from app.models.volunteer import Volunteer
+from app.utils import pdf_cache
+from app.utils.pdf_cache import PDFRenderCache
 
 # テスト用のインメモリデータベース（StaticPoolで接続を共有）
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -57,6 +70,95 @@ def override_get_db() -> Generator[Session, None, None]:
 
 # 依存性をオーバーライド
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_read_db] = override_get_db
+
+
+@contextmanager
+def _count_queries() -> Iterator[list[str]]:
+    """ブロック内で発行されたSQL文を記録する"""
+    statements: list[str] = []
+
+    def _before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.fixture(scope="function")
+def query_counter() -> Callable[[], AbstractContextManager[list[str]]]:
+    """発行SQL数を計測するコンテキストマネージャーを提供"""
+    return _count_queries
+
+
+@pytest.fixture(scope="function", autouse=True)
+def isolated_pdf_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> PDFRenderCache:
+    """PDFキャッシュをテストごとの一時ディレクトリに隔離"""
+    cache = PDFRenderCache(cache_dir=tmp_path / "pdf_cache", max_bytes=50 * 1024 * 1024)
+    monkeypatch.setattr(pdf_cache, "_pdf_cache", cache)
+    return cache
+
+
+@pytest.fixture(scope="function", autouse=True)
+def isolated_media_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """アップロード画像と派生画像の保存先をテストごとの一時ディレクトリに隔離"""
+    from app.config import get_settings
+    from app.utils import image as image_utils
+
+    media_dir = tmp_path / "media"
+    media_dir.mkdir()
+    monkeypatch.setattr(image_utils, "MEDIA_BASE_DIR", media_dir)
+    monkeypatch.setattr(image_utils, "UPLOAD_STAGING_DIR", tmp_path / "uploads")
+    monkeypatch.setattr(get_settings(), "media_dir", str(media_dir))
+    monkeypatch.setattr(get_settings(), "upload_staging_dir", str(tmp_path / "uploads"))
+    return media_dir
+
+
+@pytest.fixture(scope="function", autouse=True)
+def isolated_dashboard_stats() -> Iterator[None]:
+    """ダッシュボード統計のキャッシュをテストごとに破棄"""
+    from app.services import dashboard_service
+
+    dashboard_service.invalidate_dashboard_stats()
+    yield
+    dashboard_service.invalidate_dashboard_stats()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def isolated_list_totals() -> Iterator[None]:
+    """一覧の総件数のキャッシュをテストごとに破棄"""
+    from app.utils import pagination
+
+    pagination.clear_total_cache()
+    yield
+    pagination.clear_total_cache()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def isolated_user_cache() -> Iterator[None]:
+    """認証済みユーザーのキャッシュをテストごとに破棄（テストごとにDBを作り直すため）"""
+    from app.auth import user_cache
+
+    user_cache.clear_user_cache()
+    yield
+    user_cache.clear_user_cache()
+
+
+@pytest.fixture(scope="function")
+def pdf_job_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """PDF生成ジョブの出力先をテストごとの一時ディレクトリに隔離"""
+    from app.services import pdf_job_service
+
+    job_dir = tmp_path / "pdf_jobs"
+    monkeypatch.setattr(pdf_job_service.settings, "pdf_job_dir", str(job_dir))
+    return job_dir
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -88,12 +190,15 @@ def test_db() -> Generator[Session, None, None]:
         db.query(Applicant).delete()
         db.query(AnimalImage).delete()
         db.query(CareLog).delete()
+        db.query(DailyCareStatus).delete()
         db.query(MedicalRecord).delete()  # 診療記録を追加
         db.query(MedicalAction).delete()  # 診療行為を追加
         db.query(StatusHistory).delete()
         db.query(Animal).delete()
         db.query(Setting).delete()
         db.query(Volunteer).delete()
+        db.query(PDFJob).delete()
+        db.query(ResourceVersion).delete()
         db.query(User).delete()
         db.commit()
     except Exception:
@@ -136,12 +241,15 @@ def test_db() -> Generator[Session, None, None]:
         db.query(Applicant).delete()
         db.query(AnimalImage).delete()
         db.query(CareLog).delete()
+        db.query(DailyCareStatus).delete()
         db.query(MedicalRecord).delete()  # 診療記録を追加
         db.query(MedicalAction).delete()  # 診療行為を追加
         db.query(StatusHistory).delete()
         db.query(Animal).delete()
         db.query(Setting).delete()
         db.query(Volunteer).delete()
+        db.query(PDFJob).delete()
+        db.query(ResourceVersion).delete()
         db.query(User).delete()
         db.commit()
     except Exception:
@@ -324,24 +432,10 @@ def test_care_logs(test_db: Session, test_animal: Animal) -> list[CareLog]:
 
 
 @pytest.fixture(scope="function")
-def temp_media_dir(tmp_path, monkeypatch):
-    """テスト用の一時メディアディレクトリを作成"""
-    # 一時ディレクトリを作成
-    media_dir = tmp_path / "media"
-    media_dir.mkdir()
-
-    # 環境変数をモンキーパッチ
-    monkeypatch.setenv("MEDIA_DIR", str(media_dir))
-
-    # app.configのmedia_dirもオーバーライド
-    from app.config import get_settings
-
-    settings = get_settings()
-    monkeypatch.setattr(settings, "media_dir", str(media_dir))
-
-    yield media_dir
-
-    # クリーンアップは自動的に行われる（tmp_pathが削除される）
+def temp_media_dir(isolated_media_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """テスト用の一時メディアディレクトリ（isolated_media_dir と同じ）"""
+    monkeypatch.setenv("MEDIA_DIR", str(isolated_media_dir))
+    return isolated_media_dir
 
 
 @pytest.fixture(scope="function")
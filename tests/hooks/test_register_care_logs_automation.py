@@ -18,12 +18,14 @@ import pytest
 
 from scripts.hooks.register_care_logs import (
     AuthenticationError,
+    BatchValidationError,
     RegistrationError,
     RegistrationSummary,
     get_api_config,
     load_json_file,
     register_care_log,
     register_care_logs_batch,
+    register_care_logs_chunk,
     verify_api_key,
 )
 
@@ -247,24 +249,81 @@ class TestRegisterCareLog:
         assert "Network error" in str(exc_info.value)
 
 
+class TestRegisterCareLogsChunk:
+    """Test chunk registration via the batch endpoint"""
+
+    @patch("scripts.hooks.register_care_logs.requests.post")
+    def test_register_chunk_success(self, mock_post):
+        """Test that a chunk is sent to the batch endpoint in one request"""
+        # Given
+        care_logs = [
+            {"animal_id": 1, "log_date": "2025-11-24", "time_slot": "morning"},
+            {"animal_id": 2, "log_date": "2025-11-24", "time_slot": "noon"},
+        ]
+        results = [
+            {"index": 0, "status": "created", "id": 10, "animal_id": 1},
+            {"index": 1, "status": "created", "id": 11, "animal_id": 2},
+        ]
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "created": 2,
+            "failed": 0,
+            "results": results,
+        }
+        mock_post.return_value = mock_response
+
+        # When
+        result = register_care_logs_chunk("http://localhost:8000", "key", care_logs)
+
+        # Then
+        assert result == results
+        call_args = mock_post.call_args
+        assert call_args[0][0] == "http://localhost:8000/api/automation/care-logs/batch"
+        assert call_args[1]["json"] == {"items": care_logs}
+        assert call_args[1]["headers"]["X-Automation-Key"] == "key"
+
+    @patch("scripts.hooks.register_care_logs.requests.post")
+    def test_register_chunk_422_raises_batch_validation_error(self, mock_post):
+        """Test that a schema-rejected chunk raises BatchValidationError"""
+        # Given
+        mock_response = Mock()
+        mock_response.status_code = 422
+        mock_response.json.return_value = {"detail": [{"msg": "invalid time_slot"}]}
+        mock_post.return_value = mock_response
+
+        # When/Then
+        with pytest.raises(BatchValidationError):
+            register_care_logs_chunk("http://localhost:8000", "key", [{}])
+
+
+def _created(index: int, animal_id: int) -> dict:
+    return {
+        "index": index,
+        "status": "created",
+        "id": 100 + index,
+        "animal_id": animal_id,
+    }
+
+
 class TestRegisterCareLogsBatch:
     """Test batch registration via Automation API"""
 
-    @patch("scripts.hooks.register_care_logs.register_care_log")
+    @patch("scripts.hooks.register_care_logs.register_care_logs_chunk")
     @patch("scripts.hooks.register_care_logs.verify_api_key")
-    def test_batch_registration_all_success(self, mock_verify, mock_register, caplog):
+    def test_batch_registration_all_success(self, mock_verify, mock_chunk, caplog):
         """Test successful batch registration"""
         # Given
         care_logs = [
             {"animal_id": 1, "log_date": "2025-11-24", "time_slot": "morning"},
-            {"animal_id": 2, "log_date": "2025-11-24", "time_slot": "afternoon"},
+            {"animal_id": 2, "log_date": "2025-11-24", "time_slot": "noon"},
         ]
         api_base_url = "http://localhost:8000"
         api_key = "test-key"
 
-        mock_register.side_effect = [
-            {"id": 1, "animal_id": 1},
-            {"id": 2, "animal_id": 2},
+        mock_chunk.return_value = [
+            _created(0, 1),
+            {"index": 1, "status": "unchanged", "id": 7, "animal_id": 2},
         ]
 
         # When
@@ -276,27 +335,56 @@ class TestRegisterCareLogsBatch:
         assert result["summary"]["successful"] == 2
         assert result["summary"]["failed"] == 0
         assert len(result["errors"]) == 0
+        mock_chunk.assert_called_once()
 
         # Verify API Key was used
         assert "Using Automation API with API Key authentication" in caplog.text
 
-    @patch("scripts.hooks.register_care_logs.register_care_log")
+    @patch("scripts.hooks.register_care_logs.register_care_logs_chunk")
+    @patch("scripts.hooks.register_care_logs.verify_api_key")
+    def test_batch_registration_sends_chunks(self, mock_verify, mock_chunk):
+        """Test that records are split into chunks of chunk_size"""
+        # Given
+        care_logs = [
+            {"animal_id": i, "log_date": "2025-11-24", "time_slot": "morning"}
+            for i in range(5)
+        ]
+        mock_chunk.side_effect = lambda base_url, api_key, chunk: [
+            _created(i, record["animal_id"]) for i, record in enumerate(chunk)
+        ]
+
+        # When
+        result = register_care_logs_batch(
+            care_logs, "http://localhost:8000", "test-key", chunk_size=2
+        )
+
+        # Then
+        assert result["summary"]["successful"] == 5
+        assert [len(call.args[2]) for call in mock_chunk.call_args_list] == [2, 2, 1]
+
+    @patch("scripts.hooks.register_care_logs.register_care_logs_chunk")
     @patch("scripts.hooks.register_care_logs.verify_api_key")
-    def test_batch_registration_partial_success(self, mock_verify, mock_register):
+    def test_batch_registration_partial_success(self, mock_verify, mock_chunk):
         """Test batch registration with some failures"""
         # Given
         care_logs = [
             {"animal_id": 1, "log_date": "2025-11-24", "time_slot": "morning"},
-            {"animal_id": 999, "log_date": "2025-11-24", "time_slot": "afternoon"},
+            {"animal_id": 999, "log_date": "2025-11-24", "time_slot": "noon"},
             {"animal_id": 3, "log_date": "2025-11-24", "time_slot": "evening"},
         ]
         api_base_url = "http://localhost:8000"
         api_key = "test-key"
 
-        mock_register.side_effect = [
-            {"id": 1, "animal_id": 1},
-            RegistrationError("Animal not found"),
-            {"id": 3, "animal_id": 3},
+        mock_chunk.return_value = [
+            _created(0, 1),
+            {
+                "index": 1,
+                "status": "error",
+                "id": None,
+                "animal_id": 999,
+                "detail": "ID 999 の猫が見つかりません",
+            },
+            _created(2, 3),
         ]
 
         # When
@@ -309,30 +397,61 @@ class TestRegisterCareLogsBatch:
         assert result["summary"]["failed"] == 1
         assert len(result["errors"]) == 1
         assert result["errors"][0]["animal_id"] == 999
+        assert "999" in result["errors"][0]["error_message"]
 
     @patch("scripts.hooks.register_care_logs.register_care_log")
+    @patch("scripts.hooks.register_care_logs.register_care_logs_chunk")
+    @patch("scripts.hooks.register_care_logs.verify_api_key")
+    def test_batch_validation_error_falls_back_to_single_records(
+        self, mock_verify, mock_chunk, mock_register
+    ):
+        """Test that a rejected chunk is retried record by record"""
+        # Given
+        care_logs = [
+            {"animal_id": 1, "log_date": "2025-11-24", "time_slot": "morning"},
+            {"animal_id": 2, "log_date": "2025-11-24", "time_slot": "afternoon"},
+        ]
+        mock_chunk.side_effect = BatchValidationError("Batch rejected")
+        mock_register.side_effect = [
+            {"id": 1, "animal_id": 1},
+            RegistrationError("Registration failed (status 422): invalid time_slot"),
+        ]
+
+        # When
+        result = register_care_logs_batch(care_logs, "http://localhost:8000", "key")
+
+        # Then
+        assert result["status"] == "partial_success"
+        assert result["summary"]["successful"] == 1
+        assert result["summary"]["failed"] == 1
+        assert result["errors"][0]["record_index"] == 1
+        assert result["errors"][0]["time_slot"] == "afternoon"
+
+    @patch("scripts.hooks.register_care_logs.register_care_logs_chunk")
     @patch("scripts.hooks.register_care_logs.verify_api_key")
     def test_batch_registration_authentication_failure_stops_processing(
-        self, mock_verify, mock_register, caplog
+        self, mock_verify, mock_chunk, caplog
     ):
         """Test that authentication failure stops processing remaining records"""
         # Given
         care_logs = [
             {"animal_id": 1, "log_date": "2025-11-24", "time_slot": "morning"},
-            {"animal_id": 2, "log_date": "2025-11-24", "time_slot": "afternoon"},
+            {"animal_id": 2, "log_date": "2025-11-24", "time_slot": "noon"},
             {"animal_id": 3, "log_date": "2025-11-24", "time_slot": "evening"},
         ]
         api_base_url = "http://localhost:8000"
         api_key = "invalid-key"
 
-        # First record succeeds, second fails with auth error
-        mock_register.side_effect = [
-            {"id": 1, "animal_id": 1},
+        # First chunk succeeds, second fails with auth error
+        mock_chunk.side_effect = [
+            [_created(0, 1)],
             AuthenticationError("Invalid API Key"),
         ]
 
         # When
-        result = register_care_logs_batch(care_logs, api_base_url, api_key)
+        result = register_care_logs_batch(
+            care_logs, api_base_url, api_key, chunk_size=1
+        )
 
         # Then
         # Status is partial_success because at least one record succeeded
@@ -351,11 +470,36 @@ class TestRegisterCareLogsBatch:
             "Skipped due to authentication failure"
             in result["errors"][1]["error_message"]
         )
+        assert mock_chunk.call_count == 2
 
         # Verify error message in logs
         assert "Authentication failed" in caplog.text
         assert "AUTOMATION_API_KEY" in caplog.text
 
+    @patch("scripts.hooks.register_care_logs.register_care_logs_chunk")
+    @patch("scripts.hooks.register_care_logs.verify_api_key")
+    def test_batch_registration_chunk_error_continues(self, mock_verify, mock_chunk):
+        """Test that a failed chunk is recorded and later chunks still run"""
+        # Given
+        care_logs = [
+            {"animal_id": 1, "log_date": "2025-11-24", "time_slot": "morning"},
+            {"animal_id": 2, "log_date": "2025-11-24", "time_slot": "noon"},
+        ]
+        mock_chunk.side_effect = [
+            RegistrationError("Network error during registration"),
+            [_created(0, 2)],
+        ]
+
+        # When
+        result = register_care_logs_batch(
+            care_logs, "http://localhost:8000", "key", chunk_size=1
+        )
+
+        # Then
+        assert result["summary"]["successful"] == 1
+        assert result["summary"]["failed"] == 1
+        assert result["errors"][0]["record_index"] == 0
+
     @patch("scripts.hooks.register_care_logs.verify_api_key")
     def test_batch_registration_verification_failure(self, mock_verify, caplog):
         """Test that verification failure marks all records as failed"""
@@ -188,20 +188,96 @@ class TestNecoKeeperAPIClient:
 
     @pytest.mark.asyncio
     async def test_generate_qr_pdf_success(self, mock_config: MCPConfig) -> None:
-        """Test successful QR PDF generation via API."""
+        """Test QR PDF generation via the job API (submit, poll, download)."""
         pdf_content = b"%PDF-1.4\nfake pdf content"
-        mock_request = httpx.Request(
-            "POST", "http://localhost:8000/api/automation/pdf/qr-card-grid"
+        jobs_url = "http://localhost:8000/api/automation/pdf/jobs"
+        submit_response = httpx.Response(
+            202,
+            json={"id": "abc", "status": "queued"},
+            request=httpx.Request("POST", jobs_url),
+        )
+        running_response = httpx.Response(
+            200,
+            json={"id": "abc", "status": "running"},
+            request=httpx.Request("GET", f"{jobs_url}/abc"),
+        )
+        completed_response = httpx.Response(
+            200,
+            json={"id": "abc", "status": "completed"},
+            request=httpx.Request("GET", f"{jobs_url}/abc"),
+        )
+        download_response = httpx.Response(
+            200,
+            content=pdf_content,
+            request=httpx.Request("GET", f"{jobs_url}/abc/download"),
         )
-        mock_response = httpx.Response(200, content=pdf_content, request=mock_request)
 
         async with NecoKeeperAPIClient(mock_config) as client:
-            with patch.object(
-                client.client, "post", new=AsyncMock(return_value=mock_response)
+            mock_post = AsyncMock(return_value=submit_response)
+            mock_get = AsyncMock(
+                side_effect=[running_response, completed_response, download_response]
+            )
+            with (
+                patch.object(client.client, "post", new=mock_post),
+                patch.object(client.client, "get", new=mock_get),
             ):
-                result = await client.generate_qr_pdf([42])
+                result = await client.generate_qr_pdf(
+                    list(range(1, 26)), poll_interval=0
+                )
 
         assert result == pdf_content
+        assert mock_post.call_args.kwargs["json"] == {
+            "kind": "qr_card_grid",
+            "animal_ids": list(range(1, 26)),
+        }
+        assert mock_get.call_args.args[0] == "/api/automation/pdf/jobs/abc/download"
+
+    @pytest.mark.asyncio
+    async def test_generate_qr_pdf_job_failed(self, mock_config: MCPConfig) -> None:
+        """Test that a failed PDF job raises RuntimeError."""
+        jobs_url = "http://localhost:8000/api/automation/pdf/jobs"
+        submit_response = httpx.Response(
+            202,
+            json={"id": "abc", "status": "queued"},
+            request=httpx.Request("POST", jobs_url),
+        )
+        failed_response = httpx.Response(
+            200,
+            json={"id": "abc", "status": "failed", "error": "render error"},
+            request=httpx.Request("GET", f"{jobs_url}/abc"),
+        )
+
+        async with NecoKeeperAPIClient(mock_config) as client:
+            with (
+                patch.object(
+                    client.client, "post", new=AsyncMock(return_value=submit_response)
+                ),
+                patch.object(
+                    client.client, "get", new=AsyncMock(return_value=failed_response)
+                ),
+            ):
+                with pytest.raises(RuntimeError, match="render error"):
+                    await client.generate_qr_pdf([42], poll_interval=0)
+
+    @pytest.mark.asyncio
+    async def test_generate_qr_pdf_job_wait_timeout(
+        self, mock_config: MCPConfig
+    ) -> None:
+        """Test that polling gives up after max_wait."""
+        submit_response = httpx.Response(
+            202,
+            json={"id": "abc", "status": "queued"},
+            request=httpx.Request(
+                "POST", "http://localhost:8000/api/automation/pdf/jobs"
+            ),
+        )
+
+        async with NecoKeeperAPIClient(mock_config) as client:
+            with patch.object(
+                client.client, "post", new=AsyncMock(return_value=submit_response)
+            ):
+                with pytest.raises(TimeoutError, match="did not finish"):
+                    await client.generate_qr_pdf([42], poll_interval=0, max_wait=0)
 
     @pytest.mark.asyncio
     async def test_generate_qr_pdf_authentication_error(
@@ -209,7 +285,7 @@ class TestNecoKeeperAPIClient:
     ) -> None:
         """Test that QR PDF generation handles authentication errors."""
         mock_request = httpx.Request(
-            "POST", "http://localhost:8000/api/automation/pdf/qr-card-grid"
+            "POST", "http://localhost:8000/api/automation/pdf/jobs"
         )
         mock_response = httpx.Response(
             401, json={"detail": "Invalid API key"}, request=mock_request
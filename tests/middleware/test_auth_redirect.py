@@ -16,18 +16,68 @@ Context7参照: /fastapi/fastapi
    - 他のステータスコードの処理
 3. エッジケースのテスト
    - 各種パスパターン
+4. ストリーミングのテスト
+   - ボディをバッファリングせずにそのまま送信する
 """
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+
 import pytest
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.testclient import TestClient
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.middleware.auth_redirect import AuthRedirectMiddleware
 
 
+async def _call_asgi(app: ASGIApp, path: str) -> list[Message]:
+    """ASGIアプリを直接呼び出し、サーバーへ送信されたメッセージを返す"""
+    sent: list[Message] = []
+    disconnected = asyncio.Event()
+    request_sent = False
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    scope: Scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    await app(scope, receive, send)
+    disconnected.set()
+    return sent
+
+
+def _body_chunks(messages: list[Message]) -> list[bytes]:
+    return [
+        message["body"]
+        for message in messages
+        if message["type"] == "http.response.body" and message.get("body")
+    ]
+
+
 @pytest.fixture
 def test_app() -> FastAPI:
     """
@@ -280,3 +330,123 @@ class TestAuthRedirectMiddlewareIntegration:
         # Then: JSONエラーが返される
         assert response2.status_code == 401
         assert "application/json" in response2.headers["content-type"]
+
+
+class TestAuthRedirectMiddlewareStreaming:
+    """
+    ストリーミングレスポンスのテスト
+
+    PDF・CSV・Excel等の大きなレスポンスを、ミドルウェアがバッファリングせずに
+    そのまま送信することを確認します。
+    """
+
+    @pytest.mark.asyncio
+    async def test_streaming_chunks_are_sent_before_next_chunk(self) -> None:
+        """
+        性能: ストリーミングのチャンクは次のチャンクの生成前にサーバーへ送信される
+
+        確認事項:
+        - ミドルウェアがボディを溜め込まない（先読みしない）
+        """
+        # Given: 生成時点で送信済みのチャンク数を記録するストリーミングエンドポイント
+        app = FastAPI()
+        app.add_middleware(AuthRedirectMiddleware)
+        sent_before_next: list[int] = []
+        messages: list[Message] = []
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for i in range(3):
+                yield f"chunk{i}".encode()
+                sent_before_next.append(len(_body_chunks(messages)))
+
+        @app.get("/api/v1/export")
+        async def export() -> StreamingResponse:
+            return StreamingResponse(chunks(), media_type="text/csv")
+
+        async def recording_app(scope: Scope, receive: Receive, send: Send) -> None:
+            async def recording_send(message: Message) -> None:
+                messages.append(message)
+                await send(message)
+
+            await app(scope, receive, recording_send)
+
+        # When
+        await _call_asgi(recording_app, "/api/v1/export")
+
+        # Then: 各チャンクは次のチャンクを生成する前に送信済み
+        assert sent_before_next == [1, 2, 3]
+        assert _body_chunks(messages) == [b"chunk0", b"chunk1", b"chunk2"]
+
+    @pytest.mark.asyncio
+    async def test_messages_are_passed_through_untouched(self) -> None:
+        """
+        正常系: 401以外のレスポンスは受け取ったメッセージをそのまま送信する
+
+        確認事項:
+        - 開始・ボディのメッセージを作り直さない
+        """
+        # Given: 固定のメッセージを送信するASGIアプリ
+        original: list[Message] = [
+            {"type": "http.response.start", "status": 200, "headers": []},
+            {"type": "http.response.body", "body": b"a", "more_body": True},
+            {"type": "http.response.body", "body": b"b", "more_body": False},
+        ]
+
+        async def raw_app(scope: Scope, receive: Receive, send: Send) -> None:
+            for message in original:
+                await send(message)
+
+        # When
+        sent = await _call_asgi(AuthRedirectMiddleware(raw_app), "/api/v1/export")
+
+        # Then: 同じオブジェクトがそのまま送信される
+        assert len(sent) == len(original)
+        assert all(s is o for s, o in zip(sent, original, strict=True))
+
+    @pytest.mark.asyncio
+    async def test_unhandled_paths_do_not_wrap_send(self) -> None:
+        """
+        性能: 差し替え対象外のパス（静的ファイル等）ではsendを包まない
+        """
+        # Given: 受け取ったsendを記録するASGIアプリ
+        received_sends: list[Send] = []
+
+        async def raw_app(scope: Scope, receive: Receive, send: Send) -> None:
+            received_sends.append(send)
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = AuthRedirectMiddleware(raw_app)
+
+        # When
+        await _call_asgi(middleware, "/static/css/app.css")
+        await _call_asgi(middleware, "/api/v1/animals")
+
+        # Then: 静的ファイルはサーバーのsendをそのまま受け取る
+        assert received_sends[0].__qualname__ == "_call_asgi.<locals>.send"
+        assert received_sends[1].__qualname__ != "_call_asgi.<locals>.send"
+
+    @pytest.mark.asyncio
+    async def test_streaming_401_body_is_replaced(self) -> None:
+        """
+        正常系: ストリーミングの401レスポンスは元のボディを送信せずに差し替える
+        """
+        # Given: 401を返すストリーミングエンドポイント
+        app = FastAPI()
+        app.add_middleware(AuthRedirectMiddleware)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield b"secret"
+
+        @app.get("/admin/reports")
+        async def reports() -> StreamingResponse:
+            return StreamingResponse(chunks(), status_code=401)
+
+        # When
+        sent = await _call_asgi(app, "/admin/reports")
+
+        # Then: リダイレクトのみが送信される
+        assert sent[0]["type"] == "http.response.start"
+        assert sent[0]["status"] == 302
+        assert (b"location", b"/admin/login") in sent[0]["headers"]
+        assert b"secret" not in b"".join(_body_chunks(sent))
@@ -0,0 +1,303 @@
+"""
+世話記録の実行計画の回帰テスト
+
+件数の多い care_logs テーブルに対して、主要な参照処理が発行するSQLの
+実行計画（EXPLAIN QUERY PLAN）を確認し、テーブル全体の走査（SCAN care_logs）
+が含まれる場合は失敗させます。インデックスの追加・削除やクエリの変更で
+全件走査に戻ったことを検知するためのテストです。
+
+既定では少ない件数で実行します（ANALYZE後の実行計画は件数によらず同じ）。
+本番規模で確認する場合は件数を指定して実行してください。
+
+    NECOKEEPER_QUERY_PLAN_ROWS=1000000 pytest tests/models/test_care_log_query_plans.py
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, create_engine, event, insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.database import Base
+from app.models.animal import Animal
+from app.models.care_log import CareLog
+from app.models.volunteer import Volunteer
+from app.services import (
+    care_log_service,
+    care_status_service,
+    csv_service,
+    dashboard_service,
+    volunteer_service,
+)
+from app.utils.pagination import encode_cursor
+
+# 投入する世話記録の件数（環境変数で本番規模に変更可能）
+PLAN_ROWS = int(os.environ.get("NECOKEEPER_QUERY_PLAN_ROWS", "20000"))
+ANIMAL_COUNT = 300
+INSERT_CHUNK_SIZE = 50_000
+TIME_SLOTS = ("morning", "noon", "evening")
+FIRST_DATE = date(2020, 1, 1)
+VOLUNTEER_ID = 1
+
+# インデックスを使わない care_logs の走査（"SCAN care_logs USING INDEX ..." は許容）
+TABLE_SCAN = re.compile(r"\bSCAN care_logs\b(?! USING)")
+
+
+@dataclass(frozen=True)
+class SeededData:
+    """投入済みデータベース"""
+
+    engine: Engine
+    last_date: date
+    animal_id: int
+
+
+def _seed_care_logs(engine: Engine) -> date:
+    """猫・日付・時点が重複しない世話記録を投入し、最終日を返す"""
+    first_created_at = datetime(2020, 1, 1, 8)
+    last_date = FIRST_DATE
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Animal),
+            [
+                {
+                    "id": i + 1,
+                    "name": f"猫{i + 1}",
+                    "pattern": "キジトラ",
+                    "tail_length": "長い",
+                    "age": "成猫",
+                    "gender": "male",
+                    "status": "保護中",
+                }
+                for i in range(ANIMAL_COUNT)
+            ],
+        )
+        conn.execute(
+            insert(Volunteer),
+            [{"id": VOLUNTEER_ID, "name": "ボランティア", "status": "active"}],
+        )
+
+        rows: list[dict[str, object]] = []
+        for i in range(PLAN_ROWS):
+            slot_sequence, animal_index = divmod(i, ANIMAL_COUNT)
+            days, slot_index = divmod(slot_sequence, len(TIME_SLOTS))
+            last_date = FIRST_DATE + timedelta(days=days)
+            rows.append(
+                {
+                    "animal_id": animal_index + 1,
+                    "recorder_name": "記録者",
+                    "recorder_id": VOLUNTEER_ID if i % 50 == 0 else None,
+                    "log_date": last_date,
+                    "time_slot": TIME_SLOTS[slot_index],
+                    "created_at": first_created_at
+                    + timedelta(days=days, hours=slot_index * 4, seconds=animal_index),
+                    "last_updated_at": first_created_at,
+                }
+            )
+            if len(rows) == INSERT_CHUNK_SIZE:
+                conn.execute(insert(CareLog), rows)
+                rows = []
+        if rows:
+            conn.execute(insert(CareLog), rows)
+
+        # 実行計画の選択に使う統計情報を収集
+        conn.exec_driver_sql("ANALYZE")
+    return last_date
+
+
+@pytest.fixture(scope="module")
+def seeded(tmp_path_factory: pytest.TempPathFactory) -> Iterator[SeededData]:
+    """世話記録を投入したファイルDB（モジュール内で共有）"""
+    path: Path = tmp_path_factory.mktemp("query_plans") / "care_logs.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    last_date = _seed_care_logs(engine)
+    yield SeededData(engine=engine, last_date=last_date, animal_id=5)
+    engine.dispose()
+
+
+def _explain_care_log_queries(
+    engine: Engine, run: Callable[[Session], object]
+) -> list[tuple[str, list[str]]]:
+    """処理が発行した care_logs へのSQLと、その実行計画を取得"""
+    captured: list[tuple[str, object]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+        if "care_logs" in statement and not statement.startswith("EXPLAIN"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        db = sessionmaker(bind=engine)()
+        try:
+            run(db)
+        finally:
+            db.close()
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    plans = []
+    with engine.connect() as conn:
+        for statement, parameters in captured:
+            rows = conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).all()
+            plans.append((statement, [row[3] for row in rows]))
+    return plans
+
+
+def _window(seeded: SeededData, days: int) -> dict[str, date]:
+    return {
+        "start_date": seeded.last_date - timedelta(days=days),
+        "end_date": seeded.last_date,
+    }
+
+
+# (名前, 実行する処理)
+HOT_QUERIES: list[tuple[str, Callable[[Session, SeededData], object]]] = [
+    (
+        "latest_care_log",
+        lambda db, s: care_log_service.get_latest_care_log(db, s.animal_id),
+    ),
+    (
+        "list_by_animal_and_dates",
+        lambda db, s: care_log_service.list_care_logs(
+            db, animal_id=s.animal_id, **_window(s, 30)
+        ),
+    ),
+    ("list_all", lambda db, s: care_log_service.list_care_logs(db)),
+    (
+        "list_by_time_slot",
+        lambda db, s: care_log_service.list_care_logs(db, time_slot="morning"),
+    ),
+    (
+        "list_with_cursor",
+        lambda db, s: care_log_service.list_care_logs(
+            db, cursor=encode_cursor(datetime.combine(s.last_date, time()), PLAN_ROWS)
+        ),
+    ),
+    (
+        "list_by_animal_with_cursor",
+        lambda db, s: care_log_service.list_care_logs(
+            db,
+            animal_id=s.animal_id,
+            cursor=encode_cursor(datetime.combine(s.last_date, time()), PLAN_ROWS),
+        ),
+    ),
+    (
+        "daily_view",
+        lambda db, s: care_log_service.get_daily_view(db, **_window(s, 6)),
+    ),
+    (
+        "daily_view_by_animal",
+        lambda db, s: care_log_service.get_daily_view(
+            db, animal_id=s.animal_id, **_window(s, 6)
+        ),
+    ),
+    (
+        "load_by_slot",
+        lambda db, s: care_log_service._load_care_logs_by_slot(
+            db,
+            [
+                (s.animal_id, s.last_date, "morning"),
+                (s.animal_id + 1, s.last_date, "noon"),
+            ],
+        ),
+    ),
+    (
+        "rebuild_daily_care_status",
+        lambda db, s: care_status_service.rebuild_daily_care_status(
+            db, s.animal_id, s.last_date
+        ),
+    ),
+    (
+        "csv_export",
+        lambda db, s: list(
+            csv_service.iter_care_log_csv(
+                db, s.last_date - timedelta(days=30), s.last_date
+            )
+        ),
+    ),
+    (
+        "csv_export_by_animal",
+        lambda db, s: list(
+            csv_service.iter_care_log_csv(
+                db,
+                s.last_date - timedelta(days=30),
+                s.last_date,
+                animal_id=s.animal_id,
+            )
+        ),
+    ),
+    (
+        "dashboard_stats",
+        lambda db, s: dashboard_service._query_dashboard_stats(db, s.last_date),
+    ),
+    (
+        "volunteer_activity",
+        lambda db, s: volunteer_service.get_activity_history(db, VOLUNTEER_ID),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("name", "run"), HOT_QUERIES, ids=[name for name, _ in HOT_QUERIES]
+)
+def test_hot_queries_do_not_scan_care_logs(
+    seeded: SeededData, name: str, run: Callable[[Session, SeededData], object]
+) -> None:
+    """性能: 主要な参照処理は care_logs を全件走査しない"""
+    # When
+    plans = _explain_care_log_queries(seeded.engine, lambda db: run(db, seeded))
+
+    # Then
+    assert plans, f"{name}: care_logs へのクエリが発行されていません"
+    for statement, plan in plans:
+        scans = [detail for detail in plan if TABLE_SCAN.search(detail)]
+        assert not scans, f"{name}: 全件走査 {scans}\n{statement}\n" + "\n".join(plan)
+
+
+def test_latest_care_log_uses_animal_created_at_index(seeded: SeededData) -> None:
+    """性能: 最新の記録は猫ID＋記録日時の複合インデックスで取得する（ソート不要）"""
+    # When
+    plans = _explain_care_log_queries(
+        seeded.engine,
+        lambda db: care_log_service.get_latest_care_log(db, seeded.animal_id),
+    )
+
+    # Then
+    (_, plan), *_ = plans
+    assert any("ix_care_logs_animal_id_created_at" in detail for detail in plan)
+    assert not any("TEMP B-TREE" in detail for detail in plan)
+
+
+def test_slot_lookup_uses_unique_constraint(seeded: SeededData) -> None:
+    """性能: 猫・日付・時点の検索は一意制約のインデックスを使用する"""
+    # When
+    plans = _explain_care_log_queries(
+        seeded.engine,
+        lambda db: care_log_service._load_care_logs_by_slot(
+            db, [(seeded.animal_id, seeded.last_date, "evening")]
+        ),
+    )
+
+    # Then
+    (_, plan), *_ = plans
+    # SQLiteでは一意制約のインデックスは sqlite_autoindex_* の名前になるため、検索列で確認
+    assert any(
+        "INDEX" in detail and "(animal_id=? AND log_date=? AND time_slot=?)" in detail
+        for detail in plan
+    ), plan
+
+
+def test_seeded_row_count(seeded: SeededData) -> None:
+    """前提: 指定件数の世話記録が投入されている"""
+    with Session(seeded.engine) as db:
+        assert db.query(CareLog).count() == PLAN_ROWS
@@ -367,6 +367,36 @@ class TestListAnimals:
         assert result.total == total_count
         assert result.total_pages == expected_total_pages
 
+    def test_list_animals_with_cursor_walks_all_pages(
+        self, test_db: Session, test_animals_bulk: list[Animal]
+    ):
+        """正常系: next_cursor をたどると、OFFSET方式と同じ順序で重複・欠落なく取得できる"""
+        # Given
+        expected = [
+            animal.id
+            for animal in animal_service.list_animals(test_db, page_size=100).items
+        ]
+        first = animal_service.list_animals(test_db, page_size=4)
+
+        # When
+        ids = [animal.id for animal in first.items]
+        cursor = first.next_cursor
+        while cursor is not None:
+            result = animal_service.list_animals(test_db, page_size=4, cursor=cursor)
+            assert result.total == first.total
+            ids.extend(animal.id for animal in result.items)
+            cursor = result.next_cursor
+
+        # Then
+        assert ids == expected
+
+    def test_list_animals_with_invalid_cursor(self, test_db: Session):
+        """異常系: 不正なカーソルは400エラー"""
+        # When/Then
+        with pytest.raises(HTTPException) as exc_info:
+            animal_service.list_animals(test_db, cursor="invalid")
+        assert exc_info.value.status_code == 400
+
 
 class TestSearchAnimals:
     """猫検索のテスト"""
@@ -458,3 +488,20 @@ class TestSearchAnimals:
         assert len(result.items) <= page_size
         assert result.page == 1
         assert result.page_size == page_size
+
+    def test_search_animals_with_cursor(
+        self, test_db: Session, test_animals_bulk: list[Animal]
+    ):
+        """正常系: 検索結果もカーソル方式で次のページを取得できる"""
+        # Given
+        first = animal_service.search_animals(test_db, "猫", page_size=3)
+
+        # When
+        second = animal_service.search_animals(
+            test_db, "猫", page_size=3, cursor=first.next_cursor
+        )
+
+        # Then
+        assert first.next_cursor is not None
+        assert len(second.items) == 3
+        assert {a.id for a in first.items}.isdisjoint(a.id for a in second.items)
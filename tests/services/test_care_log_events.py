@@ -0,0 +1,262 @@
+"""
+世話記録イベント配信サービスのテスト
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import date
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.animal import Animal
+from app.schemas.care_log import CareLogCreate, CareLogUpdate
+from app.services import care_log_events, care_log_service
+from app.services.care_log_events import CareLogEventBroker
+
+
+@pytest.fixture
+def broker(monkeypatch: pytest.MonkeyPatch) -> CareLogEventBroker:
+    """テストごとに独立したブローカーを使用"""
+    broker = CareLogEventBroker(max_subscribers=3, max_queue=2)
+    monkeypatch.setattr(care_log_events, "care_log_event_broker", broker)
+    return broker
+
+
+async def _never_disconnected() -> bool:
+    return False
+
+
+def _event(animal_id: int, log_id: int = 1) -> dict[str, object]:
+    return {
+        "type": "created",
+        "log_id": log_id,
+        "animal_id": animal_id,
+        "log_date": "2025-11-15",
+        "time_slot": "morning",
+    }
+
+
+class TestCareLogEventBroker:
+    """購読・配信のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_publish_from_worker_thread(self, broker: CareLogEventBroker):
+        """正常系: ワーカースレッドから発行したイベントを購読者が受け取る"""
+        # Given
+        subscription = broker.subscribe()
+
+        # When
+        await asyncio.to_thread(broker.publish, _event(animal_id=1))
+        event = await asyncio.wait_for(subscription.get(), timeout=1)
+
+        # Then
+        assert event["animal_id"] == 1
+        assert event["id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_filter_by_animal(self, broker: CareLogEventBroker):
+        """正常系: 猫IDで絞り込んだ購読者には対象の猫のイベントのみ届く"""
+        # Given
+        subscription = broker.subscribe(animal_id=2)
+
+        # When
+        delivered_other = broker.publish(_event(animal_id=1))
+        delivered_target = broker.publish(_event(animal_id=2))
+        await asyncio.sleep(0)
+
+        # Then
+        assert delivered_other == 0
+        assert delivered_target == 1
+        assert subscription.queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_is_replaced_with_resync(self, broker: CareLogEventBroker):
+        """正常系: キューが溢れた場合は未送信のイベントを破棄してresyncを送る"""
+        # Given
+        subscription = broker.subscribe()
+
+        # When
+        for log_id in range(5):
+            broker.publish(_event(animal_id=1, log_id=log_id))
+        await asyncio.sleep(0)
+
+        # Then
+        assert subscription.queue.qsize() <= broker.max_queue
+        events = [
+            subscription.queue.get_nowait() for _ in range(subscription.queue.qsize())
+        ]
+        assert {"type": "resync"} in events
+        assert subscription.dropped > 0
+
+    @pytest.mark.asyncio
+    async def test_subscriber_limit(self, broker: CareLogEventBroker):
+        """異常系: 同時接続数の上限を超える購読は拒否する"""
+        # Given
+        for _ in range(broker.max_subscribers):
+            assert broker.subscribe() is not None
+
+        # When/Then
+        assert broker.subscribe() is None
+
+
+class TestStreamCareLogEvents:
+    """SSEストリームのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_streams_events_and_heartbeat(self, broker: CareLogEventBroker):
+        """正常系: イベントをSSE形式で送出し、イベントがない間はハートビートを送る"""
+        # Given
+        stream = care_log_events.stream_care_log_events(
+            None, _never_disconnected, heartbeat_seconds=0.01
+        )
+
+        # When
+        retry = await anext(stream)
+        heartbeat = await anext(stream)
+        broker.publish(_event(animal_id=1))
+        message = await anext(stream)
+        await stream.aclose()
+
+        # Then
+        assert retry.startswith("retry:")
+        assert heartbeat == ": heartbeat\n\n"
+        lines = message.strip().split("\n")
+        assert lines[1] == "event: created"
+        assert json.loads(lines[2].removeprefix("data: "))["animal_id"] == 1
+        assert broker.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_version_change_sends_resync(self, broker: CareLogEventBroker):
+        """正常系: 他のプロセスでの更新（バージョンの変化）はハートビートの代わりにresyncを送る"""
+        # Given
+        versions = iter([1, 1, 2])
+        stream = care_log_events.stream_care_log_events(
+            None,
+            _never_disconnected,
+            heartbeat_seconds=0.01,
+            get_version=lambda: next(versions),
+        )
+
+        # When
+        await anext(stream)
+        unchanged = await anext(stream)
+        changed = await anext(stream)
+        await stream.aclose()
+
+        # Then
+        assert unchanged == ": heartbeat\n\n"
+        assert changed.startswith("event: resync\n")
+        assert broker.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_disconnect_unsubscribes(self, broker: CareLogEventBroker):
+        """正常系: クライアントが切断すると購読を解除してストリームを終える"""
+
+        # Given
+        async def _disconnected() -> bool:
+            return True
+
+        # When
+        messages = [
+            message
+            async for message in care_log_events.stream_care_log_events(
+                None, _disconnected, heartbeat_seconds=1
+            )
+        ]
+
+        # Then
+        assert len(messages) == 1
+        assert broker.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_unstarted_stream_holds_no_subscription(
+        self, broker: CareLogEventBroker
+    ):
+        """正常系: 送出が始まる前に破棄されたストリームは購読を残さない"""
+        # Given
+        stream = care_log_events.stream_care_log_events(
+            None, _never_disconnected, heartbeat_seconds=1
+        )
+
+        # When
+        await stream.aclose()
+
+        # Then
+        assert broker.subscriber_count == 0
+        assert not broker.is_full
+
+    @pytest.mark.asyncio
+    async def test_stream_ends_when_subscriber_limit_reached(
+        self, broker: CareLogEventBroker
+    ):
+        """異常系: 開始時に接続数が上限に達している場合は再接続の待ち時間だけを送る"""
+        # Given
+        for _ in range(broker.max_subscribers):
+            broker.subscribe()
+
+        # When
+        messages = [
+            message
+            async for message in care_log_events.stream_care_log_events(
+                None, _never_disconnected, heartbeat_seconds=1
+            )
+        ]
+
+        # Then
+        assert broker.is_full
+        assert len(messages) == 1
+        assert messages[0].startswith("retry:")
+
+    @pytest.mark.asyncio
+    async def test_close_ends_streams(self, broker: CareLogEventBroker):
+        """正常系: アプリケーション終了時はすべてのストリームを終える"""
+        # Given
+        stream = care_log_events.stream_care_log_events(
+            None, _never_disconnected, heartbeat_seconds=1
+        )
+        await anext(stream)
+
+        # When
+        broker.close()
+
+        # Then
+        with pytest.raises(StopAsyncIteration):
+            await anext(stream)
+
+
+class TestCareLogServiceEvents:
+    """世話記録サービスからの発行のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_create_and_update_publish_events(
+        self, broker: CareLogEventBroker, test_db: Session, test_animal: Animal
+    ):
+        """正常系: 世話記録の登録・更新でイベントが発行される"""
+        # Given
+        subscription = broker.subscribe(animal_id=test_animal.id)
+
+        # When
+        care_log = care_log_service.create_care_log(
+            test_db,
+            CareLogCreate(
+                animal_id=test_animal.id,
+                recorder_name="記録者",
+                log_date=date(2025, 11, 15),
+                time_slot="morning",
+            ),
+        )
+        care_log_service.update_care_log(
+            test_db, care_log.id, CareLogUpdate(appetite=5), user_id=None
+        )
+        created = await asyncio.wait_for(subscription.get(), timeout=1)
+        updated = await asyncio.wait_for(subscription.get(), timeout=1)
+
+        # Then
+        assert created["type"] == "created"
+        assert created["log_id"] == care_log.id
+        assert created["log_date"] == "2025-11-15"
+        assert updated["type"] == "updated"
+        assert "previous_animal_id" not in updated
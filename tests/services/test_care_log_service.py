@@ -18,9 +18,11 @@ from sqlalchemy.orm import Session
 
 from app.models.animal import Animal
 from app.models.care_log import CareLog
+from app.models.daily_care_status import DailyCareStatus
 from app.models.user import User
 from app.schemas.care_log import CareLogCreate, CareLogUpdate
 from app.services import care_log_service
+from app.utils.pagination import encode_cursor
 
 
 class TestCreateCareLog:
@@ -181,6 +183,239 @@ class TestCreateCareLog:
         assert result.stool_condition == stool_condition
 
 
+class TestCreateCareLogUpsert:
+    """同じ猫・日付・時点の再登録（UPSERT）のテスト"""
+
+    @staticmethod
+    def _data(animal_id: int, **kwargs) -> CareLogCreate:
+        return CareLogCreate(
+            animal_id=animal_id,
+            recorder_name="記録者",
+            log_date=date(2025, 11, 15),
+            time_slot="morning",
+            **kwargs,
+        )
+
+    def test_same_slot_updates_existing(self, test_db: Session, test_animal: Animal):
+        """正常系: 同じ時点の再登録は新しい行を作らず既存の記録を更新する"""
+        # Given
+        first = care_log_service.create_care_log(test_db, self._data(test_animal.id))
+        created_at = first.created_at
+
+        # When
+        second = care_log_service.create_care_log(
+            test_db, self._data(test_animal.id, appetite=5, memo="追記")
+        )
+
+        # Then
+        assert second.id == first.id
+        assert second.appetite == 5
+        assert second.memo == "追記"
+        assert second.created_at == created_at
+        assert test_db.query(CareLog).count() == 1
+
+    def test_same_content_is_noop(
+        self, test_db: Session, test_animal: Animal, query_counter
+    ):
+        """正常系: 同じ内容の再送は書き込みを行わない"""
+        # Given
+        first = care_log_service.create_care_log(test_db, self._data(test_animal.id))
+        last_updated_at = first.last_updated_at
+
+        data = self._data(test_animal.id)
+
+        # When
+        with query_counter() as statements:
+            second = care_log_service.create_care_log(test_db, data)
+
+        # Then
+        assert second.id == first.id
+        assert second.last_updated_at == last_updated_at
+        assert len(statements) == 1
+
+    def test_idempotency_key_replay_returns_existing(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """正常系: 登録済みの冪等キーで再送された場合は既存の記録を返す"""
+        # Given
+        first = care_log_service.create_care_log(
+            test_db, self._data(test_animal.id, idempotency_key="req-1")
+        )
+
+        # When
+        replayed = care_log_service.create_care_log(
+            test_db, self._data(test_animal.id, appetite=1, idempotency_key="req-1")
+        )
+
+        # Then
+        assert replayed.id == first.id
+        assert replayed.appetite == 3
+
+    def test_update_into_occupied_slot_conflicts(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """異常系: 既に記録がある時点への変更は409"""
+        # Given
+        care_log_service.create_care_log(test_db, self._data(test_animal.id))
+        noon = care_log_service.create_care_log(
+            test_db, self._data(test_animal.id).model_copy(update={"time_slot": "noon"})
+        )
+
+        # When/Then
+        with pytest.raises(HTTPException) as exc_info:
+            care_log_service.update_care_log(
+                test_db, noon.id, CareLogUpdate(time_slot="morning"), user_id=None
+            )
+        assert exc_info.value.status_code == 409
+
+
+class TestCreateCareLogsBatch:
+    """世話記録一括登録のテスト"""
+
+    @staticmethod
+    def _item(animal_id: int, time_slot: str = "morning", **kwargs) -> CareLogCreate:
+        return CareLogCreate(
+            animal_id=animal_id,
+            recorder_name="OCR自動取込",
+            log_date=date(2025, 11, 15),
+            time_slot=time_slot,
+            **kwargs,
+        )
+
+    def test_returns_per_row_results(self, test_db: Session, test_animal: Animal):
+        """正常系: 有効な行は登録し、不正な行は行ごとのエラーとして返す"""
+        # Given
+        items = [
+            self._item(test_animal.id, "morning"),
+            self._item(99999, "noon"),
+            self._item(test_animal.id, "noon", defecation=True),
+            self._item(test_animal.id, "evening", defecation=True, stool_condition=2),
+        ]
+
+        # When
+        results = care_log_service.create_care_logs_batch(test_db, items)
+
+        # Then
+        assert [r.status for r in results] == ["created", "error", "error", "created"]
+        assert "99999" in results[1].detail
+        assert "stool_condition" in results[2].detail
+        saved = {log.id: log for log in test_db.query(CareLog).all()}
+        assert set(saved) == {results[0].id, results[3].id}
+        assert saved[results[3].id].time_slot == "evening"
+        assert saved[results[3].id].stool_condition == 2
+
+    def test_query_count_is_constant(
+        self, test_db: Session, test_animals_bulk: list[Animal], query_counter
+    ):
+        """性能: 行数に関わらず猫の確認・登録・記録状況の更新は一定回数"""
+        # Given
+        items = [
+            self._item(animal.id, time_slot)
+            for animal in test_animals_bulk
+            for time_slot in ("morning", "noon", "evening")
+        ]
+
+        # When
+        with query_counter() as statements:
+            results = care_log_service.create_care_logs_batch(test_db, items)
+
+        # Then
+        assert all(r.status == "created" for r in results)
+        assert test_db.query(CareLog).count() == len(items)
+        # 世話記録・記録状況・リソースのバージョンをそれぞれ1回で登録する
+        inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+        assert len(inserts) == 3
+        assert len(statements) <= 6
+
+    def test_reimport_is_noop(self, test_db: Session, test_animal: Animal):
+        """正常系: 同じ内容の再取り込みは何もせず、変更のある行のみ更新する"""
+        # Given
+        items = [
+            self._item(test_animal.id, "morning"),
+            self._item(test_animal.id, "noon"),
+        ]
+        first = care_log_service.create_care_logs_batch(test_db, items)
+
+        # When
+        items[1] = self._item(test_animal.id, "noon", appetite=5)
+        second = care_log_service.create_care_logs_batch(test_db, items)
+
+        # Then
+        assert [r.status for r in second] == ["unchanged", "updated"]
+        assert [r.id for r in second] == [r.id for r in first]
+        assert test_db.query(CareLog).count() == 2
+        assert test_db.get(CareLog, first[1].id).appetite == 5
+
+    def test_duplicate_slots_in_batch_apply_last_row(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """正常系: バッチ内で同じ猫・日付・時点の行は最後の行を適用する"""
+        # When
+        results = care_log_service.create_care_logs_batch(
+            test_db,
+            [
+                self._item(test_animal.id, "morning", appetite=1),
+                self._item(test_animal.id, "morning", appetite=4),
+            ],
+        )
+
+        # Then
+        assert [r.status for r in results] == ["error", "created"]
+        assert test_db.query(CareLog).one().appetite == 4
+
+    def test_idempotency_key_replay(self, test_db: Session, test_animal: Animal):
+        """正常系: 登録済みの冪等キーの行は内容に関わらず何もしない"""
+        # Given
+        first = care_log_service.create_care_logs_batch(
+            test_db, [self._item(test_animal.id, idempotency_key="import-1")]
+        )
+
+        # When
+        second = care_log_service.create_care_logs_batch(
+            test_db,
+            [self._item(test_animal.id, appetite=1, idempotency_key="import-1")],
+        )
+
+        # Then
+        assert second[0].status == "unchanged"
+        assert second[0].id == first[0].id
+        assert test_db.query(CareLog).one().appetite == 3
+
+    def test_repeated_idempotency_key_in_batch_is_row_error(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """異常系: バッチ内で別の時点の行に同じ冪等キーがある場合は後の行をエラーにする"""
+        # When
+        results = care_log_service.create_care_logs_batch(
+            test_db,
+            [
+                self._item(test_animal.id, "morning", idempotency_key="import-1"),
+                self._item(test_animal.id, "noon", idempotency_key="import-1"),
+                self._item(test_animal.id, "evening"),
+            ],
+        )
+
+        # Then
+        assert [r.status for r in results] == ["created", "error", "created"]
+        assert "冪等キー" in results[1].detail
+        saved = test_db.query(CareLog).order_by(CareLog.id).all()
+        assert [log.time_slot for log in saved] == ["morning", "evening"]
+        assert saved[0].idempotency_key == "import-1"
+
+    def test_updates_care_status_board(self, test_db: Session, test_animal: Animal):
+        """正常系: 登録した時点が当日記録状況に反映される"""
+        # When
+        care_log_service.create_care_logs_batch(
+            test_db,
+            [self._item(test_animal.id, "morning"), self._item(test_animal.id, "noon")],
+        )
+
+        # Then
+        status = test_db.get(DailyCareStatus, (date(2025, 11, 15), test_animal.id))
+        assert status is not None
+        assert status.slots == 1 | 2
+
+
 class TestGetCareLog:
     """世話記録取得のテスト"""
 
@@ -413,7 +648,7 @@ class TestListCareLogs:
         # Given: 複数の世話記録を作成
         for i in range(5):
             care_log = CareLog(
-                log_date=date.today(),
+                log_date=date.today() - timedelta(days=i),
                 animal_id=test_animal.id,
                 recorder_name=f"記録者{i}",
                 time_slot="morning",
@@ -441,7 +676,7 @@ class TestListCareLogs:
         # Given: 複数の世話記録を作成
         for i in range(10):
             care_log = CareLog(
-                log_date=date.today(),
+                log_date=date.today() - timedelta(days=i),
                 animal_id=test_animal.id,
                 recorder_name=f"記録者{i}",
                 time_slot="morning",
@@ -472,7 +707,7 @@ class TestListCareLogs:
         # 対象の猫の記録
         for i in range(3):
             care_log = CareLog(
-                log_date=date.today(),
+                log_date=date.today() - timedelta(days=i),
                 animal_id=target_animal.id,
                 recorder_name=f"記録者{i}",
                 time_slot="morning",
@@ -515,7 +750,7 @@ class TestListCareLogs:
 
         # 昨日の記録
         old_log = CareLog(
-            log_date=date.today(),
+            log_date=yesterday,
             animal_id=test_animal.id,
             recorder_name="昨日の記録者",
             time_slot="morning",
@@ -587,6 +822,87 @@ class TestListCareLogs:
         assert result.total == 0
         assert result.total_pages == 0
 
+    def test_list_care_logs_with_cursor_breaks_ties_by_id(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """正常系: 記録日時が同じ記録もIDで順序付け、カーソルで重複・欠落なく取得できる"""
+        # Given: 同じ記録日時の記録
+        created_at = datetime(2025, 11, 15, 9, 0)
+        for i in range(7):
+            test_db.add(
+                CareLog(
+                    log_date=date(2025, 11, 15) - timedelta(days=i),
+                    animal_id=test_animal.id,
+                    recorder_name=f"記録者{i}",
+                    time_slot="morning",
+                    created_at=created_at,
+                )
+            )
+        test_db.commit()
+        first = care_log_service.list_care_logs(test_db, page_size=3)
+
+        # When
+        ids = [log.id for log in first.items]
+        cursor = first.next_cursor
+        while cursor is not None:
+            result = care_log_service.list_care_logs(
+                test_db, page_size=3, cursor=cursor
+            )
+            ids.extend(log.id for log in result.items)
+            cursor = result.next_cursor
+
+        # Then
+        assert ids == sorted(ids, reverse=True)
+        assert len(set(ids)) == 7
+
+    def test_list_care_logs_cursor_total_refreshes_after_create(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """正常系: カーソル方式の総件数はキャッシュされ、世話記録の登録後は数え直す"""
+        # Given
+        for slot in ("morning", "noon"):
+            care_log_service.create_care_log(
+                test_db,
+                CareLogCreate(
+                    animal_id=test_animal.id,
+                    recorder_name="記録者",
+                    log_date=date(2025, 11, 15),
+                    time_slot=slot,
+                ),
+            )
+        first = care_log_service.list_care_logs(test_db, page_size=1)
+        before = care_log_service.list_care_logs(
+            test_db, page_size=1, cursor=first.next_cursor
+        )
+
+        # When
+        care_log_service.create_care_log(
+            test_db,
+            CareLogCreate(
+                animal_id=test_animal.id,
+                recorder_name="記録者",
+                log_date=date(2025, 11, 15),
+                time_slot="evening",
+            ),
+        )
+        after = care_log_service.list_care_logs(
+            test_db, page_size=1, cursor=first.next_cursor
+        )
+
+        # Then
+        assert before.total == 2
+        assert after.total == 3
+
+    def test_list_care_logs_with_invalid_cursor(self, test_db: Session):
+        """異常系: 種類の異なるカーソル（診療日のカーソル）は400エラー"""
+        # Given
+        cursor = encode_cursor(date(2025, 11, 15), 1)
+
+        # When/Then
+        with pytest.raises(HTTPException) as exc_info:
+            care_log_service.list_care_logs(test_db, cursor=cursor)
+        assert exc_info.value.status_code == 400
+
 
 class TestExportCareLogsCSV:
     """世話記録CSV出力のテスト"""
@@ -672,7 +988,7 @@ class TestExportCareLogsCSV:
 
         # 昨日の記録
         old_log = CareLog(
-            log_date=date.today(),
+            log_date=yesterday,
             animal_id=test_animal.id,
             recorder_name="昨日の記録者",
             time_slot="morning",
@@ -842,3 +1158,168 @@ class TestGetLatestCareLog:
         # Then
         assert result is not None
         assert result.id == max(log1.id, log2.id)
+
+
+class TestGetDailyView:
+    """日次ビュー取得のテスト"""
+
+    @staticmethod
+    def _seed(test_db: Session, animal_count: int, days: int, end: date) -> None:
+        animals = [
+            Animal(
+                name=f"日次猫{i}",
+                photo="test.jpg",
+                pattern="キジトラ",
+                tail_length="長い",
+                age="成猫",
+                gender="female",
+                status="保護中",
+            )
+            for i in range(animal_count)
+        ]
+        test_db.add_all(animals)
+        test_db.flush()
+        for animal in animals:
+            for offset in range(days):
+                test_db.add(
+                    CareLog(
+                        log_date=end - timedelta(days=offset),
+                        animal_id=animal.id,
+                        recorder_name="テスト記録者",
+                        time_slot="morning",
+                        appetite=4,
+                        energy=4,
+                        urination=True,
+                        cleaning=True,
+                    )
+                )
+        test_db.commit()
+
+    def test_get_daily_view_pivots_time_slots(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """正常系: 時点ごとの記録が1行に展開される"""
+        # Given
+        target = date(2025, 11, 15)
+        for time_slot, appetite in (("morning", 5), ("evening", 2)):
+            test_db.add(
+                CareLog(
+                    log_date=target,
+                    animal_id=test_animal.id,
+                    recorder_name="テスト記録者",
+                    time_slot=time_slot,
+                    appetite=appetite,
+                    energy=3,
+                    urination=True,
+                    cleaning=False,
+                )
+            )
+        test_db.commit()
+
+        # When
+        result = care_log_service.get_daily_view(
+            test_db, animal_id=test_animal.id, start_date=target, end_date=target
+        )
+
+        # Then
+        assert result["total"] == 1
+        item = result["items"][0]
+        assert item["date"] == "2025-11-15"
+        assert item["animal_name"] == "テスト猫"
+        assert item["morning"]["exists"] is True
+        assert item["morning"]["appetite"] == 5
+        assert item["noon"] == {
+            "exists": False,
+            "log_id": None,
+            "appetite": None,
+            "energy": None,
+            "urination": None,
+            "cleaning": None,
+        }
+        assert item["evening"]["appetite"] == 2
+        assert item["evening"]["cleaning"] is False
+
+    def test_get_daily_view_orders_by_date_desc_then_animal(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """正常系: 日付降順・同一日内は猫ID順でページングされる"""
+        # Given
+        end = date(2025, 11, 15)
+        self._seed(test_db, animal_count=2, days=3, end=end)
+        animal_ids = [row.id for row in test_db.query(Animal.id).order_by(Animal.id)]
+
+        # When
+        page1 = care_log_service.get_daily_view(
+            test_db, start_date=end - timedelta(days=2), end_date=end, page_size=4
+        )
+        page3 = care_log_service.get_daily_view(
+            test_db,
+            start_date=end - timedelta(days=2),
+            end_date=end,
+            page=3,
+            page_size=4,
+        )
+
+        # Then
+        assert page1["total"] == 9
+        assert page1["total_pages"] == 3
+        keys = [(i["date"], i["animal_id"]) for i in page1["items"]]
+        assert keys == [
+            ("2025-11-15", animal_ids[0]),
+            ("2025-11-15", animal_ids[1]),
+            ("2025-11-15", animal_ids[2]),
+            ("2025-11-14", animal_ids[0]),
+        ]
+        assert [(i["date"], i["animal_id"]) for i in page3["items"]] == [
+            ("2025-11-13", animal_ids[2])
+        ]
+
+    def test_get_daily_view_page_out_of_range(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """境界値: 範囲外のページは空のitemsを返す"""
+        # When
+        result = care_log_service.get_daily_view(
+            test_db,
+            start_date=date(2025, 11, 15),
+            end_date=date(2025, 11, 15),
+            page=5,
+        )
+
+        # Then
+        assert result["items"] == []
+        assert result["total"] == 1
+
+    def test_get_daily_view_invalid_date_range(self, test_db: Session):
+        """異常系: 開始日が終了日より後の場合は422エラー"""
+        with pytest.raises(HTTPException) as exc_info:
+            care_log_service.get_daily_view(
+                test_db, start_date=date(2025, 11, 16), end_date=date(2025, 11, 15)
+            )
+
+        assert exc_info.value.status_code == 422
+
+    def test_get_daily_view_query_count_is_constant(
+        self, test_db: Session, query_counter
+    ):
+        """性能: 猫の数・日数が増えても発行クエリ数は一定"""
+        end = date(2025, 11, 30)
+
+        # Given: 小規模（2匹×3日）
+        self._seed(test_db, animal_count=2, days=3, end=end)
+        with query_counter() as small:
+            care_log_service.get_daily_view(
+                test_db, start_date=end - timedelta(days=2), end_date=end
+            )
+
+        # Given: 大規模（120匹超×30日）
+        self._seed(test_db, animal_count=120, days=30, end=end)
+        with query_counter() as large:
+            result = care_log_service.get_daily_view(
+                test_db, start_date=end - timedelta(days=29), end_date=end, page=7
+            )
+
+        # Then
+        assert result["total"] == 123 * 30
+        assert len(result["items"]) == 20
+        assert len(large) == len(small) == 2
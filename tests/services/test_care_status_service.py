@@ -0,0 +1,177 @@
+"""
+当日記録状況サービスのテスト
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.animal import Animal
+from app.models.daily_care_status import DailyCareStatus
+from app.schemas.care_log import CareLogCreate, CareLogUpdate
+from app.services import care_log_service, care_status_service
+
+QueryCounter = Callable[[], AbstractContextManager[list[str]]]
+
+TODAY = date(2025, 11, 15)
+
+
+def _create_log(
+    db: Session, animal_id: int, time_slot: str, log_date: date = TODAY
+) -> int:
+    care_log = care_log_service.create_care_log(
+        db,
+        CareLogCreate(
+            animal_id=animal_id,
+            recorder_name="記録者",
+            log_date=log_date,
+            time_slot=time_slot,
+        ),
+    )
+    return care_log.id
+
+
+def _slots(db: Session, animal_id: int, log_date: date = TODAY) -> int | None:
+    status = db.get(DailyCareStatus, (log_date, animal_id))
+    return None if status is None else status.slots
+
+
+class TestMaintainDailyCareStatus:
+    """世話記録の登録・更新時の増分更新のテスト"""
+
+    def test_create_care_log_sets_slot_bits(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """正常系: 登録した時点のビットが立つ（同じ時点の再登録でも変わらない）"""
+        # When
+        _create_log(test_db, test_animal.id, "morning")
+        _create_log(test_db, test_animal.id, "evening")
+        _create_log(test_db, test_animal.id, "evening")
+
+        # Then
+        assert _slots(test_db, test_animal.id) == 1 | 4
+
+    def test_update_time_slot_moves_bit(self, test_db: Session, test_animal: Animal):
+        """正常系: 時点を変更すると移動元のビットが落ち、移動先のビットが立つ"""
+        # Given
+        care_log_id = _create_log(test_db, test_animal.id, "morning")
+
+        # When
+        care_log_service.update_care_log(
+            test_db, care_log_id, CareLogUpdate(time_slot="noon"), user_id=None
+        )
+
+        # Then
+        test_db.expire_all()
+        assert _slots(test_db, test_animal.id) == 2
+
+    def test_update_log_date_rebuilds_both_days(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """正常系: 日付を変更すると移動元の日の状況が消え、移動先の日に立つ"""
+        # Given
+        care_log_id = _create_log(test_db, test_animal.id, "noon")
+        next_day = TODAY + timedelta(days=1)
+
+        # When
+        care_log_service.update_care_log(
+            test_db, care_log_id, CareLogUpdate(log_date=next_day), user_id=None
+        )
+
+        # Then
+        test_db.expire_all()
+        assert _slots(test_db, test_animal.id) is None
+        assert _slots(test_db, test_animal.id, next_day) == 2
+
+    def test_mark_time_slots_recorded_merges_per_day(
+        self, test_db: Session, test_animals_bulk: list[Animal]
+    ):
+        """正常系: 一括登録分は猫・日付ごとにビットを集約して反映する"""
+        # Given
+        first, second = test_animals_bulk[0], test_animals_bulk[1]
+        _create_log(test_db, first.id, "evening")
+
+        # When
+        care_status_service.mark_time_slots_recorded(
+            test_db,
+            [
+                (first.id, TODAY, "morning"),
+                (first.id, TODAY, "noon"),
+                (second.id, TODAY, "noon"),
+            ],
+        )
+        test_db.commit()
+
+        # Then
+        assert _slots(test_db, first.id) == 1 | 2 | 4
+        assert _slots(test_db, second.id) == 2
+
+
+class TestGetCareStatusBoard:
+    """当日記録状況一覧の取得のテスト"""
+
+    def test_single_query_for_all_animals(
+        self,
+        test_db: Session,
+        test_animals_bulk: list[Animal],
+        query_counter: QueryCounter,
+    ):
+        """正常系: 猫の数に関わらず1クエリで一覧を取得する"""
+        # Given
+        _create_log(test_db, test_animals_bulk[0].id, "morning")
+        _create_log(test_db, test_animals_bulk[1].id, "noon")
+
+        # When
+        with query_counter() as statements:
+            target_date, board = care_status_service.get_care_status_board(
+                test_db, TODAY
+            )
+
+        # Then
+        assert len(statements) == 1
+        assert target_date == TODAY
+        rows = {row.animal_id: row for row in board}
+        assert rows[test_animals_bulk[0].id].is_recorded("morning")
+        assert not rows[test_animals_bulk[0].id].is_recorded("noon")
+        assert rows[test_animals_bulk[1].id].is_recorded("noon")
+        assert rows[test_animals_bulk[2].id].slots == 0
+
+    def test_excludes_adopted_animals(self, test_db: Session, test_animal: Animal):
+        """正常系: 譲渡済みの猫は一覧に含めない"""
+        # Given
+        test_animal.status = "譲渡済み"
+        test_db.commit()
+
+        # When
+        _, board = care_status_service.get_care_status_board(test_db, TODAY)
+
+        # Then
+        assert board == []
+
+    def test_rolls_over_at_jst_midnight(
+        self,
+        test_db: Session,
+        test_animal: Animal,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """正常系: JSTの日付が変わると前日の記録は当日の状況に含まれない"""
+        # Given
+        _create_log(test_db, test_animal.id, "evening")
+        monkeypatch.setattr(care_status_service, "get_jst_date", lambda: TODAY)
+        _, board = care_status_service.get_care_status_board(test_db)
+        assert board[0].is_recorded("evening")
+
+        # When
+        monkeypatch.setattr(
+            care_status_service, "get_jst_date", lambda: TODAY + timedelta(days=1)
+        )
+        target_date, board = care_status_service.get_care_status_board(test_db)
+
+        # Then
+        assert target_date == TODAY + timedelta(days=1)
+        assert board[0].slots == 0
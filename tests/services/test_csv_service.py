@@ -6,13 +6,22 @@ Requirements: Requirement 9, Requirement 25
 
 from __future__ import annotations
 
+import csv
 from datetime import date
+from io import StringIO
 
+import pytest
 from sqlalchemy.orm import Session
 
 from app.models.animal import Animal
 from app.models.care_log import CareLog
-from app.services.csv_service import generate_care_log_csv, generate_report_csv
+from app.services.csv_service import (
+    generate_care_log_csv,
+    generate_report_csv,
+    iter_care_log_csv,
+    iter_csv_chunks,
+    stream_report_csv,
+)
 
 
 class TestGenerateCareLogCSV:
@@ -168,3 +177,79 @@ class TestGenerateReportCSV:
             generate_report_csv(
                 test_db, "individual", start_date, end_date, locale="ja"
             )
+
+
+class TestStreamingCSV:
+    """ストリーミングCSV生成のテスト"""
+
+    def test_iter_csv_chunks_splits_rows(self):
+        """正常系: 指定行数ごとにチャンクが分割される"""
+        # When
+        chunks = list(
+            iter_csv_chunks(["a", "b"], ([i, i * 2] for i in range(5)), chunk_rows=2)
+        )
+
+        # Then
+        assert len(chunks) == 3
+        assert chunks[0].startswith(b"\xef\xbb\xbf")
+        text = b"".join(chunks).decode("utf-8-sig")
+        assert list(csv.reader(StringIO(text)))[1:] == [
+            [str(i), str(i * 2)] for i in range(5)
+        ]
+
+    def test_iter_csv_chunks_without_bom(self):
+        """正常系: BOMなしで生成できる"""
+        chunks = list(iter_csv_chunks(["a"], [], with_bom=False))
+
+        assert chunks == [b"a\r\n"]
+
+    def test_iter_care_log_csv_streams_in_chunks(
+        self, test_db: Session, test_animal: Animal, test_animals_bulk: list[Animal]
+    ):
+        """正常系: 大量の記録でも複数チャンクで出力され、BOMは1つだけ"""
+        # Given: 猫・日付・時点の組が重複しないように1200件
+        animals = [test_animal, *test_animals_bulk]
+        time_slots = ("morning", "noon", "evening")
+        test_db.add_all(
+            [
+                CareLog(
+                    animal_id=animals[i % len(animals)].id,
+                    log_date=date(2024, 11, 1 + i // (len(animals) * 3)),
+                    time_slot=time_slots[i // len(animals) % 3],
+                    recorder_name="テストユーザー",
+                )
+                for i in range(1200)
+            ]
+        )
+        test_db.commit()
+
+        # When
+        chunks = list(iter_care_log_csv(test_db, date(2024, 11, 1), date(2024, 11, 30)))
+
+        # Then
+        assert len(chunks) > 1
+        body = b"".join(chunks)
+        assert body.count(b"\xef\xbb\xbf") == 1
+        rows = list(csv.reader(StringIO(body.decode("utf-8-sig"))))
+        assert len(rows) == 1201
+        assert {row[3] for row in rows[1:]} == {animal.name for animal in animals}
+
+    def test_stream_report_csv_validates_eagerly(self, test_db: Session):
+        """異常系: 不正な帳票種別はストリーム開始前に例外発生"""
+        with pytest.raises(ValueError):
+            stream_report_csv(test_db, "invalid", date(2024, 11, 1), date(2024, 11, 30))
+
+    def test_stream_report_csv_matches_generate(
+        self, test_db: Session, test_care_logs: list[CareLog]
+    ):
+        """正常系: ストリーミング出力は一括生成と同じ内容になる"""
+        start_date = date(2024, 11, 1)
+        end_date = date(2024, 11, 30)
+
+        streamed = b"".join(
+            stream_report_csv(test_db, "daily", start_date, end_date, locale="en")
+        ).decode("utf-8")
+
+        assert streamed == generate_report_csv(
+            test_db, "daily", start_date, end_date, locale="en"
+        )
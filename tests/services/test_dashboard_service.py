@@ -0,0 +1,169 @@
+"""
+ダッシュボード統計サービスのテスト
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import date
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.animal import Animal
+from app.models.care_log import CareLog
+from app.models.user import User
+from app.models.volunteer import Volunteer
+from app.schemas.animal import AnimalUpdate
+from app.schemas.care_log import CareLogCreate
+from app.services import animal_service, care_log_service, dashboard_service
+
+QueryCounter = Callable[[], AbstractContextManager[list[str]]]
+
+
+def _add_animal(db: Session, name: str, status: str) -> Animal:
+    animal = Animal(
+        name=name,
+        pattern="キジトラ",
+        tail_length="長い",
+        age="成猫",
+        gender="female",
+        status=status,
+    )
+    db.add(animal)
+    db.commit()
+    return animal
+
+
+class TestGetDashboardStats:
+    """ダッシュボード統計集計のテスト"""
+
+    def test_aggregates_in_single_query(
+        self, test_db: Session, test_animal: Animal, query_counter: QueryCounter
+    ):
+        """正常系: ステータス別件数・今日の記録数・ボランティア数を1クエリで集計"""
+        # Given
+        _add_animal(test_db, "譲渡可能猫", "譲渡可能")
+        _add_animal(test_db, "治療中猫", "治療中")
+        _add_animal(test_db, "譲渡済み猫", "譲渡済み")
+        test_db.add_all(
+            [
+                CareLog(
+                    animal_id=test_animal.id,
+                    recorder_name="記録者",
+                    log_date=date.today(),
+                    time_slot="morning",
+                    appetite=3,
+                    energy=3,
+                ),
+                CareLog(
+                    animal_id=test_animal.id,
+                    recorder_name="記録者",
+                    log_date=date(2024, 1, 1),
+                    time_slot="morning",
+                    appetite=3,
+                    energy=3,
+                ),
+                Volunteer(name="活動中", status="active"),
+                Volunteer(name="休止中", status="inactive"),
+            ]
+        )
+        test_db.commit()
+
+        # When
+        with query_counter() as statements:
+            stats = dashboard_service.get_dashboard_stats(test_db)
+
+        # Then
+        assert len(statements) == 1
+        assert stats.status_counts == {
+            "保護中": 1,
+            "譲渡可能": 1,
+            "治療中": 1,
+            "譲渡済み": 1,
+        }
+        assert stats.total_animals == 4
+        assert stats.count_for("保護中") == 1
+        assert stats.count_for("存在しないステータス") == 0
+        assert stats.today_logs_count == 1
+        assert stats.active_volunteers_count == 1
+
+    def test_cached_within_ttl(self, test_db: Session, query_counter: QueryCounter):
+        """正常系: 有効期間内の2回目以降はDBに問い合わせない"""
+        # Given
+        dashboard_service.get_dashboard_stats(test_db)
+
+        # When
+        with query_counter() as statements:
+            dashboard_service.get_dashboard_stats(test_db)
+
+        # Then
+        assert statements == []
+
+    def test_expires_after_ttl(
+        self,
+        test_db: Session,
+        query_counter: QueryCounter,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """正常系: 有効期間を過ぎると再集計する"""
+        # Given
+        monkeypatch.setattr(
+            dashboard_service.settings, "dashboard_stats_ttl_seconds", 30.0
+        )
+        now = 1000.0
+        monkeypatch.setattr(dashboard_service.time, "monotonic", lambda: now)
+        dashboard_service.get_dashboard_stats(test_db)
+        now += 31
+
+        # When
+        with query_counter() as statements:
+            dashboard_service.get_dashboard_stats(test_db)
+
+        # Then
+        assert len(statements) == 1
+
+
+class TestInvalidateDashboardStats:
+    """更新時のキャッシュ破棄のテスト"""
+
+    def test_invalidated_on_care_log_create(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """正常系: 世話記録を登録すると今日の記録数に反映される"""
+        # Given
+        assert dashboard_service.get_dashboard_stats(test_db).today_logs_count == 0
+
+        # When
+        care_log_service.create_care_log(
+            test_db,
+            CareLogCreate(
+                animal_id=test_animal.id,
+                recorder_name="記録者",
+                log_date=date.today(),
+                time_slot="evening",
+                appetite=3,
+                energy=3,
+            ),
+        )
+
+        # Then
+        assert dashboard_service.get_dashboard_stats(test_db).today_logs_count == 1
+
+    def test_invalidated_on_animal_update(
+        self, test_db: Session, test_animal: Animal, test_user: User
+    ):
+        """正常系: 猫のステータスを変更すると内訳に反映される"""
+        # Given
+        stats = dashboard_service.get_dashboard_stats(test_db)
+        assert stats.status_counts == {"保護中": 1}
+
+        # When
+        animal_service.update_animal(
+            test_db, test_animal.id, AnimalUpdate(status="譲渡可能"), test_user.id
+        )
+
+        # Then
+        stats = dashboard_service.get_dashboard_stats(test_db)
+        assert stats.status_counts == {"譲渡可能": 1}
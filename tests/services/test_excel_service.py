@@ -6,16 +6,23 @@ Requirements: Requirement 9, Requirement 25
 
 from __future__ import annotations
 
+import tempfile
 from datetime import date
+from io import BytesIO
 
+import pytest
 from openpyxl import load_workbook
 from sqlalchemy.orm import Session
 
 from app.models.animal import Animal
 from app.models.care_log import CareLog
 from app.services.excel_service import (
+    EXCEL_MAX_COLUMN_WIDTH,
+    EXCEL_MIN_COLUMN_WIDTH,
     generate_care_log_excel,
     generate_report_excel,
+    iter_spooled_file,
+    stream_report_excel,
 )
 
 
@@ -181,3 +188,104 @@ class TestGenerateReportExcel:
             generate_report_excel(
                 test_db, "individual", start_date, end_date, locale="ja"
             )
+
+
+class TestStreamReportExcel:
+    """書き込み専用モードのExcel生成のテスト"""
+
+    def test_stream_report_excel_matches_in_memory_values(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """正常系: 通常モードと同じ値・ヘッダースタイルで出力される"""
+        # Given
+        start_date = date(2024, 11, 1)
+        end_date = date(2024, 11, 30)
+        test_db.add_all(
+            [
+                CareLog(
+                    animal_id=test_animal.id,
+                    log_date=date(2024, 11, 15),
+                    time_slot=time_slot,
+                    recorder_name="テストユーザー",
+                    memo="メモ",
+                )
+                for time_slot in ("morning", "noon", "evening")
+            ]
+        )
+        test_db.commit()
+
+        # When
+        streamed = b"".join(
+            stream_report_excel(test_db, "daily", start_date, end_date, locale="ja")
+        )
+        in_memory = generate_report_excel(
+            test_db, "daily", start_date, end_date, locale="ja"
+        )
+
+        # Then
+        ws = load_workbook(BytesIO(streamed))["世話記録"]
+        expected = load_workbook(BytesIO(in_memory))["世話記録"]
+        assert ws.max_row == 4
+        assert list(ws.values) == list(expected.values)
+        assert ws["A1"].font.bold is True
+        assert ws["A1"].fill.start_color.rgb.endswith("4472C4")
+        assert ws["E2"].alignment.horizontal == "center"
+        assert ws.freeze_panes == "A2"
+
+    def test_stream_report_excel_column_widths_from_sample(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """正常系: 列幅はサンプル行から算出され上限で丸められる"""
+        # Given
+        test_db.add(
+            CareLog(
+                animal_id=test_animal.id,
+                log_date=date(2024, 11, 15),
+                time_slot="morning",
+                recorder_name="テストユーザー",
+                memo="長いメモ" * 50,
+            )
+        )
+        test_db.commit()
+
+        # When
+        ws = load_workbook(
+            BytesIO(
+                b"".join(
+                    stream_report_excel(
+                        test_db, "daily", date(2024, 11, 1), date(2024, 11, 30)
+                    )
+                )
+            )
+        )["世話記録"]
+
+        # Then
+        assert ws.column_dimensions["L"].width == EXCEL_MAX_COLUMN_WIDTH
+        assert ws.column_dimensions["F"].width >= EXCEL_MIN_COLUMN_WIDTH
+
+    def test_stream_report_excel_medical_summary(self, test_db: Session):
+        """正常系: 診療記録（利益計算用）も書き込み専用モードで生成できる"""
+        chunks = stream_report_excel(
+            test_db, "medical_summary", date(2024, 11, 1), date(2024, 11, 30)
+        )
+
+        wb = load_workbook(BytesIO(b"".join(chunks)))
+        assert "診療記録" in wb.sheetnames
+
+    def test_stream_report_excel_invalid_type(self, test_db: Session):
+        """異常系: 不正な帳票種別はストリーム開始前に例外発生"""
+        with pytest.raises(ValueError):
+            stream_report_excel(
+                test_db, "invalid", date(2024, 11, 1), date(2024, 11, 30)
+            )
+
+    def test_iter_spooled_file_closes_after_read(self):
+        """正常系: 一時ファイルは読み終えるとクローズされる"""
+        with tempfile.TemporaryFile() as spool:
+            spool.write(b"x" * 10)
+            spool.seek(0)
+
+            chunks = list(iter_spooled_file(spool, chunk_size=4))
+
+            assert chunks == [b"xxxx", b"xxxx", b"xx"]
+            assert spool.closed
@@ -22,6 +22,7 @@ from starlette.datastructures import Headers
 from app.models.animal import Animal
 from app.models.animal_image import AnimalImage
 from app.models.setting import Setting
+from app.schemas.animal_image import AnimalImageResponse
 from app.services import image_service
 
 
@@ -231,6 +232,115 @@ class TestUploadImage:
         assert "上限" in exc_info.value.detail
 
 
+class TestImageVariants:
+    """派生画像（サムネイル等）のテスト"""
+
+    @pytest.fixture
+    def media_base_dir(self, isolated_media_dir: Path) -> Path:
+        """画像の保存先（conftest でテストごとの一時ディレクトリに隔離済み）"""
+        return isolated_media_dir
+
+    def test_upload_generates_thumbnail(
+        self,
+        test_db: Session,
+        test_animal: Animal,
+        mock_image_file: UploadFile,
+        media_base_dir: Path,
+    ):
+        """正常系: アップロード後にサムネイルが生成され、レスポンスで参照できる"""
+        # When
+        result = image_service.upload_image(
+            db=test_db, animal_id=test_animal.id, file=mock_image_file
+        )
+        response = AnimalImageResponse.model_validate(result)
+
+        # Then
+        stem = Path(result.image_path).stem
+        assert response.thumbnail_path.endswith(f"{stem}_thumb.jpg")
+        assert response.thumbnail_webp_path.endswith(f"{stem}_thumb.webp")
+        assert response.large_path.endswith(f"{stem}_large.jpg")
+        assert (media_base_dir / response.thumbnail_path).exists()
+
+    def test_first_upload_sets_large_variant_as_profile_photo(
+        self,
+        test_db: Session,
+        test_animal: Animal,
+        mock_image_file: UploadFile,
+        media_base_dir: Path,
+    ):
+        """正常系: 最初の画像はプロフィール画像になり、大サイズの派生画像を指す"""
+        # Given
+        test_animal.photo = None
+        test_db.commit()
+
+        # When
+        image = image_service.upload_image(
+            db=test_db, animal_id=test_animal.id, file=mock_image_file
+        )
+
+        # Then
+        test_db.refresh(test_animal)
+        stem = Path(image.image_path).stem
+        assert test_animal.photo == f"animals/{test_animal.id}/gallery/{stem}_large.jpg"
+        assert (media_base_dir / test_animal.photo).exists()
+
+    def test_set_as_profile_points_to_large_variant(
+        self,
+        test_db: Session,
+        test_animal: Animal,
+        mock_image_file: UploadFile,
+        media_base_dir: Path,
+    ):
+        """正常系: プロフィール画像に設定した画像は大サイズの派生画像を指す"""
+        # Given
+        test_animal.photo = "/media/animals/1/old.png"
+        test_db.commit()
+
+        # When
+        image = image_service.upload_image(
+            db=test_db,
+            animal_id=test_animal.id,
+            file=mock_image_file,
+            set_as_profile=True,
+        )
+
+        # Then
+        test_db.refresh(test_animal)
+        stem = Path(image.image_path).stem
+        assert test_animal.photo == (
+            f"/media/animals/{test_animal.id}/gallery/{stem}_large.jpg"
+        )
+
+    def test_profile_photo_falls_back_until_large_variant_exists(
+        self, media_base_dir: Path
+    ):
+        """正常系: 大サイズの派生画像の生成前は元画像のパスを使う"""
+        assert (
+            image_service.profile_photo_path("/media/animals/1/gallery/abc.png")
+            == "/media/animals/1/gallery/abc.png"
+        )
+
+    def test_delete_removes_variants(
+        self,
+        test_db: Session,
+        test_animal: Animal,
+        mock_image_file: UploadFile,
+        media_base_dir: Path,
+    ):
+        """正常系: 画像を削除すると派生画像も削除される"""
+        # Given
+        image = image_service.upload_image(
+            db=test_db, animal_id=test_animal.id, file=mock_image_file
+        )
+        gallery_dir = (media_base_dir / image.image_path).parent
+
+        # When
+        image_service.delete_image(test_db, image.id)
+
+        # Then
+        assert list(gallery_dir.iterdir()) == []
+
+
 class TestListImages:
     """画像一覧取得のテスト"""
 
@@ -0,0 +1,234 @@
+"""
+PDF生成ジョブサービスのテスト
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.models.animal import Animal
+from app.models.pdf_job import PDFJob
+from app.schemas.pdf_job import PDFJobCreate
+from app.services import pdf_job_service, pdf_service
+from app.utils.pdf_renderer import PDFRenderBusyError
+from app.utils.timezone import get_jst_now
+
+
+class TestSubmitPDFJob:
+    """ジョブ投入のテスト"""
+
+    def test_submit_qr_card_grid_job(
+        self, test_db: Session, test_animals_bulk: list[Animal]
+    ):
+        """正常系: 10枚を超える面付けQRカードのジョブを投入できる"""
+        # Given
+        animal_ids = [animal.id for animal in test_animals_bulk]
+        job_data = PDFJobCreate(kind="qr_card_grid", animal_ids=animal_ids)
+
+        # When
+        job = pdf_job_service.submit_pdf_job(test_db, job_data)
+
+        # Then
+        assert job.status == "queued"
+        assert len(job.id) == 32
+        assert json.loads(job.params)["animal_ids"] == animal_ids
+
+    def test_submit_job_with_nonexistent_animal(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """異常系: 存在しない猫を含むジョブは投入時に404"""
+        # Given
+        job_data = PDFJobCreate(kind="qr_card_grid", animal_ids=[test_animal.id, 99999])
+
+        # When/Then
+        with pytest.raises(HTTPException) as exc_info:
+            pdf_job_service.submit_pdf_job(test_db, job_data)
+        assert exc_info.value.status_code == 404
+        assert test_db.query(PDFJob).count() == 0
+
+    def test_submit_report_job_with_invalid_type(self, test_db: Session):
+        """異常系: 不正な帳票種別のジョブは投入時に400"""
+        # Given
+        job_data = PDFJobCreate(
+            kind="report",
+            report_type="yearly",
+            start_date=date(2024, 11, 1),
+            end_date=date(2024, 11, 30),
+        )
+
+        # When/Then
+        with pytest.raises(HTTPException) as exc_info:
+            pdf_job_service.submit_pdf_job(test_db, job_data)
+        assert exc_info.value.status_code == 400
+
+    def test_missing_required_fields(self):
+        """異常系: PDF種別ごとの必須項目がない場合はバリデーションエラー"""
+        with pytest.raises(ValueError, match="animal_ids"):
+            PDFJobCreate(kind="qr_card_grid")
+
+
+class TestProcessPDFJob:
+    """ジョブ処理のテスト"""
+
+    def test_process_qr_card_grid_job(
+        self, test_db: Session, test_animals_bulk: list[Animal], pdf_job_dir: Path
+    ):
+        """正常系: ジョブを処理するとPDFが保存され完了状態になる"""
+        # Given
+        animal_ids = [animal.id for animal in test_animals_bulk]
+        job = pdf_job_service.submit_pdf_job(
+            test_db, PDFJobCreate(kind="qr_card_grid", animal_ids=animal_ids)
+        )
+
+        # When
+        processed = pdf_job_service.process_next_pdf_job(test_db)
+
+        # Then
+        assert processed is not None
+        assert processed.id == job.id
+        assert processed.status == "completed"
+        assert processed.started_at is not None
+        assert processed.finished_at is not None
+        _, result_path = pdf_job_service.get_pdf_job_result(test_db, job.id)
+        assert result_path.parent == pdf_job_dir
+        assert result_path.read_bytes().startswith(b"%PDF")
+
+    def test_process_returns_none_without_queued_jobs(self, test_db: Session):
+        """正常系: 待機中のジョブがなければNone"""
+        assert pdf_job_service.process_next_pdf_job(test_db) is None
+
+    def test_jobs_are_processed_in_submission_order(
+        self, test_db: Session, test_animals_bulk: list[Animal], pdf_job_dir: Path
+    ):
+        """正常系: 先に投入したジョブから処理される"""
+        # Given
+        first = pdf_job_service.submit_pdf_job(
+            test_db, PDFJobCreate(kind="qr_card", animal_id=test_animals_bulk[0].id)
+        )
+        second = pdf_job_service.submit_pdf_job(
+            test_db, PDFJobCreate(kind="qr_card", animal_id=test_animals_bulk[1].id)
+        )
+
+        # When/Then
+        assert pdf_job_service.process_next_pdf_job(test_db).id == first.id
+        assert pdf_job_service.process_next_pdf_job(test_db).id == second.id
+
+    def test_failed_job_records_error(
+        self, test_db: Session, test_animal: Animal, pdf_job_dir: Path
+    ):
+        """異常系: 投入後に猫が削除された場合はジョブが失敗状態になる"""
+        # Given
+        job = pdf_job_service.submit_pdf_job(
+            test_db, PDFJobCreate(kind="qr_card", animal_id=test_animal.id)
+        )
+        test_db.delete(test_animal)
+        test_db.commit()
+
+        # When
+        processed = pdf_job_service.process_next_pdf_job(test_db)
+
+        # Then
+        assert processed.status == "failed"
+        assert "見つかりません" in processed.error
+        with pytest.raises(HTTPException) as exc_info:
+            pdf_job_service.get_pdf_job_result(test_db, job.id)
+        assert exc_info.value.status_code == 409
+
+    def test_busy_render_pool_requeues_job(
+        self,
+        test_db: Session,
+        test_animal: Animal,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """正常系: 描画プールが混雑している場合はジョブを待機中に戻す"""
+
+        # Given
+        def _busy(*args: object, **kwargs: object) -> bytes:
+            raise PDFRenderBusyError("busy")
+
+        monkeypatch.setattr(pdf_service, "render_pdf_blocking", _busy)
+        job = pdf_job_service.submit_pdf_job(
+            test_db, PDFJobCreate(kind="qr_card", animal_id=test_animal.id)
+        )
+
+        # When
+        pdf_job_service.process_next_pdf_job(test_db)
+
+        # Then
+        test_db.refresh(job)
+        assert job.status == "queued"
+        assert job.started_at is None
+
+
+class TestPDFJobMaintenance:
+    """ジョブの再投入・削除のテスト"""
+
+    def test_requeue_interrupted_jobs(self, test_db: Session, test_animal: Animal):
+        """正常系: 処理中のまま停止したジョブを待機中に戻す"""
+        # Given
+        job = pdf_job_service.submit_pdf_job(
+            test_db, PDFJobCreate(kind="qr_card", animal_id=test_animal.id)
+        )
+        pdf_job_service.claim_next_pdf_job(test_db)
+
+        # When
+        count = pdf_job_service.requeue_interrupted_pdf_jobs(
+            test_db,
+            now=get_jst_now()
+            + timedelta(seconds=pdf_job_service.settings.pdf_job_lease_seconds + 1),
+        )
+
+        # Then
+        test_db.refresh(job)
+        assert count == 1
+        assert job.status == "queued"
+        assert job.started_at is None
+
+    def test_requeue_keeps_jobs_within_lease(
+        self, test_db: Session, test_animal: Animal
+    ):
+        """正常系: リース時間内の処理中ジョブ（他のプロセスが処理中）は戻さない"""
+        # Given
+        job = pdf_job_service.submit_pdf_job(
+            test_db, PDFJobCreate(kind="qr_card", animal_id=test_animal.id)
+        )
+        pdf_job_service.claim_next_pdf_job(test_db)
+
+        # When
+        count = pdf_job_service.requeue_interrupted_pdf_jobs(test_db)
+
+        # Then
+        test_db.refresh(job)
+        assert count == 0
+        assert job.status == "running"
+        assert job.started_at is not None
+
+    def test_purge_expired_jobs(
+        self, test_db: Session, test_animal: Animal, pdf_job_dir: Path
+    ):
+        """正常系: 保持期間を過ぎたジョブと出力ファイルを削除"""
+        # Given
+        job = pdf_job_service.submit_pdf_job(
+            test_db, PDFJobCreate(kind="qr_card", animal_id=test_animal.id)
+        )
+        pdf_job_service.process_next_pdf_job(test_db)
+        result_path = Path(job.result_path)
+        assert result_path.exists()
+
+        # When
+        not_expired = pdf_job_service.purge_expired_pdf_jobs(test_db)
+        expired = pdf_job_service.purge_expired_pdf_jobs(
+            test_db, now=get_jst_now() + timedelta(days=2)
+        )
+
+        # Then
+        assert not_expired == 0
+        assert expired == 1
+        assert not result_path.exists()
+        assert test_db.query(PDFJob).count() == 0
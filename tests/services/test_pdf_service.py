@@ -6,11 +6,17 @@ Requirements: Requirement 2, Requirement 7, Requirement 9, Requirement 28.3
 
 from __future__ import annotations
 
+import base64
+from pathlib import Path
+
 import pytest
 from sqlalchemy.orm import Session
 
 from app.models.animal import Animal
-from app.services import pdf_service
+from app.models.user import User
+from app.schemas.animal import AnimalUpdate
+from app.services import animal_service, pdf_service
+from app.utils.pdf_cache import PDFRenderCache
 
 
 def _extract_pdf_text(pdf_bytes: bytes) -> str:
@@ -56,6 +62,32 @@ class TestGenerateQRCardPDF:
                 base_url="https://test.example.com",
             )
 
+    def test_prepare_qr_card_pdf_embeds_large_variant(
+        self,
+        test_db: Session,
+        test_animal: Animal,
+        isolated_media_dir: Path,
+    ):
+        """正常系: 写真は元画像ではなく大サイズの派生画像を埋め込む"""
+        # Given
+        gallery_dir = isolated_media_dir / "animals" / "1" / "gallery"
+        gallery_dir.mkdir(parents=True)
+        (gallery_dir / "abc.png").write_bytes(b"original")
+        (gallery_dir / "abc_large.jpg").write_bytes(b"large")
+        test_animal.photo = "/media/animals/1/gallery/abc.png"
+        test_db.commit()
+
+        # When
+        job = pdf_service.prepare_qr_card_pdf(
+            db=test_db, animal_id=test_animal.id, base_url="https://test.example.com"
+        )
+
+        # Then
+        assert f"data:image/jpeg;base64,{base64.b64encode(b'large').decode()}" in (
+            job.html
+        )
+        assert base64.b64encode(b"original").decode() not in job.html
+
     def test_generate_qr_card_pdf_with_japanese_locale(
         self, test_db: Session, test_animal: Animal
     ):
@@ -149,6 +181,23 @@ class TestGenerateQRCardGridPDF:
                 base_url="https://test.example.com",
             )
 
+    def test_prepare_qr_card_pages_pdf_splits_into_a4_pages(
+        self, test_db: Session, test_animals_bulk: list[Animal]
+    ):
+        """正常系: 10枚を超えるQRカードは10枚ごとにA4ページを分ける"""
+        # Given
+        animal_ids = [animal.id for animal in test_animals_bulk]
+
+        # When
+        job = pdf_service.prepare_qr_card_pages_pdf(
+            db=test_db, animal_ids=animal_ids, base_url="https://test.example.com"
+        )
+
+        # Then
+        assert job.html.count('class="grid"') == 2
+        assert job.html.count("break-after: page") == 1
+        assert job.cache_key is None
+
     def test_generate_qr_card_grid_pdf_nonexistent_animal(self, test_db: Session):
         """異常系: 存在しない猫IDでエラー"""
         # When/Then
@@ -267,6 +316,77 @@ class TestGeneratePaperFormPDF:
             )
 
 
+class TestPDFRenderCache:
+    """PDFキャッシュのテスト"""
+
+    def test_second_qr_card_request_is_served_from_cache(
+        self,
+        test_db: Session,
+        test_animal: Animal,
+        isolated_pdf_cache: PDFRenderCache,
+    ):
+        """正常系: 同じ入力の2回目は再生成せずキャッシュから返す"""
+        # When
+        first = pdf_service.generate_qr_card_pdf(
+            db=test_db, animal_id=test_animal.id, base_url="https://test.example.com"
+        )
+        second = pdf_service.generate_qr_card_pdf(
+            db=test_db, animal_id=test_animal.id, base_url="https://test.example.com"
+        )
+
+        # Then
+        assert second == first
+        stats = isolated_pdf_cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_different_locale_is_cached_separately(
+        self,
+        test_db: Session,
+        test_animal: Animal,
+        isolated_pdf_cache: PDFRenderCache,
+    ):
+        """正常系: ロケールが異なる場合は別エントリとして生成する"""
+        # When
+        for locale in ("ja", "en"):
+            pdf_service.generate_qr_card_pdf(
+                db=test_db,
+                animal_id=test_animal.id,
+                base_url="https://test.example.com",
+                locale=locale,
+            )
+
+        # Then
+        stats = isolated_pdf_cache.stats()
+        assert stats["hits"] == 0
+        assert stats["entries"] == 2
+
+    def test_update_animal_invalidates_cached_pdfs(
+        self,
+        test_db: Session,
+        test_animal: Animal,
+        test_user: User,
+        isolated_pdf_cache: PDFRenderCache,
+    ):
+        """正常系: 猫情報の更新でその猫のキャッシュが削除される"""
+        # Given
+        pdf_service.generate_qr_card_pdf(
+            db=test_db, animal_id=test_animal.id, base_url="https://test.example.com"
+        )
+        pdf_service.generate_paper_form_pdf(
+            db=test_db, animal_id=test_animal.id, year=2024, month=11
+        )
+        assert isolated_pdf_cache.stats()["entries"] == 2
+
+        # When
+        animal_service.update_animal(
+            test_db, test_animal.id, AnimalUpdate(name="更新猫"), test_user.id
+        )
+
+        # Then
+        assert isolated_pdf_cache.stats()["entries"] == 0
+
+
 class TestGenerateMedicalDetailPDF:
     """診療明細PDF生成のテスト"""
 
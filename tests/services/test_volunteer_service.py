@@ -230,13 +230,13 @@ class TestGetActivityHistory:
     ) -> None:
         """正常系: 記録がある場合の活動履歴を取得できる"""
         # Given: 3件の世話記録を作成
-        for _i in range(3):
+        for time_slot in ("morning", "noon", "evening"):
             care_log = CareLog(
                 log_date=date.today(),
                 animal_id=test_animal.id,
                 recorder_id=test_volunteer.id,
                 recorder_name=test_volunteer.name,
-                time_slot="morning",
+                time_slot=time_slot,
                 appetite=5,
                 energy=5,
             )
@@ -0,0 +1,217 @@
+"""
+データベース接続（SQLite性能プロファイル）のテスト
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi import APIRouter
+from fastapi.routing import APIRoute
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.api.v1 import care_logs, pdf, reports
+from app.config import get_settings
+from app.database import (
+    WalCheckpointScheduler,
+    create_read_engine,
+    get_db,
+    get_read_db,
+    install_sqlite_pragmas,
+    sqlite_pragma_statements,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "necokeeper.db"
+
+
+@pytest.fixture
+def tuned_engine(db_path: Path) -> Iterator[Engine]:
+    """性能プロファイルを適用したファイルDBのエンジン"""
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    install_sqlite_pragmas(engine, sqlite_pragma_statements(get_settings()))
+    yield engine
+    engine.dispose()
+
+
+def _pragma(engine: Engine, name: str) -> object:
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+class TestSqlitePragmas:
+    """接続時のPRAGMA適用のテスト"""
+
+    def test_default_profile_is_applied_on_connect(self, tuned_engine: Engine):
+        """正常系: 既定の性能プロファイルが接続ごとに適用される"""
+        settings = get_settings()
+
+        assert _pragma(tuned_engine, "journal_mode") == "wal"
+        assert _pragma(tuned_engine, "synchronous") == 1  # NORMAL
+        assert _pragma(tuned_engine, "busy_timeout") == settings.sqlite_busy_timeout_ms
+        assert _pragma(tuned_engine, "cache_size") == -(
+            settings.sqlite_cache_size_mb * 1024
+        )
+        assert _pragma(tuned_engine, "temp_store") == 2  # MEMORY
+        assert _pragma(tuned_engine, "foreign_keys") == 1
+
+    def test_profile_follows_settings(self, db_path: Path):
+        """正常系: 設定値に応じたPRAGMAを生成する"""
+        # Given
+        settings = get_settings().model_copy(
+            update={
+                "sqlite_journal_mode": "DELETE",
+                "sqlite_synchronous": "FULL",
+                "sqlite_temp_store_memory": False,
+                "sqlite_foreign_keys": False,
+                "sqlite_mmap_size_mb": 0,
+            }
+        )
+        engine = create_engine(f"sqlite:///{db_path}")
+
+        # When
+        install_sqlite_pragmas(engine, sqlite_pragma_statements(settings))
+
+        # Then
+        assert _pragma(engine, "journal_mode") == "delete"
+        assert _pragma(engine, "synchronous") == 2  # FULL
+        assert _pragma(engine, "temp_store") == 0  # DEFAULT
+        assert _pragma(engine, "foreign_keys") == 0
+        assert _pragma(engine, "mmap_size") == 0
+        engine.dispose()
+
+    def test_foreign_key_cascade_is_enforced(self, tuned_engine: Engine):
+        """正常系: 外部キーのON DELETE CASCADEが有効になる"""
+        # Given
+        with tuned_engine.begin() as conn:
+            conn.execute(text("CREATE TABLE parent (id INTEGER PRIMARY KEY)"))
+            conn.execute(
+                text(
+                    "CREATE TABLE child (id INTEGER PRIMARY KEY, parent_id INTEGER "
+                    "REFERENCES parent(id) ON DELETE CASCADE)"
+                )
+            )
+            conn.execute(text("INSERT INTO parent (id) VALUES (1)"))
+            conn.execute(text("INSERT INTO child (id, parent_id) VALUES (1, 1)"))
+
+        # When
+        with tuned_engine.begin() as conn:
+            conn.execute(text("DELETE FROM parent WHERE id = 1"))
+
+        # Then
+        with tuned_engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM child")).scalar() == 0
+
+
+class TestWalCheckpointScheduler:
+    """WAL定期チェックポイントのテスト"""
+
+    def _write_rows(self, engine: Engine) -> None:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE IF NOT EXISTS t (v TEXT)"))
+            conn.execute(
+                text("INSERT INTO t (v) VALUES (:v)"),
+                [{"v": "x" * 1000} for _ in range(200)],
+            )
+
+    def test_truncate_checkpoint_empties_wal(self, tuned_engine: Engine, db_path: Path):
+        """正常系: TRUNCATEモードでWALを本体に反映し、WALファイルを切り詰める"""
+        # Given
+        self._write_rows(tuned_engine)
+        wal_path = db_path.with_name(db_path.name + "-wal")
+        assert wal_path.stat().st_size > 0
+
+        # When
+        busy, log_pages, checkpointed = WalCheckpointScheduler(
+            tuned_engine, interval=60, mode="TRUNCATE"
+        ).checkpoint()
+
+        # Then
+        assert busy == 0
+        assert log_pages == checkpointed
+        assert wal_path.stat().st_size == 0
+
+    def test_runs_periodically_until_stopped(self, tuned_engine: Engine, db_path: Path):
+        """正常系: 起動中は一定間隔でチェックポイントを実行し、停止できる"""
+        # Given
+        scheduler = WalCheckpointScheduler(tuned_engine, interval=0.05, mode="TRUNCATE")
+        wal_path = db_path.with_name(db_path.name + "-wal")
+        self._write_rows(tuned_engine)
+
+        # When
+        scheduler.start()
+        deadline = time.monotonic() + 5
+        while wal_path.stat().st_size > 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        scheduler.stop()
+
+        # Then
+        assert wal_path.stat().st_size == 0
+        assert scheduler._thread is None
+
+
+class TestReadEngine:
+    """帳票・エクスポート用の読み取り専用エンジンのテスト"""
+
+    def test_reads_primary_file_without_writing(self, tuned_engine: Engine):
+        """正常系: 主DBの更新を参照でき、書き込みは拒否される"""
+        # Given
+        read_engine = create_read_engine(tuned_engine, get_settings())
+        with tuned_engine.begin() as conn:
+            conn.execute(text("CREATE TABLE t (v INTEGER)"))
+            conn.execute(text("INSERT INTO t (v) VALUES (1)"))
+
+        # When/Then
+        with read_engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM t")).scalar() == 1
+            with pytest.raises(OperationalError, match="readonly"):
+                conn.execute(text("INSERT INTO t (v) VALUES (2)"))
+        assert read_engine is not tuned_engine
+        read_engine.dispose()
+
+    def test_read_url_setting(self, tuned_engine: Engine, tmp_path: Path):
+        """正常系: 読み取り専用の接続先が指定されていればそちらを使う"""
+        # Given
+        replica = tmp_path / "replica.db"
+        settings = get_settings().model_copy(
+            update={"database_read_url": f"sqlite:///{replica}"}
+        )
+
+        # When
+        read_engine = create_read_engine(tuned_engine, settings)
+
+        # Then
+        assert read_engine.url.database == str(replica)
+        read_engine.dispose()
+
+    def test_in_memory_database_shares_primary_engine(self):
+        """正常系: インメモリDBでは別の接続が別のDBになるため主DBのエンジンを使う"""
+        primary = create_engine("sqlite:///:memory:")
+
+        assert create_read_engine(primary, get_settings()) is primary
+
+    @pytest.mark.parametrize(
+        ("router", "path"),
+        [
+            (reports.router, "/reports/export"),
+            (pdf.router, "/pdf/report"),
+            (care_logs.router, "/care-logs/export"),
+        ],
+    )
+    def test_reporting_routes_use_read_db(self, router: APIRouter, path: str):
+        """正常系: 帳票・エクスポートのエンドポイントは読み取り専用セッションを使う"""
+        route = next(
+            r for r in router.routes if isinstance(r, APIRoute) and r.path == path
+        )
+        dependencies = {d.call for d in route.dependant.dependencies}
+
+        assert get_read_db in dependencies
+        assert get_db not in dependencies
@@ -0,0 +1,157 @@
+"""
+起動時のインポート時間のテスト
+
+`python -X importtime` で FastAPI・SQLAlchemy を読み込んだ後に app.main を
+インポートする処理を別プロセスで実行し、重い描画系ライブラリ（WeasyPrint・
+openpyxl・Pillow・qrcode）を起動時に読み込んでいないこと、アプリケーション自身の
+インポート時間が同じプロセスで計測したフレームワークのインポート時間に比べて
+一定の倍率に収まることを確認します（実行環境の速さに依存しない比較）。
+
+絶対時間の予算（ミリ秒）は、環境変数 NECOKEEPER_IMPORT_TIME_BUDGET_MS を
+設定した場合のみ確認します（ベンチマーク用の環境向け）。
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 先に読み込み、app.main の計測から除くフレームワーク（比較の基準）
+FRAMEWORK_MODULES = ("fastapi", "sqlalchemy")
+
+# app.main 自身のインポート時間の上限（フレームワークのインポート時間に対する倍率）
+IMPORT_TIME_RATIO_BUDGET = 2.0
+
+# app.main のインポート時間の予算（ミリ秒、-X importtime の計測値、未設定なら確認しない）
+IMPORT_TIME_BUDGET_MS = os.environ.get("NECOKEEPER_IMPORT_TIME_BUDGET_MS")
+
+# 初回利用時にインポートするライブラリ
+LAZY_MODULES = ("weasyprint", "openpyxl", "PIL", "qrcode")
+
+# 計測回数（最小値で判定し、ばらつきの影響を減らす）
+MEASURE_RUNS = 3
+
+
+def run_importtime(
+    module: str = "app.main", preload: tuple[str, ...] = FRAMEWORK_MODULES
+) -> dict[str, int]:
+    """
+    別プロセスで -X importtime を実行し、モジュールごとの累積時間を返す
+
+    preload のモジュールを先にインポートするため、module の累積時間には
+    それらのインポート時間が含まれません。
+
+    Returns:
+        dict[str, int]: モジュール名 → 累積インポート時間（マイクロ秒）
+    """
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")])
+    )
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import {', '.join(preload)}; import {module}"
+            if preload
+            else f"import {module}",
+        ],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if cumulative_us.strip().isdigit():
+            cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+
+@pytest.fixture(scope="module")
+def import_times() -> list[dict[str, int]]:
+    """app.main のインポート時間（複数回分）"""
+    return [run_importtime() for _ in range(MEASURE_RUNS)]
+
+
+class TestStartupImportTime:
+    """起動時のインポート時間のテスト"""
+
+    def test_heavy_libraries_are_not_imported_at_startup(
+        self, import_times: list[dict[str, int]]
+    ):
+        """性能: 起動時に重い描画系ライブラリを読み込まない"""
+        # Given
+        modules = import_times[0]
+
+        # When
+        imported = [name for name in modules if name.split(".")[0] in LAZY_MODULES]
+
+        # Then
+        assert imported == []
+
+    def test_startup_within_framework_ratio(self, import_times: list[dict[str, int]]):
+        """性能: app.main 自身のインポート時間がフレームワークの一定倍率に収まる"""
+        # Given
+        best = min(import_times, key=lambda modules: modules["app.main"])
+
+        # When
+        app_ms = best["app.main"] / 1000
+        framework_ms = sum(best[name] for name in FRAMEWORK_MODULES) / 1000
+
+        # Then
+        assert app_ms <= framework_ms * IMPORT_TIME_RATIO_BUDGET, (
+            f"app.main のインポートに {app_ms:.0f} ms かかりました"
+            f"（{', '.join(FRAMEWORK_MODULES)} は {framework_ms:.0f} ms、"
+            f"上限は {IMPORT_TIME_RATIO_BUDGET} 倍）\n{_slowest_report(best)}"
+        )
+
+    @pytest.mark.skipif(
+        IMPORT_TIME_BUDGET_MS is None,
+        reason="NECOKEEPER_IMPORT_TIME_BUDGET_MS が未設定です",
+    )
+    def test_startup_within_budget(self):
+        """性能: フレームワークを含む app.main のインポート時間が予算内に収まる"""
+        # Given
+        assert IMPORT_TIME_BUDGET_MS is not None
+        budget_ms = float(IMPORT_TIME_BUDGET_MS)
+
+        # When
+        best = min(
+            (run_importtime(preload=()) for _ in range(MEASURE_RUNS)),
+            key=lambda modules: modules["app.main"],
+        )
+        elapsed_ms = best["app.main"] / 1000
+
+        # Then
+        assert elapsed_ms <= budget_ms, (
+            f"app.main のインポートに {elapsed_ms:.0f} ms かかりました"
+            f"（予算 {budget_ms:.0f} ms）\n{_slowest_report(best)}"
+        )
+
+
+def _slowest_report(modules: dict[str, int]) -> str:
+    """インポートに時間のかかった app 配下のモジュール（上位10件）"""
+    slowest = sorted(
+        (
+            (us, name)
+            for name, us in modules.items()
+            if name.startswith("app.") and name != "app.main"
+        ),
+        reverse=True,
+    )[:10]
+    return "\n".join(f"  {us / 1000:8.1f} ms  {name}" for us, name in slowest)
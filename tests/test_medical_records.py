@@ -14,6 +14,7 @@ from fastapi import status
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.models.medical_action import MedicalAction
 from app.schemas.medical_record import MedicalRecordCreate, MedicalRecordUpdate
 from app.services import medical_record_service
 
@@ -168,6 +169,132 @@ class TestMedicalRecordService:
         assert result.comment == "体重が増加しました"
         assert result.last_updated_by == test_vet_user.id
 
+    def test_get_medical_record_includes_relation_fields(
+        self, test_db: Session, test_animal, test_vet_user
+    ):
+        """猫名・獣医師名・診療行為名・単位・請求価格を含めて取得できる"""
+        # Given
+        action = MedicalAction(
+            name="ワクチン",
+            valid_from=date(2024, 1, 1),
+            valid_to=None,
+            cost_price=Decimal("1000"),
+            selling_price=Decimal("3000"),
+            procedure_fee=Decimal("500"),
+            currency="JPY",
+            unit="回",
+        )
+        test_db.add(action)
+        test_db.commit()
+        created = medical_record_service.create_medical_record(
+            test_db,
+            MedicalRecordCreate(
+                animal_id=test_animal.id,
+                vet_id=test_vet_user.id,
+                date=date(2025, 11, 15),
+                symptoms="ワクチン接種",
+                medical_action_id=action.id,
+                dosage=2,
+            ),
+        )
+
+        # When
+        result = medical_record_service.get_medical_record(test_db, created.id)
+
+        # Then
+        assert result.animal_name == test_animal.name
+        assert result.vet_name == test_vet_user.name
+        assert result.medical_action_name == "ワクチン"
+        assert result.dosage_unit == "回"
+        assert result.billing_amount == action.calculate_total_price(2)
+
+    def test_list_medical_records_query_count_is_constant(
+        self, test_db: Session, test_animal, test_vet_user, query_counter
+    ):
+        """性能: page_sizeが増えても発行クエリ数は一定"""
+        # Given
+        action = MedicalAction(
+            name="投薬",
+            valid_from=date(2024, 1, 1),
+            cost_price=Decimal("100"),
+            selling_price=Decimal("300"),
+            procedure_fee=Decimal("0"),
+            currency="JPY",
+            unit="錠",
+        )
+        test_db.add(action)
+        test_db.commit()
+        for i in range(30):
+            medical_record_service.create_medical_record(
+                test_db,
+                MedicalRecordCreate(
+                    animal_id=test_animal.id,
+                    vet_id=test_vet_user.id,
+                    date=date(2025, 11, 1 + i % 28),
+                    symptoms=f"症状{i}",
+                    medical_action_id=action.id if i % 2 == 0 else None,
+                ),
+            )
+
+        # When
+        with query_counter() as small:
+            small_result = medical_record_service.list_medical_records(
+                test_db, page_size=2
+            )
+        with query_counter() as large:
+            large_result = medical_record_service.list_medical_records(
+                test_db, page_size=30
+            )
+
+        # Then
+        assert len(small_result.items) == 2
+        assert len(large_result.items) == 30
+        assert all(item.animal_name == test_animal.name for item in large_result.items)
+        assert all(item.vet_name == test_vet_user.name for item in large_result.items)
+        assert {item.dosage_unit for item in large_result.items} == {"錠", None}
+        assert len(large) == len(small) == 2
+
+    def test_list_medical_records_with_cursor(
+        self, test_db: Session, test_animal, test_vet_user, query_counter
+    ):
+        """正常系: カーソル方式では同じ診療日の記録もIDで順序付けて重複なく取得できる"""
+        # Given
+        for i in range(10):
+            medical_record_service.create_medical_record(
+                test_db,
+                MedicalRecordCreate(
+                    animal_id=test_animal.id,
+                    vet_id=test_vet_user.id,
+                    date=date(2025, 11, 1 + i % 3),
+                    symptoms=f"症状{i}",
+                ),
+            )
+        expected = [
+            item.id
+            for item in medical_record_service.list_medical_records(
+                test_db, page_size=100
+            ).items
+        ]
+        first = medical_record_service.list_medical_records(test_db, page_size=4)
+        second = medical_record_service.list_medical_records(
+            test_db, page_size=4, cursor=first.next_cursor
+        )
+
+        # When
+        with query_counter() as statements:
+            third = medical_record_service.list_medical_records(
+                test_db, page_size=4, cursor=second.next_cursor
+            )
+
+        # Then
+        ids = [item.id for page in (first, second, third) for item in page.items]
+        assert ids == expected
+        assert third.next_cursor is None
+        assert third.total == 10
+        # 総件数はキャッシュを使うため、バージョン番号の確認と一覧の取得のみ
+        assert len(statements) == 2
+        assert not any("count(" in statement.lower() for statement in statements)
+
 
 class TestMedicalRecordAPI:
     """診療記録APIのテスト"""
@@ -0,0 +1,273 @@
+"""
+PostgreSQLバックエンドのテスト
+
+マイグレーションが生成するSQLにSQLite固有の構文が含まれないことを確認し、
+PostgreSQLを利用できる環境（tests/postgres.py 参照）では、一時的なデータベースに
+対してマイグレーションの適用・巻き戻しと世話記録の登録を実行します。
+"""
+
+from __future__ import annotations
+
+import io
+import re
+from collections.abc import Callable, Iterator
+from datetime import date
+from pathlib import Path
+
+import pytest
+from alembic.config import Config
+from sqlalchemy import Engine, QueuePool, create_engine, inspect
+from sqlalchemy.orm import Session
+
+from alembic import command
+from app.config import Settings, get_settings
+from app.database import Base, engine_options
+from app.models.animal import Animal
+from app.models.care_log import CareLog
+from app.schemas.care_log import CareLogCreate
+from app.services import care_log_service
+from app.utils.http_cache import (
+    RESOURCE_CARE_LOGS,
+    bump_resource_versions,
+    get_resource_version,
+)
+from tests.postgres import postgres_server, temporary_database, unavailable_reason
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# PostgreSQLでは実行できないSQLite固有の構文
+SQLITE_ONLY_SQL = re.compile(
+    r"\bdatetime\(|\bstrftime\(|\bjulianday\(|\bPRAGMA\b|\bAUTOINCREMENT\b"
+    r"|BOOLEAN DEFAULT [01]\b|\bDATETIME\b"
+)
+
+POSTGRES_UNAVAILABLE = unavailable_reason()
+requires_postgres = pytest.mark.skipif(
+    POSTGRES_UNAVAILABLE is not None, reason=POSTGRES_UNAVAILABLE or ""
+)
+
+
+def _alembic_config(buffer: io.StringIO | None = None) -> Config:
+    # alembic.ini を読み込むとログ設定が上書きされるため、設定ファイルは使わない
+    config = Config(output_buffer=buffer)
+    config.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
+    return config
+
+
+@pytest.fixture
+def use_database_url(monkeypatch: pytest.MonkeyPatch) -> Callable[[str], None]:
+    """alembic/env.py が参照する接続URLを差し替える"""
+
+    def _use(url: str) -> None:
+        monkeypatch.setattr(get_settings(), "database_url", url)
+
+    return _use
+
+
+@pytest.fixture(scope="module")
+def postgres_url() -> Iterator[str]:
+    """PostgreSQLサーバーの管理用データベースへの接続URL（モジュール内で共有）"""
+    with postgres_server() as url:
+        yield url
+
+
+@pytest.fixture
+def postgres_database(postgres_url: str) -> Iterator[str]:
+    """テストごとに作成する空のデータベースへの接続URL"""
+    with temporary_database(postgres_url) as url:
+        yield url
+
+
+@pytest.fixture
+def pg_engine(postgres_database: str) -> Iterator[Engine]:
+    """アプリケーションと同じ接続プール設定のエンジン（テーブル作成済み）"""
+    engine = create_engine(
+        postgres_database, **engine_options(postgres_database, get_settings())
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+class TestEngineOptions:
+    """接続先に応じたエンジン設定のテスト"""
+
+    def test_sqlite_shares_connections_across_threads(self):
+        """正常系: SQLiteでは接続プールの設定を適用しない"""
+        options = engine_options("sqlite:///./data/necokeeper.db", get_settings())
+
+        assert options["connect_args"] == {"check_same_thread": False}
+        assert "pool_size" not in options
+
+    def test_postgresql_uses_tuned_queue_pool(self):
+        """正常系: PostgreSQLでは設定値どおりのQueuePoolを使う"""
+        # Given
+        settings = get_settings().model_copy(
+            update={
+                "database_pool_size": 5,
+                "database_max_overflow": 7,
+                "database_pool_timeout_seconds": 3.0,
+                "database_pool_recycle_seconds": 600,
+            }
+        )
+
+        # When
+        options = engine_options("postgresql+psycopg://u:p@db/necokeeper", settings)
+
+        # Then
+        assert options["poolclass"] is QueuePool
+        assert options["pool_size"] == 5
+        assert options["max_overflow"] == 7
+        assert options["pool_timeout"] == 3.0
+        assert options["pool_recycle"] == 600
+        assert options["pool_pre_ping"] is True
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("postgres://u:p@db/neco", "postgresql+psycopg://u:p@db/neco"),
+            ("postgresql://u:p@db/neco", "postgresql+psycopg://u:p@db/neco"),
+            ("postgresql+psycopg://u:p@db/neco", "postgresql+psycopg://u:p@db/neco"),
+            ("sqlite:///./data/necokeeper.db", "sqlite:///./data/necokeeper.db"),
+        ],
+    )
+    def test_database_url_is_normalized(self, url: str, expected: str):
+        """正常系: PostgreSQLの接続URLはpsycopgドライバーの指定に正規化される"""
+        settings = Settings(database_url=url, database_read_url=url)
+
+        assert settings.database_url == expected
+        assert settings.database_read_url == expected
+
+
+def test_migrations_render_portable_sql(
+    use_database_url: Callable[[str], None],
+) -> None:
+    """正常系: PostgreSQL向けのマイグレーションSQLにSQLite固有の構文を含まない"""
+    # Given
+    use_database_url("postgresql+psycopg://u:p@localhost/necokeeper")
+    buffer = io.StringIO()
+
+    # When
+    command.upgrade(_alembic_config(buffer), "head", sql=True)
+
+    # Then
+    sql = buffer.getvalue()
+    assert "CREATE TABLE care_logs" in sql
+    assert SQLITE_ONLY_SQL.findall(sql) == []
+
+
+def test_downgrade_migrations_render_portable_sql(
+    use_database_url: Callable[[str], None],
+) -> None:
+    """正常系: PostgreSQL向けの巻き戻しSQLにもSQLite固有の構文を含まない"""
+    # Given
+    use_database_url("postgresql+psycopg://u:p@localhost/necokeeper")
+    buffer = io.StringIO()
+
+    # When
+    command.downgrade(_alembic_config(buffer), "head:base", sql=True)
+
+    # Then
+    sql = buffer.getvalue()
+    assert "DROP TABLE care_logs" in sql
+    assert SQLITE_ONLY_SQL.findall(sql) == []
+
+
+@requires_postgres
+class TestLivePostgres:
+    """一時的なPostgreSQLデータベースに対するテスト"""
+
+    def test_migrations_upgrade_and_downgrade(
+        self, postgres_database: str, use_database_url: Callable[[str], None]
+    ):
+        """正常系: 全マイグレーションを適用・巻き戻し・再適用できる"""
+        # Given
+        use_database_url(postgres_database)
+        config = _alembic_config()
+
+        # When
+        command.upgrade(config, "head")
+        command.downgrade(config, "base")
+        command.upgrade(config, "head")
+
+        # Then
+        engine = create_engine(postgres_database)
+        tables = set(inspect(engine).get_table_names())
+        engine.dispose()
+        assert {
+            "animals",
+            "care_logs",
+            "daily_care_statuses",
+            "pdf_jobs",
+            "resource_versions",
+        } <= tables
+
+    def test_care_log_upsert(self, pg_engine: Engine):
+        """正常系: 同じ猫・日付・時点の登録はON CONFLICTで更新される"""
+        # Given
+        with Session(pg_engine) as db:
+            animal = Animal(
+                name="たま",
+                pattern="キジトラ",
+                tail_length="長い",
+                age="成猫",
+                gender="female",
+            )
+            db.add(animal)
+            db.commit()
+            data = {
+                "animal_id": animal.id,
+                "recorder_name": "ボランティア",
+                "log_date": date(2025, 11, 15),
+                "time_slot": "morning",
+                "appetite": 3,
+                "energy": 3,
+                "urination": True,
+                "cleaning": False,
+            }
+
+            # When
+            first = care_log_service.create_care_log(db, CareLogCreate(**data))
+            second = care_log_service.create_care_log(
+                db, CareLogCreate(**{**data, "appetite": 5})
+            )
+
+            # Then
+            assert second.id == first.id
+            assert second.appetite == 5
+            assert db.query(CareLog).count() == 1
+            assert get_resource_version(db, RESOURCE_CARE_LOGS, animal.id) == 2
+
+    def test_resource_versions_are_shared_between_engines(
+        self, pg_engine: Engine, postgres_database: str
+    ):
+        """正常系: 別のプロセス（別のエンジン）で進めたバージョンが見える"""
+        # Given
+        other_engine = create_engine(postgres_database)
+        try:
+            with Session(other_engine) as other:
+                before = get_resource_version(other, RESOURCE_CARE_LOGS)
+
+            # When
+            with Session(pg_engine) as db:
+                bump_resource_versions(db, RESOURCE_CARE_LOGS, [2, 1, 2])
+                db.commit()
+
+            # Then
+            with Session(other_engine) as other:
+                assert get_resource_version(other, RESOURCE_CARE_LOGS) == before + 2
+                assert get_resource_version(other, RESOURCE_CARE_LOGS, 1) == 1
+        finally:
+            other_engine.dispose()
+
+    def test_pool_reuses_connections(self, pg_engine: Engine):
+        """正常系: 接続を使い回し、プールの大きさを超えて保持しない"""
+        # When
+        for _ in range(get_settings().database_pool_size * 3):
+            with pg_engine.connect() as conn:
+                conn.exec_driver_sql("SELECT 1")
+
+        # Then
+        assert isinstance(pg_engine.pool, QueuePool)
+        assert pg_engine.pool.checkedout() == 0
+        assert pg_engine.pool.checkedin() <= get_settings().database_pool_size
@@ -0,0 +1,92 @@
+"""
+条件付きリクエスト（ETag）ユーティリティのテスト
+"""
+
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+
+from app.utils import http_cache
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+class TestResourceVersion:
+    """リソースバージョンのテスト"""
+
+    def test_bump_with_key_advances_table_and_key(self, test_db: Session):
+        """正常系: キー指定時はキー単位とテーブル単位の両方が進む"""
+        # Given
+        table_before = http_cache.get_resource_version(test_db, "test_resource")
+        other_before = http_cache.get_resource_version(test_db, "test_resource", 2)
+
+        # When
+        http_cache.bump_resource_version(test_db, "test_resource", 1)
+        http_cache.bump_resource_version(test_db, "test_resource", 1)
+        test_db.commit()
+
+        # Then
+        assert (
+            http_cache.get_resource_version(test_db, "test_resource")
+            == table_before + 2
+        )
+        assert http_cache.get_resource_version(test_db, "test_resource", 1) == 2
+        assert (
+            http_cache.get_resource_version(test_db, "test_resource", 2) == other_before
+        )
+
+    def test_rollback_discards_bump(self, test_db: Session):
+        """正常系: 更新をロールバックした場合はバージョンも進まない"""
+        # When
+        http_cache.bump_resource_version(test_db, "test_resource", 1)
+        test_db.rollback()
+
+        # Then
+        assert http_cache.get_resource_version(test_db, "test_resource", 1) == 0
+
+    def test_bump_is_visible_to_other_sessions(self, test_db: Session):
+        """正常系: 別のセッション（別のワーカープロセス）からも進んだバージョンが見える"""
+        # Given
+        other = Session(test_db.get_bind())
+        before = http_cache.get_resource_version(other, "test_resource")
+        other.rollback()
+
+        # When
+        http_cache.bump_resource_version(test_db, "test_resource")
+        test_db.commit()
+
+        # Then
+        try:
+            assert http_cache.get_resource_version(other, "test_resource") == before + 1
+        finally:
+            other.close()
+
+
+class TestEtagMatches:
+    """If-None-Match の比較のテスト"""
+
+    def test_weak_comparison(self):
+        """正常系: 弱いETagと強いETagを区別せずに比較する"""
+        etag = http_cache.make_weak_etag("animal", 1, 3)
+        assert http_cache.etag_matches(_request(etag), etag)
+        assert http_cache.etag_matches(_request(etag.removeprefix("W/")), etag)
+
+    def test_multiple_candidates_and_wildcard(self):
+        """正常系: カンマ区切りの候補と * に対応する"""
+        etag = http_cache.make_weak_etag("animal", 1, 3)
+        assert http_cache.etag_matches(_request(f'W/"stale", {etag}'), etag)
+        assert http_cache.etag_matches(_request("*"), etag)
+
+    def test_mismatch(self):
+        """異常系: ヘッダーがない場合・値が異なる場合は一致しない"""
+        etag = http_cache.make_weak_etag("animal", 1, 3)
+        assert not http_cache.etag_matches(_request(), etag)
+        assert not http_cache.etag_matches(
+            _request(http_cache.make_weak_etag("animal", 1, 4)), etag
+        )
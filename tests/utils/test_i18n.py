@@ -8,7 +8,15 @@ from __future__ import annotations
 
 import pytest
 
-from app.utils.i18n import load_json_translations, tj
+from app.utils import i18n
+from app.utils.i18n import (
+    flatten_translations,
+    get_catalog,
+    load_babel_translations,
+    load_json_translations,
+    tj,
+    translate,
+)
 
 
 class TestLoadJsonTranslations:
@@ -230,3 +238,108 @@ class TestTj:
         assert morning == "Morning"
         assert noon == "Noon"
         assert evening == "Evening"
+
+
+class TestTranslationCatalog:
+    """コンパイル済み翻訳カタログのテスト"""
+
+    def test_flatten_translations(self):
+        """正常系: ネストしたキーをドット区切りのキーに変換する"""
+        # Given
+        data = {"headers": {"animal_name": "猫名"}, "units": {"count": 3}}
+
+        # When
+        messages = flatten_translations(data)
+
+        # Then
+        assert messages == {"headers.animal_name": "猫名", "units.count": "3"}
+
+    def test_get_catalog_is_cached(self):
+        """性能: カタログは (ロケール, 名前空間) ごとに一度だけ作成される"""
+        assert get_catalog("en", "reports") is get_catalog("en", "reports")
+        assert get_catalog("ja", "reports") is not get_catalog("en", "reports")
+
+    @pytest.mark.parametrize(
+        "key,kwargs",
+        [
+            ("headers.animal_name", {}),
+            ("time_slots.morning", {}),
+            ("animal.no_name", {"id": 123}),
+            ("animal.no_name", {"name": "unused"}),
+            ("nonexistent.key.path", {}),
+            ("headers", {}),
+        ],
+    )
+    @pytest.mark.parametrize("locale", ["ja", "en"])
+    def test_gettext_matches_tj(self, key, kwargs, locale):
+        """正常系: カタログの gettext は tj と同じ結果を返す"""
+        assert get_catalog(locale).gettext(key, **kwargs) == tj(
+            key, locale=locale, **kwargs
+        )
+
+    def test_gettext_missing_key_returns_last_segment(self):
+        """異常系: 存在しないキーは最後のキーをそのまま返す"""
+        assert get_catalog("ja").gettext("nonexistent.key.path") == "path"
+
+    def test_translate_column(self):
+        """正常系: 列の値をまとめて翻訳する（未定義の値はそのまま）"""
+        # When
+        result = get_catalog("en").translate_column(
+            "time_slots", ["morning", "evening", "morning", "unknown"]
+        )
+
+        # Then
+        assert result == ["Morning", "Evening", "Morning", "unknown"]
+
+    def test_labeler_memoizes_values(self, monkeypatch: pytest.MonkeyPatch):
+        """性能: labeler は値ごとに一度だけ翻訳キーを解決する"""
+        # Given
+        catalog = get_catalog("ja")
+        label = catalog.labeler("time_slots")
+        calls: list[str] = []
+        original = i18n.TranslationCatalog.gettext
+
+        def counting_gettext(self, key, **kwargs):
+            calls.append(key)
+            return original(self, key, **kwargs)
+
+        monkeypatch.setattr(i18n.TranslationCatalog, "gettext", counting_gettext)
+
+        # When
+        result = [label(slot) for slot in ["morning", "noon", "morning", "noon"]]
+
+        # Then
+        assert result == ["朝", "昼", "朝", "昼"]
+        assert calls == ["time_slots.morning", "time_slots.noon"]
+
+    def test_yes_no(self):
+        """正常系: 真偽値を○/×に変換する"""
+        catalog = get_catalog("ja")
+        assert catalog.yes_no(True) == "○"
+        assert catalog.yes_no(False) == "×"
+        assert catalog.yes_no(None) == "×"
+
+
+class TestBabelLoader:
+    """Babel翻訳カタログ読み込みのテスト"""
+
+    def test_translate_loads_catalog_once(self, monkeypatch: pytest.MonkeyPatch):
+        """性能: translate は翻訳カタログを毎回ディスクから読み込まない"""
+        # Given
+        monkeypatch.setattr(i18n, "_translations_cache", {})
+        loads: list[list[str]] = []
+        original = i18n.Translations.load
+
+        def counting_load(dirname, locales):
+            loads.append(locales)
+            return original(dirname, locales)
+
+        monkeypatch.setattr(i18n.Translations, "load", counting_load)
+
+        # When
+        for _ in range(3):
+            translate("Save", "en")
+
+        # Then
+        assert loads == [["en"]]
+        assert load_babel_translations("en") is load_babel_translations("en")
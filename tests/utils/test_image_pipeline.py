@@ -0,0 +1,216 @@
+"""
+画像派生サイズ生成パイプラインのテスト
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from app.utils import image as image_utils
+from app.utils import image_pipeline
+
+
+@pytest.fixture
+def media_base_dir(isolated_media_dir: Path) -> Path:
+    """メディアディレクトリ（conftest でテストごとの一時ディレクトリに隔離済み）"""
+    return isolated_media_dir
+
+
+def _create_image(
+    media_dir: Path, relative_path: str, size: tuple[int, int], mode: str = "RGB"
+) -> str:
+    path = media_dir / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    color = (200, 100, 50, 128) if mode == "RGBA" else (200, 100, 50)
+    Image.new(mode, size, color=color).save(path)
+    return relative_path
+
+
+class TestVariantPaths:
+    """派生画像のパス導出のテスト"""
+
+    def test_variant_relative_path(self):
+        """正常系: 元画像と同じディレクトリにサイズ名付きで配置する"""
+        assert (
+            image_pipeline.variant_relative_path("animals/1/gallery/abc.png", "thumb")
+            == "animals/1/gallery/abc_thumb.jpg"
+        )
+        assert (
+            image_pipeline.variant_relative_path(
+                "/media/animals/1/gallery/abc.png", "large", "webp"
+            )
+            == "animals/1/gallery/abc_large.webp"
+        )
+
+    def test_variant_path_from_variant_path(self):
+        """正常系: 派生画像のパスからも別のサイズのパスを導出できる"""
+        assert (
+            image_pipeline.variant_relative_path(
+                "/media/animals/1/gallery/abc_large.jpg", "thumb", "webp"
+            )
+            == "animals/1/gallery/abc_thumb.webp"
+        )
+        assert (
+            image_pipeline.variant_relative_path(
+                "animals/1/gallery/abc_large.png", "thumb"
+            )
+            == "animals/1/gallery/abc_large_thumb.jpg"
+        )
+
+    def test_resolve_falls_back_to_original(self, media_base_dir: Path):
+        """正常系: 派生画像が未生成の場合は元画像のパスを返す"""
+        relative_path = "animals/1/gallery/abc.jpg"
+
+        assert image_pipeline.resolve_image_variant(relative_path, "thumb") == (
+            relative_path
+        )
+        assert (
+            image_pipeline.resolve_image_variant(relative_path, "thumb", fallback=False)
+            is None
+        )
+        assert image_pipeline.resolve_image_variant(None, "thumb") is None
+
+
+class TestBuildImageVariants:
+    """派生画像生成のテスト"""
+
+    def test_builds_all_sizes_in_jpeg_and_webp(self, media_base_dir: Path):
+        """正常系: 各サイズのJPEGとWebPを縦横比を保って生成する"""
+        # Given
+        relative_path = _create_image(
+            media_base_dir, "animals/1/gallery/abc.jpg", (4000, 3000)
+        )
+
+        # When
+        created = image_pipeline.build_image_variants(relative_path)
+
+        # Then
+        assert len(created) == 6
+        expected_sizes = {
+            "large": (1440, 1080),
+            "medium": (800, 600),
+            "thumb": (320, 240),
+        }
+        for variant, expected_size in expected_sizes.items():
+            with Image.open(
+                media_base_dir
+                / image_pipeline.variant_relative_path(relative_path, variant)
+            ) as img:
+                assert img.format == "JPEG"
+                assert img.size == expected_size
+            with Image.open(
+                media_base_dir
+                / image_pipeline.variant_relative_path(relative_path, variant, "webp")
+            ) as img:
+                assert img.format == "WEBP"
+                assert img.size == expected_size
+
+    def test_transparent_png_is_flattened(self, media_base_dir: Path):
+        """正常系: 透過PNGは白背景に合成してJPEGにする"""
+        # Given
+        relative_path = _create_image(
+            media_base_dir, "animals/1/gallery/alpha.png", (100, 100), mode="RGBA"
+        )
+
+        # When
+        image_pipeline.build_image_variants(relative_path)
+
+        # Then
+        thumb = image_pipeline.resolve_image_variant(relative_path, "thumb")
+        assert thumb == "animals/1/gallery/alpha_thumb.jpg"
+        with Image.open(media_base_dir / thumb) as img:
+            assert img.mode == "RGB"
+            assert img.size == (100, 100)
+
+    def test_delete_image_variants(self, media_base_dir: Path):
+        """正常系: 派生画像をすべて削除する"""
+        # Given
+        relative_path = _create_image(
+            media_base_dir, "animals/1/gallery/abc.jpg", (640, 480)
+        )
+        image_pipeline.build_image_variants(relative_path)
+
+        # When
+        deleted = image_pipeline.delete_image_variants(relative_path)
+
+        # Then
+        assert deleted == 6
+        assert (media_base_dir / relative_path).exists()
+        assert image_pipeline.resolve_image_variant(relative_path, "thumb") == (
+            relative_path
+        )
+
+    def test_staged_upload_is_published_without_metadata(self, media_base_dir: Path):
+        """正常系: 一時保存の元画像はメタデータを除き大サイズ以下に縮小して公開する"""
+        # Given: GPS情報付きの大きなJPEG（アップロード直後は一時保存ディレクトリ）
+        relative_path = "animals/1/gallery/gps.jpg"
+        staged = image_utils.UPLOAD_STAGING_DIR / relative_path
+        staged.parent.mkdir(parents=True)
+        exif = Image.Exif()
+        exif[0x8825] = {1: "N", 2: (35.0, 41.0, 0.0)}  # GPSInfo
+        Image.new("RGB", (4000, 3000), color=(200, 100, 50)).save(staged, exif=exif)
+
+        # When
+        image_pipeline.build_image_variants(relative_path)
+
+        # Then
+        assert not staged.exists()
+        with Image.open(media_base_dir / relative_path) as img:
+            assert img.format == "JPEG"
+            assert img.size == (1440, 1080)
+            assert "exif" not in img.info
+            assert not img.getexif()
+
+    def test_broken_staged_upload_is_not_published(self, media_base_dir: Path):
+        """異常系: 生成に失敗しても一時保存の元画像は削除し、公開しない"""
+        # Given
+        relative_path = "animals/1/gallery/broken.jpg"
+        staged = image_utils.UPLOAD_STAGING_DIR / relative_path
+        staged.parent.mkdir(parents=True)
+        staged.write_bytes(b"not an image")
+
+        # When
+        with pytest.raises(OSError):
+            image_pipeline.build_image_variants(relative_path)
+
+        # Then
+        assert not staged.exists()
+        assert not (media_base_dir / relative_path).exists()
+
+
+class TestImageVariantPool:
+    """派生画像ワーカープールのテスト"""
+
+    def test_generates_variants_in_worker_threads(self, media_base_dir: Path):
+        """正常系: ワーカーで生成し、完了を待てる"""
+        # Given
+        pool = image_pipeline.ImageVariantPool(max_workers=2)
+        relative_path = _create_image(
+            media_base_dir, "animals/1/gallery/abc.jpg", (640, 480)
+        )
+
+        # When
+        try:
+            created = pool.submit(relative_path).result(timeout=30)
+        finally:
+            pool.shutdown()
+
+        # Then
+        assert len(created) == 6
+
+    def test_broken_image_does_not_raise(self, media_base_dir: Path):
+        """異常系: 画像として読めないファイルでも例外を送出しない"""
+        # Given
+        pool = image_pipeline.ImageVariantPool(max_workers=0)
+        broken = media_base_dir / "animals/1/gallery/broken.jpg"
+        broken.parent.mkdir(parents=True)
+        broken.write_bytes(b"not an image")
+
+        # When
+        created = pool.submit("animals/1/gallery/broken.jpg").result()
+
+        # Then
+        assert created == []
@@ -0,0 +1,95 @@
+"""
+キーセット（カーソル）ページネーションユーティリティのテスト
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.utils import http_cache, pagination
+
+
+class TestCursor:
+    """カーソルの生成・復元のテスト"""
+
+    def test_round_trip(self):
+        """正常系: 日時・日付とIDを復元できる"""
+        created_at = datetime(2025, 11, 15, 9, 30, 15, 123456)
+
+        assert pagination.decode_cursor(
+            pagination.encode_cursor(created_at, 42), datetime
+        ) == (created_at, 42)
+        assert pagination.decode_cursor(
+            pagination.encode_cursor(date(2025, 11, 15), 7), date
+        ) == (date(2025, 11, 15), 7)
+
+    def test_cursor_is_url_safe(self):
+        """正常系: カーソルはURLにそのまま含められる"""
+        cursor = pagination.encode_cursor(datetime(2025, 11, 15, 9, 30), 10**9)
+        assert cursor.replace("-", "").replace("_", "").isalnum()
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "invalid",
+            "",
+            pagination.encode_cursor(date(2025, 11, 15), 1),
+            pagination.encode_cursor(datetime(2025, 11, 15), 1)[:-2],
+        ],
+    )
+    def test_invalid_cursor(self, cursor: str):
+        """異常系: 不正なカーソル・日付のカーソルは400エラー"""
+        with pytest.raises(HTTPException) as exc_info:
+            pagination.decode_cursor(cursor, datetime)
+        assert exc_info.value.status_code == 400
+
+
+class TestCachedTotal:
+    """総件数のキャッシュのテスト"""
+
+    def test_cached_until_resource_version_changes(self, test_db: Session):
+        """正常系: リソースのバージョンが変わるまで数え直さない"""
+        # Given
+        calls: list[int] = []
+
+        def count() -> int:
+            calls.append(1)
+            return len(calls)
+
+        # When
+        first = pagination.cached_total(test_db, "test_resource", ("list",), count)
+        second = pagination.cached_total(test_db, "test_resource", ("list",), count)
+        http_cache.bump_resource_version(test_db, "test_resource")
+        test_db.commit()
+        third = pagination.cached_total(test_db, "test_resource", ("list",), count)
+
+        # Then
+        assert (first, second, third) == (1, 1, 2)
+
+    def test_filters_are_cached_separately(self, test_db: Session):
+        """正常系: 絞り込み条件ごとにキャッシュする"""
+        first = pagination.cached_total(
+            test_db, "test_resource", ("list", 1), lambda: 3
+        )
+        other = pagination.cached_total(
+            test_db, "test_resource", ("list", 2), lambda: 5
+        )
+
+        assert (first, other) == (3, 5)
+
+    def test_bounded_entries(self, test_db: Session, monkeypatch: pytest.MonkeyPatch):
+        """正常系: キャッシュの件数は上限を超えない（古いものから破棄）"""
+        # Given
+        monkeypatch.setattr(pagination, "TOTAL_CACHE_MAX_ENTRIES", 2)
+
+        # When
+        for i in range(3):
+            pagination.cached_total(test_db, "test_resource", ("list", i), lambda: 1)
+
+        # Then
+        assert len(pagination._total_cache) == 2
+        assert ("test_resource", "list", 0) not in pagination._total_cache
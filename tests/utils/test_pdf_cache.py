@@ -0,0 +1,118 @@
+"""
+PDFキャッシュユーティリティのテスト
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from app.utils.pdf_cache import PDFRenderCache
+
+
+def _make_cache(tmp_path: Path, max_bytes: int = 1024) -> PDFRenderCache:
+    return PDFRenderCache(cache_dir=tmp_path / "cache", max_bytes=max_bytes)
+
+
+class TestBuildKey:
+    """キャッシュキー生成のテスト"""
+
+    def test_same_inputs_produce_same_key(self):
+        """正常系: 同じ入力からは同じキーが生成される"""
+        key1 = PDFRenderCache.build_key("qr_card", [1], locale="ja", photo_mtime=10)
+        key2 = PDFRenderCache.build_key("qr_card", [1], photo_mtime=10, locale="ja")
+
+        assert key1 == key2
+
+    def test_changed_input_produces_different_key(self):
+        """正常系: 入力が変わるとキーも変わる"""
+        key_ja = PDFRenderCache.build_key("qr_card", [1], locale="ja")
+        key_en = PDFRenderCache.build_key("qr_card", [1], locale="en")
+
+        assert key_ja != key_en
+
+    def test_key_contains_kind_and_animal_ids(self):
+        """正常系: キーに種別と猫IDが含まれる"""
+        key = PDFRenderCache.build_key("qr_card_grid", [3, 1, 2], locale="ja")
+
+        assert key.startswith("qr_card_grid__1-2-3__")
+
+
+class TestGetAndPut:
+    """取得・保存のテスト"""
+
+    def test_miss_then_hit(self, tmp_path: Path):
+        """正常系: 保存前はミス、保存後はヒットとして計上される"""
+        cache = _make_cache(tmp_path)
+        key = cache.build_key("qr_card", [1])
+
+        assert cache.get(key) is None
+        cache.put(key, b"%PDF-1")
+
+        assert cache.get(key) == b"%PDF-1"
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["size_bytes"] == len(b"%PDF-1")
+
+    def test_disabled_cache_never_stores(self, tmp_path: Path):
+        """正常系: 無効化されている場合は保存も取得もしない"""
+        cache = PDFRenderCache(
+            cache_dir=tmp_path / "cache", max_bytes=1024, enabled=False
+        )
+        key = cache.build_key("qr_card", [1])
+
+        cache.put(key, b"%PDF-1")
+
+        assert cache.get(key) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_evicts_least_recently_used_entry(self, tmp_path: Path):
+        """正常系: 上限超過時は最も長く参照されていないエントリから削除される"""
+        cache = _make_cache(tmp_path, max_bytes=250)
+        keys = [cache.build_key("qr_card", [animal_id]) for animal_id in (1, 2, 3)]
+
+        cache.put(keys[0], b"a" * 100)
+        cache.put(keys[1], b"b" * 100)
+        # 参照順序を明確にするため更新日時を固定
+        os.utime(cache.cache_dir / f"{keys[0]}.pdf", ns=(1_000, 1_000))
+        os.utime(cache.cache_dir / f"{keys[1]}.pdf", ns=(2_000, 2_000))
+        # 1件目を参照して最新にする
+        assert cache.get(keys[0]) is not None
+
+        cache.put(keys[2], b"c" * 100)
+
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_entry_larger_than_limit_is_not_stored(self, tmp_path: Path):
+        """境界値: 上限より大きいPDFは保存しない"""
+        cache = _make_cache(tmp_path, max_bytes=10)
+        key = cache.build_key("qr_card", [1])
+
+        cache.put(key, b"x" * 11)
+
+        assert cache.stats()["entries"] == 0
+
+
+class TestInvalidateAnimal:
+    """猫単位の無効化のテスト"""
+
+    def test_removes_entries_containing_animal(self, tmp_path: Path):
+        """正常系: 対象の猫を含むエントリのみ削除される"""
+        cache = _make_cache(tmp_path)
+        single = cache.build_key("qr_card", [1])
+        grid = cache.build_key("qr_card_grid", [2, 1])
+        other = cache.build_key("qr_card", [11])
+        for key in (single, grid, other):
+            cache.put(key, b"%PDF")
+
+        removed = cache.invalidate_animal(1)
+
+        assert removed == 2
+        assert cache.get(single) is None
+        assert cache.get(grid) is None
+        assert cache.get(other) == b"%PDF"
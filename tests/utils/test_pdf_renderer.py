@@ -0,0 +1,100 @@
+"""
+PDF描画プールのテスト
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.utils.pdf_renderer import (
+    PDFRenderBusyError,
+    PDFRenderPool,
+    PDFRenderTimeoutError,
+)
+
+SIMPLE_HTML = "<html><body><p>テスト</p></body></html>"
+
+
+class _BlockingRenderer:
+    """解放されるまで描画を終えない描画関数"""
+
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, html: str, base_url: str) -> bytes:
+        self.started.set()
+        self.release.wait(timeout=5)
+        return b"%PDF-blocked"
+
+
+class TestPDFRenderPool:
+    """PDF描画プールのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_render_in_thread_mode(self):
+        """正常系: ワーカー数0の場合はスレッドで描画できる"""
+        pool = PDFRenderPool(max_workers=0, max_pending=2, timeout_seconds=10)
+        try:
+            pdf_bytes = await pool.render(SIMPLE_HTML, base_url=".")
+        finally:
+            pool.shutdown()
+
+        assert pdf_bytes.startswith(b"%PDF")
+        assert pool.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_render_in_process_pool(self):
+        """正常系: ワーカープロセスで描画できる"""
+        pool = PDFRenderPool(max_workers=1, max_pending=2, timeout_seconds=60)
+        try:
+            pdf_bytes = await pool.render(SIMPLE_HTML, base_url=".")
+        finally:
+            pool.shutdown()
+
+        assert pdf_bytes.startswith(b"%PDF")
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self):
+        """異常系: 受付中のジョブ数が上限に達している場合は即座に拒否する"""
+        renderer = _BlockingRenderer()
+        pool = PDFRenderPool(
+            max_workers=0, max_pending=1, timeout_seconds=10, render_func=renderer
+        )
+        try:
+            task = asyncio.ensure_future(pool.render(SIMPLE_HTML, base_url="."))
+            assert await asyncio.to_thread(renderer.started.wait, 5)
+
+            with pytest.raises(PDFRenderBusyError):
+                await pool.render(SIMPLE_HTML, base_url=".")
+
+            renderer.release.set()
+            assert await task == b"%PDF-blocked"
+        finally:
+            renderer.release.set()
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_timeout_keeps_slot_until_job_finishes(self):
+        """異常系: タイムアウト後も描画が終わるまで枠を解放しない"""
+        renderer = _BlockingRenderer()
+        pool = PDFRenderPool(
+            max_workers=0, max_pending=1, timeout_seconds=0.05, render_func=renderer
+        )
+        try:
+            with pytest.raises(PDFRenderTimeoutError):
+                await pool.render(SIMPLE_HTML, base_url=".")
+            assert pool.pending == 1
+
+            renderer.release.set()
+            deadline = time.monotonic() + 5
+            while pool.pending and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert pool.pending == 0
+        finally:
+            renderer.release.set()
+            pool.shutdown()
@@ -134,3 +134,90 @@ class TestGenerateAnimalQRCodeBytes:
         assert isinstance(qr_bytes, bytes)
         assert len(qr_bytes) > 0
         assert qr_bytes.startswith(b"\x89PNG")
+
+
+class TestQRCodeCache:
+    """QRコードキャッシュのテスト"""
+
+    def test_same_inputs_are_served_from_cache(self):
+        """正常系: 同じ入力の2回目はキャッシュから返す"""
+        # Given
+        qr_code.clear_qr_cache()
+        base_url = "https://necokeeper.example.com"
+
+        # When
+        first = qr_code.generate_animal_qr_code_bytes(base_url, 123)
+        second = qr_code.generate_animal_qr_code_bytes(base_url, 123)
+
+        # Then
+        stats = qr_code.get_qr_cache_stats()
+        assert first == second
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["max_entries"] == qr_code.QR_CACHE_MAX_ENTRIES
+
+    def test_different_inputs_are_cached_separately(self):
+        """正常系: 猫ID・サイズ・形式が異なれば別々にキャッシュする"""
+        # Given
+        qr_code.clear_qr_cache()
+        base_url = "https://necokeeper.example.com"
+
+        # When
+        qr_code.generate_animal_qr_code_bytes(base_url, 1)
+        qr_code.generate_animal_qr_code_bytes(base_url, 2)
+        qr_code.generate_animal_qr_code_bytes(base_url, 1, box_size=8)
+        qr_code.generate_animal_qr_code_svg(base_url, 1)
+
+        # Then
+        assert qr_code.get_qr_cache_stats()["entries"] == 4
+
+    def test_empty_data_is_not_cached(self):
+        """異常系: 空のデータはエラーになりキャッシュされない"""
+        # Given
+        qr_code.clear_qr_cache()
+
+        # When/Then
+        with pytest.raises(ValueError, match="QRコードに埋め込むデータが空です"):
+            qr_code.generate_qr_code_bytes("")
+        assert qr_code.get_qr_cache_stats()["entries"] == 0
+
+
+class TestGenerateQRCodeSVG:
+    """QRコードSVG生成のテスト"""
+
+    def test_generate_animal_qr_code_svg_success(self):
+        """正常系: 猫のQRコードをSVGとして生成できる"""
+        # When
+        svg = qr_code.generate_animal_qr_code_svg("https://necokeeper.example.com", 1)
+
+        # Then
+        assert svg.startswith("<svg")
+        assert svg.endswith("</svg>")
+        assert 'fill="#000"' in svg
+
+    def test_svg_matches_png_modules(self):
+        """正常系: SVGの暗いモジュールはPNGと同じ位置に描画される"""
+        # Given
+        data = "https://necokeeper.example.com/public/care?animal_id=1"
+        img = qr_code.generate_qr_code(data, box_size=1, border=4).get_image()
+        svg = qr_code.generate_qr_code_svg(data, border=4)
+
+        # When: SVGのパスをモジュール単位の座標に展開
+        path = svg.split('fill="#000" d="')[1].split('"')[0]
+        dark_from_svg: set[tuple[int, int]] = set()
+        for command in path.split("z")[:-1]:
+            origin, width = command[1:].split("h")[:2]
+            x, y = (int(value) for value in origin.split(" "))
+            for offset in range(int(width.split("v")[0])):
+                dark_from_svg.add((x + offset, y))
+
+        # Then
+        width, height = img.size
+        dark_from_png = {
+            (x, y)
+            for y in range(height)
+            for x in range(width)
+            if img.convert("L").getpixel((x, y)) == 0
+        }
+        assert dark_from_svg == dark_from_png